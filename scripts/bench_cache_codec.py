@@ -0,0 +1,99 @@
+"""Compare analysis-cache payload codecs on cache-hit latency and database size.
+
+Analyzes the files under tests/corpus once, then stores those results for N
+synthetic file paths in one cache database per codec:
+
+- json:   canonical JSON text, the format written before binary payloads
+- binary: schema-tagged, zlib-compressed marshal with lazily decoded sections
+
+For each database it reports the file size and the per-hit latency of a
+prefetched cache session, both for restoring results (``get``) and for
+restoring plus rendering them as JSON-ready dicts (``get`` + ``to_dict``).
+
+Usage:
+    python scripts/bench_cache_codec.py [--files 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, List, Tuple
+
+from slop_detector.analysis_cache import CODEC_BINARY, CODEC_JSON, FileAnalysisCache
+from slop_detector.core import SlopDetector
+
+CORPUS = Path(__file__).parent.parent / "tests" / "corpus"
+FINGERPRINT = "bench"
+
+
+def _templates() -> List[Any]:
+    detector = SlopDetector()
+    detector._analysis_cache = None
+    templates = []
+    for path in sorted(CORPUS.rglob("*.py")):
+        try:
+            templates.append(detector.analyze_file(str(path)))
+        except Exception:
+            continue
+    return templates
+
+
+def _fill(cache: FileAnalysisCache, templates: List[Any], count: int) -> List[Tuple[str, Any]]:
+    keys = []
+    with cache.session([], FINGERPRINT):
+        for index in range(count):
+            file_path = f"/synthetic/pkg{index // 100}/module_{index}.py"
+            key = dict(file_path=file_path, file_size=index, mtime_ns=index, content_hash="0")
+            cache.put(
+                config_fingerprint=FINGERPRINT, result=templates[index % len(templates)], **key
+            )
+            keys.append((file_path, key))
+    return keys
+
+
+def _hits(cache: FileAnalysisCache, keys: List[Tuple[str, Any]], render: bool) -> float:
+    start = time.perf_counter()
+    with cache.session([path for path, _ in keys], FINGERPRINT):
+        for _, key in keys:
+            result = cache.get(config_fingerprint=FINGERPRINT, **key)
+            assert result is not None
+            if render:
+                result.to_dict()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5_000, help="Synthetic file count")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs; the best is kept")
+    args = parser.parse_args()
+
+    templates = _templates()
+    print(f"{args.files} cached files ({len(templates)} corpus templates)")
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = []
+        for codec in (CODEC_JSON, CODEC_BINARY):
+            db_path = Path(tmp) / f"{codec}.db"
+            cache = FileAnalysisCache(db_path, codec=codec)
+            keys = _fill(cache, templates, args.files)
+            cache.close()
+            get = min(_hits(cache, keys, render=False) for _ in range(args.repeat))
+            render = min(_hits(cache, keys, render=True) for _ in range(args.repeat))
+            cache.close()
+            rows.append((codec, db_path.stat().st_size, get, render))
+
+    json_size, json_get, json_render = rows[0][1:]
+    for codec, size, get, render in rows:
+        print(
+            f"{codec:<7} {size / 2**20:7.1f} MiB ({size / json_size:4.2f}x)"
+            f"  get {1e6 * get / args.files:6.1f} us/hit ({json_get / get:4.2f}x faster)"
+            f"  get+to_dict {1e6 * render / args.files:6.1f} us/hit"
+            f" ({json_render / render:4.2f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Measure memory held by project results on a synthetic large project.
+
+Analyzes the files under tests/corpus once, then replicates those results
+for N synthetic file paths, building them the way a warm-cache project
+scan restores them (one JSON payload per file). Reports the memory held by
+the result list in three layouts:
+
+- legacy:  dict-backed dataclasses, one ``Path`` per issue, no interning
+- compact: slotted models, interned issue strings, one ``Path`` per file
+- compact, snippets dropped: as above, after ``drop_code_snippets()``
+
+Usage:
+    python scripts/bench_memory.py [--files 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import MISSING, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from slop_detector.analysis_cache import serialize_file_analysis
+from slop_detector.core import SlopDetector
+from slop_detector.models import DDCResult, FileAnalysis, InflationResult, LDRResult, SlopStatus
+from slop_detector.patterns.base import Axis, Issue, Severity
+
+CORPUS = Path(__file__).parent.parent / "tests" / "corpus"
+
+
+def _unslotted(cls: type) -> type:
+    """Rebuild a slotted dataclass as the dict-backed class it used to be.
+
+    ``__post_init__`` becomes a no-op: the old models did not intern, and
+    their range clamping does not change memory use.
+    """
+    names = {f.name for f in fields(cls)}
+    namespace = {
+        key: value for key, value in cls.__dict__.items() if key not in names and key != "__slots__"
+    }
+    for f in fields(cls):
+        if f.default is not MISSING:
+            namespace[f.name] = f.default
+    namespace["__post_init__"] = lambda self: None
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+LegacyIssue = _unslotted(Issue)
+LegacyLDR = _unslotted(LDRResult)
+LegacyInflation = _unslotted(InflationResult)
+LegacyDDC = _unslotted(DDCResult)
+LegacyFileAnalysis = _unslotted(FileAnalysis)
+
+
+LEGACY = (LegacyFileAnalysis, LegacyLDR, LegacyInflation, LegacyDDC, LegacyIssue)
+COMPACT = (FileAnalysis, LDRResult, InflationResult, DDCResult, Issue)
+
+
+def _build(payload: str, classes: tuple, share_paths: bool) -> Any:
+    """Restore one payload with ``classes``; sub-results are left out for both layouts."""
+    file_cls, ldr_cls, inflation_cls, ddc_cls, issue_cls = classes
+    data = json.loads(payload)
+    paths: Dict[str, Path] = {}
+
+    def path_of(name: str) -> Path:
+        if not share_paths:
+            return Path(name)
+        if name not in paths:
+            paths[name] = Path(name)
+        return paths[name]
+
+    return file_cls(
+        file_path=data["file_path"],
+        ldr=ldr_cls(**data["ldr"]),
+        inflation=inflation_cls(**data["inflation"]),
+        ddc=ddc_cls(**data["ddc"]),
+        deficit_score=data["deficit_score"],
+        status=SlopStatus(data["status"]),
+        warnings=data.get("warnings", []),
+        pattern_issues=[
+            issue_cls(
+                pattern_id=item["pattern_id"],
+                severity=Severity(item["severity"]),
+                axis=Axis(item["axis"]),
+                file=path_of(item["file"]),
+                line=item["line"],
+                column=item.get("column", 0),
+                message=item["message"],
+                code=item.get("code"),
+                suggestion=item.get("suggestion"),
+            )
+            for item in data.get("pattern_issues", [])
+        ],
+        dcf=data.get("dcf", {}),
+        deficit_breakdown=data.get("deficit_breakdown", {}),
+    )
+
+
+def _templates() -> List[Dict[str, Any]]:
+    detector = SlopDetector()
+    detector._analysis_cache = None
+    templates = []
+    for path in sorted(CORPUS.rglob("*.py")):
+        try:
+            result = detector.analyze_file(str(path))
+        except Exception:
+            continue
+        templates.append(json.loads(serialize_file_analysis(result)))
+    return templates
+
+
+def _payloads(templates: List[Dict[str, Any]], count: int) -> List[str]:
+    payloads = []
+    for index in range(count):
+        data = dict(templates[index % len(templates)])
+        file_path = f"/synthetic/pkg{index // 100}/module_{index}.py"
+        data["file_path"] = file_path
+        data["pattern_issues"] = [
+            {**item, "file": file_path} for item in data.get("pattern_issues", [])
+        ]
+        payloads.append(json.dumps(data))
+    return payloads
+
+
+def _measure(payloads: List[str], build: Callable[[str], Any], drop: bool) -> int:
+    gc.collect()
+    tracemalloc.start()
+    results = []
+    for payload in payloads:
+        result = build(payload)
+        if drop:
+            result.drop_code_snippets()
+        results.append(result)
+    gc.collect()
+    held, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return held
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=50_000, help="Synthetic file count")
+    args = parser.parse_args()
+
+    templates = _templates()
+    payloads = _payloads(templates, args.files)
+    issues = sum(len(json.loads(p).get("pattern_issues", [])) for p in payloads)
+    print(f"{args.files} files, {issues} issues ({len(templates)} corpus templates)")
+
+    legacy = _measure(payloads, lambda p: _build(p, LEGACY, share_paths=False), drop=False)
+    rows = [
+        ("legacy", legacy),
+        ("compact", _measure(payloads, lambda p: _build(p, COMPACT, True), drop=False)),
+        (
+            "compact, snippets dropped",
+            _measure(payloads, lambda p: _build(p, COMPACT, True), drop=True),
+        ),
+    ]
+    for label, held in rows:
+        print(
+            f"{label:<28} {held / 2**20:8.1f} MiB  {held / args.files:8.0f} B/file"
+            f"  {100.0 * (1 - held / legacy):5.1f}% smaller"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,29 @@
 """AI SLOP Detector - Production-ready code quality analyzer."""
 
-from typing import Any
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __version__ = "3.8.9"
 __author__ = "Flamehaven Labs"
 __email__ = "info@flamehaven.space"
 
-from slop_detector.autofix.engine import FixEngine, FixResult
-from slop_detector.core import SlopDetector
 from slop_detector.decorators import ignore, slop  # v2.6.3
-from slop_detector.gate.slop_gate import SlopGate, SlopGateDecision
-from slop_detector.models import (
-    DDCResult,
-    FileAnalysis,
-    IgnoredFunction,
-    InflationResult,
-    LDRResult,
-    PriorityHotspot,
-    ProjectAnalysis,
-    SlopStatus,
-)
+
+if TYPE_CHECKING:
+    from slop_detector.autofix.engine import FixEngine, FixResult
+    from slop_detector.core import SlopDetector
+    from slop_detector.gate.slop_gate import SlopGate, SlopGateDecision
+    from slop_detector.ml.scorer import MLScore, MLScorer
+    from slop_detector.models import (
+        DDCResult,
+        FileAnalysis,
+        IgnoredFunction,
+        InflationResult,
+        LDRResult,
+        PriorityHotspot,
+        ProjectAnalysis,
+        SlopStatus,
+    )
 
 __all__ = [
     "SlopDetector",
@@ -37,18 +41,46 @@ __all__ = [
     "SlopGateDecision",
     "FixEngine",
     "FixResult",
+    "MLScore",  # v2.8.0
+    "MLScorer",  # v2.8.0
 ]
 
-try:  # v2.8.0: optional ML surface should not hard-fail core imports
-    from slop_detector.ml.scorer import MLScore as _MLScore
-    from slop_detector.ml.scorer import MLScorer as _MLScorer
-except ImportError:  # pragma: no cover - optional dependency path
-    MLScore: Any = None
-    MLScorer: Any = None
-else:
-    MLScore = _MLScore
-    MLScorer = _MLScorer
-    __all__ += [
-        "MLScore",  # v2.8.0
-        "MLScorer",  # v2.8.0
-    ]
+# Public names resolve on first access (PEP 562) so `import slop_detector`, the
+# CLI and `--version` do not pay for the detector, autofix, gate and ML stacks.
+_LAZY_EXPORTS = {
+    "SlopDetector": "slop_detector.core",
+    "SlopStatus": "slop_detector.models",
+    "LDRResult": "slop_detector.models",
+    "InflationResult": "slop_detector.models",
+    "DDCResult": "slop_detector.models",
+    "FileAnalysis": "slop_detector.models",
+    "ProjectAnalysis": "slop_detector.models",
+    "PriorityHotspot": "slop_detector.models",
+    "IgnoredFunction": "slop_detector.models",
+    "SlopGate": "slop_detector.gate.slop_gate",
+    "SlopGateDecision": "slop_detector.gate.slop_gate",
+    "FixEngine": "slop_detector.autofix.engine",
+    "FixResult": "slop_detector.autofix.engine",
+    "MLScore": "slop_detector.ml.scorer",
+    "MLScorer": "slop_detector.ml.scorer",
+}
+# v2.8.0: optional ML surface should not hard-fail core imports.
+_OPTIONAL_EXPORTS = frozenset({"MLScore", "MLScorer"})
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(import_module(module_name), name)
+    except ImportError:  # pragma: no cover - optional dependency path
+        if name not in _OPTIONAL_EXPORTS:
+            raise
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
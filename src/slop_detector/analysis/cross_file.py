@@ -4,7 +4,8 @@ Cross-File Analysis Module
 Detects project-level slop patterns that single-file analysis misses:
 
 1. Slop Propagation  : file A imports from slop file B -> contamination flag
-2. Duplicate Code    : similar function bodies across files (Levenshtein ratio)
+2. Duplicate Code    : exact and near-duplicate function bodies across files
+                      (near duplicates via MinHash/LSH, see near_duplicates.py)
 3. Dead Exports      : defined in __all__ or exported but never imported elsewhere
 4. Import Cycles     : circular import detection via DFS
 5. Slop Hotspots     : files that are both heavily imported AND have high slop score
@@ -14,11 +15,14 @@ from __future__ import annotations
 
 import ast
 import hashlib
+from array import array
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, FrozenSet, List, Set, Tuple
 
+from slop_detector.analysis.near_duplicates import function_shingles, near_duplicate_pairs
+
 # ------------------------------------------------------------------
 # Data classes
 # ------------------------------------------------------------------
@@ -26,15 +30,17 @@ from typing import Dict, FrozenSet, List, Set, Tuple
 
 @dataclass
 class DuplicateBlock:
-    """Two code blocks that are exact cross-file duplicates."""
+    """Two functions in different files that are exact or near duplicates."""
 
     file_a: str
     file_b: str
     func_a: str
     func_b: str
-    similarity: float  # 0.0-1.0
+    similarity: float  # 0.0-1.0 (Jaccard of normalized token shingles; 1.0 if exact)
     line_a: int
     line_b: int
+    # Identical syntax trees (docstrings aside); near duplicates may reach 1.0 without it.
+    exact: bool = False
 
 
 @dataclass
@@ -94,6 +100,7 @@ class CrossFileReport:
                     "func_b": d.func_b,
                     "line_b": d.line_b,
                     "similarity": d.similarity,
+                    "exact": d.exact,
                 }
                 for d in self.duplicates
             ],
@@ -146,41 +153,19 @@ def _hash_function_body(func_node: ast.AST) -> str:
     return hashlib.sha256("\n".join(body_lines).encode()).hexdigest()
 
 
-def _extract_functions(tree: ast.AST) -> List[Tuple[str, int, str]]:
+def _extract_functions(tree: ast.AST) -> List[Tuple[str, int, str, array]]:
     """
-    Extract (func_name, line_no, body_hash) from AST.
+    Extract (func_name, line_no, body_hash, shingles) from AST.
     Body hash: sha256 of normalized function body lines.
+    Shingles: normalized token shingle hashes for near-duplicate detection.
     """
     return [
-        (node.name, node.lineno, _hash_function_body(node))
+        (node.name, node.lineno, _hash_function_body(node), function_shingles(node))
         for node in ast.walk(tree)
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
     ]
 
 
-def _levenshtein_ratio(a: str, b: str) -> float:
-    """Approximate similarity ratio using edit distance."""
-    if a == b:
-        return 1.0
-    la, lb = len(a), len(b)
-    if la == 0 or lb == 0:
-        return 0.0
-    # Quick length filter
-    if max(la, lb) / max(min(la, lb), 1) > 3:
-        return 0.0
-    # Full DP for short strings only
-    if la > 200 or lb > 200:
-        return 1.0 if a[:100] == b[:100] else 0.0
-    dp = list(range(lb + 1))
-    for i, ca in enumerate(a, 1):
-        new_dp = [i]
-        for j, cb in enumerate(b, 1):
-            new_dp.append(min(dp[j] + 1, new_dp[-1] + 1, dp[j - 1] + (0 if ca == cb else 1)))
-        dp = new_dp
-    dist = dp[lb]
-    return round(1.0 - dist / max(la, lb), 4)
-
-
 # ------------------------------------------------------------------
 # Analyzer
 # ------------------------------------------------------------------
@@ -196,6 +181,7 @@ class CrossFileAnalyzer:
     """
 
     DUPLICATE_THRESHOLD = 0.85  # similarity >= this -> duplicate
+    MAX_DUPLICATES = 50  # duplicate pairs reported, exact matches first
     HOTSPOT_SLOP_THRESHOLD = 40.0  # slop_score >= this -> hotspot candidate
     HOTSPOT_IMPORT_MIN = 2  # imported by >= this many files
 
@@ -228,7 +214,7 @@ class CrossFileAnalyzer:
         # Build import graph
         import_graph: Dict[str, Set[str]] = {}
         tree_cache: Dict[str, ast.AST] = {}
-        func_cache: Dict[str, List[Tuple[str, int, str]]] = {}
+        func_cache: Dict[str, List[Tuple[str, int, str, array]]] = {}
 
         for fpath in py_files:
             try:
@@ -299,7 +285,7 @@ class CrossFileAnalyzer:
         self,
         hash_index: Dict[str, List[Tuple[str, str, int]]],
     ) -> List[DuplicateBlock]:
-        """Build DuplicateBlock list from exact-match hash groups (cap 50)."""
+        """Build DuplicateBlock list from exact-match hash groups (cap MAX_DUPLICATES)."""
         duplicates: List[DuplicateBlock] = []
         seen_pairs: Set[FrozenSet] = set()
         for entries in hash_index.values():
@@ -324,24 +310,69 @@ class CrossFileAnalyzer:
                             func_b=nb,
                             line_b=lb,
                             similarity=1.0,
+                            exact=True,
                         )
                     )
-                    if len(duplicates) >= 50:
+                    if len(duplicates) >= self.MAX_DUPLICATES:
                         return duplicates
         return duplicates
 
     def _detect_duplicates(
         self,
-        func_cache: Dict[str, List[Tuple[str, int, str]]],
+        func_cache: Dict[str, List[Tuple[str, int, str, array]]],
         py_files: List[Path],
     ) -> List[DuplicateBlock]:
-        """Detect exact duplicate functions across files."""
+        """Detect exact, then near-duplicate functions across files."""
         hash_index: Dict[str, List[Tuple[str, str, int]]] = defaultdict(list)
         for fpath, funcs in func_cache.items():
-            for fname, lineno, bhash in funcs:
+            for fname, lineno, bhash, _ in funcs:
                 if bhash:
                     hash_index[bhash].append((fpath, fname, lineno))
-        return self._build_exact_duplicate_pairs(hash_index)
+        duplicates = self._build_exact_duplicate_pairs(hash_index)
+        if len(duplicates) < self.MAX_DUPLICATES:
+            duplicates.extend(self._build_near_duplicate_pairs(func_cache, duplicates))
+        return duplicates
+
+    def _build_near_duplicate_pairs(
+        self,
+        func_cache: Dict[str, List[Tuple[str, int, str, array]]],
+        exact: List[DuplicateBlock],
+    ) -> List[DuplicateBlock]:
+        """Near-duplicate pairs not already reported as exact, most similar first."""
+        entries = [
+            (fpath, fname, lineno, shingles)
+            for fpath, funcs in func_cache.items()
+            for fname, lineno, _, shingles in funcs
+        ]
+        reported = {
+            frozenset({(d.file_a, d.func_a, d.line_a), (d.file_b, d.func_b, d.line_b)})
+            for d in exact
+        }
+        duplicates: List[DuplicateBlock] = []
+        pairs = near_duplicate_pairs(
+            [entry[3] for entry in entries],
+            self.DUPLICATE_THRESHOLD,
+            groups=[entry[0] for entry in entries],
+        )
+        for i, j, similarity in pairs:
+            fa, na, la, _ = entries[i]
+            fb, nb, lb, _ = entries[j]
+            if frozenset({(fa, na, la), (fb, nb, lb)}) in reported:
+                continue
+            duplicates.append(
+                DuplicateBlock(
+                    file_a=fa,
+                    func_a=na,
+                    line_a=la,
+                    file_b=fb,
+                    func_b=nb,
+                    line_b=lb,
+                    similarity=similarity,
+                )
+            )
+            if len(exact) + len(duplicates) >= self.MAX_DUPLICATES:
+                break
+        return duplicates
 
     def _detect_hotspots(
         self,
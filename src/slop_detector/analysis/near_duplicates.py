@@ -0,0 +1,221 @@
+"""
+Near-Duplicate Function Detection (MinHash + banded LSH)
+
+Finds pairs of functions whose normalized token shingles overlap heavily,
+without comparing every pair:
+
+1. Tokens      : pre-order AST walk; locals and arguments renamed as in the
+                 exact-duplicate pattern, literals reduced to their type,
+                 docstrings dropped
+2. Shingles    : hashes of every run of _SHINGLE_TOKENS consecutive tokens
+3. Signature   : one-permutation MinHash with rotation densification
+                 (_BANDS x _BAND_ROWS slots, one hash per shingle)
+4. LSH         : functions sharing all rows of at least _MIN_SHARED_BANDS
+                 bands become candidates
+5. Verification: exact Jaccard similarity of the candidates' shingle sets
+
+Work is linear in the number of shingles plus the candidate pairs, and each
+bucket only pairs a member with its _BUCKET_WINDOW nearest neighbours by
+shingle count. With 20 bands of 6 rows and two shared bands required, a
+pair at Jaccard 0.85 becomes a candidate with probability about 0.999, a
+pair at 0.95 almost surely, and a pair at 0.5 with about 0.04.
+"""
+
+from __future__ import annotations
+
+import ast
+import operator
+import zlib
+from array import array
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Hashable, List, Optional, Sequence, Set, Tuple, Union
+
+_SHINGLE_TOKENS = 5
+_BANDS = 20
+_BAND_ROWS = 6
+_SLOTS = _BANDS * _BAND_ROWS
+_MIN_SHARED_BANDS = 2
+# Functions with fewer shingles are too small for a similarity score to mean much.
+_MIN_SHINGLES = 24
+# Bucket members are sorted by shingle count and paired with this many successors.
+_BUCKET_WINDOW = 32
+
+_MASK64 = (1 << 64) - 1
+_EMPTY = 1 << 64
+_GOLDEN = 0x9E3779B97F4A7C15
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_id(token: str) -> int:
+    # str hashes are salted per process; CRC-32 keeps signatures reproducible.
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def _arguments(func: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> List[str]:
+    args = func.args
+    names = [arg.arg for arg in (*args.posonlyargs, *args.args, *args.kwonlyargs)]
+    names.extend(arg.arg for arg in (args.vararg, args.kwarg) if arg is not None)
+    return names
+
+
+def function_tokens(func: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> List[int]:
+    """Token ids of a function in pre-order, with local names normalized.
+
+    Arguments become ``a<n>`` and other assigned names ``v<n>`` (numbered in
+    order of first appearance), as in the exact-duplicate pattern's
+    renaming; attribute and global names are kept. One walk records where
+    each name occurs, and names are resolved once the locals are known.
+    """
+    tokens: List[int] = []
+    occurrences: List[Tuple[int, str]] = []
+    assigned: Set[str] = set()
+    stack: List[ast.AST] = [func]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.expr_context):
+            continue
+        if (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        ):
+            continue
+        tokens.append(_token_id(type(node).__name__))
+        if isinstance(node, ast.Name):
+            occurrences.append((len(tokens), node.id))
+            tokens.append(0)
+            if not isinstance(node.ctx, ast.Load):
+                assigned.add(node.id)
+        elif isinstance(node, ast.arg):
+            occurrences.append((len(tokens), node.arg))
+            tokens.append(0)
+            assigned.add(node.arg)
+        elif isinstance(node, ast.Attribute):
+            tokens.append(_token_id(node.attr))
+        elif isinstance(node, ast.Constant):
+            tokens.append(_token_id(type(node.value).__name__))
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            occurrences.append((len(tokens), node.name))
+            tokens.append(0)
+            assigned.add(node.name)
+        children: List[ast.AST] = []
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, ast.AST):
+                children.append(value)
+            elif isinstance(value, list):
+                children.extend(item for item in value if isinstance(item, ast.AST))
+        stack.extend(reversed(children))
+
+    labels = {name: f"a{index}" for index, name in enumerate(_arguments(func))}
+    local_count = 0
+    for position, name in occurrences:
+        label = labels.get(name)
+        if label is None:
+            label = name
+            if name in assigned:
+                label = f"v{local_count}"
+                local_count += 1
+            labels[name] = label
+        tokens[position] = _token_id(label)
+    return tokens
+
+
+def function_shingles(func: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> array:
+    """Sorted, distinct shingle hashes of a function's normalized tokens."""
+    tokens = function_tokens(func)
+    width = min(_SHINGLE_TOKENS, len(tokens))
+    # Tuples of ints hash deterministically (and well mixed), unlike str.
+    shingles = set(map(hash, zip(*(tokens[offset:] for offset in range(width)))))
+    return array("q", sorted(shingles))
+
+
+def _signature(shingles: Sequence[int]) -> List[int]:
+    """One-permutation MinHash: each shingle lands in one slot, which keeps its minimum.
+
+    An empty slot borrows the value of the next non-empty slot, tagged with
+    the distance (rotation densification), so two sets agree on a slot with
+    probability close to their Jaccard similarity.
+    """
+    slots = [_EMPTY] * _SLOTS
+    for shingle in shingles:
+        value = shingle & _MASK64
+        # Multiply-shift maps the (already well mixed) value onto a slot.
+        slot = ((((value * _GOLDEN) & _MASK64) >> 32) * _SLOTS) >> 32
+        if value < slots[slot]:
+            slots[slot] = value
+    signature = list(slots)
+    for slot in range(_SLOTS):
+        if slots[slot] != _EMPTY:
+            continue
+        distance = 1
+        while slots[(slot + distance) % _SLOTS] == _EMPTY:
+            distance += 1
+        signature[slot] = slots[(slot + distance) % _SLOTS] + distance * _EMPTY
+    return signature
+
+
+def _band_keys(shingles: Sequence[int]) -> array:
+    signature = _signature(shingles)
+    return array(
+        "q",
+        (
+            hash(tuple(signature[start : start + _BAND_ROWS]))
+            for start in range(0, _SLOTS, _BAND_ROWS)
+        ),
+    )
+
+
+def _jaccard(left: Sequence[int], right: Sequence[int]) -> float:
+    shared = len(set(left).intersection(right))
+    return shared / (len(left) + len(right) - shared)
+
+
+def near_duplicate_pairs(
+    shingle_sets: Sequence[Sequence[int]],
+    threshold: float,
+    groups: Optional[Sequence[Hashable]] = None,
+) -> List[Tuple[int, int, float]]:
+    """Pairs ``(i, j, similarity)`` whose shingle Jaccard similarity is >= ``threshold``.
+
+    ``shingle_sets`` are distinct shingle hashes per function (see
+    ``function_shingles``); sets with fewer than _MIN_SHINGLES entries are
+    skipped. Pairs within the same ``groups`` value (e.g. the same file) are
+    not reported. Results have ``i < j`` and are sorted by descending
+    similarity, then by index. LSH may miss a pair (see the module
+    docstring), but every reported similarity is exact.
+    """
+    indices = [i for i, shingles in enumerate(shingle_sets) if len(shingles) >= _MIN_SHINGLES]
+    keys = {i: _band_keys(shingle_sets[i]) for i in indices}
+
+    candidates: Set[Tuple[int, int]] = set()
+    for band in range(_BANDS):
+        buckets: Dict[int, List[int]] = defaultdict(list)
+        for i in indices:
+            buckets[keys[i][band]].append(i)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            members.sort(key=lambda i: len(shingle_sets[i]))
+            for position, i in enumerate(members):
+                for j in members[position + 1 : position + 1 + _BUCKET_WINDOW]:
+                    # Jaccard similarity is at most the ratio of the set sizes.
+                    if len(shingle_sets[i]) < threshold * len(shingle_sets[j]):
+                        break
+                    if groups is not None and groups[i] == groups[j]:
+                        continue
+                    pair = (i, j) if i < j else (j, i)
+                    if pair in candidates:
+                        continue
+                    # Pairs sharing a single band are mostly chance collisions.
+                    if sum(map(operator.eq, keys[i], keys[j])) >= _MIN_SHARED_BANDS:
+                        candidates.add(pair)
+
+    pairs = []
+    for i, j in candidates:
+        similarity = _jaccard(shingle_sets[i], shingle_sets[j])
+        if similarity >= threshold:
+            pairs.append((i, j, round(similarity, 4)))
+    pairs.sort(key=lambda pair: (-pair[2], pair[0], pair[1]))
+    return pairs
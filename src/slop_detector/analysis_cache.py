@@ -1,14 +1,33 @@
-"""SQLite-backed repeated-run cache for Python file analysis."""
+"""SQLite-backed repeated-run cache for Python, JS/TS and Go file analysis."""
 
 from __future__ import annotations
 
 import json
+import logging
+import marshal
+import math
+import os
 import sqlite3
+import threading
+import time
+import zlib
 from contextlib import contextmanager
 from dataclasses import asdict, is_dataclass
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 from slop_detector.metrics.context_jargon import ContextJargonResult, JargonEvidence
 from slop_detector.metrics.docstring_inflation import (
@@ -32,27 +51,171 @@ from slop_detector.models import (
     SuppressionLedgerEntry,
 )
 from slop_detector.patterns.base import Axis, Issue, Severity
+from slop_detector.patterns.python_imports import import_environment_key
+
+logger = logging.getLogger(__name__)
 
-CACHE_ENGINE_VERSION = "analysis-cache-v11"
+CACHE_ENGINE_VERSION = "analysis-cache-v12"
 DEFAULT_CACHE_DB = Path.home() / ".slop-detector" / "analysis_cache.db"
+# Execution-only settings that never change a file's analysis result.
+_EXECUTION_ONLY_ADVANCED_KEYS = frozenset(
+    {
+        "max_workers",
+        "retain_code_snippets",
+        "analysis_cache_enabled",
+        "analysis_cache_db",
+        "analysis_cache_trust",
+        "analysis_cache_verify_rate",
+        "analysis_cache_max_mb",
+        "analysis_cache_max_entries",
+        "coherence_rebuild_fraction",
+    }
+)
+# Seconds a write waits for another connection's lock before it is dropped.
+_BUSY_TIMEOUT_S = 5.0
+# Paths per prefetch query; stays under SQLite's default bound-parameter limit.
+_PREFETCH_BATCH = 500
+# Buffered session writes are committed in transactions of this many rows.
+_MAX_PENDING_PUTS = 500
+# Rows written before inodes were recorded; they never satisfy a stat lookup.
+_UNKNOWN_INODE = -1
+# Rows deleted per eviction transaction, so a running scan's writes interleave.
+_EVICTION_BATCH = 500
+# Once over a limit, eviction continues down to this fraction of it.
+_EVICTION_TARGET = 0.9
+# Project aggregates kept per kind; writing one drops the least recently used beyond it.
+_AGGREGATES_PER_KIND = 16
+# Cache bundles: format version, and the placeholder path their results report.
+_BUNDLE_FORMAT = "1"
+_BUNDLE_PATH = "<bundle>"
+
+# How a file result was obtained, reported per project scan.
+CACHE_TIER_STAT = "stat"  # size, mtime and inode matched; file not read
+CACHE_TIER_HASH = "hash"  # content hash matched
+CACHE_TIER_CONTENT = "content"  # identical content cached under another path
+CACHE_TIER_STAGES = "stages"  # rebuilt from per-stage entries; only stale stages reran
+CACHE_TIER_FUNCTIONS = "functions"  # edited; unchanged definitions reused from the last version
+CACHE_TIER_VERIFIED = "verified"  # stat hit sampled for re-hashing, content matched
+CACHE_TIER_STALE = "stale"  # stat hit sampled for re-hashing, content differed
+CACHE_TIER_MISS = "miss"  # analyzed and stored
+CACHE_TIERS = (
+    CACHE_TIER_STAT,
+    CACHE_TIER_HASH,
+    CACHE_TIER_CONTENT,
+    CACHE_TIER_STAGES,
+    CACHE_TIER_FUNCTIONS,
+    CACHE_TIER_VERIFIED,
+    CACHE_TIER_STALE,
+    CACHE_TIER_MISS,
+)
+# Tiers that served a whole cached result without analyzing the file.
+CACHE_HIT_TIERS = frozenset(
+    {CACHE_TIER_STAT, CACHE_TIER_HASH, CACHE_TIER_CONTENT, CACHE_TIER_VERIFIED}
+)
+# Languages whose analyzers' results ``get_language`` / ``put_language`` store.
+CACHED_LANGUAGES = ("javascript", "go")
+
+# Payload codecs for the ``result_json`` column. Rows of either codec are read
+# back whatever the cache writes, so switching never invalidates the cache.
+CODEC_JSON = "json"  # canonical JSON text, as written before binary payloads
+CODEC_BINARY = "binary"  # schema-tagged, zlib-compressed marshal blob
+# Binary payload header: magic, then the schema version of the body layout.
+_BINARY_MAGIC = b"SLFA"
+_BINARY_SCHEMA_VERSION = 1
+_BINARY_HEADER = _BINARY_MAGIC + bytes([_BINARY_SCHEMA_VERSION])
+# Binary bodies store issues as tuples in this order instead of dicts.
+_ISSUE_FIELDS = (
+    "pattern_id",
+    "severity",
+    "axis",
+    "file",
+    "line",
+    "column",
+    "message",
+    "code",
+    "suggestion",
+)
 
 
 class FileAnalysisCache:
-    """Persistent cache keyed by path, file metadata, and analyzer/config fingerprint."""
+    """Persistent cache keyed by path, file metadata, and analyzer/config fingerprint.
+
+    Each thread keeps one open WAL-mode connection for the life of the cache.
+    Project scans wrap their files in ``session()``, which loads the rows for
+    those files up front and writes new results in batched transactions.
 
-    def __init__(self, db_path: str | Path | None = None) -> None:
+    Rows are also indexed by content: ``get_by_content`` serves a file from
+    the row of any other path with the same content hash and path role, so
+    checkouts, worktrees and renamed files reuse one analysis.
+
+    ``export_bundle`` writes the content-addressed part of the cache (results
+    and stage entries, without paths) to a portable file; ``import_bundle``
+    merges one into ``file_analysis_content``, which ``get_by_content`` also
+    reads. A fresh CI runner seeded from the main branch's bundle only
+    analyzes the files that differ.
+
+    Alongside whole results, ``put_stages`` keeps the per-stage entries of each
+    content (see ``core_stages``), so a config change reruns only the stages
+    that read the changed keys. ``get_previous_stages`` finds the entries of
+    the content a path held when it was last analyzed, whose per-definition
+    findings an edited file reuses for its unchanged functions and classes.
+
+    JS/TS and Go results live in ``language_analysis_cache``, addressed by
+    content hash, language and the analyzer's ``cache_key`` (mode, thresholds
+    and path-derived inputs) alone, so any path with that content is served.
+    Their lookups are counted per language.
+
+    ``put_aggregate`` keeps project-level results (structural coherence,
+    git churn, hotspot rankings) under a digest of their inputs, so a rescan
+    of an unchanged project skips recomputing them.
+
+    Every hit refreshes the row's last-access time. With ``max_bytes`` or
+    ``max_entries`` set, ``evict()`` drops least recently used rows once the
+    database outgrows either limit; a zero or ``None`` limit is unbounded.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        codec: str = CODEC_BINARY,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
         self.db_path = Path(db_path) if db_path else DEFAULT_CACHE_DB
+        self.codec = codec
+        self.max_bytes = max_bytes or 0
+        self.max_entries = max_entries or 0
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Connections and session state are per thread: sqlite3 connections
+        # must not be shared, and the API server runs requests on a pool.
+        self._local = threading.local()
+        self._eviction_lock = threading.Lock()
+        self._eviction_thread: Optional[threading.Thread] = None
         self._init_db()
 
+    def _connection(self) -> sqlite3.Connection:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=_BUSY_TIMEOUT_S)
+            # WAL lets worker processes read while another one commits.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
     @contextmanager
     def _conn(self) -> Iterator[sqlite3.Connection]:
-        conn = sqlite3.connect(self.db_path)
-        try:
+        conn = self._connection()
+        with conn:
             yield conn
-            conn.commit()
-        finally:
+
+    def close(self) -> None:
+        """Flush pending writes and close this thread's connection."""
+        self._flush()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
             conn.close()
+            self._local.conn = None
 
     def _init_db(self) -> None:
         with self._conn() as conn:
@@ -65,11 +228,238 @@ class FileAnalysisCache:
                     sha256 TEXT NOT NULL,
                     engine_version TEXT NOT NULL,
                     config_fingerprint TEXT NOT NULL,
-                    result_json TEXT NOT NULL
+                    result_json TEXT NOT NULL,
+                    inode INTEGER NOT NULL DEFAULT -1
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(file_analysis_cache)")}
+            if "inode" not in columns:
+                conn.execute(
+                    "ALTER TABLE file_analysis_cache "
+                    f"ADD COLUMN inode INTEGER NOT NULL DEFAULT {_UNKNOWN_INODE}"
+                )
+            if "last_access" not in columns:
+                # Rows from before access tracking count as the least recent.
+                conn.execute(
+                    "ALTER TABLE file_analysis_cache "
+                    "ADD COLUMN last_access INTEGER NOT NULL DEFAULT 0"
+                )
+            if "path_role" not in columns:
+                # Rows without a path role are never served to other paths.
+                conn.execute(
+                    "ALTER TABLE file_analysis_cache "
+                    "ADD COLUMN path_role TEXT NOT NULL DEFAULT ''"
+                )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS file_analysis_cache_last_access "
+                "ON file_analysis_cache(last_access)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS file_analysis_cache_content "
+                "ON file_analysis_cache(sha256, engine_version, config_fingerprint, path_role)"
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_analysis_stages (
+                    sha256 TEXT NOT NULL,
+                    path_role TEXT NOT NULL,
+                    engine_version TEXT NOT NULL,
+                    stages BLOB NOT NULL,
+                    PRIMARY KEY (sha256, path_role, engine_version)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_analysis_content (
+                    sha256 TEXT NOT NULL,
+                    path_role TEXT NOT NULL,
+                    engine_version TEXT NOT NULL,
+                    config_fingerprint TEXT NOT NULL,
+                    result_json BLOB NOT NULL,
+                    last_access INTEGER NOT NULL DEFAULT 0,
+                    environment TEXT NOT NULL DEFAULT '',
+                    PRIMARY KEY (sha256, path_role, engine_version, config_fingerprint)
+                )
+                """
+            )
+            content_columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(file_analysis_content)")
+            }
+            if "last_access" not in content_columns:
+                # Entries imported before access tracking count as the least recent.
+                conn.execute(
+                    "ALTER TABLE file_analysis_content "
+                    "ADD COLUMN last_access INTEGER NOT NULL DEFAULT 0"
+                )
+            if "environment" not in content_columns:
+                # Entries of an unknown environment are never served.
+                conn.execute(
+                    "ALTER TABLE file_analysis_content "
+                    "ADD COLUMN environment TEXT NOT NULL DEFAULT ''"
+                )
+            # A path's new content supersedes the stage entries of its old
+            # content, which no lookup reaches once no other row refers to it.
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS file_analysis_cache_replaced_content
+                AFTER UPDATE OF sha256 ON file_analysis_cache
+                WHEN OLD.sha256 != NEW.sha256
+                BEGIN
+                    DELETE FROM file_analysis_stages
+                    WHERE sha256 = OLD.sha256 AND path_role = OLD.path_role
+                      AND NOT EXISTS (
+                          SELECT 1 FROM file_analysis_cache
+                          WHERE sha256 = OLD.sha256 AND path_role = OLD.path_role
+                      )
+                      AND NOT EXISTS (
+                          SELECT 1 FROM file_analysis_content
+                          WHERE sha256 = OLD.sha256 AND path_role = OLD.path_role
+                      );
+                END
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS language_analysis_cache (
+                    sha256 TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    analyzer_key TEXT NOT NULL,
+                    engine_version TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    last_access INTEGER NOT NULL,
+                    PRIMARY KEY (sha256, language, analyzer_key)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS project_aggregates (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    engine_version TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    last_access INTEGER NOT NULL,
+                    PRIMARY KEY (kind, key)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_analysis_cache_stats (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
                 )
                 """
             )
 
+    @contextmanager
+    def session(
+        self,
+        file_paths: Iterable[str],
+        config_fingerprint: str,
+        engine_version: str = CACHE_ENGINE_VERSION,
+    ) -> Iterator[None]:
+        """Prefetch the rows for ``file_paths`` and batch ``put`` calls until exit.
+
+        Lookups for the given paths are answered from memory, and new results
+        are written in one transaction per ``_MAX_PENDING_PUTS`` rows, the last
+        on exit. Paths must be resolved, as ``analyze_file`` stores them.
+        """
+        paths = list(file_paths)
+        self._local.prefetched = self._fetch_rows(paths, config_fingerprint, engine_version)
+        self._local.prefetched_paths = set(paths)
+        self._local.pending = []
+        self._local.pending_stages = []
+        self._local.pending_languages = []
+        self._local.touched = []
+        self._local.touched_languages = []
+        self._local.touched_contents = []
+        self._local.lookups = [0, 0]
+        self._local.language_lookups = {}
+        try:
+            yield
+        finally:
+            self._local.prefetched = None
+            self._local.prefetched_paths = None
+            self._flush()
+            self._local.pending = None
+            self._local.pending_stages = None
+            self._local.pending_languages = None
+            self._local.touched = None
+            self._local.touched_languages = None
+            self._local.touched_contents = None
+            self._local.lookups = None
+            self._local.language_lookups = None
+
+    def _fetch_rows(
+        self, file_paths: List[str], config_fingerprint: str, engine_version: str
+    ) -> Dict[str, Tuple[int, int, str, int, str]]:
+        rows: Dict[str, Tuple[int, int, str, int, str]] = {}
+        with self._conn() as conn:
+            for start in range(0, len(file_paths), _PREFETCH_BATCH):
+                batch = file_paths[start : start + _PREFETCH_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                for file_path, file_size, mtime_ns, content_hash, inode, payload in conn.execute(
+                    f"""
+                    SELECT file_path, file_size, mtime_ns, sha256, inode, result_json
+                    FROM file_analysis_cache
+                    WHERE engine_version = ?
+                      AND config_fingerprint = ?
+                      AND file_path IN ({placeholders})
+                    """,
+                    (engine_version, config_fingerprint, *batch),
+                ):
+                    rows[file_path] = (file_size, mtime_ns, content_hash, inode, payload)
+        return rows
+
+    def get_by_stat(
+        self,
+        file_path: str,
+        file_size: int,
+        mtime_ns: int,
+        inode: int,
+        config_fingerprint: str,
+        engine_version: str = CACHE_ENGINE_VERSION,
+    ) -> Optional[Tuple[FileAnalysis, str]]:
+        """Return the cached result and its content hash when file metadata matches.
+
+        Trusts size, mtime and inode without reading the file. On a mismatch
+        the prefetched row is kept for the content-hash lookup that follows.
+        """
+        key = (file_size, mtime_ns, inode)
+        prefetched_paths = getattr(self._local, "prefetched_paths", None)
+        if prefetched_paths is not None and file_path in prefetched_paths:
+            row = self._local.prefetched.get(file_path)
+            if row is None or (row[0], row[1], row[3]) != key:
+                return None
+            del self._local.prefetched[file_path]
+            restored = _decode_row(file_path, row[4])
+            if restored is None:
+                return None
+            self._record_lookup(file_path, hit=True)
+            return restored, row[2]
+        with self._conn() as conn:
+            found = conn.execute(
+                """
+                SELECT result_json, sha256
+                FROM file_analysis_cache
+                WHERE file_path = ?
+                  AND file_size = ?
+                  AND mtime_ns = ?
+                  AND inode = ?
+                  AND engine_version = ?
+                  AND config_fingerprint = ?
+                """,
+                (file_path, file_size, mtime_ns, inode, engine_version, config_fingerprint),
+            ).fetchone()
+        restored = None if found is None else _decode_row(file_path, found[0])
+        if restored is None:
+            return None
+        self._record_lookup(file_path, hit=True)
+        return restored, found[1]
+
     def get(
         self,
         file_path: str,
@@ -79,8 +469,19 @@ class FileAnalysisCache:
         config_fingerprint: str,
         engine_version: str = CACHE_ENGINE_VERSION,
     ) -> Optional[FileAnalysis]:
+        prefetched_paths = getattr(self._local, "prefetched_paths", None)
+        if prefetched_paths is not None and file_path in prefetched_paths:
+            # Rows were prefetched for this session's fingerprint and engine.
+            row = self._local.prefetched.pop(file_path, None)
+            restored = (
+                None
+                if row is None or row[:3] != (file_size, mtime_ns, content_hash)
+                else _decode_row(file_path, row[4])
+            )
+            self._record_lookup(file_path, hit=restored is not None)
+            return restored
         with self._conn() as conn:
-            row = conn.execute(
+            found = conn.execute(
                 """
                 SELECT result_json
                 FROM file_analysis_cache
@@ -93,9 +494,71 @@ class FileAnalysisCache:
                 """,
                 (file_path, file_size, mtime_ns, content_hash, engine_version, config_fingerprint),
             ).fetchone()
-        if row is None:
+        restored = None if found is None else _decode_row(file_path, found[0])
+        self._record_lookup(file_path, hit=restored is not None)
+        return restored
+
+    def get_by_content(
+        self,
+        file_path: str,
+        content_hash: str,
+        path_role: str,
+        config_fingerprint: str,
+        engine_version: str = CACHE_ENGINE_VERSION,
+    ) -> Optional[FileAnalysis]:
+        """Return another path's cached result for identical content, rebound to ``file_path``.
+
+        ``path_role`` must capture every path-derived input of the analysis,
+        so that only the reported paths differ between the two files. Meant to
+        follow a ``get`` miss for the same file: a hit replaces that miss in
+        the lookup counters.
+        """
+        if not path_role:
+            return None
+        with self._conn() as conn:
+            found = conn.execute(
+                """
+                SELECT file_path, result_json
+                FROM file_analysis_cache
+                WHERE sha256 = ?
+                  AND engine_version = ?
+                  AND config_fingerprint = ?
+                  AND path_role = ?
+                ORDER BY last_access DESC
+                LIMIT 1
+                """,
+                (content_hash, engine_version, config_fingerprint, path_role),
+            ).fetchone()
+            if found is None:
+                found = conn.execute(
+                    """
+                    SELECT ?, result_json
+                    FROM file_analysis_content
+                    WHERE sha256 = ?
+                      AND path_role = ?
+                      AND engine_version = ?
+                      AND config_fingerprint = ?
+                      AND environment = ?
+                    """,
+                    (
+                        _BUNDLE_PATH,
+                        content_hash,
+                        path_role,
+                        engine_version,
+                        config_fingerprint,
+                        import_environment_key(),
+                    ),
+                ).fetchone()
+        restored = None if found is None else _decode_row(found[0], found[1])
+        if restored is None:
             return None
-        return deserialize_file_analysis(row[0])
+        if found[0] == _BUNDLE_PATH:
+            self._record_content_lookup(
+                (content_hash, path_role, engine_version, config_fingerprint)
+            )
+        else:
+            self._record_lookup(found[0], hit=True, replaces_miss=True)
+        return rebind_file_analysis(restored, file_path)
 
     def put(
         self,
@@ -106,33 +569,842 @@ class FileAnalysisCache:
         config_fingerprint: str,
         result: FileAnalysis,
         engine_version: str = CACHE_ENGINE_VERSION,
+        inode: int = _UNKNOWN_INODE,
+        path_role: str = "",
     ) -> None:
-        payload = serialize_file_analysis(result)
+        row = (
+            file_path,
+            file_size,
+            mtime_ns,
+            content_hash,
+            engine_version,
+            config_fingerprint,
+            (
+                encode_file_analysis(result)
+                if self.codec == CODEC_BINARY
+                else serialize_file_analysis(result)
+            ),
+            inode,
+            int(time.time()),
+            path_role,
+        )
+        pending: Optional[List[Tuple[Any, ...]]] = getattr(self._local, "pending", None)
+        if pending is None:
+            self._write(rows=[row])
+            return
+        pending.append(row)
+        if len(pending) >= _MAX_PENDING_PUTS:
+            self._flush()
+
+    def get_stages(
+        self, content_hash: str, path_role: str, engine_version: str = CACHE_ENGINE_VERSION
+    ) -> Optional[Dict[str, Tuple[str, Any]]]:
+        """Return the cached stage entries for this content and path role, if any.
+
+        Entries map a stage name to ``(config fingerprint, payload)``; callers
+        decide which entries still match their config.
+        """
+        if not path_role:
+            return None
+        with self._conn() as conn:
+            found = conn.execute(
+                """
+                SELECT stages FROM file_analysis_stages
+                WHERE sha256 = ? AND path_role = ? AND engine_version = ?
+                """,
+                (content_hash, path_role, engine_version),
+            ).fetchone()
+        if found is None:
+            return None
+        try:
+            return cast(Dict[str, Tuple[str, Any]], marshal.loads(zlib.decompress(found[0])))
+        except (ValueError, TypeError, EOFError, zlib.error) as exc:
+            logger.debug("Ignoring unreadable stage cache entry for %s: %s", content_hash, exc)
+            return None
+
+    def get_previous_stages(
+        self, file_path: str, path_role: str, engine_version: str = CACHE_ENGINE_VERSION
+    ) -> Optional[Dict[str, Tuple[str, Any]]]:
+        """Return the stage entries of the content ``file_path`` had when last cached."""
+        if not path_role:
+            return None
         with self._conn() as conn:
+            found = conn.execute(
+                """
+                SELECT sha256 FROM file_analysis_cache
+                WHERE file_path = ? AND path_role = ? AND engine_version = ?
+                """,
+                (file_path, path_role, engine_version),
+            ).fetchone()
+        if found is None:
+            return None
+        return self.get_stages(found[0], path_role, engine_version)
+
+    def put_stages(
+        self,
+        content_hash: str,
+        path_role: str,
+        stages: Dict[str, Tuple[str, Any]],
+        engine_version: str = CACHE_ENGINE_VERSION,
+    ) -> None:
+        """Replace the stage entries for this content and path role."""
+        if not path_role:
+            return
+        try:
+            blob = zlib.compress(marshal.dumps(stages), 1)
+        except ValueError:
+            # A payload marshal cannot store; the whole-result row still serves hits.
+            return
+        row = (content_hash, path_role, engine_version, blob)
+        pending: Optional[List[Tuple[Any, ...]]] = getattr(self._local, "pending_stages", None)
+        if pending is None:
+            self._write(stage_rows=[row])
+            return
+        pending.append(row)
+        if len(pending) >= _MAX_PENDING_PUTS:
+            self._flush()
+
+    def get_language(
+        self,
+        language: str,
+        file_path: str,
+        content_hash: str,
+        analyzer_key: str,
+        engine_version: str = CACHE_ENGINE_VERSION,
+    ) -> Optional[Any]:
+        """Return the cached JS/TS or Go result for this content, bound to ``file_path``."""
+        key = (content_hash, language, analyzer_key)
+        with self._conn() as conn:
+            found = conn.execute(
+                """
+                SELECT payload FROM language_analysis_cache
+                WHERE sha256 = ? AND language = ? AND analyzer_key = ? AND engine_version = ?
+                """,
+                (*key, engine_version),
+            ).fetchone()
+        restored = None
+        if found is not None:
+            try:
+                restored = decode_language_analysis(language, found[0], file_path)
+            except (ValueError, TypeError, EOFError, KeyError, zlib.error) as exc:
+                logger.debug(
+                    "Ignoring unreadable %s cache entry for %s: %s", language, file_path, exc
+                )
+        self._record_language_lookup(language, key, hit=restored is not None)
+        return restored
+
+    def put_language(
+        self,
+        language: str,
+        content_hash: str,
+        analyzer_key: str,
+        result: Any,
+        engine_version: str = CACHE_ENGINE_VERSION,
+    ) -> None:
+        """Store a JS/TS or Go result under its content hash and analyzer key."""
+        row = (
+            content_hash,
+            language,
+            analyzer_key,
+            engine_version,
+            encode_language_analysis(result),
+            int(time.time()),
+        )
+        pending: Optional[List[Tuple[Any, ...]]] = getattr(self._local, "pending_languages", None)
+        if pending is None:
+            self._write(language_rows=[row])
+            return
+        pending.append(row)
+        if len(pending) >= _MAX_PENDING_PUTS:
+            self._flush()
+
+    def get_aggregate(
+        self, kind: str, key: str, engine_version: str = CACHE_ENGINE_VERSION
+    ) -> Optional[Any]:
+        """Return the project aggregate of ``kind`` stored under ``key``, if any."""
+        with self._conn() as conn:
+            found = conn.execute(
+                """
+                SELECT payload FROM project_aggregates
+                WHERE kind = ? AND key = ? AND engine_version = ?
+                """,
+                (kind, key, engine_version),
+            ).fetchone()
+        if found is None:
+            return None
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "UPDATE project_aggregates SET last_access = ? WHERE kind = ? AND key = ?",
+                    (time.time_ns(), kind, key),
+                )
+        except sqlite3.Error as exc:
+            logger.debug("Could not refresh %s aggregate %s: %s", kind, key, exc)
+        try:
+            return marshal.loads(zlib.decompress(found[0]))
+        except (ValueError, TypeError, EOFError, zlib.error) as exc:
+            logger.debug("Ignoring unreadable %s aggregate %s: %s", kind, key, exc)
+            return None
+
+    def put_aggregate(
+        self, kind: str, key: str, payload: Any, engine_version: str = CACHE_ENGINE_VERSION
+    ) -> None:
+        """Store a marshal-able project aggregate of ``kind`` under ``key``.
+
+        Only the ``_AGGREGATES_PER_KIND`` most recently used aggregates of a
+        kind are kept, enough for a few projects and branches at once.
+        """
+        try:
+            blob = zlib.compress(marshal.dumps(payload), 1)
+        except ValueError:
+            return
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO project_aggregates (
+                        kind, key, engine_version, payload, last_access
+                    ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (kind, key, engine_version, blob, time.time_ns()),
+                )
+                conn.execute(
+                    """
+                    DELETE FROM project_aggregates
+                    WHERE kind = ? AND key NOT IN (
+                        SELECT key FROM project_aggregates WHERE kind = ?
+                        ORDER BY last_access DESC LIMIT ?
+                    )
+                    """,
+                    (kind, kind, _AGGREGATES_PER_KIND),
+                )
+        except sqlite3.Error as exc:
+            logger.warning(f"Analysis cache write failed, {kind} aggregate not cached: {exc}")
+
+    def export_bundle(
+        self, bundle_path: str | Path, config_fingerprint: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Write this engine version's content-addressed entries to a portable bundle.
+
+        The bundle is a standalone SQLite file holding one result per
+        content hash, path role and config fingerprint (only
+        ``config_fingerprint``'s when given), with every reported path
+        replaced by a placeholder, plus the stage entries of this engine
+        version. Rows without a path role are left out: they are never
+        served by content. The bundle records ``import_environment_key()``,
+        since phantom-import findings depend on the installed packages.
+        """
+        self._flush()
+        environment = import_environment_key()
+        bundle_path = Path(bundle_path)
+        partial = bundle_path.with_name(bundle_path.name + ".partial")
+        partial.unlink(missing_ok=True)
+        fingerprint_filter = "" if config_fingerprint is None else "AND config_fingerprint = ?"
+        params: Tuple[str, ...] = (CACHE_ENGINE_VERSION,)
+        if config_fingerprint is not None:
+            params += (config_fingerprint,)
+
+        entries: Dict[Tuple[str, str, str], bytes] = {}
+        with self._conn() as conn:
+            for content_hash, path_role, fingerprint, file_path, payload in conn.execute(
+                f"""
+                SELECT sha256, path_role, config_fingerprint, file_path, result_json
+                FROM file_analysis_cache
+                WHERE engine_version = ? AND path_role != '' {fingerprint_filter}
+                ORDER BY last_access DESC
+                """,
+                params,
+            ):
+                key = (content_hash, path_role, fingerprint)
+                if key in entries:
+                    continue
+                restored = _decode_row(file_path, payload)
+                if restored is not None:
+                    entries[key] = encode_file_analysis(
+                        rebind_file_analysis(restored, _BUNDLE_PATH)
+                    )
+            for content_hash, path_role, fingerprint, payload in conn.execute(
+                f"""
+                SELECT sha256, path_role, config_fingerprint, result_json
+                FROM file_analysis_content
+                WHERE engine_version = ? {fingerprint_filter} AND environment = ?
+                """,
+                (*params, environment),
+            ):
+                entries.setdefault((content_hash, path_role, fingerprint), payload)
+            stage_rows = conn.execute(
+                "SELECT sha256, path_role, stages FROM file_analysis_stages "
+                "WHERE engine_version = ?",
+                (CACHE_ENGINE_VERSION,),
+            ).fetchall()
+            language_rows = conn.execute(
+                "SELECT sha256, language, analyzer_key, payload FROM language_analysis_cache "
+                "WHERE engine_version = ?",
+                (CACHE_ENGINE_VERSION,),
+            ).fetchall()
+
+        bundle = sqlite3.connect(partial)
+        try:
+            with bundle:
+                bundle.execute("CREATE TABLE bundle_meta (name TEXT PRIMARY KEY, value TEXT)")
+                bundle.execute(
+                    """
+                    CREATE TABLE content_entries (
+                        sha256 TEXT NOT NULL,
+                        path_role TEXT NOT NULL,
+                        config_fingerprint TEXT NOT NULL,
+                        result_json BLOB NOT NULL
+                    )
+                    """
+                )
+                bundle.execute(
+                    """
+                    CREATE TABLE stage_entries (
+                        sha256 TEXT NOT NULL,
+                        path_role TEXT NOT NULL,
+                        stages BLOB NOT NULL
+                    )
+                    """
+                )
+                bundle.execute(
+                    """
+                    CREATE TABLE language_entries (
+                        sha256 TEXT NOT NULL,
+                        language TEXT NOT NULL,
+                        analyzer_key TEXT NOT NULL,
+                        payload BLOB NOT NULL
+                    )
+                    """
+                )
+                bundle.executemany(
+                    "INSERT INTO bundle_meta (name, value) VALUES (?, ?)",
+                    [
+                        ("format", _BUNDLE_FORMAT),
+                        ("engine_version", CACHE_ENGINE_VERSION),
+                        ("environment", environment),
+                    ],
+                )
+                bundle.executemany(
+                    "INSERT INTO content_entries VALUES (?, ?, ?, ?)",
+                    [(*key, payload) for key, payload in entries.items()],
+                )
+                bundle.executemany("INSERT INTO stage_entries VALUES (?, ?, ?)", stage_rows)
+                bundle.executemany(
+                    "INSERT INTO language_entries VALUES (?, ?, ?, ?)", language_rows
+                )
+        finally:
+            bundle.close()
+        os.replace(partial, bundle_path)
+        return {
+            "entries": len(entries),
+            "stage_entries": len(stage_rows),
+            "language_entries": len(language_rows),
+            "size_bytes": bundle_path.stat().st_size,
+        }
+
+    def import_bundle(self, bundle_path: str | Path) -> Dict[str, int]:
+        """Merge a bundle written by ``export_bundle`` into this cache.
+
+        Entries already present are kept, unless imported under another
+        environment. A bundle from another engine
+        version imports nothing, since none of its entries could hit. One
+        from another ``import_environment_key()`` imports only JS/TS and Go
+        results: its Python results and stages may not hold here.
+        Raises ``ValueError`` for a missing file or one that is not a bundle.
+        """
+        self._flush()
+        bundle_path = Path(bundle_path)
+        if not bundle_path.is_file():
+            raise ValueError(f"Cache bundle not found: {bundle_path}")
+        conn = self._connection()
+        conn.execute("ATTACH DATABASE ? AS bundle", (str(bundle_path),))
+        try:
+            try:
+                meta = dict(conn.execute("SELECT name, value FROM bundle.bundle_meta"))
+            except sqlite3.DatabaseError as exc:
+                raise ValueError(f"Not an analysis cache bundle: {bundle_path}") from exc
+            if meta.get("format") != _BUNDLE_FORMAT:
+                raise ValueError(f"Unsupported cache bundle format: {meta.get('format')}")
+            if meta.get("engine_version") != CACHE_ENGINE_VERSION:
+                return {"entries": 0, "stage_entries": 0, "language_entries": 0}
+            environment = import_environment_key()
+            same_environment = meta.get("environment") == environment
+            # Bundles written before JS/TS and Go caching have no such table.
+            has_languages = conn.execute(
+                "SELECT 1 FROM bundle.sqlite_master WHERE name = 'language_entries'"
+            ).fetchone()
+            with conn:
+                entries = stage_entries = 0
+                if same_environment:
+                    # Entries of an earlier environment are replaced; they no longer hit.
+                    entries = conn.execute(
+                        """
+                        INSERT INTO file_analysis_content (
+                            sha256, path_role, engine_version, config_fingerprint, result_json,
+                            last_access, environment
+                        )
+                        SELECT sha256, path_role, ?, config_fingerprint, result_json, ?, ?
+                        FROM bundle.content_entries WHERE true
+                        ON CONFLICT (sha256, path_role, engine_version, config_fingerprint)
+                        DO UPDATE SET
+                            result_json = excluded.result_json,
+                            last_access = excluded.last_access,
+                            environment = excluded.environment
+                        WHERE environment != excluded.environment
+                        """,
+                        (CACHE_ENGINE_VERSION, int(time.time()), environment),
+                    ).rowcount
+                    stage_entries = conn.execute(
+                        """
+                        INSERT OR IGNORE INTO file_analysis_stages (
+                            sha256, path_role, engine_version, stages
+                        )
+                        SELECT sha256, path_role, ?, stages FROM bundle.stage_entries
+                        """,
+                        (CACHE_ENGINE_VERSION,),
+                    ).rowcount
+                else:
+                    logger.warning(
+                        "Cache bundle comes from another Python environment; "
+                        "importing only its JS/TS and Go results"
+                    )
+                language_entries = 0
+                if has_languages:
+                    language_entries = conn.execute(
+                        """
+                        INSERT OR IGNORE INTO language_analysis_cache (
+                            sha256, language, analyzer_key, engine_version, payload, last_access
+                        )
+                        SELECT sha256, language, analyzer_key, ?, payload, ?
+                        FROM bundle.language_entries
+                        """,
+                        (CACHE_ENGINE_VERSION, int(time.time())),
+                    ).rowcount
+        finally:
+            conn.execute("DETACH DATABASE bundle")
+        return {
+            "entries": entries,
+            "stage_entries": stage_entries,
+            "language_entries": language_entries,
+        }
+
+    def _record_lookup(self, file_path: str, hit: bool, replaces_miss: bool = False) -> None:
+        """Count a lookup; a hit also refreshes the row's last-access time."""
+        misses = -1 if replaces_miss else int(not hit)
+        touched: Optional[List[str]] = getattr(self._local, "touched", None)
+        if touched is None:
+            self._write(touched=[file_path] if hit else [], hits=int(hit), misses=misses)
+            return
+        if hit:
+            touched.append(file_path)
+        self._local.lookups[0] += int(hit)
+        self._local.lookups[1] += misses
+
+    def _record_content_lookup(self, key: Tuple[str, str, str, str]) -> None:
+        """Count a hit on an imported entry, replacing the path miss, and refresh its access time."""
+        touched: Optional[List[Tuple[str, str, str, str]]] = getattr(
+            self._local, "touched_contents", None
+        )
+        if touched is None:
+            self._write(touched_contents=[key], hits=1, misses=-1)
+            return
+        touched.append(key)
+        self._local.lookups[0] += 1
+        self._local.lookups[1] -= 1
+
+    def _record_language_lookup(self, language: str, key: Tuple[str, str, str], hit: bool) -> None:
+        """Count a JS/TS or Go lookup under ``<language>_hits`` / ``<language>_misses``."""
+        counter = f"{language}_{'hits' if hit else 'misses'}"
+        touched: Optional[List[Tuple[str, str, str]]] = getattr(
+            self._local, "touched_languages", None
+        )
+        if touched is None:
+            self._write(touched_languages=[key] if hit else [], language_counters={counter: 1})
+            return
+        if hit:
+            touched.append(key)
+        lookups: Dict[str, int] = self._local.language_lookups
+        lookups[counter] = lookups.get(counter, 0) + 1
+
+    def _flush(self) -> None:
+        pending: Optional[List[Tuple[Any, ...]]] = getattr(self._local, "pending", None)
+        stage_rows: Optional[List[Tuple[Any, ...]]] = getattr(self._local, "pending_stages", None)
+        language_rows: Optional[List[Tuple[Any, ...]]] = getattr(
+            self._local, "pending_languages", None
+        )
+        touched: Optional[List[str]] = getattr(self._local, "touched", None)
+        touched_languages: Optional[List[Tuple[str, str, str]]] = getattr(
+            self._local, "touched_languages", None
+        )
+        touched_contents: Optional[List[Tuple[str, str, str, str]]] = getattr(
+            self._local, "touched_contents", None
+        )
+        lookups: Optional[List[int]] = getattr(self._local, "lookups", None)
+        language_lookups: Optional[Dict[str, int]] = getattr(self._local, "language_lookups", None)
+        buffers = (
+            pending,
+            stage_rows,
+            language_rows,
+            touched,
+            touched_languages,
+            touched_contents,
+            language_lookups,
+        )
+        if not any(buffers) and not (lookups and any(lookups)):
+            return
+        hits, misses = lookups or (0, 0)
+        self._write(
+            rows=pending or [],
+            stage_rows=stage_rows or [],
+            language_rows=language_rows or [],
+            touched=touched or [],
+            touched_languages=touched_languages or [],
+            touched_contents=touched_contents or [],
+            hits=hits,
+            misses=misses,
+            language_counters=language_lookups,
+        )
+        for buffer in buffers:
+            if buffer is not None:
+                buffer.clear()
+        if lookups is not None:
+            lookups[:] = [0, 0]
+
+    def _write(
+        self,
+        rows: Sequence[Tuple[Any, ...]] = (),
+        stage_rows: Sequence[Tuple[Any, ...]] = (),
+        language_rows: Sequence[Tuple[Any, ...]] = (),
+        touched: Sequence[str] = (),
+        touched_languages: Sequence[Tuple[str, str, str]] = (),
+        touched_contents: Sequence[Tuple[str, str, str, str]] = (),
+        language_counters: Optional[Dict[str, int]] = None,
+        **counters: int,
+    ) -> None:
+        """Store results and stages, refresh access times and add to counters in one transaction.
+
+        Writes are best effort: when the database is locked or unwritable,
+        the batch is dropped with a warning and the scan goes on uncached.
+        """
+        try:
+            with self._conn() as conn:
+                if rows:
+                    conn.executemany(
+                        """
+                        INSERT INTO file_analysis_cache (
+                            file_path, file_size, mtime_ns, sha256, engine_version,
+                            config_fingerprint, result_json, inode, last_access, path_role
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(file_path) DO UPDATE SET
+                            file_size = excluded.file_size,
+                            mtime_ns = excluded.mtime_ns,
+                            sha256 = excluded.sha256,
+                            engine_version = excluded.engine_version,
+                            config_fingerprint = excluded.config_fingerprint,
+                            result_json = excluded.result_json,
+                            inode = excluded.inode,
+                            last_access = excluded.last_access,
+                            path_role = excluded.path_role
+                        """,
+                        rows,
+                    )
+                if stage_rows:
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO file_analysis_stages (
+                            sha256, path_role, engine_version, stages
+                        ) VALUES (?, ?, ?, ?)
+                        """,
+                        stage_rows,
+                    )
+                if language_rows:
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO language_analysis_cache (
+                            sha256, language, analyzer_key, engine_version, payload, last_access
+                        ) VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        language_rows,
+                    )
+                if touched:
+                    now = int(time.time())
+                    conn.executemany(
+                        "UPDATE file_analysis_cache SET last_access = ? WHERE file_path = ?",
+                        [(now, file_path) for file_path in touched],
+                    )
+                if touched_languages:
+                    now = int(time.time())
+                    conn.executemany(
+                        """
+                        UPDATE language_analysis_cache SET last_access = ?
+                        WHERE sha256 = ? AND language = ? AND analyzer_key = ?
+                        """,
+                        [(now, *key) for key in touched_languages],
+                    )
+                if touched_contents:
+                    now = int(time.time())
+                    conn.executemany(
+                        """
+                        UPDATE file_analysis_content SET last_access = ?
+                        WHERE sha256 = ? AND path_role = ? AND engine_version = ?
+                          AND config_fingerprint = ?
+                        """,
+                        [(now, *key) for key in touched_contents],
+                    )
+                counters.update(language_counters or {})
+                counts = [(name, value) for name, value in counters.items() if value]
+                if counts:
+                    conn.executemany(
+                        """
+                        INSERT INTO file_analysis_cache_stats (name, value) VALUES (?, ?)
+                        ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+                        """,
+                        counts,
+                    )
+        except sqlite3.Error as exc:
+            logger.warning(f"Analysis cache write failed, results not cached: {exc}")
+
+    def _usage(self, conn: sqlite3.Connection) -> Tuple[int, int]:
+        """Return the path, imported and JS/TS/Go result count and the bytes of pages in use."""
+        entries = conn.execute(
+            "SELECT (SELECT COUNT(*) FROM file_analysis_cache) "
+            "+ (SELECT COUNT(*) FROM file_analysis_content) "
+            "+ (SELECT COUNT(*) FROM language_analysis_cache)"
+        ).fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return entries, (page_count - free_pages) * page_size
+
+    def _excess_rows(self, entries: int, used_bytes: int, fraction: float) -> int:
+        """Rows to drop to bring the cache within ``fraction`` of its limits."""
+        excess = 0
+        if self.max_entries and entries > self.max_entries * fraction:
+            excess = entries - int(self.max_entries * fraction)
+        if self.max_bytes and entries and used_bytes > self.max_bytes * fraction:
+            # Rows vary in size; assume the average and measure again after.
+            bytes_per_row = used_bytes / entries
+            excess = max(
+                excess, math.ceil((used_bytes - self.max_bytes * fraction) / bytes_per_row)
+            )
+        return excess
+
+    def evict(self) -> int:
+        """Delete least recently used rows once the cache outgrows a limit.
+
+        Eviction continues down to ``_EVICTION_TARGET`` of the exceeded limit
+        so that it does not run again on the next scan, deleting in
+        transactions of ``_EVICTION_BATCH`` rows. Returns the rows deleted.
+        """
+        if not self.max_bytes and not self.max_entries:
+            return 0
+        self._flush()
+        with self._conn() as conn:
+            excess = self._excess_rows(*self._usage(conn), fraction=1.0)
+        evicted = 0
+        while excess > 0:
+            with self._conn() as conn:
+                # Python rows by path, imported and JS/TS/Go rows by rowid, oldest first.
+                victims = conn.execute(
+                    """
+                    SELECT file_path, NULL, NULL, sha256, path_role, last_access
+                    FROM file_analysis_cache
+                    UNION ALL
+                    SELECT NULL, rowid, NULL, sha256, path_role, last_access
+                    FROM file_analysis_content
+                    UNION ALL
+                    SELECT NULL, NULL, rowid, sha256, language, last_access
+                    FROM language_analysis_cache
+                    ORDER BY last_access, file_path
+                    LIMIT ?
+                    """,
+                    (min(excess, _EVICTION_BATCH),),
+                ).fetchall()
+                paths = [victim for victim in victims if victim[0] is not None]
+                imported = [victim for victim in victims if victim[1] is not None]
+                conn.executemany(
+                    "DELETE FROM file_analysis_cache WHERE file_path = ?",
+                    [(victim[0],) for victim in paths],
+                )
+                conn.executemany(
+                    "DELETE FROM file_analysis_content WHERE rowid = ?",
+                    [(victim[1],) for victim in imported],
+                )
+                conn.executemany(
+                    "DELETE FROM language_analysis_cache WHERE rowid = ?",
+                    [(victim[2],) for victim in victims if victim[2] is not None],
+                )
+                self._delete_orphaned_stages(conn, [victim[3:5] for victim in (*paths, *imported)])
+                usage = self._usage(conn)
+            if not victims:
+                break
+            evicted += len(victims)
+            excess = self._excess_rows(*usage, fraction=_EVICTION_TARGET)
+        if evicted:
+            self._write(evictions=evicted)
+            logger.info(f"Evicted {evicted} least recently used analysis cache entries")
+        return evicted
+
+    @staticmethod
+    def _delete_orphaned_stages(
+        conn: sqlite3.Connection, contents: Sequence[Tuple[str, str]]
+    ) -> None:
+        """Drop stage entries of the given contents once no row refers to them."""
+        conn.executemany(
+            """
+            DELETE FROM file_analysis_stages
+            WHERE sha256 = ?1 AND path_role = ?2
+              AND NOT EXISTS (
+                  SELECT 1 FROM file_analysis_cache WHERE sha256 = ?1 AND path_role = ?2
+              )
+              AND NOT EXISTS (
+                  SELECT 1 FROM file_analysis_content WHERE sha256 = ?1 AND path_role = ?2
+              )
+            """,
+            list(set(contents)),
+        )
+
+    def schedule_eviction(self) -> Optional[threading.Thread]:
+        """Run ``evict()`` on a background thread unless one is still running.
+
+        The thread uses its own connection, and WAL mode lets scans keep
+        reading while it deletes. Returns the started thread, if any.
+        """
+        if not self.max_bytes and not self.max_entries:
+            return None
+        with self._eviction_lock:
+            if self._eviction_thread is not None and self._eviction_thread.is_alive():
+                return None
+            self._eviction_thread = threading.Thread(
+                target=self._evict_in_background, name="analysis-cache-eviction"
+            )
+            self._eviction_thread.start()
+            return self._eviction_thread
+
+    def _evict_in_background(self) -> None:
+        try:
+            self.evict()
+        except sqlite3.Error as exc:
+            logger.warning(f"Analysis cache eviction failed: {exc}")
+        finally:
+            self.close()
+
+    def _file_bytes(self) -> int:
+        """Bytes on disk for the database and its write-ahead log."""
+        total = 0
+        for suffix in ("", "-wal"):
+            try:
+                total += os.path.getsize(f"{self.db_path}{suffix}")
+            except OSError:
+                continue
+        return total
+
+    def stats(self) -> Dict[str, Any]:
+        """Report entry count, size, limits and lifetime lookup counters."""
+        self._flush()
+        with self._conn() as conn:
+            _, used_bytes = self._usage(conn)
+            entries, stage_entries, imported_entries, language_entries, aggregate_entries = (
+                conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in (
+                    "file_analysis_cache",
+                    "file_analysis_stages",
+                    "file_analysis_content",
+                    "language_analysis_cache",
+                    "project_aggregates",
+                )
+            )
+            counters = dict(conn.execute("SELECT name, value FROM file_analysis_cache_stats"))
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        language_counters = {
+            f"{language}_{name}": counters.get(f"{language}_{name}", 0)
+            for language in CACHED_LANGUAGES
+            for name in ("hits", "misses")
+        }
+        return {
+            "db_path": str(self.db_path),
+            "entries": entries,
+            "stage_entries": stage_entries,
+            "imported_entries": imported_entries,
+            "language_entries": language_entries,
+            "aggregate_entries": aggregate_entries,
+            "size_bytes": self._file_bytes(),
+            "used_bytes": used_bytes,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "evictions": counters.get("evictions", 0),
+            **language_counters,
+        }
+
+    def prune(self) -> Dict[str, int]:
+        """Delete rows that can never hit again, then evict down to the limits.
+
+        That covers files that were deleted or renamed, rows, imported
+        entries, JS/TS and Go results and project aggregates written by
+        another engine version, imported entries of another environment, and
+        stage entries that neither a path row nor an imported entry refers to.
+        """
+        self._flush()
+        with self._conn() as conn:
+            paths = [row[0] for row in conn.execute("SELECT file_path FROM file_analysis_cache")]
+        missing = [(path,) for path in paths if not os.path.exists(path)]
+        with self._conn() as conn:
+            conn.executemany("DELETE FROM file_analysis_cache WHERE file_path = ?", missing)
+            outdated = conn.execute(
+                "DELETE FROM file_analysis_cache WHERE engine_version != ?",
+                (CACHE_ENGINE_VERSION,),
+            ).rowcount
+            conn.execute(
+                "DELETE FROM file_analysis_content WHERE environment != ?",
+                (import_environment_key(),),
+            )
             conn.execute(
                 """
-                INSERT INTO file_analysis_cache (
-                    file_path, file_size, mtime_ns, sha256,
-                    engine_version, config_fingerprint, result_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(file_path) DO UPDATE SET
-                    file_size = excluded.file_size,
-                    mtime_ns = excluded.mtime_ns,
-                    sha256 = excluded.sha256,
-                    engine_version = excluded.engine_version,
-                    config_fingerprint = excluded.config_fingerprint,
-                    result_json = excluded.result_json
+                DELETE FROM file_analysis_stages
+                WHERE engine_version != ?
+                   OR NOT EXISTS (
+                       SELECT 1 FROM file_analysis_cache c
+                       WHERE c.sha256 = file_analysis_stages.sha256
+                         AND c.path_role = file_analysis_stages.path_role
+                   )
+                   AND NOT EXISTS (
+                       SELECT 1 FROM file_analysis_content c
+                       WHERE c.sha256 = file_analysis_stages.sha256
+                         AND c.path_role = file_analysis_stages.path_role
+                   )
                 """,
-                (
-                    file_path,
-                    file_size,
-                    mtime_ns,
-                    content_hash,
-                    engine_version,
-                    config_fingerprint,
-                    payload,
-                ),
+                (CACHE_ENGINE_VERSION,),
             )
+            for table in ("file_analysis_content", "language_analysis_cache", "project_aggregates"):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE engine_version != ?", (CACHE_ENGINE_VERSION,)
+                )
+        return {"missing": len(missing), "outdated": outdated, "evicted": self.evict()}
+
+    def vacuum(self) -> Dict[str, int]:
+        """Rebuild the database file to return free pages to the filesystem."""
+        self._flush()
+        size_before = self._file_bytes()
+        conn = self._connection()
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return {"size_before": size_before, "size_after": self._file_bytes()}
+
+    def clear(self) -> Dict[str, int]:
+        """Delete every cached result and counter, then vacuum."""
+        self._flush()
+        with self._conn() as conn:
+            removed = conn.execute("DELETE FROM file_analysis_cache").rowcount
+            conn.execute("DELETE FROM file_analysis_stages")
+            conn.execute("DELETE FROM file_analysis_content")
+            conn.execute("DELETE FROM language_analysis_cache")
+            conn.execute("DELETE FROM project_aggregates")
+            conn.execute("DELETE FROM file_analysis_cache_stats")
+        return {"removed": removed, **self.vacuum()}
 
 
 def fingerprint_config(config_dict: Dict[str, Any]) -> str:
@@ -147,7 +1419,13 @@ def fingerprint_config(config_dict: Dict[str, Any]) -> str:
             return [_normalize(v) for v in value]
         return value
 
-    canonical = json.dumps(_normalize(config_dict), sort_keys=True, separators=(",", ":"))
+    relevant = dict(config_dict)
+    advanced = relevant.get("advanced")
+    if isinstance(advanced, dict):
+        relevant["advanced"] = {
+            k: v for k, v in advanced.items() if k not in _EXECUTION_ONLY_ADVANCED_KEYS
+        }
+    canonical = json.dumps(_normalize(relevant), sort_keys=True, separators=(",", ":"))
     return sha256(canonical.encode("utf-8")).hexdigest()
 
 
@@ -157,6 +1435,189 @@ def serialize_file_analysis(result: FileAnalysis) -> str:
 
 def deserialize_file_analysis(payload: str) -> FileAnalysis:
     data = json.loads(payload)
+    paths: Dict[str, Path] = {}
+    return _restore_file_analysis(
+        data,
+        [_restore_issue(item, paths) for item in data.get("pattern_issues", [])],
+        _restore_docstring_inflation(data.get("docstring_inflation")),
+        _restore_hallucination_deps(data.get("hallucination_deps")),
+        _restore_context_jargon(data.get("context_jargon")),
+    )
+
+
+def encode_file_analysis(result: FileAnalysis) -> bytes:
+    """Binary cache payload: ``_BINARY_HEADER`` then a zlib-compressed marshal body.
+
+    The body is ``result.to_dict()`` with issues as ``_ISSUE_FIELDS`` tuples and
+    the docstring, dependency and jargon sections as nested marshal blobs that
+    ``decode_file_analysis`` leaves undecoded until first use. Results holding
+    values marshal cannot store are written as JSON text instead.
+    """
+    data = result.to_dict()
+    try:
+        data["pattern_issues"] = [
+            tuple(item[name] for name in _ISSUE_FIELDS) for item in data["pattern_issues"]
+        ]
+        for name in _LAZY_SECTIONS:
+            if name in data:
+                data[name] = marshal.dumps(data[name])
+        body = marshal.dumps(data)
+    except (TypeError, ValueError):
+        return serialize_file_analysis(result).encode("utf-8")
+    return _BINARY_HEADER + zlib.compress(body, 1)
+
+
+def decode_file_analysis(payload: Union[bytes, str]) -> FileAnalysis:
+    """Restore a cached payload written by either codec."""
+    if isinstance(payload, str):
+        return deserialize_file_analysis(payload)
+    if not payload.startswith(_BINARY_MAGIC):
+        return deserialize_file_analysis(payload.decode("utf-8"))
+    version = payload[len(_BINARY_MAGIC)]
+    if version != _BINARY_SCHEMA_VERSION:
+        raise ValueError(f"unsupported binary cache schema version {version}")
+    data = marshal.loads(zlib.decompress(payload[len(_BINARY_HEADER) :]))
+    paths: Dict[str, Path] = {}
+    sections = [
+        LazySection(restore, data[name]) if name in data else None
+        for name, restore in _LAZY_SECTIONS.items()
+    ]
+    return _restore_file_analysis(
+        data,
+        [_restore_issue_row(row, paths) for row in data["pattern_issues"]],
+        *sections,
+    )
+
+
+def rebind_file_analysis(result: FileAnalysis, file_path: str) -> FileAnalysis:
+    """Point a result restored from another path's cache entry at ``file_path``.
+
+    Rewrites the reported path on the result, its issues, suppression ledger
+    and masked issues; entries naming other files are left alone.
+    """
+    old_path = result.file_path
+    if old_path == file_path:
+        return result
+    result.file_path = file_path
+    new_file = Path(file_path)
+    for issue in result.pattern_issues:
+        if str(issue.file) == old_path:
+            issue.file = new_file
+    entries: List[Union[SuppressionLedgerEntry, MaskedIssue]] = [
+        *result.suppression_ledger,
+        *result.masked_issues,
+    ]
+    for entry in entries:
+        if entry.file_path == old_path:
+            entry.file_path = file_path
+    return result
+
+
+def encode_language_analysis(result: Any) -> bytes:
+    """Encode a ``JSFileAnalysis`` or ``GoFileAnalysis`` without its paths.
+
+    Paths are restored from the file being served, since entries are shared
+    by every path with the same content.
+    """
+    data = asdict(result)
+    data.pop("cache_tier", None)
+    data["file_path"] = ""
+    for masked in data.get("masked_issues", ()):
+        masked["file_path"] = ""
+    return _BINARY_HEADER + zlib.compress(marshal.dumps(data), 1)
+
+
+def decode_language_analysis(language: str, payload: bytes, file_path: str) -> Any:
+    """Decode a payload from ``encode_language_analysis`` for ``file_path``."""
+    if not payload.startswith(_BINARY_HEADER):
+        raise ValueError("Unknown language payload header")
+    data = marshal.loads(zlib.decompress(payload[len(_BINARY_HEADER) :]))
+    data["file_path"] = file_path
+    if language == "go":
+        from slop_detector.languages.go_analyzer import GoFileAnalysis, GoIssue
+
+        data["issues"] = [GoIssue(**item) for item in data["issues"]]
+        return GoFileAnalysis(**data)
+    from slop_detector.languages.js_analyzer import FunctionMetrics, JSFileAnalysis, JSIssue
+
+    data["issues"] = [JSIssue(**item) for item in data["issues"]]
+    data["function_metrics"] = [FunctionMetrics(**item) for item in data["function_metrics"]]
+    # Masking reports the path as ``str(Path(file_path))``.
+    masked_path = str(Path(file_path))
+    data["masked_issues"] = [
+        MaskedIssue(**{**item, "file_path": masked_path}) for item in data["masked_issues"]
+    ]
+    return JSFileAnalysis(**data)
+
+
+def _decode_row(file_path: str, payload: Union[bytes, str]) -> Optional[FileAnalysis]:
+    # An unreadable row (corrupt, or from a newer schema) is a cache miss.
+    try:
+        return decode_file_analysis(payload)
+    except (ValueError, TypeError, KeyError, EOFError, zlib.error) as exc:
+        logger.debug("Ignoring unreadable analysis cache entry for %s: %s", file_path, exc)
+        return None
+
+
+class LazySection:
+    """Cached result section restored on first attribute access.
+
+    Stands in for ``FileAnalysis.docstring_inflation``, ``hallucination_deps``
+    and ``context_jargon`` on binary cache hits. ``to_dict()`` reads the stored
+    payload directly, so JSON reports of cached files never build the nested
+    dataclasses.
+    """
+
+    __slots__ = ("_restore", "_blob", "_value")
+
+    def __init__(self, restore: Callable[[Dict[str, Any]], Any], blob: bytes) -> None:
+        object.__setattr__(self, "_restore", restore)
+        object.__setattr__(self, "_blob", blob)
+        object.__setattr__(self, "_value", None)
+
+    def materialize(self) -> Any:
+        if self._value is None:
+            object.__setattr__(self, "_value", self._restore(marshal.loads(self._blob)))
+        return self._value
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self._value is None:
+            return cast(Dict[str, Any], marshal.loads(self._blob))
+        return cast(Dict[str, Any], self._value.to_dict())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.materialize(), name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazySection):
+            other = other.materialize()
+        return bool(self.materialize() == other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        if self._value is None:
+            return (LazySection, (self._restore, self._blob))
+        return (_identity, (self._value,))
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _restore_file_analysis(
+    data: Dict[str, Any],
+    pattern_issues: List[Issue],
+    docstring_inflation: Any,
+    hallucination_deps: Any,
+    context_jargon: Any,
+) -> FileAnalysis:
     return FileAnalysis(
         file_path=data["file_path"],
         ldr=LDRResult(**data["ldr"]),
@@ -165,10 +1626,10 @@ def deserialize_file_analysis(payload: str) -> FileAnalysis:
         deficit_score=data["deficit_score"],
         status=SlopStatus(data["status"]),
         warnings=data.get("warnings", []),
-        pattern_issues=[_restore_issue(item) for item in data.get("pattern_issues", [])],
-        docstring_inflation=_restore_docstring_inflation(data.get("docstring_inflation")),
-        hallucination_deps=_restore_hallucination_deps(data.get("hallucination_deps")),
-        context_jargon=_restore_context_jargon(data.get("context_jargon")),
+        pattern_issues=pattern_issues,
+        docstring_inflation=docstring_inflation,
+        hallucination_deps=hallucination_deps,
+        context_jargon=context_jargon,
         ignored_functions=[IgnoredFunction(**item) for item in data.get("ignored_functions", [])],
         suppression_directives=[
             SuppressionDirective(**item) for item in data.get("suppression_directives", [])
@@ -184,17 +1645,40 @@ def deserialize_file_analysis(payload: str) -> FileAnalysis:
     )
 
 
-def _restore_issue(item: Dict[str, Any]) -> Issue:
+def _restore_issue(item: Dict[str, Any], paths: Dict[str, Path]) -> Issue:
+    return _restore_issue_row(
+        (
+            item["pattern_id"],
+            item["severity"],
+            item["axis"],
+            item["file"],
+            item["line"],
+            item.get("column", 0),
+            item["message"],
+            item.get("code"),
+            item.get("suggestion"),
+        ),
+        paths,
+    )
+
+
+def _restore_issue_row(row: Tuple[Any, ...], paths: Dict[str, Path]) -> Issue:
+    """Build an ``Issue`` from values in ``_ISSUE_FIELDS`` order."""
+    pattern_id, severity, axis, file_name, line, column, message, code, suggestion = row
+    # Issues of one file share a single Path, as they do when freshly analyzed.
+    file = paths.get(file_name)
+    if file is None:
+        file = paths[file_name] = Path(file_name)
     return Issue(
-        pattern_id=item["pattern_id"],
-        severity=Severity(item["severity"]),
-        axis=Axis(item["axis"]),
-        file=Path(item["file"]),
-        line=item["line"],
-        column=item.get("column", 0),
-        message=item["message"],
-        code=item.get("code"),
-        suggestion=item.get("suggestion"),
+        pattern_id=pattern_id,
+        severity=Severity(severity),
+        axis=Axis(axis),
+        file=file,
+        line=line,
+        column=column,
+        message=message,
+        code=code,
+        suggestion=suggestion,
     )
 
 
@@ -254,3 +1738,11 @@ def _restore_ml_score(data: Optional[Dict[str, Any]]) -> Any:
         agreement=data["agreement"],
         features_used=data["features_used"],
     )
+
+
+# Sections decoded lazily from binary payloads, in FileAnalysis field order.
+_LAZY_SECTIONS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "docstring_inflation": _restore_docstring_inflation,
+    "hallucination_deps": _restore_hallucination_deps,
+    "context_jargon": _restore_context_jargon,
+}
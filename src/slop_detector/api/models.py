@@ -153,6 +153,7 @@ class AgentProjectResponse(BaseModel):
                 ),
                 "structural_coherence": result.structural_coherence,
                 "coherence_level": result.coherence_level,
+                "coherence_error_bound": getattr(result, "coherence_error_bound", None),
                 "suppressed_issue_count": getattr(result, "suppressed_issue_count", 0),
             },
             signals={
@@ -9,7 +9,6 @@ from pathlib import Path
 from typing import Optional, Sequence
 
 from slop_detector.core import SlopDetector  # re-exported for CLI patch surface/tests
-from slop_detector.leda_injection import build_leda_injection, write_leda_injection
 
 _OPERATIONS_COMMANDS = {
     "audit",
@@ -60,12 +59,30 @@ def _apply_runtime_overrides(args, detector) -> None:
     _impl(args, detector)
 
 
+def build_leda_injection(*args, **kwargs):
+    from slop_detector.leda_injection import build_leda_injection as _impl
+
+    return _impl(*args, **kwargs)
+
+
+def write_leda_injection(*args, **kwargs):
+    from slop_detector.leda_injection import write_leda_injection as _impl
+
+    return _impl(*args, **kwargs)
+
+
 def _run_analysis_phase(args, detector):
     from slop_detector.cli_analysis import _run_analysis_phase as _impl
 
     return _impl(args, detector)
 
 
+def _run_stream_phase(args, detector):
+    from slop_detector.cli_analysis import _run_stream_phase as _impl
+
+    return _impl(args, detector)
+
+
 def _record_optional_impact(command_name: str, result) -> None:
     from slop_detector.cli_observability import _record_optional_impact as _impl
 
@@ -188,6 +205,13 @@ def _run_telemetry_command(argv: list[str]) -> int:
     return _impl(argv)
 
 
+def _run_cache_command(argv: list[str]) -> int:
+    """Execute analysis cache maintenance commands."""
+    from slop_detector.cli_handlers import run_cache_command as _impl
+
+    return _impl(argv)
+
+
 def _run_operations_command(command: str, argv: list[str]) -> int:
     """Execute an operational command family (audit / health / cleanup / explain / watch)."""
     from slop_detector.cli_handlers import run_operations_command as _impl
@@ -238,6 +262,26 @@ def _emit_leda_yaml(args, result) -> None:
     print(f"[+] LEDA injection YAML saved to {written}")
 
 
+def _run_stream_command(args, detector) -> int:
+    """Run a streamed project scan; only ``--fail-threshold`` applies afterwards."""
+    if not Path(args.path).is_dir():
+        print("[!] --stream requires a project directory", file=sys.stderr)
+        return 2
+    try:
+        summary = _run_stream_phase(args, detector)
+    except Exception as e:
+        print(f"[!] Analysis failed: {e}", file=sys.stderr)
+        return 1
+    score = summary.weighted_deficit_score
+    if args.fail_threshold is not None and score > args.fail_threshold:
+        print(
+            f"\n[!] FAIL: Deficit score {score:.1f} exceeds threshold {args.fail_threshold}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     """CLI entry point."""
     argv_list = list(sys.argv[1:] if argv is None else argv)
@@ -252,6 +296,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return _run_impact_command(argv_list[1:])
     if argv_list and argv_list[0] == "telemetry":
         return _run_telemetry_command(argv_list[1:])
+    if argv_list and argv_list[0] == "cache":
+        return _run_cache_command(argv_list[1:])
     if argv_list and argv_list[0] == "mcp":
         from slop_detector.mcp.server import run_stdio_server
 
@@ -320,6 +366,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         print(f"[!] Invalid runtime override: {e}", file=sys.stderr)
         return 2
 
+    if getattr(args, "stream", False):
+        return _run_stream_command(args, detector)
+
     try:
         result, score = _run_analysis_phase(args, detector)
     except Exception as e:
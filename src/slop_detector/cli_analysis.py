@@ -19,11 +19,8 @@ def _build_fallback_project_analysis(
     scan_root = (
         project_path if project_path.exists() and project_path.is_dir() else project_path.parent
     )
-    python_files = [
-        fp
-        for fp in scan_root.rglob("*.py")
-        if not detector._should_ignore(fp, ignore_patterns, root=scan_root)
-    ]
+    project_files = detector._scan_project_files(scan_root, ignore_patterns)
+    python_files = project_files.python
 
     file_results = []
     for file_path in python_files:
@@ -32,8 +29,8 @@ def _build_fallback_project_analysis(
         except Exception:
             continue
 
-    js_results = detector._analyze_js_files(scan_root, ignore_patterns)
-    go_results = detector._analyze_go_files(scan_root, ignore_patterns)
+    js_results = detector._analyze_js_files(scan_root, ignore_patterns, project_files.javascript)
+    go_results = detector._analyze_go_files(scan_root, ignore_patterns, project_files.go)
     all_results = file_results + js_results + go_results
     if not all_results:
         return None
@@ -78,7 +75,7 @@ def _build_fallback_project_analysis(
         overall_status = SlopStatus.CLEAN
 
     file_dcfs = [result.dcf for result in file_results if result.dcf]
-    structural_coherence, coherence_level = detector._compute_coherence_vr(file_dcfs)
+    coherence = detector._estimate_coherence_vr(file_dcfs)
     suppression_ledger = [
         entry
         for file_result in file_results
@@ -87,7 +84,7 @@ def _build_fallback_project_analysis(
     priority_hotspots, churn_available, coverage_available = (
         detector.project_prioritizer.prioritize_project(str(scan_root), all_results)
     )
-    scan_coverage = detector._collect_project_scan_coverage(scan_root, ignore_patterns)
+    scan_coverage = project_files.scan_coverage
     detector._set_analyzed_scan_counts(scan_coverage, file_results, js_results, go_results)
 
     return ProjectAnalysis(
@@ -102,8 +99,9 @@ def _build_fallback_project_analysis(
         avg_ddc=avg_ddc,
         overall_status=overall_status,
         file_results=file_results,
-        structural_coherence=structural_coherence,
-        coherence_level=coherence_level,
+        structural_coherence=coherence.coherence,
+        coherence_level=coherence.level,
+        coherence_error_bound=coherence.error_bound,
         suppressed_issue_count=len(suppression_ledger),
         suppression_ledger=suppression_ledger,
         priority_hotspots=priority_hotspots,
@@ -125,11 +123,37 @@ def _run_analysis_phase(args, detector):
     return result, result.deficit_score
 
 
+def _run_stream_phase(args, detector) -> ProjectAnalysis:
+    """Stream project results as NDJSON. Returns the final project summary.
+
+    Each file result is written as ``{"type": "file", "result": {...}}`` as
+    soon as it finishes, followed by one ``{"type": "summary", "result": {...}}``
+    line whose per-file result lists are empty.
+    """
+    from slop_detector.cli_output import _open_stream_output, _write_ndjson_record
+
+    summary: Optional[ProjectAnalysis] = None
+    with _open_stream_output(args) as handle:
+        for item in detector.analyze_project_iter(args.path):
+            if isinstance(item, ProjectAnalysis):
+                summary = item
+                _write_ndjson_record(handle, "summary", item)
+            else:
+                _write_ndjson_record(handle, "file", item)
+    assert summary is not None
+    return summary
+
+
 def _apply_runtime_overrides(args, detector) -> None:
     """Apply CLI overrides onto detector config before analysis."""
-    advanced = detector.config.config.setdefault("advanced", {})
+    _apply_config_overrides(args, detector.config)
+
+
+def _apply_config_overrides(args, config) -> None:
+    """Apply CLI overrides onto a loaded ``Config``; flags ``args`` lacks are skipped."""
+    advanced = config.config.setdefault("advanced", {})
     if getattr(args, "include_tests", False):
-        if not detector.config.include_default_tests():
+        if not config.include_default_tests():
             raise ValueError(
                 "--include-tests cannot override explicit ignore rules in .slopconfig.yaml; "
                 "remove the test pattern from that config to opt in."
@@ -138,3 +162,9 @@ def _apply_runtime_overrides(args, detector) -> None:
         advanced["exact_topology_ceiling"] = args.topology_ceiling
     if getattr(args, "topology_mode", None) is not None:
         advanced["topology_mode_above_ceiling"] = args.topology_mode
+    if getattr(args, "jobs", None) is not None:
+        if args.jobs < 0:
+            raise ValueError("--jobs must be 0 (one per CPU) or a positive worker count")
+        advanced["max_workers"] = args.jobs
+    if getattr(args, "drop_code_snippets", False):
+        advanced["retain_code_snippets"] = False
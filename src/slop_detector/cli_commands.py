@@ -141,7 +141,13 @@ def _run_cross_file(result) -> None:
         for dup in report.duplicates[:5]:
             a = Path(dup.file_a).name
             b = Path(dup.file_b).name
-            print(f"    {a}:{dup.func_a}() == {b}:{dup.func_b}() (sim={dup.similarity:.0%})")
+            op = "==" if dup.exact else "~"
+            # Near duplicates can score 100% once names and literals are normalized.
+            kind = ", normalized" if not dup.exact and dup.similarity >= 1.0 else ""
+            print(
+                f"    {a}:{dup.func_a}() {op} {b}:{dup.func_b}() "
+                f"(sim={dup.similarity:.0%}{kind})"
+            )
 
     if report.hotspots:
         print(f"\n  Slop Hotspots ({len(report.hotspots)}) - heavily imported + sloppy:")
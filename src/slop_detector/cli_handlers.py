@@ -7,6 +7,7 @@ import sys
 from pathlib import Path
 
 from slop_detector.cli_analysis import (
+    _apply_config_overrides,
     _apply_runtime_overrides,
     _build_fallback_project_analysis,
 )
@@ -28,6 +29,7 @@ from slop_detector.cli_output import (
     _sanitize_for_json,
 )
 from slop_detector.cli_parsers import (
+    _build_cache_parser,
     _build_impact_parser,
     _build_operations_parser,
     _build_telemetry_parser,
@@ -76,6 +78,51 @@ def run_telemetry_command(argv: list[str]) -> int:
     return _emit_simple_payload(payload, as_json=bool(args.json))
 
 
+def run_cache_command(argv: list[str]) -> int:
+    """Execute analysis cache maintenance commands."""
+    from slop_detector.analysis_cache import FileAnalysisCache, fingerprint_config
+    from slop_detector.config import Config
+
+    parser = _build_cache_parser()
+    args = parser.parse_args(argv)
+    if args.action in ("export", "import") and not args.bundle:
+        parser.error(f"'{args.action}' needs a bundle path")
+    config = Config(args.config)
+    try:
+        # Exports carry the fingerprint of the config analysis runs with.
+        _apply_config_overrides(args, config)
+    except ValueError as exc:
+        print(f"[!] Invalid runtime override: {exc}", file=sys.stderr)
+        return 2
+    cache = FileAnalysisCache(
+        config.get_analysis_cache_db(),
+        max_bytes=config.get_analysis_cache_max_bytes(),
+        max_entries=config.get_analysis_cache_max_entries(),
+    )
+    try:
+        if args.action == "prune":
+            payload = cache.prune()
+        elif args.action == "vacuum":
+            payload = cache.vacuum()
+        elif args.action == "clear":
+            payload = cache.clear()
+        elif args.action == "export":
+            payload = cache.export_bundle(
+                args.bundle,
+                config_fingerprint=None if args.all_configs else fingerprint_config(config.config),
+            )
+        elif args.action == "import":
+            payload = cache.import_bundle(args.bundle)
+        else:
+            payload = cache.stats()
+    except ValueError as exc:
+        print(f"[!] {exc}", file=sys.stderr)
+        return 1
+    finally:
+        cache.close()
+    return _emit_simple_payload(payload, as_json=bool(args.json))
+
+
 def run_operations_command(
     command: str,
     argv: list[str],
@@ -7,8 +7,6 @@ import ast
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
-
 
 def _detect_project_type(path: Path) -> str:
     """Infer project type from root directory structure."""
@@ -608,6 +606,8 @@ def _write_init_config(
     comment_lines: List[str],
 ) -> None:
     """Write YAML config with a preserved explanatory comment block."""
+    import yaml
+
     header = "\n".join(comment_lines).rstrip() + "\n\n"
     yaml_body = yaml.safe_dump(config_data, sort_keys=False, allow_unicode=True)
     config_path.write_text(header + yaml_body, encoding="utf-8")
@@ -790,6 +790,8 @@ def _print_skip_existing_config(needs_adaptive: bool, preview_text: str) -> None
 
 
 def _load_existing_init_yaml(config_path: Path) -> Optional[Dict[str, Any]]:
+    import yaml
+
     try:
         current_data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
     except yaml.YAMLError as exc:
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import json
 import math
-from typing import Any
+import sys
+from contextlib import contextmanager
+from typing import Any, Iterator, TextIO
 
 
 def _write_file(path: str, content: str, label: str = "") -> None:
@@ -64,36 +66,62 @@ def _write_json_output(args, result) -> None:
         print(output)
 
 
+@contextmanager
+def _open_stream_output(args) -> Iterator[TextIO]:
+    """Yield the NDJSON destination: ``--output`` when given, else stdout."""
+    if getattr(args, "output", None):
+        with open(str(args.output), "w", encoding="utf-8") as handle:
+            yield handle
+    else:
+        yield sys.stdout
+
+
+def _write_ndjson_record(handle: TextIO, record_type: str, result) -> None:
+    """Write one NDJSON record and flush so readers see it immediately."""
+    record = {"type": record_type, "result": _sanitize_for_json(result.to_dict())}
+    handle.write(json.dumps(record, allow_nan=False) + "\n")
+    handle.flush()
+
+
 def _route_file_output(out: str, result, rich_ok: bool) -> None:
-    """Write result to file or console based on output extension and flags."""
-    from slop_detector.cli_renderer import (
-        generate_html_report,
-        generate_markdown_report,
-        generate_text_report,
-        print_rich_report,
-    )
+    """Write result to file or console based on output extension and flags.
 
+    Each branch imports only its own renderer, so plain-text runs never load rich.
+    """
     if out.endswith(".html"):
+        from slop_detector.renderer_html import generate_html_report
+
         _write_file(out, generate_html_report(result), "HTML report")
         return
     if out.endswith(".md"):
+        from slop_detector.renderer_markdown import generate_markdown_report
+
         _write_file(out, generate_markdown_report(result), "Markdown report")
         return
     if out:
+        from slop_detector.renderer_text import generate_text_report
+
         _write_file(out, generate_text_report(result))
         return
     if rich_ok:
+        from slop_detector.renderer_rich import print_rich_report
+
         print_rich_report(result)
         return
+    from slop_detector.renderer_text import generate_text_report
+
     print(generate_text_report(result))
 
 
 def _handle_output(args, result) -> None:
     """Route analysis result to the appropriate output format."""
-    from slop_detector.cli_renderer import RICH_AVAILABLE
-
     if args.json:
         _write_json_output(args, result)
         return
     out = str(args.output) if args.output else ""
-    _route_file_output(out, result, RICH_AVAILABLE and not args.no_color)
+    rich_ok = False
+    if not out and not args.no_color:
+        from slop_detector.renderer_rich import RICH_AVAILABLE
+
+        rich_ok = RICH_AVAILABLE
+    _route_file_output(out, result, rich_ok)
@@ -24,6 +24,8 @@ Examples:
   slop-detector file.py                      # Analyze single file
   slop-detector --project src/               # Analyze project
   slop-detector --project . --json           # JSON output
+  slop-detector --project . --jobs 8         # Analyze with 8 worker processes
+  slop-detector --project . --stream         # NDJSON per file as it finishes
   slop-detector --project . -o report.html   # HTML report
   slop-detector file.py --fix --dry-run      # Preview auto-fixes
   slop-detector file.py --fix                # Apply auto-fixes
@@ -64,9 +66,32 @@ Examples:
     )
     parser.add_argument(
         "--topology-mode",
-        choices=["exact", "deterministic_approximate"],
+        choices=["exact", "deterministic_approximate", "knn_graph"],
         help="Structural topology mode above the exact ceiling",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        metavar="N",
+        help="Worker processes for project analysis (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Write project results as NDJSON while scanning: one line per file, "
+            "then a summary line (implies --project)"
+        ),
+    )
+    parser.add_argument(
+        "--drop-code-snippets",
+        action="store_true",
+        help=(
+            "Do not keep per-issue code snippets in project results "
+            "(--stream still writes them per file); lowers memory on large scans"
+        ),
+    )
     parser.add_argument(
         "--fix",
         action="store_true",
@@ -333,6 +358,50 @@ def _build_telemetry_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _build_cache_parser() -> argparse.ArgumentParser:
+    """Build parser for analysis cache maintenance commands."""
+    parser = argparse.ArgumentParser(
+        prog="slop-detector cache",
+        description="Inspect and maintain the repeated-run analysis cache",
+    )
+    parser.add_argument(
+        "action",
+        nargs="?",
+        choices=["stats", "prune", "vacuum", "clear", "export", "import"],
+        default="stats",
+        help="Cache action to run",
+    )
+    parser.add_argument(
+        "bundle",
+        nargs="?",
+        help="Bundle file written by 'export' or read by 'import'",
+    )
+    parser.add_argument("--config", "-c", help="Path to .slopconfig.yaml configuration file")
+    parser.add_argument(
+        "--all-configs",
+        action="store_true",
+        help="Export entries of every config fingerprint, not only the current config's",
+    )
+    parser.add_argument(
+        "--include-tests",
+        action="store_true",
+        help="Export entries of scans run with --include-tests",
+    )
+    parser.add_argument(
+        "--topology-ceiling",
+        type=int,
+        metavar="N",
+        help="Export entries of scans run with this --topology-ceiling",
+    )
+    parser.add_argument(
+        "--topology-mode",
+        choices=["exact", "deterministic_approximate", "knn_graph"],
+        help="Export entries of scans run with this --topology-mode",
+    )
+    parser.add_argument("--json", action="store_true", help="Output JSON format")
+    return parser
+
+
 def _normalize_format_args(args) -> None:
     """Map format aliases onto existing boolean output flags."""
     if getattr(args, "format", None) == "json":
@@ -3,10 +3,11 @@
 import logging as _logging
 import os
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
+from slop_detector.core_topology import TOPOLOGY_MODES
 
 _logger = _logging.getLogger(__name__)
 
@@ -16,12 +17,21 @@ DEFAULT_TEST_IGNORE_PATTERNS = frozenset({"tests/**", "**/*_test.py", "**/test_*
 # Runtime schema guards for .slopconfig.yaml user input.
 # Pydantic v2 is a base dependency but guard gracefully if absent so the
 # package imports cleanly in stripped environments (pip install without deps).
+# The models are built on first use: importing pydantic costs more than the
+# rest of a single-file scan, and most configs never set the guarded keys.
 # ---------------------------------------------------------------------------
 
-try:
-    from pydantic import BaseModel as _BaseModel
-    from pydantic import Field as _Field
-    from pydantic import ValidationError as _ValidationError
+
+@lru_cache(maxsize=None)
+def _config_schemas() -> Optional[Tuple[Any, Any, Any]]:
+    """Return ``(WeightsSchema, GodFunctionSchema, ValidationError)`` or ``None``."""
+    try:
+        from pydantic import BaseModel as _BaseModel
+        from pydantic import Field as _Field
+        from pydantic import ValidationError as _ValidationError
+    except ImportError:
+        _logger.debug("pydantic not installed — .slopconfig.yaml schema validation disabled")
+        return None
 
     class _WeightsSchema(_BaseModel):
         model_config = {"extra": "allow"}
@@ -42,11 +52,7 @@ try:
         lines_threshold: int = _Field(default=50, ge=1)
         domain_overrides: List[_DomainOverrideSchema] = _Field(default_factory=list)
 
-    _PYDANTIC_AVAILABLE = True
-
-except ImportError:
-    _PYDANTIC_AVAILABLE = False
-    _logger.debug("pydantic not installed — .slopconfig.yaml schema validation disabled")
+    return _WeightsSchema, _GodFunctionSchema, _ValidationError
 
 
 def _validate_yaml_config(raw: Dict[str, Any]) -> None:
@@ -55,22 +61,28 @@ def _validate_yaml_config(raw: Dict[str, Any]) -> None:
     Raises ValueError with a user-readable message if any section is invalid.
     Skipped silently when pydantic is unavailable.
     """
-    if not _PYDANTIC_AVAILABLE:
+    weights = raw.get("weights")
+    patterns = raw.get("patterns") or {}
+    has_god_function = isinstance(patterns, dict) and "god_function" in patterns
+    if not isinstance(weights, dict) and not has_god_function:
+        return
+    schemas = _config_schemas()
+    if schemas is None:
         return
+    weights_schema, god_function_schema, validation_error = schemas
 
     errors: List[str] = []
 
-    if "weights" in raw and isinstance(raw["weights"], dict):
+    if isinstance(weights, dict):
         try:
-            _WeightsSchema.model_validate(raw["weights"])  # type: ignore[name-defined]
-        except _ValidationError as exc:  # type: ignore[name-defined]
+            weights_schema.model_validate(weights)
+        except validation_error as exc:
             errors.append(f"weights: {exc}")
 
-    patterns = raw.get("patterns") or {}
-    if isinstance(patterns, dict) and "god_function" in patterns:
+    if has_god_function:
         try:
-            _GodFunctionSchema.model_validate(patterns["god_function"])  # type: ignore[name-defined]
-        except _ValidationError as exc:  # type: ignore[name-defined]
+            god_function_schema.model_validate(patterns["god_function"])
+        except validation_error as exc:
             errors.append(f"patterns.god_function: {exc}")
 
     if errors:
@@ -149,8 +161,15 @@ class Config:
             "max_file_size": 10000,
             "exact_topology_ceiling": 300,
             "topology_mode_above_ceiling": "deterministic_approximate",
+            "coherence_rebuild_fraction": 0.25,
             "analysis_cache_enabled": True,
             "analysis_cache_db": "",
+            "analysis_cache_trust": "hash",
+            "analysis_cache_verify_rate": 0.0,
+            "analysis_cache_max_mb": 512,
+            "analysis_cache_max_entries": 0,
+            "max_workers": 1,
+            "retain_code_snippets": True,
             "churn_commit_window": 200,
             "coverage_data_file": ".coverage",
             "hotspot_limit": 10,
@@ -192,8 +211,11 @@ class Config:
 
         # Load custom config
         if config_path and Path(config_path).exists():
+            import yaml
+
             with open(config_path, "r", encoding="utf-8") as f:
-                custom_config = yaml.safe_load(f)
+                # libyaml's loader when present: same safe semantics, far less startup.
+                custom_config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
                 self._merge_config(custom_config)
 
     def _merge_config(self, custom: Dict[str, Any]) -> None:
@@ -282,11 +304,15 @@ class Config:
     def get_topology_mode_above_ceiling(self) -> str:
         """How to compute topology after the exact ceiling is exceeded."""
         value = str(self.get("advanced.topology_mode_above_ceiling", "deterministic_approximate"))
-        return (
-            value
-            if value in {"deterministic_approximate", "exact"}
-            else "deterministic_approximate"
-        )
+        return value if value in TOPOLOGY_MODES else "deterministic_approximate"
+
+    def get_coherence_rebuild_fraction(self) -> float:
+        """Share of changed DCFs past which cached coherence is rebuilt, not repaired."""
+        value = self.get("advanced.coherence_rebuild_fraction", 0.25)
+        try:
+            return min(1.0, max(0.0, float(value)))
+        except (TypeError, ValueError):
+            return 0.25
 
     def use_analysis_cache(self) -> bool:
         """Check if repeated-run file analysis cache is enabled."""
@@ -296,6 +322,47 @@ class Config:
         """Get configured SQLite path for the file analysis cache."""
         return str(self.get("advanced.analysis_cache_db", "") or "")
 
+    def get_analysis_cache_trust(self) -> str:
+        """How cache hits are validated: ``hash`` (read and hash) or ``stat`` (metadata only)."""
+        value = self.get("advanced.analysis_cache_trust", "hash")
+        return value if value in {"hash", "stat"} else "hash"
+
+    def get_analysis_cache_verify_rate(self) -> float:
+        """Fraction of ``stat``-mode cache hits re-hashed to catch silent changes."""
+        value = self.get("advanced.analysis_cache_verify_rate", 0.0)
+        try:
+            return min(1.0, max(0.0, float(value)))
+        except (TypeError, ValueError):
+            return 0.0
+
+    def get_analysis_cache_max_bytes(self) -> int:
+        """Size above which the analysis cache evicts old entries (0 = unbounded)."""
+        value = self.get("advanced.analysis_cache_max_mb", 512)
+        try:
+            return max(0, int(float(value) * 2**20))
+        except (TypeError, ValueError):
+            return 512 * 2**20
+
+    def get_analysis_cache_max_entries(self) -> int:
+        """Entry count above which the analysis cache evicts old entries (0 = unbounded)."""
+        value = self.get("advanced.analysis_cache_max_entries", 0)
+        try:
+            return max(0, int(value))
+        except (TypeError, ValueError):
+            return 0
+
+    def get_max_workers(self) -> int:
+        """Worker processes for project analysis (1 = serial, 0 = one per CPU)."""
+        value = self.get("advanced.max_workers", 1)
+        try:
+            return max(0, int(value))
+        except (TypeError, ValueError):
+            return 1
+
+    def retain_code_snippets(self) -> bool:
+        """Whether project results keep per-issue code snippets."""
+        return bool(self.get("advanced.retain_code_snippets", True))
+
     def get_churn_commit_window(self) -> int:
         """Get the recent commit window used for churn-based prioritization."""
         value = self.get("advanced.churn_commit_window", 200)
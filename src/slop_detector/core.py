@@ -5,12 +5,42 @@ from __future__ import annotations
 import ast
 import hashlib
 import logging
+import marshal
+import os
+import random
+from contextlib import contextmanager
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from slop_detector.analysis_cache import CACHE_ENGINE_VERSION, FileAnalysisCache, fingerprint_config
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from slop_detector.analysis_cache import (
+    CACHE_ENGINE_VERSION,
+    CACHE_TIER_CONTENT,
+    CACHE_TIER_FUNCTIONS,
+    CACHE_TIER_HASH,
+    CACHE_TIER_MISS,
+    CACHE_TIER_STAGES,
+    CACHE_TIER_STALE,
+    CACHE_TIER_STAT,
+    CACHE_TIER_VERIFIED,
+    FileAnalysisCache,
+    fingerprint_config,
+)
 from slop_detector.config import Config
+from slop_detector.core_execution import (
+    LANGUAGE_GO,
+    LANGUAGE_JAVASCRIPT,
+    LANGUAGE_PYTHON,
+    WorkerState,
+    analyze_files_in_pool,
+    analyze_task,
+    iter_files_in_pool,
+    log_task_error,
+    resolve_worker_count,
+)
 from slop_detector.core_project import (
+    ProjectAggregate,
+    ProjectFiles,
     build_project_analysis,
     collect_project_scan_coverage,
     create_empty_project_analysis,
@@ -22,6 +52,7 @@ from slop_detector.core_project import (
     result_slop_score,
     result_status_value,
     result_total_lines,
+    scan_project_files,
     set_analyzed_scan_counts,
     should_ignore,
 )
@@ -32,14 +63,43 @@ from slop_detector.core_scoring import (
     compute_deficit_breakdown,
     compute_gqg,
 )
+from slop_detector.core_stages import (
+    STAGE_CONTEXT_JARGON,
+    STAGE_DDC,
+    STAGE_DOCSTRING_INFLATION,
+    STAGE_FUNCTION_JARGON,
+    STAGE_FUNCTION_PATTERNS,
+    STAGE_HALLUCINATION_DEPS,
+    STAGE_INFLATION,
+    STAGE_LDR,
+    STAGE_PARSE,
+    DefinitionIndex,
+    FileStages,
+    ParseFacts,
+    PatternResult,
+    dump_definition_findings,
+    dump_definition_jargon,
+    dump_metric,
+    dump_parse_facts,
+    dump_pattern_result,
+    known_jargon_hits,
+    merge_definition_findings,
+    pattern_stage,
+    restore_metric,
+    restore_parse_facts,
+    restore_pattern_result,
+    stage_fingerprints,
+)
 from slop_detector.core_topology import (
-    compute_coherence_vr,
+    CoherenceEstimate,
     compute_coherence_vr_exact,
     compute_dcf,
     deterministic_sample_indices,
+    estimate_coherence_vr,
+    incremental_coherence_vr_exact,
     js_divergence,
 )
-from slop_detector.file_role import classify_file
+from slop_detector.file_role import classify_file, path_role
 from slop_detector.ignore_handler import IgnoreHandler
 from slop_detector.masking import FrameworkMasker
 from slop_detector.metrics import DDCCalculator, InflationCalculator, LDRCalculator
@@ -49,6 +109,7 @@ from slop_detector.metrics.hallucination_deps import HallucinationDepsDetector
 from slop_detector.models import (
     FileAnalysis,
     IgnoredFunction,
+    InflationResult,
     MaskedIssue,
     ProjectAnalysis,
     SlopStatus,
@@ -57,13 +118,22 @@ from slop_detector.models import (
 )
 from slop_detector.patterns import get_all_patterns
 from slop_detector.patterns.base import Issue
-from slop_detector.patterns.registry import PatternRegistry
+from slop_detector.patterns.python_imports import import_context_key
+from slop_detector.patterns.registry import PatternOutcome, PatternRegistry, is_function_scoped
 from slop_detector.prioritization import ProjectPrioritizer
 from slop_detector.rust_scan import discover_project_files
+from slop_detector.source_context import SourceContext, source_context_for
 from slop_detector.suppression_handler import SuppressionHandler
 
 logger = logging.getLogger(__name__)
 
+# Project aggregate kinds for structural coherence (``FileAnalysisCache.put_aggregate``):
+# results by DCF content, and per project the MST that the next scan repairs.
+_COHERENCE_AGGREGATE = "coherence"
+_TOPOLOGY_AGGREGATE = "coherence_topology"
+# ``ml_scoring`` of results whose ML score is left to the project's batch stage.
+_ML_SCORING_PENDING: Dict[str, Any] = {"status": "pending"}
+
 
 class SlopDetector:
     """Main SLOP detection engine with v2.1 pattern support."""
@@ -78,6 +148,56 @@ class SlopDetector:
                          ML scoring is silently disabled when the file is absent.
         """
         self.config = Config(config_path)
+        self._config_path = config_path
+        self._model_path = model_path
+        # Project runs score ML in one batch once every file is analyzed.
+        self._defer_ml_scoring = False
+        self._build_analyzers()
+
+        # Phase 3b: JS/TS analyzer (lazy — only instantiated when needed)
+        self._js_analyzer = None
+        # Phase 3c: Go analyzer (lazy — only instantiated when needed)
+        self._go_analyzer = None
+        self._analysis_cache = (
+            FileAnalysisCache(
+                self.config.get_analysis_cache_db(),
+                max_bytes=self.config.get_analysis_cache_max_bytes(),
+                max_entries=self.config.get_analysis_cache_max_entries(),
+            )
+            if self.config.use_analysis_cache()
+            else None
+        )
+        # Config fingerprint shared by every file of an open cache session.
+        self._cache_fingerprint: Optional[str] = None
+        self._stage_fingerprint_memo: Optional[Tuple[str, Dict[str, str]]] = None
+        self.project_prioritizer = ProjectPrioritizer(self.config)
+
+    @cached_property
+    def _ml_capability(self) -> tuple[Any, Dict[str, Any]]:
+        """Optional ML scorer and its availability, loaded on first analysis.
+
+        Unpickling the model (and importing its numeric stack) is deferred so
+        commands that never score a file do not pay for it. Unavailable
+        capability is carried into reports.
+        """
+        from slop_detector.ml.scorer import MLScorer
+
+        model_path = (
+            Path(self._model_path) if self._model_path else Path("models/slop_classifier.pkl")
+        )
+        scorer, availability = MLScorer.from_model_with_status(model_path)
+        return scorer, availability.to_dict()
+
+    @cached_property
+    def _ml_scorer(self) -> Any:
+        return self._ml_capability[0]
+
+    @cached_property
+    def _ml_scoring(self) -> Dict[str, Any]:
+        return self._ml_capability[1]
+
+    def _build_analyzers(self) -> None:
+        """(Re)build metric calculators and the pattern registry from ``self.config``."""
         self.ldr_calc = LDRCalculator(self.config)
         self.inflation_calc = InflationCalculator(self.config)
         self.ddc_calc = DDCCalculator(self.config)
@@ -99,26 +219,6 @@ class SlopDetector:
         for pattern_id in disabled:
             self.pattern_registry.disable(pattern_id)
 
-        # Optional ML scorer: unavailable capability is carried into reports.
-        from pathlib import Path as _Path
-
-        from slop_detector.ml.scorer import MLScorer as _MLScorer
-
-        _mp = _Path(model_path) if model_path else _Path("models/slop_classifier.pkl")
-        self._ml_scorer, availability = _MLScorer.from_model_with_status(_mp)
-        self._ml_scoring = availability.to_dict()
-
-        # Phase 3b: JS/TS analyzer (lazy — only instantiated when needed)
-        self._js_analyzer = None
-        # Phase 3c: Go analyzer (lazy — only instantiated when needed)
-        self._go_analyzer = None
-        self._analysis_cache = (
-            FileAnalysisCache(self.config.get_analysis_cache_db())
-            if self.config.use_analysis_cache()
-            else None
-        )
-        self.project_prioritizer = ProjectPrioritizer(self.config)
-
     def _get_js_analyzer(self):
         """Lazy-load JSAnalyzer (avoids import cost when not used)."""
         if self._js_analyzer is None:
@@ -153,6 +253,24 @@ class SlopDetector:
         logger.info(f"Analyzing: {file_path}")
 
         stat = path_obj.stat()
+        cache = self._analysis_cache
+        config_fingerprint = None
+        stat_hit = None
+        if cache is not None:
+            config_fingerprint = self._cache_fingerprint or fingerprint_config(self.config.config)
+            if self.config.get_analysis_cache_trust() == "stat":
+                stat_hit = cache.get_by_stat(
+                    file_path=file_path,
+                    file_size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    inode=stat.st_ino,
+                    config_fingerprint=config_fingerprint,
+                    engine_version=CACHE_ENGINE_VERSION,
+                )
+                verify_rate = self.config.get_analysis_cache_verify_rate()
+                if stat_hit is not None and not (verify_rate and random.random() < verify_rate):
+                    return self._serve_cached(stat_hit[0], CACHE_TIER_STAT, file_path, stat_hit[1])
+
         try:
             raw_bytes = path_obj.read_bytes()
         except Exception as e:
@@ -161,46 +279,170 @@ class SlopDetector:
         content = raw_bytes.decode("utf-8", errors="ignore")
         content_hash = hashlib.sha256(raw_bytes).hexdigest()
 
-        if self._analysis_cache is not None:
-            cached = self._analysis_cache.get(
-                file_path=file_path,
-                file_size=stat.st_size,
-                mtime_ns=stat.st_mtime_ns,
-                content_hash=content_hash,
-                config_fingerprint=fingerprint_config(self.config.config),
-                engine_version=CACHE_ENGINE_VERSION,
+        tier = CACHE_TIER_MISS
+        path_role_key = None
+        if cache is not None and config_fingerprint is not None:
+            if stat_hit is not None:
+                if stat_hit[1] == content_hash:
+                    return self._serve_cached(
+                        stat_hit[0], CACHE_TIER_VERIFIED, file_path, content_hash
+                    )
+                logger.warning(
+                    "Cached analysis of %s no longer matches its content although size, "
+                    "mtime and inode are unchanged; re-analyzing",
+                    file_path,
+                )
+                tier = CACHE_TIER_STALE
+            else:
+                cached = cache.get(
+                    file_path=file_path,
+                    file_size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    content_hash=content_hash,
+                    config_fingerprint=config_fingerprint,
+                    engine_version=CACHE_ENGINE_VERSION,
+                )
+                if cached is not None:
+                    if self.config.get_analysis_cache_trust() == "stat":
+                        # The row predates inode tracking or the file was
+                        # replaced in place; record the inode for next time.
+                        cache.put(
+                            file_path=file_path,
+                            file_size=stat.st_size,
+                            mtime_ns=stat.st_mtime_ns,
+                            content_hash=content_hash,
+                            config_fingerprint=config_fingerprint,
+                            result=cached,
+                            engine_version=CACHE_ENGINE_VERSION,
+                            inode=stat.st_ino,
+                            path_role=self._path_role_key(file_path),
+                        )
+                    return self._serve_cached(cached, CACHE_TIER_HASH, file_path, content_hash)
+                # Another checkout, worktree or name may hold the same content.
+                path_role_key = self._path_role_key(file_path)
+                cached = cache.get_by_content(
+                    file_path=file_path,
+                    content_hash=content_hash,
+                    path_role=path_role_key,
+                    config_fingerprint=config_fingerprint,
+                    engine_version=CACHE_ENGINE_VERSION,
+                )
+                if cached is not None:
+                    cache.put(
+                        file_path=file_path,
+                        file_size=stat.st_size,
+                        mtime_ns=stat.st_mtime_ns,
+                        content_hash=content_hash,
+                        config_fingerprint=config_fingerprint,
+                        result=cached,
+                        engine_version=CACHE_ENGINE_VERSION,
+                        inode=stat.st_ino,
+                        path_role=path_role_key,
+                    )
+                    return self._serve_cached(cached, CACHE_TIER_CONTENT, file_path, content_hash)
+
+        # Stages still valid under this config are reused from an earlier
+        # analysis of the same content, whatever else in the config changed.
+        stages = None
+        if cache is not None and config_fingerprint is not None:
+            path_role_key = path_role_key or self._path_role_key(file_path)
+            entries = cache.get_stages(content_hash, path_role_key, CACHE_ENGINE_VERSION)
+            stages = FileStages(
+                self._stage_fingerprints(config_fingerprint),
+                entries,
+                # New content, typically an edit: unchanged definitions keep
+                # the findings stored with the path's previous content.
+                previous=(
+                    None
+                    if entries
+                    else cache.get_previous_stages(file_path, path_role_key, CACHE_ENGINE_VERSION)
+                ),
             )
-            if cached is not None:
-                logger.debug("File analysis cache hit: %s", file_path)
-                # Capability belongs to this execution environment, not the
-                # cached file content. Never surface a historical ML score when
-                # the current run cannot load its model.
-                cached.ml_scoring = self._ml_scoring
-                if self._ml_scorer is None:
-                    cached.ml_score = None
-                return cached
-
-        # Parse AST once
-        try:
-            tree = ast.parse(content, filename=file_path)
-        except SyntaxError as e:
-            logger.warning(f"Syntax error in {file_path}: {e}")
-            # Return minimal analysis
-            return self._create_error_analysis(file_path, str(e))
 
-        result = self._build_file_analysis(file_path, content, tree)
-        if self._analysis_cache is not None:
-            self._analysis_cache.put(
+        # Parse AST once; content with stage entries is known to parse, and
+        # is parsed later only if some stage has to run.
+        tree = None
+        if stages is None or not stages.entries:
+            try:
+                tree = ast.parse(content, filename=file_path)
+            except SyntaxError as e:
+                logger.warning(f"Syntax error in {file_path}: {e}")
+                # Return minimal analysis
+                return self._create_error_analysis(file_path, str(e))
+
+        result = self._build_file_analysis(file_path, content, tree, stages)
+        result.content_hash = content_hash
+        if cache is not None and config_fingerprint is not None and path_role_key is not None:
+            cache.put(
                 file_path=file_path,
                 file_size=stat.st_size,
                 mtime_ns=stat.st_mtime_ns,
                 content_hash=content_hash,
-                config_fingerprint=fingerprint_config(self.config.config),
+                config_fingerprint=config_fingerprint,
                 result=result,
                 engine_version=CACHE_ENGINE_VERSION,
+                inode=stat.st_ino,
+                path_role=path_role_key,
             )
+            if stages is not None:
+                if stages.computed:
+                    cache.put_stages(
+                        content_hash, path_role_key, stages.entries, CACHE_ENGINE_VERSION
+                    )
+                if tier == CACHE_TIER_MISS and stages.reused:
+                    tier = CACHE_TIER_STAGES
+                elif tier == CACHE_TIER_MISS and stages.definitions_reused:
+                    tier = CACHE_TIER_FUNCTIONS
+            result.cache_tier = tier
         return result
 
+    def _stage_fingerprints(self, config_fingerprint: str) -> Dict[str, str]:
+        """Per-stage config fingerprints, recomputed only when the config changes."""
+        memo = self._stage_fingerprint_memo
+        if memo is None or memo[0] != config_fingerprint:
+            patterns = self.pattern_registry.get_all()
+            memo = (
+                config_fingerprint,
+                stage_fingerprints(
+                    self.config,
+                    [pattern.id for pattern in patterns],
+                    [pattern.id for pattern in patterns if is_function_scoped(pattern)],
+                ),
+            )
+            self._stage_fingerprint_memo = memo
+        return memo[1]
+
+    def _path_role_key(self, file_path: str) -> str:
+        """Digest of every path-derived input to the analysis of ``file_path``.
+
+        Files with equal content and equal keys analyze identically apart from
+        the paths they report, so the cache can share one result between them.
+        """
+        path = Path(file_path)
+        role = path_role(file_path)
+        signals = (
+            role.value if role is not None else "",
+            path.name == "__init__.py",
+            file_path.endswith(".pyi"),
+            FrameworkMasker.is_python_test_file(path),
+            self.inflation_calc.is_config_path(file_path),
+            self.context_jargon_detector.path_signals(file_path),
+            import_context_key(path),
+        )
+        return hashlib.sha256(repr(signals).encode("utf-8")).hexdigest()[:16]
+
+    def _serve_cached(
+        self, cached: FileAnalysis, tier: str, file_path: str, content_hash: str
+    ) -> FileAnalysis:
+        logger.debug("File analysis cache hit (%s): %s", tier, file_path)
+        cached.cache_tier = tier
+        cached.content_hash = content_hash
+        # Capability belongs to this execution environment, not the cached
+        # file content. Never surface a historical ML score when the current
+        # run cannot load its model.
+        self._attach_ml_score(cached)
+        return cached
+
     def analyze_code_string(self, content: str, filename: str = "<string>") -> FileAnalysis:
         """Analyze Python source code provided as a string (no file I/O).
 
@@ -220,7 +462,12 @@ class SlopDetector:
             return self._create_error_analysis(filename, str(e))
         return self._build_file_analysis(filename, content, tree)
 
-    def analyze_project(self, project_path: str, pattern: str = "**/*.py") -> ProjectAnalysis:
+    def analyze_project(
+        self,
+        project_path: str,
+        pattern: str = "**/*.py",
+        max_workers: Optional[int] = None,
+    ) -> ProjectAnalysis:
         """
         Analyze entire project with weighted scoring.
 
@@ -228,34 +475,60 @@ class SlopDetector:
         - Weighted by file size (LOC)
         - Respects ignore patterns
         - Parallel-ready architecture
+
+        Args:
+            project_path: Project root to scan.
+            pattern:      Glob used for Python discovery.
+            max_workers:  Worker processes for file analysis. ``None`` reads
+                          ``advanced.max_workers``; ``0`` uses one per CPU;
+                          ``1`` keeps the serial in-process path.
         """
         project_path_obj = Path(project_path)
         ignore_patterns = self.config.get_ignore_patterns()
-        scan_coverage = self._collect_project_scan_coverage(project_path_obj, ignore_patterns)
-
-        # Rust discovery is optional acceleration, not the source of truth. Its
-        # paths must agree with root-relative Python discovery before use.
-        python_files = self._discover_supported_files(
-            project_path_obj, [pattern], {".py"}, ignore_patterns
-        )
+        # One walk finds Python, JS/TS and Go sources and builds scan coverage.
+        project_files = self._scan_project_files(project_path_obj, ignore_patterns, pattern)
+        scan_coverage = project_files.scan_coverage
+        python_files = project_files.python
 
         logger.info(f"Found {len(python_files)} Python files in {project_path}")
 
-        # Analyze files
-        results: List[FileAnalysis] = []
-        for file_path in python_files:
+        requested_workers = self.config.get_max_workers() if max_workers is None else max_workers
+        retain_snippets = self.config.retain_code_snippets()
+        parallel = None
+        if requested_workers != 1:
+            parallel = self._analyze_project_parallel(project_files, requested_workers)
+        if parallel is not None:
+            results, js_results, go_results = parallel
+            if not retain_snippets:
+                for result in results:
+                    result.drop_code_snippets()
+        else:
+            # Analyze files
+            results = []
+            self._defer_ml_scoring = True
             try:
-                result = self.analyze_file(str(file_path))
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error analyzing {file_path}: {e}")
-
-        # Phase 3b: JS/TS analysis is independent of Python — run before early return
-        js_results = self._analyze_js_files(project_path_obj, ignore_patterns)
-        # Phase 3c: Go analysis is independent of Python — run before early return
-        go_results = self._analyze_go_files(project_path_obj, ignore_patterns)
+                with self._analysis_cache_session(python_files):
+                    for file_path in python_files:
+                        try:
+                            result = self.analyze_file(str(file_path))
+                            if not retain_snippets:
+                                result.drop_code_snippets()
+                            results.append(result)
+                        except Exception as e:
+                            logger.error(f"Error analyzing {file_path}: {e}")
+            finally:
+                self._defer_ml_scoring = False
+
+            # Phase 3b: JS/TS analysis is independent of Python — run before early return
+            js_results = self._analyze_js_files(
+                project_path_obj, ignore_patterns, project_files.javascript
+            )
+            # Phase 3c: Go analysis is independent of Python — run before early return
+            go_results = self._analyze_go_files(project_path_obj, ignore_patterns, project_files.go)
+        self._score_ml([result for result in results if result.ml_scoring == _ML_SCORING_PENDING])
         if not results and not js_results and not go_results:
             logger.warning("No files analyzed")
+        self._schedule_cache_eviction()
 
         return build_project_analysis(
             str(project_path),
@@ -265,38 +538,282 @@ class SlopDetector:
             go_results,
             scan_coverage,
             self.config.use_weighted_analysis(),
-            self._compute_coherence_vr,
-            self.project_prioritizer.prioritize_project,
+            partial(self._project_coherence, project_path=str(project_path_obj)),
+            self._prioritize_project,
             self._ml_scoring,
         )
 
-    def _build_file_analysis(self, file_path: str, content: str, tree: ast.AST) -> FileAnalysis:
-        """Build a FileAnalysis from already-read source and parsed AST."""
+    def _analyze_project_parallel(
+        self, project_files: ProjectFiles, requested_workers: int
+    ) -> Optional[tuple[List[FileAnalysis], List, List]]:
+        """Analyze Python, JS/TS and Go files across worker processes.
+
+        Returns ``None`` when the serial path should run instead (a single
+        file, one worker, or a pool that could not start).
+        """
+        python_files = project_files.python
+        js_files = project_files.javascript
+        go_files = project_files.go
+        task_count = len(python_files) + len(js_files) + len(go_files)
+        worker_count = resolve_worker_count(requested_workers, task_count)
+        if worker_count <= 1:
+            return None
+
+        logger.info(f"Analyzing {task_count} files with {worker_count} worker processes")
+        state = self._worker_state(defer_ml_scoring=True)
+        by_language = analyze_files_in_pool(
+            [
+                (LANGUAGE_PYTHON, python_files),
+                (LANGUAGE_JAVASCRIPT, js_files),
+                (LANGUAGE_GO, go_files),
+            ],
+            worker_count,
+            state,
+        )
+        if by_language is None:
+            return None
+        if js_files:
+            logger.info(f"Analyzed {len(by_language[LANGUAGE_JAVASCRIPT])} JS/TS files")
+        if go_files:
+            logger.info(f"Analyzed {len(by_language[LANGUAGE_GO])} Go files")
+        return (
+            by_language[LANGUAGE_PYTHON],
+            by_language[LANGUAGE_JAVASCRIPT],
+            by_language[LANGUAGE_GO],
+        )
+
+    def _worker_state(self, defer_ml_scoring: bool = False) -> WorkerState:
+        """Snapshot the effective configuration for worker processes.
+
+        With ``defer_ml_scoring`` workers leave ML scoring to the parent,
+        which scores the whole project in one batch.
+        """
+        return WorkerState(
+            config_path=self._config_path,
+            model_path=self._model_path,
+            config=self.config.config,
+            cache_db=(
+                str(self._analysis_cache.db_path) if self._analysis_cache is not None else None
+            ),
+            defer_ml_scoring=defer_ml_scoring,
+        )
+
+    @contextmanager
+    def _analysis_cache_session(
+        self, file_paths: Sequence[Any], batch_writes: bool = False
+    ) -> Iterator[None]:
+        """Prefetch cache rows for ``file_paths`` and batch writes until exit.
+
+        The config fingerprint is computed once for the whole session rather
+        than for every file lookup. With ``batch_writes``, a session opens
+        even without Python files, for the JS/TS and Go results to be written.
+        """
+        cache = self._analysis_cache
+        if cache is None or not (file_paths or batch_writes) or self._cache_fingerprint is not None:
+            yield
+            return
+        fingerprint = fingerprint_config(self.config.config)
+        # Resolve each directory once; a symlinked file simply misses the
+        # prefetch and is looked up on its own.
+        directories: Dict[str, str] = {}
+        resolved = []
+        for file_path in file_paths:
+            directory, name = os.path.split(os.fspath(file_path))
+            if directory not in directories:
+                directories[directory] = str(Path(directory).resolve())
+            resolved.append(os.path.join(directories[directory], name))
+        with cache.session(resolved, fingerprint, CACHE_ENGINE_VERSION):
+            self._cache_fingerprint = fingerprint
+            try:
+                yield
+            finally:
+                self._cache_fingerprint = None
+
+    def _schedule_cache_eviction(self) -> None:
+        """Trim the analysis cache to its configured limits off the scan path."""
+        if self._analysis_cache is not None:
+            self._analysis_cache.schedule_eviction()
+
+    def analyze_project_iter(
+        self,
+        project_path: str,
+        pattern: str = "**/*.py",
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Yield each file result as it finishes, then a project summary.
+
+        Python ``FileAnalysis`` results come first in discovery order, then
+        ``JSFileAnalysis`` and ``GoFileAnalysis`` results. The last item is a
+        ``ProjectAnalysis`` built from running aggregates: its totals, scores,
+        hotspots and finding summary match ``analyze_project``, but its
+        per-file result lists are empty because every file was already
+        yielded. Files that fail to analyze are logged and skipped, as in
+        ``analyze_project``. With ``advanced.retain_code_snippets`` off, a
+        Python result's code snippets are dropped once the consumer asks for
+        the next item.
+        """
+        project_path_obj = Path(project_path)
+        ignore_patterns = self.config.get_ignore_patterns()
+        project_files = self._scan_project_files(project_path_obj, ignore_patterns, pattern)
+        scan_coverage = project_files.scan_coverage
+        files_by_language = [
+            (LANGUAGE_PYTHON, project_files.python),
+            (LANGUAGE_JAVASCRIPT, project_files.javascript),
+            (LANGUAGE_GO, project_files.go),
+        ]
+        task_count = sum(len(paths) for _, paths in files_by_language)
+        requested_workers = self.config.get_max_workers() if max_workers is None else max_workers
+        worker_count = resolve_worker_count(requested_workers, task_count)
+
+        def run_here(task: tuple[str, str]) -> tuple[Any, Optional[str]]:
+            return analyze_task(self, task)
+
+        outcomes: Iterator[tuple[str, str, Any, Optional[str]]]
+        if worker_count > 1:
+            logger.info(f"Streaming {task_count} files with {worker_count} worker processes")
+            outcomes = iter_files_in_pool(
+                files_by_language, worker_count, self._worker_state(), run_here
+            )
+        else:
+            outcomes = (
+                (language, str(path), *run_here((language, str(path))))
+                for language, paths in files_by_language
+                for path in paths
+            )
+
+        retain_snippets = self.config.retain_code_snippets()
+        aggregate = ProjectAggregate()
+        # Workers open their own cache sessions; the serial path shares this one.
+        with self._analysis_cache_session(
+            project_files.python if worker_count <= 1 else [], batch_writes=worker_count <= 1
+        ):
+            for language, file_path, result, error in outcomes:
+                if error is not None:
+                    log_task_error(language, file_path, error)
+                    continue
+                aggregate.add(language, result)
+                yield result
+                if not retain_snippets and language == LANGUAGE_PYTHON:
+                    # The consumer has rendered this file; keep no snippets if it holds on.
+                    result.drop_code_snippets()
+        if not aggregate.total_files:
+            logger.warning("No files analyzed")
+        self._schedule_cache_eviction()
+
+        yield aggregate.build(
+            str(project_path),
+            str(project_path_obj),
+            scan_coverage,
+            self.config.use_weighted_analysis(),
+            partial(self._project_coherence, project_path=str(project_path_obj)),
+            self._prioritize_project,
+            self._ml_scoring,
+        )
+
+    def _build_file_analysis(
+        self,
+        file_path: str,
+        content: str,
+        tree: Optional[ast.AST],
+        stages: Optional[FileStages] = None,
+    ) -> FileAnalysis:
+        """Build a FileAnalysis from already-read source and parsed AST.
+
+        With ``stages``, every stage whose entry is still valid is restored
+        instead of run and the stages that do run are stored back into it.
+        ``tree`` may then be ``None``; the source is parsed on first need.
+        Stages that rerun while recording reuse the per-definition findings
+        of unchanged functions and classes (see ``DefinitionIndex``).
+        """
         from slop_detector.file_role import ROLE_SKIP
 
-        role = classify_file(file_path, content, tree)  # type: ignore[arg-type]
-        skip = ROLE_SKIP[role]
-
-        ldr = self.ldr_calc.calculate(file_path, content, tree)
-        inflation = self.inflation_calc.calculate(file_path, content, tree)
-        ddc = self.ddc_calc.calculate(file_path, content, tree)
-        dcf = self._compute_dcf(tree)
-        docstring_inflation = self.docstring_inflation_detector.analyze(file_path, content, tree)
-        hallucination_deps = self.hallucination_deps_detector.analyze(file_path, content, tree, ddc)
-        context_jargon = self.context_jargon_detector.analyze(file_path, content, tree, inflation)
-        ignored_functions = IgnoreHandler.collect_ignored_functions(tree)
-        suppression_directives = SuppressionHandler.parse_comment_suppressions(content)
-        pattern_issues, suppression_ledger, masked_issues = (
-            ([], [], [])
-            if "patterns" in skip
-            else self._run_patterns(
-                tree,
+        stages = stages or FileStages({}, record=False)
+        # One shared view of the file: lines, classification, function spans.
+        parsed: List[Tuple[ast.AST, SourceContext]] = []
+        indexed: List[Optional[DefinitionIndex]] = []
+
+        def parse() -> Tuple[ast.AST, SourceContext]:
+            if not parsed:
+                node = tree if tree is not None else ast.parse(content, filename=file_path)
+                parsed.append((node, SourceContext(content, node)))
+            return parsed[0]
+
+        def definitions() -> Optional[DefinitionIndex]:
+            if not indexed:
+                node, source = parse()
+                indexed.append(
+                    DefinitionIndex.build(content, node, source) if stages.record else None
+                )
+            return indexed[0]
+
+        if stages.valid(STAGE_PARSE):
+            facts = restore_parse_facts(stages.payload(STAGE_PARSE))
+        else:
+            node, source = parse()
+            facts = ParseFacts(
+                role=classify_file(file_path, content, node),  # type: ignore[arg-type]
+                dcf=self._compute_dcf(node),
+                ignored_functions=IgnoreHandler.collect_ignored_functions(node),
+                suppression_directives=SuppressionHandler.parse_comment_suppressions(
+                    content, source
+                ),
+            )
+            stages.store(STAGE_PARSE, facts, dump_parse_facts)
+        skip = ROLE_SKIP[facts.role]
+        ignored_functions = facts.ignored_functions
+        suppression_directives = facts.suppression_directives
+
+        def metric(stage: str, compute: Callable[[], Any]) -> Any:
+            if stages.valid(stage):
+                return restore_metric(stage, stages.payload(stage))
+            value = compute()
+            stages.store(stage, value, dump_metric)
+            return value
+
+        ldr = metric(STAGE_LDR, lambda: self.ldr_calc.calculate(file_path, content, *parse()))
+        inflation = metric(
+            STAGE_INFLATION,
+            lambda: self._calculate_inflation(file_path, content, *parse(), definitions(), stages),
+        )
+        ddc = metric(STAGE_DDC, lambda: self.ddc_calc.calculate(file_path, content, parse()[0]))
+        docstring_inflation = metric(
+            STAGE_DOCSTRING_INFLATION,
+            lambda: self.docstring_inflation_detector.analyze(file_path, content, parse()[0]),
+        )
+        hallucination_deps = metric(
+            STAGE_HALLUCINATION_DEPS,
+            lambda: self.hallucination_deps_detector.analyze(file_path, content, parse()[0], ddc),
+        )
+        context_jargon = metric(
+            STAGE_CONTEXT_JARGON,
+            lambda: self.context_jargon_detector.analyze(
+                file_path, content, parse()[0], inflation, parse()[1]
+            ),
+        )
+        pattern_issues: List[Issue] = []
+        suppression_ledger: List[SuppressionLedgerEntry] = []
+        masked_issues: List[MaskedIssue] = []
+        if "patterns" not in skip:
+            patterns_cached = all(
+                stages.valid(pattern_stage(pattern.id))
+                for pattern in self.pattern_registry.get_all()
+            )
+            # Fully cached patterns need no tree (only to-be-run ones do).
+            pattern_tree: Optional[ast.AST] = None
+            pattern_source: Optional[SourceContext] = None
+            if not patterns_cached:
+                pattern_tree, pattern_source = parse()
+            pattern_issues, suppression_ledger, masked_issues = self._run_patterns(
+                pattern_tree,
                 Path(file_path),
                 content,
                 ignored_functions,
                 suppression_directives=suppression_directives,
+                source=pattern_source,
+                stages=stages,
+                definitions=None if patterns_cached else definitions(),
             )
-        )
+        dcf = facts.dcf
 
         slop_score, slop_status, warnings, deficit_breakdown = self._calculate_slop_status(
             ldr, inflation, ddc, pattern_issues, skip=skip
@@ -327,12 +844,36 @@ class SlopDetector:
                 "SUPPRESSIONS: high inline suppression usage — review whether rules should be fixed or narrowed"
             )
 
-        if self._ml_scorer is not None:
-            result.ml_score = self._ml_scorer.score(result)
-        result.ml_scoring = self._ml_scoring
+        self._attach_ml_score(result)
 
         return result
 
+    def _attach_ml_score(self, result: FileAnalysis) -> None:
+        """Score ``result`` now, or mark it for the project's batched ML stage."""
+        if self._defer_ml_scoring:
+            result.ml_scoring = dict(_ML_SCORING_PENDING)
+        else:
+            self._score_ml([result])
+
+    def _score_ml(self, results: Sequence[FileAnalysis]) -> None:
+        """Attach this run's ML capability and score every result still missing one.
+
+        Unscored results go through one batched model call. Scores restored
+        from the cache are kept while the model is available and cleared when
+        it is not.
+        """
+        scorer = self._ml_scorer
+        for result in results:
+            result.ml_scoring = self._ml_scoring
+            if scorer is None:
+                result.ml_score = None
+        if scorer is None:
+            return
+        pending = [result for result in results if result.ml_score is None]
+        if pending:
+            for result, ml_score in zip(pending, scorer.score_batch(pending)):
+                result.ml_score = ml_score
+
     _JS_EXTENSIONS = frozenset({".js", ".jsx", ".ts", ".tsx"})
 
     def _discover_supported_files(
@@ -351,100 +892,269 @@ class SlopDetector:
             rust_discoverer=discover_project_files,
         )
 
-    def _analyze_js_files(self, project_path_obj: Path, ignore_patterns: List[str]) -> List:
-        """Scan and analyze JS/TS files in project_path_obj (Phase 3b)."""
-        js_files = self._discover_supported_files(
-            project_path_obj,
-            [f"**/*{ext}" for ext in self._JS_EXTENSIONS],
-            self._JS_EXTENSIONS,
-            ignore_patterns,
-        )
+    def _analyze_js_files(
+        self,
+        project_path_obj: Path,
+        ignore_patterns: List[str],
+        js_files: Optional[List[Path]] = None,
+    ) -> List:
+        """Scan and analyze JS/TS files in project_path_obj (Phase 3b).
+
+        ``js_files`` skips discovery when the caller already walked the project.
+        """
+        if js_files is None:
+            js_files = self._discover_supported_files(
+                project_path_obj,
+                [f"**/*{ext}" for ext in self._JS_EXTENSIONS],
+                self._JS_EXTENSIONS,
+                ignore_patterns,
+            )
         if not js_files:
             return []
-        analyzer = self._get_js_analyzer()
         results = []
-        for fp in js_files:
-            try:
-                results.append(analyzer.analyze(str(fp)))
-            except Exception as exc:
-                logger.error(f"Error analyzing JS/TS file {fp}: {exc}")
+        with self._analysis_cache_session([], batch_writes=True):
+            for fp in js_files:
+                try:
+                    results.append(self.analyze_js_file(str(fp)))
+                except Exception as exc:
+                    logger.error(f"Error analyzing JS/TS file {fp}: {exc}")
         logger.info(f"Analyzed {len(results)} JS/TS files")
         return results
 
     def analyze_js_file(self, file_path: str):
         """Analyze a single JS/TS file and return JSFileAnalysis."""
-        return self._get_js_analyzer().analyze(file_path)
+        return self._analyze_language_file(LANGUAGE_JAVASCRIPT, file_path, self._get_js_analyzer())
 
     _GO_EXTENSIONS = frozenset({".go"})
 
-    def _analyze_go_files(self, project_path_obj: Path, ignore_patterns: List[str]) -> List:
-        """Scan and analyze Go files in project_path_obj (Phase 3c)."""
-        go_files = self._discover_supported_files(
-            project_path_obj,
-            [f"**/*{ext}" for ext in self._GO_EXTENSIONS],
-            self._GO_EXTENSIONS,
-            ignore_patterns,
-        )
+    def _analyze_go_files(
+        self,
+        project_path_obj: Path,
+        ignore_patterns: List[str],
+        go_files: Optional[List[Path]] = None,
+    ) -> List:
+        """Scan and analyze Go files in project_path_obj (Phase 3c).
+
+        ``go_files`` skips discovery when the caller already walked the project.
+        """
+        if go_files is None:
+            go_files = self._discover_supported_files(
+                project_path_obj,
+                [f"**/*{ext}" for ext in self._GO_EXTENSIONS],
+                self._GO_EXTENSIONS,
+                ignore_patterns,
+            )
         if not go_files:
             return []
-        analyzer = self._get_go_analyzer()
         results = []
-        for fp in go_files:
-            try:
-                results.append(analyzer.analyze(str(fp)))
-            except Exception as exc:
-                logger.error(f"Error analyzing Go file {fp}: {exc}")
+        with self._analysis_cache_session([], batch_writes=True):
+            for fp in go_files:
+                try:
+                    results.append(self.analyze_go_file(str(fp)))
+                except Exception as exc:
+                    logger.error(f"Error analyzing Go file {fp}: {exc}")
         logger.info(f"Analyzed {len(results)} Go files")
         return results
 
     def analyze_go_file(self, file_path: str):
         """Analyze a single .go file and return GoFileAnalysis."""
-        return self._get_go_analyzer().analyze(file_path)
+        return self._analyze_language_file(LANGUAGE_GO, file_path, self._get_go_analyzer())
+
+    def _analyze_language_file(self, language: str, file_path: str, analyzer: Any) -> Any:
+        """Analyze a JS/TS or Go file, serving it from the analysis cache when possible.
+
+        Results are keyed by content hash and ``analyzer.cache_key``, which
+        covers the analyzer mode (tree-sitter or regex), its thresholds and
+        the path-derived inputs.
+        """
+        cache = self._analysis_cache
+        if cache is None:
+            return analyzer.analyze(file_path)
+        try:
+            raw_bytes = Path(file_path).read_bytes()
+        except OSError:
+            # Let the analyzer report the unreadable file as it always has.
+            return analyzer.analyze(file_path)
+        content_hash = hashlib.sha256(raw_bytes).hexdigest()
+        analyzer_key = analyzer.cache_key(file_path)
+        cached = cache.get_language(
+            language, file_path, content_hash, analyzer_key, CACHE_ENGINE_VERSION
+        )
+        if cached is not None:
+            cached.cache_tier = CACHE_TIER_HASH
+            return cached
+        result = analyzer.analyze(file_path, raw_bytes.decode("utf-8", errors="ignore"))
+        cache.put_language(language, content_hash, analyzer_key, result, CACHE_ENGINE_VERSION)
+        result.cache_tier = CACHE_TIER_MISS
+        return result
 
     def _run_patterns(
         self,
-        tree: ast.AST,
+        tree: Optional[ast.AST],
         file: Path,
         content: str,
         ignored_functions: Optional[List[IgnoredFunction]] = None,
         suppression_directives: Optional[List[SuppressionDirective]] = None,
+        source: Optional[SourceContext] = None,
+        stages: Optional[FileStages] = None,
+        definitions: Optional[DefinitionIndex] = None,
     ) -> tuple[List[Issue], List[SuppressionLedgerEntry], List[MaskedIssue]]:
         """
         Run all enabled patterns on the file.
 
         v2.1: New pattern-based detection.
         v2.6.3: Filters issues from @slop.ignore decorated functions.
+
+        Patterns with a valid entry in ``stages`` are restored rather than run
+        (``tree`` is only needed when some pattern has to run); the others are
+        stored back into it. With ``definitions``, function-scoped patterns
+        run through ``_run_scoped_patterns``.
         """
         issues = []
         suppression_ledger: List[SuppressionLedgerEntry] = []
         masked_issues: List[MaskedIssue] = []
         ignored_functions = ignored_functions or []
         suppression_directives = suppression_directives or []
-        ignored_ranges = IgnoreHandler.get_ignored_line_ranges(tree, ignored_functions)
-
-        for pattern in self.pattern_registry.get_all():
-            try:
-                pattern_issues = pattern.check(tree, file, content)
-                pattern_issues, pattern_masked = FrameworkMasker.apply_python_masking(
-                    file, content, tree, pattern_issues
+        enabled = self.pattern_registry.get_all()
+        pending = [
+            pattern.id
+            for pattern in enabled
+            if stages is None or not stages.valid(pattern_stage(pattern.id))
+        ]
+        results: Dict[str, PatternResult] = {}
+
+        if pending and tree is not None:
+            source = source_context_for(content, tree, source)
+            ignored_ranges = IgnoreHandler.get_ignored_line_ranges(tree, ignored_functions, source)
+            scoped = []
+            if stages is not None and definitions is not None:
+                scoped = [
+                    pattern.id
+                    for pattern in enabled
+                    if pattern.id in pending and is_function_scoped(pattern)
+                ]
+            outcomes: List[PatternOutcome] = []
+            if len(scoped) < len(pending):
+                outcomes = self.pattern_registry.check_all(
+                    tree,
+                    file,
+                    content,
+                    source,
+                    only=None if stages is None else [id_ for id_ in pending if id_ not in scoped],
+                )
+            if scoped:
+                outcomes += self._run_scoped_patterns(
+                    tree, file, content, source, scoped, definitions, stages  # type: ignore[arg-type]
                 )
-                masked_issues.extend(pattern_masked)
-                # v2.6.3: Filter issues in ignored functions
-                for issue in pattern_issues:
-                    if IgnoreHandler.is_line_in_ignored_range(issue.line, ignored_ranges):
-                        continue
-                    ledger_entry = SuppressionHandler.match_issue(
-                        str(file), issue.line, pattern.id, suppression_directives
+            for outcome in outcomes:
+                pattern = outcome.pattern
+                if outcome.error is not None:
+                    logger.warning(f"Pattern {pattern.id} failed: {outcome.error}")
+                    continue
+                result = results[pattern.id] = PatternResult([], [], [])
+                try:
+                    pattern_issues, pattern_masked = FrameworkMasker.apply_python_masking(
+                        file, content, tree, outcome.issues, source
                     )
-                    if ledger_entry is not None:
-                        suppression_ledger.append(ledger_entry)
-                        continue
-                    issues.append(issue)
-            except Exception as e:
-                logger.warning(f"Pattern {pattern.id} failed: {e}")
+                    result.masked_issues.extend(pattern_masked)
+                    # v2.6.3: Filter issues in ignored functions
+                    for issue in pattern_issues:
+                        if IgnoreHandler.is_line_in_ignored_range(issue.line, ignored_ranges):
+                            continue
+                        ledger_entry = SuppressionHandler.match_issue(
+                            str(file), issue.line, pattern.id, suppression_directives
+                        )
+                        if ledger_entry is not None:
+                            result.suppression_ledger.append(ledger_entry)
+                            continue
+                        result.issues.append(issue)
+                except Exception as e:
+                    logger.warning(f"Pattern {pattern.id} failed: {e}")
+                    continue
+                if stages is not None:
+                    stages.store(pattern_stage(pattern.id), result, dump_pattern_result)
+
+        for pattern in enabled:
+            stage = pattern_stage(pattern.id)
+            if pattern.id in results:
+                result = results[pattern.id]
+            elif stages is not None and stages.valid(stage):
+                result = restore_pattern_result(stages.payload(stage), str(file))
+            else:
+                continue
+            issues.extend(result.issues)
+            suppression_ledger.extend(result.suppression_ledger)
+            masked_issues.extend(result.masked_issues)
 
         return issues, suppression_ledger, masked_issues
 
+    def _run_scoped_patterns(
+        self,
+        tree: ast.AST,
+        file: Path,
+        content: str,
+        source: SourceContext,
+        pattern_ids: List[str],
+        definitions: DefinitionIndex,
+        stages: FileStages,
+    ) -> List[PatternOutcome]:
+        """Run function-scoped patterns, skipping definitions unchanged since the last version.
+
+        Their stored findings are merged back in walk order, and the findings
+        of every definition are stored for the next version. Both need the
+        whole set of function-scoped patterns to run.
+        """
+        complete = len(pattern_ids) == sum(map(is_function_scoped, self.pattern_registry.get_all()))
+        payload = (complete and stages.definition_payload(STAGE_FUNCTION_PATTERNS)) or {}
+        reused = definitions.reusable(payload)
+        outcomes = self.pattern_registry.check_scoped(
+            tree,
+            file,
+            content,
+            source,
+            only=pattern_ids,
+            skip={id(definition.node) for definition in reused},
+        )
+        walked = {
+            outcome.pattern.id: list(zip(outcome.paths, outcome.issues)) for outcome in outcomes
+        }
+        merged = merge_definition_findings(definitions, outcomes, reused, payload, file)
+        for outcome in outcomes:
+            outcome.issues = merged[outcome.pattern.id] if outcome.error is None else []
+        stages.definitions_reused += len(reused)
+        if complete and all(outcome.error is None for outcome in outcomes):
+            stages.store(
+                STAGE_FUNCTION_PATTERNS,
+                dump_definition_findings(definitions, walked, reused, payload),
+                dict,
+            )
+        return outcomes
+
+    def _calculate_inflation(
+        self,
+        file_path: str,
+        content: str,
+        tree: ast.AST,
+        source: SourceContext,
+        definitions: Optional[DefinitionIndex],
+        stages: FileStages,
+    ) -> InflationResult:
+        """Calculate inflation, reusing the jargon hits of unchanged definitions."""
+        if definitions is None:
+            return self.inflation_calc.calculate(file_path, content, tree, source)
+        payload = stages.definition_payload(STAGE_FUNCTION_JARGON) or {}
+        reused = definitions.reusable(payload)
+        result = self.inflation_calc.calculate(
+            file_path, content, tree, source, known_jargon_hits(reused, payload)
+        )
+        stages.definitions_reused += len(reused)
+        stages.store(
+            STAGE_FUNCTION_JARGON,
+            dump_definition_jargon(definitions, result.jargon_details, source.function_scopes),
+            dict,
+        )
+        return result
+
     # Backward-compat shims — delegate to IgnoreHandler
     def _collect_ignored_functions(self, tree: ast.AST) -> List[IgnoredFunction]:
         return IgnoreHandler.collect_ignored_functions(tree)
@@ -516,11 +1226,71 @@ class SlopDetector:
 
     def _compute_coherence_vr(self, file_dcfs: List[Dict[str, float]]) -> tuple[float, str]:
         """Backward-compatible facade for configured coherence calculation."""
-        return compute_coherence_vr(
+        estimate = self._estimate_coherence_vr(file_dcfs)
+        return estimate.coherence, estimate.level
+
+    def _estimate_coherence_vr(
+        self, file_dcfs: List[Dict[str, float]], project_path: Optional[str] = None
+    ) -> CoherenceEstimate:
+        """Configured coherence calculation with its level and error bound.
+
+        With a ``project_path`` and the analysis cache, exact coherence of the
+        whole file set is repaired from the project's previous MST instead of
+        rebuilt. A sample above the ceiling is computed from scratch, since
+        the cached MST must keep covering every file.
+        """
+        ceiling = self.config.get_exact_topology_ceiling()
+        mode = self.config.get_topology_mode_above_ceiling()
+        exact_calculator: Callable[[Sequence[Dict[str, float]]], float]
+        exact_calculator = self._compute_coherence_vr_exact
+        if (
+            project_path is not None
+            and self._analysis_cache is not None
+            and (len(file_dcfs) <= ceiling or mode == "exact")
+        ):
+            exact_calculator = partial(self._incremental_coherence_vr_exact, project_path)
+        return estimate_coherence_vr(file_dcfs, ceiling, mode, exact_calculator=exact_calculator)
+
+    def _incremental_coherence_vr_exact(
+        self, project_path: str, file_dcfs: Sequence[Dict[str, float]]
+    ) -> float:
+        """Exact coherence repaired from, and stored as, the project's cached MST."""
+        cache = self._analysis_cache
+        assert cache is not None
+        key = str(Path(project_path).resolve())
+        coherence, state = incremental_coherence_vr_exact(
             file_dcfs,
-            self.config.get_exact_topology_ceiling(),
-            self.config.get_topology_mode_above_ceiling(),
-            exact_calculator=self._compute_coherence_vr_exact,
+            cache.get_aggregate(_TOPOLOGY_AGGREGATE, key),
+            self.config.get_coherence_rebuild_fraction(),
+        )
+        if state is not None:
+            cache.put_aggregate(_TOPOLOGY_AGGREGATE, key, state)
+        return coherence
+
+    def _project_coherence(
+        self, file_dcfs: List[Dict[str, float]], project_path: Optional[str] = None
+    ) -> CoherenceEstimate:
+        """Coherence of a project scan, reused from the cache while its DCFs are unchanged."""
+        cache = self._analysis_cache
+        if cache is None or len(file_dcfs) <= 1:
+            return self._estimate_coherence_vr(file_dcfs)
+        ceiling = self.config.get_exact_topology_ceiling()
+        mode = self.config.get_topology_mode_above_ceiling()
+        # Version 2 writes no back-references, so equal inputs give equal bytes.
+        key = hashlib.sha256(marshal.dumps((ceiling, mode, file_dcfs), 2)).hexdigest()
+        cached = cache.get_aggregate(_COHERENCE_AGGREGATE, key)
+        if cached is not None:
+            # Entries written before error bounds were kept hold two fields.
+            return CoherenceEstimate(*cached)
+        estimate = self._estimate_coherence_vr(file_dcfs, project_path)
+        cache.put_aggregate(_COHERENCE_AGGREGATE, key, tuple(estimate))
+        return estimate
+
+    def _prioritize_project(
+        self, project_path: str, file_results: Sequence[Any]
+    ) -> tuple[List[Any], bool, bool]:
+        return self.project_prioritizer.prioritize_project(
+            project_path, file_results, cache=self._analysis_cache
         )
 
     def _calculate_pattern_penalty(self, issues: List[Issue]) -> float:
@@ -564,6 +1334,17 @@ class SlopDetector:
         """Backward-compatible facade for project scope reporting."""
         return collect_project_scan_coverage(project_path, ignore_patterns)
 
+    def _scan_project_files(
+        self, project_path: Path, ignore_patterns: List[str], pattern: str = "**/*.py"
+    ) -> ProjectFiles:
+        """Facade for single-walk source discovery and scan coverage."""
+        return scan_project_files(
+            project_path,
+            ignore_patterns,
+            python_pattern=pattern,
+            rust_discoverer=discover_project_files,
+        )
+
     @staticmethod
     def _set_analyzed_scan_counts(
         scan_coverage: Dict[str, Any],
@@ -0,0 +1,215 @@
+"""Process-pool execution engine for project-wide file analysis."""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import BrokenExecutor, Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+LANGUAGE_PYTHON = "python"
+LANGUAGE_JAVASCRIPT = "javascript"
+LANGUAGE_GO = "go"
+
+_ERROR_LABELS = {
+    LANGUAGE_PYTHON: "Error analyzing",
+    LANGUAGE_JAVASCRIPT: "Error analyzing JS/TS file",
+    LANGUAGE_GO: "Error analyzing Go file",
+}
+_MAX_CHUNKSIZE = 32
+
+# A pool that cannot start or dies mid-run; BrokenExecutor covers
+# BrokenProcessPool without importing multiprocessing for serial runs.
+_POOL_ERRORS = (BrokenExecutor, NotImplementedError, OSError)
+
+# One warm detector per worker process, built once by ``_init_worker``.
+_WORKER_DETECTOR: Any = None
+
+
+@dataclass(frozen=True)
+class WorkerState:
+    """Picklable snapshot of the parent detector needed to rebuild it in a worker."""
+
+    config_path: Optional[str]
+    model_path: Optional[str]
+    config: Dict[str, Any]
+    cache_db: Optional[str]
+    defer_ml_scoring: bool = False
+
+
+def resolve_worker_count(requested: Optional[int], task_count: int) -> int:
+    """Clamp a requested worker count; ``0`` or negative means one per CPU."""
+    if requested is None:
+        requested = 1
+    if requested <= 0:
+        requested = os.cpu_count() or 1
+    return max(1, min(requested, task_count))
+
+
+def _new_pool(worker_count: int, state: WorkerState) -> ProcessPoolExecutor:
+    """Start a worker pool; multiprocessing is imported only when one is needed."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(
+        max_workers=worker_count, initializer=_init_worker, initargs=(state,)
+    )
+
+
+def _init_worker(state: WorkerState) -> None:
+    """Build the per-process detector with the parent's effective configuration."""
+    global _WORKER_DETECTOR
+    from slop_detector.analysis_cache import FileAnalysisCache
+    from slop_detector.core import SlopDetector
+
+    detector = SlopDetector(config_path=state.config_path, model_path=state.model_path)
+    detector.config.config = state.config
+    detector._build_analyzers()
+    detector._analysis_cache = FileAnalysisCache(state.cache_db) if state.cache_db else None
+    detector._defer_ml_scoring = state.defer_ml_scoring
+    _WORKER_DETECTOR = detector
+
+
+def analyze_task(detector: Any, task: Tuple[str, str]) -> Tuple[Any, Optional[str]]:
+    """Analyze one ``(language, path)`` task with ``detector``; errors are returned, never raised."""
+    language, file_path = task
+    try:
+        if language == LANGUAGE_JAVASCRIPT:
+            return detector.analyze_js_file(file_path), None
+        if language == LANGUAGE_GO:
+            return detector.analyze_go_file(file_path), None
+        return detector.analyze_file(file_path), None
+    except Exception as exc:
+        return None, str(exc)
+
+
+def log_task_error(language: str, file_path: str, error: str) -> None:
+    """Log a per-file failure with the message the serial path has always used."""
+    logger.error(f"{_ERROR_LABELS[language]} {file_path}: {error}")
+
+
+def _analyze_chunk_in_worker(chunk: List[Tuple[str, str]]) -> List[Tuple[Any, Optional[str]]]:
+    """Analyze a contiguous run of tasks in a worker.
+
+    The chunk's files share one analysis-cache session: the rows of its
+    Python files are read in one query and new results are written in one
+    transaction.
+    """
+    python_files = [path for language, path in chunk if language == LANGUAGE_PYTHON]
+    with _WORKER_DETECTOR._analysis_cache_session(python_files, batch_writes=True):
+        return [analyze_task(_WORKER_DETECTOR, task) for task in chunk]
+
+
+def _build_tasks(files_by_language: Sequence[Tuple[str, Sequence[Path]]]) -> List[Tuple[str, str]]:
+    return [(language, str(path)) for language, paths in files_by_language for path in paths]
+
+
+def _chunk_tasks(tasks: List[Tuple[str, str]], worker_count: int) -> List[List[Tuple[str, str]]]:
+    size = _chunksize(len(tasks), worker_count)
+    return [tasks[start : start + size] for start in range(0, len(tasks), size)]
+
+
+def _chunksize(task_count: int, worker_count: int) -> int:
+    return max(1, min(_MAX_CHUNKSIZE, task_count // (worker_count * 4)))
+
+
+def analyze_files_in_pool(
+    files_by_language: Sequence[Tuple[str, Sequence[Path]]],
+    worker_count: int,
+    state: WorkerState,
+) -> Optional[Dict[str, List[Any]]]:
+    """Fan files out across worker processes and return results in discovery order.
+
+    Returns ``None`` when the pool cannot be started or breaks mid-run so the
+    caller can fall back to serial execution.
+    """
+    tasks = _build_tasks(files_by_language)
+    results: Dict[str, List[Any]] = {language: [] for language, _ in files_by_language}
+    if not tasks:
+        return results
+
+    try:
+        with _new_pool(worker_count, state) as pool:
+            outcomes = [
+                outcome
+                for chunk_outcomes in pool.map(
+                    _analyze_chunk_in_worker, _chunk_tasks(tasks, worker_count)
+                )
+                for outcome in chunk_outcomes
+            ]
+    except _POOL_ERRORS as exc:
+        logger.warning("Parallel analysis unavailable (%s); falling back to serial execution", exc)
+        return None
+
+    for (language, file_path), (result, error) in zip(tasks, outcomes):
+        if error is not None:
+            log_task_error(language, file_path, error)
+            continue
+        results[language].append(result)
+    return results
+
+
+def iter_files_in_pool(
+    files_by_language: Sequence[Tuple[str, Sequence[Path]]],
+    worker_count: int,
+    state: WorkerState,
+    fallback: Callable[[Tuple[str, str]], Tuple[Any, Optional[str]]],
+) -> Iterator[Tuple[str, str, Any, Optional[str]]]:
+    """Yield ``(language, path, result, error)`` in discovery order as chunks finish.
+
+    At most ``2 * worker_count`` chunks are in flight, so finished results
+    never pile up faster than the consumer reads them. If the pool cannot
+    start or breaks, the remaining tasks run through ``fallback`` in-process;
+    nothing is yielded twice. Closing the iterator early cancels queued work.
+    """
+    tasks = _build_tasks(files_by_language)
+    if not tasks:
+        return
+    chunks = _chunk_tasks(tasks, worker_count)
+    pending: Deque[Future] = deque()
+    finished = 0
+    pool: Optional[ProcessPoolExecutor] = None
+    try:
+        try:
+            pool = _new_pool(worker_count, state)
+            submitted = 0
+            while finished < len(chunks):
+                while submitted < len(chunks) and len(pending) < worker_count * 2:
+                    pending.append(pool.submit(_analyze_chunk_in_worker, chunks[submitted]))
+                    submitted += 1
+                outcomes = pending.popleft().result()
+                chunk = chunks[finished]
+                finished += 1
+                for (language, file_path), (result, error) in zip(chunk, outcomes):
+                    yield language, file_path, result, error
+        except _POOL_ERRORS as exc:
+            logger.warning(
+                "Parallel analysis unavailable (%s); finishing remaining files serially", exc
+            )
+            for chunk in chunks[finished:]:
+                for language, file_path in chunk:
+                    result, error = fallback((language, file_path))
+                    yield language, file_path, result, error
+    finally:
+        if pool is not None:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
@@ -2,34 +2,30 @@
 
 from __future__ import annotations
 
-import fnmatch
 import logging
 import math
+import os
 from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence
-
-from slop_detector.finding_summary import build_finding_summary
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from slop_detector.analysis_cache import CACHE_HIT_TIERS, CACHE_TIERS
+from slop_detector.core_topology import CoherenceEstimate
+from slop_detector.finding_summary import FindingSummaryBuilder
+from slop_detector.ignore_matcher import (
+    DEFAULT_EXCLUDE_PARTS,
+    IgnoreMatcher,
+    compiled_ignore_matcher,
+    default_directory_reason,
+)
 from slop_detector.models import FileAnalysis, ProjectAnalysis, SlopStatus
 from slop_detector.rust_scan import discover_project_files
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_EXCLUDE_PARTS = {
-    ".claude",
-    ".venv",
-    "venv",
-    "site-packages",
-    "node_modules",
-    "__pycache__",
-    ".git",
-    "build",
-    "dist",
-    ".tox",
-    ".next",
-    "htmlcov",
-}
 _COVERAGE_FILE_DETAIL_LIMIT = 200
+DEFAULT_PYTHON_PATTERN = "**/*.py"
 _SUPPORTED_SOURCE_EXTENSIONS = {
     ".py": "python",
     ".js": "javascript",
@@ -60,31 +56,7 @@ def ignore_reason(
     file_path: Path, patterns: List[str], root: Optional[Path] = None
 ) -> Optional[str]:
     """Return the exclusion source for a path, if any."""
-    lowered_parts = {part.lower() for part in file_path.parts}
-    default_parts = lowered_parts & DEFAULT_EXCLUDE_PARTS
-    if default_parts:
-        return f"directory:{sorted(default_parts)[0]}"
-
-    if root is not None:
-        try:
-            normalized_paths = {str(file_path.relative_to(root)).replace("\\", "/")}
-        except ValueError:
-            normalized_paths = {str(file_path).replace("\\", "/")}
-    else:
-        normalized_paths = {str(file_path).replace("\\", "/")}
-
-    for pattern in patterns:
-        normalized_pattern = str(pattern).replace("\\", "/")
-        for normalized in normalized_paths:
-            if Path(normalized).match(normalized_pattern):
-                return f"pattern:{normalized_pattern}"
-            if fnmatch.fnmatch(normalized, normalized_pattern):
-                return f"pattern:{normalized_pattern}"
-            if normalized_pattern.startswith("**/") and fnmatch.fnmatch(
-                normalized, normalized_pattern[3:]
-            ):
-                return f"pattern:{normalized_pattern}"
-    return None
+    return compiled_ignore_matcher(tuple(patterns)).reason(file_path, root=root)
 
 
 def should_ignore(file_path: Path, patterns: List[str], root: Optional[Path] = None) -> bool:
@@ -128,43 +100,144 @@ def discover_supported_files(
     return accelerated
 
 
-def collect_project_scan_coverage(project_path: Path, ignore_patterns: List[str]) -> Dict[str, Any]:
-    """Report excluded supported files and unexcluded unsupported source files."""
+@dataclass
+class ProjectFiles:
+    """Supported source files and scan coverage from one walk of a project tree."""
+
+    python: List[Path]
+    javascript: List[Path]
+    go: List[Path]
+    scan_coverage: Dict[str, Any]
+
+
+def _path_suffix(name: str) -> str:
+    """``PurePath(name).suffix`` without building a path object."""
+    index = name.rfind(".")
+    return name[index:] if 0 < index < len(name) - 1 else ""
+
+
+def _walk_project_tree(
+    root: Path,
+    matcher: IgnoreMatcher,
+    pruned: List[Tuple[Path, str]],
+    relative: str = "",
+    covered: Optional[str] = None,
+) -> Iterator[Tuple[os.DirEntry, str, Optional[str]]]:
+    """Yield ``(entry, relative_path, subtree_reason)`` for non-directories under ``root``.
+
+    Entries come in ``Path.glob("**/*")`` order: a directory's entries before
+    its subdirectories', which are visited depth-first in ``scandir`` order;
+    symlinked directories are not followed. Subdirectories named in
+    ``DEFAULT_EXCLUDE_PARTS`` exclude everything below them, so they are
+    recorded in ``pruned`` instead of being descended into.
+    ``subtree_reason`` is the ignore reason shared by every path in the
+    enclosing subtree, or ``None`` when each path must be checked.
+    """
+    try:
+        with os.scandir(root) as scandir_it:
+            entries = list(scandir_it)
+    except OSError as exc:
+        logger.debug("Could not list %s: %s", root, exc)
+        return
+    prefix = f"{relative}/" if relative else ""
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir() and not entry.is_symlink()
+        except OSError:
+            continue
+        if is_dir:
+            subdirs.append(entry)
+        else:
+            yield entry, prefix + entry.name, covered
+    for entry in subdirs:
+        name = entry.name.lower()
+        if name in DEFAULT_EXCLUDE_PARTS:
+            pruned.append((root / entry.name, f"directory:{name}"))
+            continue
+        child = prefix + entry.name
+        yield from _walk_project_tree(
+            root / entry.name,
+            matcher,
+            pruned,
+            child,
+            covered if covered is not None else matcher.subtree_reason(child),
+        )
+
+
+def _relative_posix(path: Path, root: Path) -> str:
+    return str(path.relative_to(root)).replace("\\", "/")
+
+
+def scan_project_files(
+    project_path: Path,
+    ignore_patterns: List[str],
+    python_pattern: str = DEFAULT_PYTHON_PATTERN,
+    rust_discoverer: Callable[
+        [Path, Sequence[str], List[str]], Optional[List[Path]]
+    ] = discover_project_files,
+) -> ProjectFiles:
+    """Discover Python, JS/TS and Go sources and build scan coverage in one walk.
+
+    File lists match ``Path.glob("**/*<ext>")`` discovery filtered by
+    ``should_ignore``, in the same order. Dependency and build directories
+    (``DEFAULT_EXCLUDE_PARTS``) are pruned before descending: they are
+    reported under ``scan_coverage["pruned"]`` and the files inside them are
+    not counted. A non-default ``python_pattern`` falls back to
+    ``discover_supported_files`` (and ``rust_discoverer``) for Python files only.
+    """
+    by_language: Dict[str, List[Path]] = {"python": [], "javascript": [], "go": []}
     excluded: List[Dict[str, str]] = []
     unsupported: List[Dict[str, str]] = []
     excluded_by_reason: Counter[str] = Counter()
     unsupported_count = 0
-    try:
-        for path in project_path.rglob("*"):
-            if not path.is_file():
-                continue
-            suffix = path.suffix.lower()
-            reason = ignore_reason(path, ignore_patterns, root=project_path)
-            if suffix in _SUPPORTED_SOURCE_EXTENSIONS and reason is not None:
-                excluded_by_reason[reason] += 1
-                if len(excluded) < _COVERAGE_FILE_DETAIL_LIMIT:
-                    excluded.append(
-                        {
-                            "path": str(path.relative_to(project_path)).replace("\\", "/"),
-                            "language": _SUPPORTED_SOURCE_EXTENSIONS[suffix],
-                            "reason": reason,
-                        }
-                    )
-                continue
-            if suffix in _UNSUPPORTED_SOURCE_EXTENSIONS and reason is None:
-                unsupported_count += 1
-                if len(unsupported) < _COVERAGE_FILE_DETAIL_LIMIT:
-                    unsupported.append(
-                        {
-                            "path": str(path.relative_to(project_path)).replace("\\", "/"),
-                            "extension": suffix,
-                        }
-                    )
-    except OSError as exc:
-        logger.debug("Could not collect full scan coverage for %s: %s", project_path, exc)
+    pruned: List[Tuple[Path, str]] = []
+    walk_python = python_pattern == DEFAULT_PYTHON_PATTERN
+    matcher = compiled_ignore_matcher(tuple(ignore_patterns))
+    # Directories below the root are never default-excluded (those are
+    # pruned), so only the root's own parts can give a directory reason.
+    root_reason = default_directory_reason(project_path.parts)
+
+    for entry, relative, covered in _walk_project_tree(project_path, matcher, pruned):
+        suffix = _path_suffix(entry.name)
+        lowered = suffix.lower()
+        language = _SUPPORTED_SOURCE_EXTENSIONS.get(lowered)
+        if language is None and lowered not in _UNSUPPORTED_SOURCE_EXTENSIONS:
+            continue
+        path = Path(entry.path)
+        reason = root_reason or covered or matcher.pattern_reason(relative)
+        # Discovery globs are case-sensitive wherever the filesystem is.
+        if (
+            language is not None
+            and reason is None
+            and (walk_python or language != "python")
+            and os.path.normcase(suffix) == lowered
+        ):
+            by_language[language].append(path)
+        try:
+            is_file = entry.is_file()
+        except OSError:
+            is_file = False
+        if not is_file:
+            continue
+        if language is not None and reason is not None:
+            excluded_by_reason[reason] += 1
+            if len(excluded) < _COVERAGE_FILE_DETAIL_LIMIT:
+                excluded.append({"path": relative, "language": language, "reason": reason})
+            continue
+        if language is None and reason is None:
+            unsupported_count += 1
+            if len(unsupported) < _COVERAGE_FILE_DETAIL_LIMIT:
+                unsupported.append({"path": relative, "extension": lowered})
+
+    if not walk_python:
+        by_language["python"] = discover_supported_files(
+            project_path, [python_pattern], {".py"}, ignore_patterns, rust_discoverer
+        )
 
     excluded_count = sum(excluded_by_reason.values())
-    return {
+    pruned_by_reason = Counter(reason for _, reason in pruned)
+    scan_coverage = {
         "analyzed": {"total": 0, "python": 0, "javascript": 0, "go": 0},
         "excluded": {
             "total": excluded_count,
@@ -177,7 +250,27 @@ def collect_project_scan_coverage(project_path: Path, ignore_patterns: List[str]
             "files": unsupported,
             "omitted_file_details": max(0, unsupported_count - len(unsupported)),
         },
+        "pruned": {
+            "total": len(pruned),
+            "directories": [
+                {"path": _relative_posix(path, project_path), "reason": reason}
+                for path, reason in pruned[:_COVERAGE_FILE_DETAIL_LIMIT]
+            ],
+            "omitted_directory_details": max(0, len(pruned) - _COVERAGE_FILE_DETAIL_LIMIT),
+            "by_reason": dict(sorted(pruned_by_reason.items())),
+        },
     }
+    return ProjectFiles(
+        python=by_language["python"],
+        javascript=by_language["javascript"],
+        go=by_language["go"],
+        scan_coverage=scan_coverage,
+    )
+
+
+def collect_project_scan_coverage(project_path: Path, ignore_patterns: List[str]) -> Dict[str, Any]:
+    """Report excluded supported files, unexcluded unsupported files and pruned directories."""
+    return scan_project_files(project_path, ignore_patterns).scan_coverage
 
 
 def set_analyzed_scan_counts(
@@ -192,6 +285,40 @@ def set_analyzed_scan_counts(
     analyzed["javascript"] = len(js_results)
     analyzed["go"] = len(go_results)
     analyzed["total"] = len(python_results) + len(js_results) + len(go_results)
+    set_cache_tier_counts(
+        scan_coverage,
+        {
+            language: Counter(getattr(result, "cache_tier", None) for result in results)
+            for language, results in (
+                ("python", python_results),
+                ("javascript", js_results),
+                ("go", go_results),
+            )
+        },
+    )
+
+
+def set_cache_tier_counts(scan_coverage: Dict[str, Any], tiers: Dict[str, Counter]) -> None:
+    """Report the analysis-cache tiers of Python results and hits and misses per language.
+
+    ``tiers`` counts the ``cache_tier`` of each language's results. Languages
+    none of whose results went through the cache (cache disabled) are omitted.
+    """
+    python_tiers = tiers.get("python", Counter())
+    if any(python_tiers[tier] for tier in CACHE_TIERS):
+        scan_coverage["analysis_cache"] = {tier: python_tiers[tier] for tier in CACHE_TIERS}
+    by_language = {}
+    for language, counts in tiers.items():
+        hits = sum(count for tier, count in counts.items() if tier in CACHE_HIT_TIERS)
+        misses = sum(
+            count
+            for tier, count in counts.items()
+            if tier is not None and tier not in CACHE_HIT_TIERS
+        )
+        if hits or misses:
+            by_language[language] = {"hits": hits, "misses": misses}
+    if by_language:
+        scan_coverage["analysis_cache_languages"] = by_language
 
 
 def result_status_value(result: Any) -> str:
@@ -263,6 +390,153 @@ def create_empty_project_analysis(project_path: str) -> ProjectAnalysis:
     )
 
 
+@dataclass(frozen=True)
+class PriorityEntry:
+    """The fields hotspot prioritization reads from a Python file result."""
+
+    file_path: str
+    deficit_score: float
+    status: SlopStatus
+    content_hash: Optional[str] = None
+
+
+class ProjectAggregate:
+    """Running project totals, fed one file result at a time.
+
+    Only per-file scalars, DCF histograms, suppression entries and the fields
+    hotspot ranking needs are retained, so a streamed scan never has to hold
+    every ``FileAnalysis``. Results must be added Python first, then JS/TS,
+    then Go (the order ``build_project_analysis`` aggregates in) for the
+    floating-point sums to match exactly.
+    """
+
+    def __init__(self) -> None:
+        self.analyzed: Dict[str, int] = {"python": 0, "javascript": 0, "go": 0}
+        self._deficit_files = 0
+        self._scores: List[float] = []
+        self._lines: List[int] = []
+        self._ldr_scores: List[float] = []
+        self._finite_inflation: List[float] = []
+        self._ddc_ratios: List[float] = []
+        self._dcfs: List[Dict[str, float]] = []
+        self._suppression_ledger: List[Any] = []
+        self._priority_entries: List[PriorityEntry] = []
+        self._findings = FindingSummaryBuilder()
+        self._cache_tiers: Dict[str, Counter] = {}
+
+    @property
+    def total_files(self) -> int:
+        return sum(self.analyzed.values())
+
+    def add(self, language: str, result: Any) -> None:
+        """Fold one analysis result for ``language`` into the running totals."""
+        self.analyzed[language] += 1
+        self._deficit_files += is_result_non_clean(result)
+        self._scores.append(result_slop_score(result))
+        self._lines.append(result_total_lines(result))
+        self._ldr_scores.append(result_ldr_score(result))
+        self._findings.add(result)
+        self._cache_tiers.setdefault(language, Counter())[getattr(result, "cache_tier", None)] += 1
+        if language != "python":
+            return
+        if math.isfinite(result.inflation.inflation_score):
+            self._finite_inflation.append(result.inflation.inflation_score)
+        self._ddc_ratios.append(result.ddc.usage_ratio)
+        if result.dcf:
+            self._dcfs.append(result.dcf)
+        self._suppression_ledger.extend(getattr(result, "suppression_ledger", []))
+        self._priority_entries.append(
+            PriorityEntry(
+                result.file_path, result.deficit_score, result.status, result.content_hash
+            )
+        )
+
+    def build(
+        self,
+        project_path: str,
+        prioritization_path: str,
+        scan_coverage: Dict[str, Any],
+        use_weighted_analysis: bool,
+        coherence_calculator: Callable[[List[Dict[str, float]]], CoherenceEstimate],
+        prioritize_project: Callable[[str, List[Any]], tuple[List[Any], bool, bool]],
+        ml_scoring: Dict[str, Any],
+        file_results: Optional[List[FileAnalysis]] = None,
+        js_file_results: Optional[List[Any]] = None,
+        go_file_results: Optional[List[Any]] = None,
+    ) -> ProjectAnalysis:
+        """Build the project result; per-file lists are attached only when given."""
+        file_results = file_results if file_results is not None else []
+        js_file_results = js_file_results if js_file_results is not None else []
+        go_file_results = go_file_results if go_file_results is not None else []
+        analyzed = scan_coverage["analyzed"]
+        analyzed.update(self.analyzed)
+        analyzed["total"] = self.total_files
+        set_cache_tier_counts(scan_coverage, self._cache_tiers)
+        if not self.total_files:
+            result = create_empty_project_analysis(project_path)
+            result.js_file_results = js_file_results
+            result.go_file_results = go_file_results
+            result.scan_coverage = scan_coverage
+            result.ml_scoring = ml_scoring
+            return result
+
+        total_files = self.total_files
+        average_deficit = sum(self._scores) / total_files
+        average_ldr = 0.6 * min(self._ldr_scores) + 0.4 * (sum(self._ldr_scores) / total_files)
+        average_inflation = sum(self._finite_inflation) / max(1, len(self._finite_inflation))
+        average_ddc = sum(self._ddc_ratios) / max(1, self.analyzed["python"])
+
+        if use_weighted_analysis:
+            total_lines = sum(self._lines)
+            weighted_deficit = (
+                sum(
+                    score * (lines / total_lines) for score, lines in zip(self._scores, self._lines)
+                )
+                if total_lines > 0
+                else average_deficit
+            )
+        else:
+            weighted_deficit = average_deficit
+
+        if weighted_deficit >= 50:
+            overall_status = SlopStatus.CRITICAL_DEFICIT
+        elif weighted_deficit >= 30:
+            overall_status = SlopStatus.SUSPICIOUS
+        else:
+            overall_status = SlopStatus.CLEAN
+
+        coherence = coherence_calculator(self._dcfs)
+        priority_hotspots, churn_available, coverage_available = prioritize_project(
+            prioritization_path, file_results or self._priority_entries
+        )
+        return ProjectAnalysis(
+            project_path=project_path,
+            total_files=total_files,
+            deficit_files=self._deficit_files,
+            clean_files=total_files - self._deficit_files,
+            avg_deficit_score=average_deficit,
+            weighted_deficit_score=weighted_deficit,
+            avg_ldr=average_ldr,
+            avg_inflation=average_inflation,
+            avg_ddc=average_ddc,
+            overall_status=overall_status,
+            file_results=file_results,
+            structural_coherence=coherence.coherence,
+            coherence_level=coherence.level,
+            coherence_error_bound=coherence.error_bound,
+            suppressed_issue_count=len(self._suppression_ledger),
+            suppression_ledger=self._suppression_ledger,
+            priority_hotspots=priority_hotspots,
+            churn_analysis_available=churn_available,
+            coverage_analysis_available=coverage_available,
+            js_file_results=js_file_results,
+            go_file_results=go_file_results,
+            finding_summary=self._findings.build(),
+            scan_coverage=scan_coverage,
+            ml_scoring=ml_scoring,
+        )
+
+
 def build_project_analysis(
     project_path: str,
     prioritization_path: str,
@@ -271,87 +545,28 @@ def build_project_analysis(
     go_results: List[Any],
     scan_coverage: Dict[str, Any],
     use_weighted_analysis: bool,
-    coherence_calculator: Callable[[List[Dict[str, float]]], tuple[float, str]],
-    prioritize_project: Callable[[str, List[FileAnalysis]], tuple[List[Any], bool, bool]],
+    coherence_calculator: Callable[[List[Dict[str, float]]], CoherenceEstimate],
+    prioritize_project: Callable[[str, List[Any]], tuple[List[Any], bool, bool]],
     ml_scoring: Dict[str, Any],
 ) -> ProjectAnalysis:
     """Aggregate analyzed language results into the stable project contract."""
-    all_results = python_results + js_results + go_results
-    set_analyzed_scan_counts(scan_coverage, python_results, js_results, go_results)
-    if not all_results:
-        result = create_empty_project_analysis(project_path)
-        result.js_file_results = js_results
-        result.go_file_results = go_results
-        result.scan_coverage = scan_coverage
-        result.ml_scoring = ml_scoring
-        return result
-
-    total_files = len(all_results)
-    deficit_files = sum(1 for result in all_results if is_result_non_clean(result))
-    average_deficit = sum(result_slop_score(result) for result in all_results) / total_files
-    ldr_scores = [result_ldr_score(result) for result in all_results]
-    average_ldr = 0.6 * min(ldr_scores) + 0.4 * (sum(ldr_scores) / total_files)
-    finite_python_inflation = [
-        result.inflation.inflation_score
-        for result in python_results
-        if math.isfinite(result.inflation.inflation_score)
-    ]
-    average_inflation = sum(finite_python_inflation) / max(1, len(finite_python_inflation))
-    average_ddc = sum(result.ddc.usage_ratio for result in python_results) / max(
-        1, len(python_results)
-    )
-
-    if use_weighted_analysis:
-        total_lines = sum(result_total_lines(result) for result in all_results)
-        weighted_deficit = (
-            sum(
-                result_slop_score(result) * (result_total_lines(result) / total_lines)
-                for result in all_results
-            )
-            if total_lines > 0
-            else average_deficit
-        )
-    else:
-        weighted_deficit = average_deficit
-
-    if weighted_deficit >= 50:
-        overall_status = SlopStatus.CRITICAL_DEFICIT
-    elif weighted_deficit >= 30:
-        overall_status = SlopStatus.SUSPICIOUS
-    else:
-        overall_status = SlopStatus.CLEAN
-
-    structural_coherence, coherence_level = coherence_calculator(
-        [result.dcf for result in python_results if result.dcf]
-    )
-    suppression_ledger = [
-        entry for result in python_results for entry in getattr(result, "suppression_ledger", [])
-    ]
-    priority_hotspots, churn_available, coverage_available = prioritize_project(
-        prioritization_path, python_results
-    )
-    return ProjectAnalysis(
-        project_path=project_path,
-        total_files=total_files,
-        deficit_files=deficit_files,
-        clean_files=total_files - deficit_files,
-        avg_deficit_score=average_deficit,
-        weighted_deficit_score=weighted_deficit,
-        avg_ldr=average_ldr,
-        avg_inflation=average_inflation,
-        avg_ddc=average_ddc,
-        overall_status=overall_status,
+    aggregate = ProjectAggregate()
+    for language, results in (
+        ("python", python_results),
+        ("javascript", js_results),
+        ("go", go_results),
+    ):
+        for result in results:
+            aggregate.add(language, result)
+    return aggregate.build(
+        project_path,
+        prioritization_path,
+        scan_coverage,
+        use_weighted_analysis,
+        coherence_calculator,
+        prioritize_project,
+        ml_scoring,
         file_results=python_results,
-        structural_coherence=structural_coherence,
-        coherence_level=coherence_level,
-        suppressed_issue_count=len(suppression_ledger),
-        suppression_ledger=suppression_ledger,
-        priority_hotspots=priority_hotspots,
-        churn_analysis_available=churn_available,
-        coverage_analysis_available=coverage_available,
         js_file_results=js_results,
         go_file_results=go_results,
-        finding_summary=build_finding_summary(all_results),
-        scan_coverage=scan_coverage,
-        ml_scoring=ml_scoring,
     )
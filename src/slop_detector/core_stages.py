@@ -0,0 +1,505 @@
+"""Per-stage Python file analysis backed by cached stage entries.
+
+A file's analysis runs as independent stages: parse-derived facts, each
+metric calculator and each pattern. The cache keeps every stage's result
+for a file content together with a fingerprint of only the config keys
+that stage reads, so a config change reruns just the stages reading the
+changed keys. Scoring is cheap and always reruns from the stage results.
+
+Below the stages, edited files are re-analyzed per definition: functions and
+classes are fingerprinted by their source text, and the findings of
+function-scoped patterns and the jargon hits inside definitions whose text is
+unchanged since the path's previous version are reused. Only the changed
+definitions and module-level code are walked again.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+from dataclasses import asdict, dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from slop_detector.analysis_cache import (
+    _ISSUE_FIELDS,
+    _restore_context_jargon,
+    _restore_docstring_inflation,
+    _restore_hallucination_deps,
+    _restore_issue_row,
+)
+from slop_detector.file_role import FileRole
+from slop_detector.models import (
+    DDCResult,
+    IgnoredFunction,
+    InflationResult,
+    LDRResult,
+    MaskedIssue,
+    SuppressionDirective,
+    SuppressionLedgerEntry,
+)
+from slop_detector.patterns.base import Axis, Issue, Severity
+from slop_detector.patterns.registry import NodePath, PatternOutcome
+from slop_detector.source_context import _IRREGULAR_BREAK_RE, SourceContext
+
+STAGE_PARSE = "parse"
+STAGE_LDR = "ldr"
+STAGE_INFLATION = "inflation"
+STAGE_DDC = "ddc"
+STAGE_DOCSTRING_INFLATION = "docstring_inflation"
+STAGE_HALLUCINATION_DEPS = "hallucination_deps"
+STAGE_CONTEXT_JARGON = "context_jargon"
+# Per-definition findings, reused across versions of a file (see ``DefinitionIndex``).
+STAGE_FUNCTION_PATTERNS = "functions:patterns"
+STAGE_FUNCTION_JARGON = "functions:jargon"
+_PATTERN_STAGE_PREFIX = "pattern:"
+
+# Config keys each stage reads, including those of the stages it consumes:
+# context_jargon takes the inflation result. Scoring reads ``weights``.
+STAGE_CONFIG_KEYS: Dict[str, Tuple[str, ...]] = {
+    STAGE_PARSE: (),
+    STAGE_LDR: ("thresholds.ldr", "exceptions.abc_interface"),
+    STAGE_INFLATION: ("advanced.use_radon", "exceptions.config_files"),
+    STAGE_DDC: (),
+    STAGE_DOCSTRING_INFLATION: (),
+    STAGE_HALLUCINATION_DEPS: (),
+    STAGE_CONTEXT_JARGON: ("advanced.use_radon", "exceptions.config_files"),
+    STAGE_FUNCTION_JARGON: (),
+}
+# Patterns built from config (see ``get_all_patterns``); every other pattern reads none.
+PATTERN_CONFIG_KEYS: Dict[str, Tuple[str, ...]] = {
+    "god_function": ("patterns.god_function",),
+    "nested_complexity": ("patterns.nested_complexity",),
+    "phantom_import": ("phantom_import_allowlist",),
+}
+
+
+def pattern_stage(pattern_id: str) -> str:
+    return _PATTERN_STAGE_PREFIX + pattern_id
+
+
+def stage_fingerprints(
+    config: Any, pattern_ids: Iterable[str], function_scoped: Iterable[str] = ()
+) -> Dict[str, str]:
+    """Fingerprint, per stage, the values of the config keys that stage reads.
+
+    The per-definition pattern stage covers the ``function_scoped`` patterns
+    together, so it changes with the set of them and with any of their keys.
+    """
+    keys_by_stage = dict(STAGE_CONFIG_KEYS)
+    for pattern_id in pattern_ids:
+        keys_by_stage[pattern_stage(pattern_id)] = PATTERN_CONFIG_KEYS.get(pattern_id, ())
+    fingerprints = {}
+    for stage, keys in keys_by_stage.items():
+        fingerprints[stage] = _digest([[key, config.get(key)] for key in keys])
+    fingerprints[STAGE_FUNCTION_PATTERNS] = _digest(
+        [[pattern_id, fingerprints[pattern_stage(pattern_id)]] for pattern_id in function_scoped]
+    )
+    return fingerprints
+
+
+def _digest(values: Any) -> str:
+    canonical = json.dumps(values, sort_keys=True, separators=(",", ":"), default=str)
+    return sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class ParseFacts:
+    """Config-independent facts read off the parsed source."""
+
+    role: FileRole
+    dcf: Dict[str, float]
+    ignored_functions: List[IgnoredFunction]
+    suppression_directives: List[SuppressionDirective]
+
+
+@dataclass
+class PatternResult:
+    """One pattern's findings after masking, ignore ranges and suppressions."""
+
+    issues: List[Issue]
+    suppression_ledger: List[SuppressionLedgerEntry]
+    masked_issues: List[MaskedIssue]
+
+
+class FileStages:
+    """Stage entries of one file content, reused while their config is unchanged.
+
+    ``entries`` maps a stage name to ``(config fingerprint, payload)``, where
+    payloads are plain marshal-able values, so the map is stored as one cache
+    row. ``fingerprints`` holds the current fingerprint of every stage. With
+    ``record`` off, nothing is reused or stored (no cache to write to).
+    """
+
+    def __init__(
+        self,
+        fingerprints: Mapping[str, str],
+        entries: Optional[Dict[str, Tuple[str, Any]]] = None,
+        record: bool = True,
+        previous: Optional[Dict[str, Tuple[str, Any]]] = None,
+    ) -> None:
+        self.fingerprints = fingerprints
+        self.entries: Dict[str, Tuple[str, Any]] = dict(entries or {})
+        self.record = record
+        # Stage entries of the path's previous content, for per-definition reuse.
+        self.previous = previous or {}
+        self.reused = 0
+        self.computed = 0
+        self.definitions_reused = 0
+
+    def valid(self, stage: str) -> bool:
+        entry = self.entries.get(stage)
+        return entry is not None and entry[0] == self.fingerprints.get(stage)
+
+    def definition_payload(self, stage: str) -> Optional[Dict[str, Any]]:
+        """Per-definition entries of ``stage`` from this content or the previous one."""
+        for entries in (self.entries, self.previous):
+            entry = entries.get(stage)
+            if entry is not None and entry[0] == self.fingerprints.get(stage):
+                return dict(entry[1])
+        return None
+
+    def payload(self, stage: str) -> Any:
+        self.reused += 1
+        return self.entries[stage][1]
+
+    def store(self, stage: str, value: Any, dump: Callable[[Any], Any]) -> None:
+        self.computed += 1
+        if self.record:
+            self.entries[stage] = (self.fingerprints.get(stage, ""), dump(value))
+
+
+def dump_parse_facts(facts: ParseFacts) -> Dict[str, Any]:
+    return {
+        "role": facts.role.value,
+        "dcf": facts.dcf,
+        "ignored_functions": [item.to_dict() for item in facts.ignored_functions],
+        "suppression_directives": [item.to_dict() for item in facts.suppression_directives],
+    }
+
+
+def restore_parse_facts(payload: Dict[str, Any]) -> ParseFacts:
+    return ParseFacts(
+        role=FileRole(payload["role"]),
+        dcf=payload["dcf"],
+        ignored_functions=[IgnoredFunction(**item) for item in payload["ignored_functions"]],
+        suppression_directives=[
+            SuppressionDirective(**item) for item in payload["suppression_directives"]
+        ],
+    )
+
+
+def dump_metric(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, (LDRResult, InflationResult, DDCResult)):
+        # Field for field: ``to_dict`` truncates the inflation jargon lists.
+        return asdict(value)
+    return value.to_dict()
+
+
+_METRIC_RESTORERS = {
+    STAGE_LDR: lambda data: LDRResult(**data),
+    STAGE_INFLATION: lambda data: InflationResult(**data),
+    STAGE_DDC: lambda data: DDCResult(**data),
+    STAGE_DOCSTRING_INFLATION: _restore_docstring_inflation,
+    STAGE_HALLUCINATION_DEPS: _restore_hallucination_deps,
+    STAGE_CONTEXT_JARGON: _restore_context_jargon,
+}
+
+
+def restore_metric(stage: str, payload: Any) -> Any:
+    if payload is None:
+        return None
+    return _METRIC_RESTORERS[stage](payload)
+
+
+def dump_pattern_result(result: PatternResult) -> Tuple[List[Any], List[Any], List[Any]]:
+    """Store a pattern result without its file path, which ``restore`` fills in."""
+    issues = []
+    for issue in result.issues:
+        item = issue.to_dict()
+        issues.append(tuple(item[name] for name in _ISSUE_FIELDS if name != "file"))
+    return (
+        issues,
+        [_without_path(entry.to_dict()) for entry in result.suppression_ledger],
+        [_without_path(entry.to_dict()) for entry in result.masked_issues],
+    )
+
+
+def restore_pattern_result(payload: Sequence[Any], file_path: str) -> PatternResult:
+    issue_rows, ledger, masked = payload
+    file_index = _ISSUE_FIELDS.index("file")
+    paths = {file_path: Path(file_path)}
+    return PatternResult(
+        issues=[
+            _restore_issue_row((*row[:file_index], file_path, *row[file_index:]), paths)
+            for row in issue_rows
+        ],
+        suppression_ledger=[SuppressionLedgerEntry(file_path=file_path, **item) for item in ledger],
+        masked_issues=[MaskedIssue(file_path=file_path, **item) for item in masked],
+    )
+
+
+def _without_path(data: Dict[str, Any]) -> Dict[str, Any]:
+    data.pop("file_path", None)
+    return data
+
+
+@dataclass
+class Definition:
+    """A function or class reached from module level through class bodies.
+
+    ``start`` includes decorators. ``digest`` fingerprints the source lines
+    ``start..end``: equal text means an equal subtree (up to a line shift)
+    and equal comments and layout, which line-reading patterns depend on.
+    """
+
+    node: ast.AST
+    path: NodePath
+    start: int
+    end: int
+    digest: str
+    members: List["Definition"] = field(default_factory=list)
+
+
+class DefinitionIndex:
+    """The definitions of one parsed file, with the code each one owns.
+
+    A definition owns its nodes and lines except those of its members
+    (methods and nested classes), which are definitions of their own; the
+    rest of the file is module-level code and is always re-analyzed.
+    """
+
+    _KINDS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+    def __init__(self, tree: ast.AST, lines: Sequence[str]) -> None:
+        self.definitions: List[Definition] = []  # pre-order: classes before their members
+        self.roots = self._collect(tree, (), lines)
+        self._by_path = {definition.path: definition for definition in self.definitions}
+        self._line_owner: List[Optional[Definition]] = [None] * (len(lines) + 2)
+        for definition in self.definitions:
+            for line in range(definition.start, min(definition.end, len(lines)) + 1):
+                self._line_owner[line] = definition
+
+    @classmethod
+    def build(cls, content: str, tree: ast.AST, source: SourceContext) -> Optional[DefinitionIndex]:
+        """Index ``tree``, or ``None`` when line numbers are ambiguous.
+
+        Line breaks other than ``\\n`` and ``\\r\\n`` number lines differently
+        for the AST and for ``str.splitlines``; such files are never split.
+        """
+        if _IRREGULAR_BREAK_RE.search(content) is not None:
+            return None
+        return cls(tree, source.lines)
+
+    def _collect(self, parent: ast.AST, path: NodePath, lines: Sequence[str]) -> List[Definition]:
+        found = []
+        for position, node in enumerate(ast.iter_child_nodes(parent)):
+            if not isinstance(node, self._KINDS):
+                continue
+            decorators = node.decorator_list
+            start = min(d.lineno for d in decorators) if decorators else node.lineno
+            end = node.end_lineno if node.end_lineno is not None else node.lineno
+            text = "\n".join(lines[start - 1 : end])
+            definition = Definition(
+                node, path + (position,), start, end, sha256(text.encode("utf-8")).hexdigest()[:32]
+            )
+            self.definitions.append(definition)
+            if isinstance(node, ast.ClassDef):
+                definition.members = self._collect(node, definition.path, lines)
+            found.append(definition)
+        return found
+
+    def owner(self, path: NodePath) -> Optional[Definition]:
+        """The innermost definition containing the node at ``path``."""
+        for length in range(len(path), 0, -1):
+            definition = self._by_path.get(path[:length])
+            if definition is not None:
+                return definition
+        return None
+
+    def line_owner(self, line: int) -> Optional[Definition]:
+        """The innermost definition containing 1-based ``line``."""
+        if 0 < line < len(self._line_owner):
+            return self._line_owner[line]
+        return None
+
+    def reusable(self, known: Collection[str]) -> List[Definition]:
+        """Outermost definitions whose own digest and all members' digests are ``known``."""
+        found: List[Definition] = []
+
+        def complete(definition: Definition) -> bool:
+            return definition.digest in known and all(map(complete, definition.members))
+
+        def visit(definitions: List[Definition]) -> None:
+            for definition in definitions:
+                if complete(definition):
+                    found.append(definition)
+                else:
+                    visit(definition.members)
+
+        visit(self.roots)
+        return found
+
+
+def _with_members(definitions: Iterable[Definition]) -> Iterable[Definition]:
+    for definition in definitions:
+        yield definition
+        yield from _with_members(definition.members)
+
+
+def merge_definition_findings(
+    index: DefinitionIndex,
+    outcomes: Sequence[PatternOutcome],
+    reused: Sequence[Definition],
+    payload: Mapping[str, Dict[str, List[Any]]],
+    file: Path,
+) -> Dict[str, List[Issue]]:
+    """Combine a ``check_scoped`` walk that skipped ``reused`` with their stored findings.
+
+    Returns each pattern's issues in ``ast.walk`` order, as a full walk gives.
+    """
+    merged: Dict[str, List[Tuple[Tuple[int, NodePath], Issue]]] = {}
+    for outcome in outcomes:
+        merged[outcome.pattern.id] = [
+            ((len(path), path), issue) for path, issue in zip(outcome.paths, outcome.issues)
+        ]
+    for definition in _with_members(reused):
+        for pattern_id, rows in payload[definition.digest].items():
+            items = merged.get(pattern_id)
+            if items is None:
+                continue
+            for relative, offset, column, severity, axis, message, code, suggestion in rows:
+                path = definition.path + tuple(relative)
+                issue = Issue(
+                    pattern_id=pattern_id,
+                    severity=Severity(severity),
+                    axis=Axis(axis),
+                    file=file,
+                    line=definition.start + offset,
+                    column=column,
+                    message=message,
+                    code=code,
+                    suggestion=suggestion,
+                )
+                items.append(((len(path), path), issue))
+    return {
+        pattern_id: [issue for _, issue in sorted(items, key=lambda item: item[0])]
+        for pattern_id, items in merged.items()
+    }
+
+
+def dump_definition_findings(
+    index: DefinitionIndex,
+    findings: Mapping[str, List[Tuple[NodePath, Issue]]],
+    reused: Sequence[Definition],
+    payload: Mapping[str, Dict[str, List[Any]]],
+) -> Dict[str, Dict[str, List[Any]]]:
+    """Per-definition findings of every definition in ``index``, for the next version.
+
+    ``findings`` maps each function-scoped pattern to the ``(path, issue)``
+    pairs its walk produced; ``reused`` definitions keep their entries from
+    ``payload``. A definition with a finding outside its own lines is left
+    out, so it is walked again next time.
+    """
+    dumped: Dict[str, Dict[str, List[Any]]] = {
+        definition.digest: payload[definition.digest] for definition in _with_members(reused)
+    }
+    # Definitions with equal text have equal findings: record the first one.
+    recorders = _first_by_digest(index, exclude=dumped)
+    for digest in recorders:
+        dumped[digest] = {pattern_id: [] for pattern_id in findings}
+    broken = set()
+    for pattern_id, pairs in findings.items():
+        for path, issue in pairs:
+            definition = index.owner(path)
+            if definition is None or recorders.get(definition.digest) is not definition:
+                continue
+            if not definition.start <= issue.line <= definition.end:
+                broken.add(definition.digest)
+                continue
+            dumped[definition.digest][pattern_id].append(
+                (
+                    path[len(definition.path) :],
+                    issue.line - definition.start,
+                    issue.column,
+                    issue.severity.value,
+                    issue.axis.value,
+                    issue.message,
+                    issue.code,
+                    issue.suggestion,
+                )
+            )
+    for digest in broken:
+        del dumped[digest]
+    return dumped
+
+
+def _first_by_digest(
+    index: DefinitionIndex, exclude: Collection[str] = ()
+) -> Dict[str, Definition]:
+    first: Dict[str, Definition] = {}
+    for definition in index.definitions:
+        if definition.digest not in exclude:
+            first.setdefault(definition.digest, definition)
+    return first
+
+
+def known_jargon_hits(
+    reused: Sequence[Definition], payload: Mapping[str, List[Any]]
+) -> Dict[int, List[Tuple[str, str, Optional[bool]]]]:
+    """Jargon hits on every line of the ``reused`` definitions, by 1-based line.
+
+    Lines without hits map to an empty list, so none of them is rescanned.
+    """
+    hits: Dict[int, List[Tuple[str, str, Optional[bool]]]] = {}
+    for root in reused:
+        for line in range(root.start, root.end + 1):
+            hits[line] = []
+        for definition in _with_members([root]):
+            for offset, word, category, justified in payload[definition.digest]:
+                hits[definition.start + offset].append((word, category, justified))
+    return hits
+
+
+def dump_definition_jargon(
+    index: DefinitionIndex,
+    jargon_details: Sequence[Mapping[str, Any]],
+    function_scopes: Mapping[int, Optional[Tuple[int, int]]],
+) -> Dict[str, List[Any]]:
+    """Jargon hits on the lines each definition owns, for the next version.
+
+    A justification decided within the definition's own lines is kept; one
+    that depends on the rest of the file is stored as ``None`` and re-derived.
+    """
+    recorders = _first_by_digest(index)
+    dumped: Dict[str, List[Any]] = {digest: [] for digest in recorders}
+    for detail in jargon_details:
+        line = detail["line"]
+        definition = index.line_owner(line)
+        if definition is None or recorders[definition.digest] is not definition:
+            continue
+        scope = function_scopes.get(line)
+        local = scope is not None and definition.start <= scope[0] and scope[1] <= definition.end
+        dumped[definition.digest].append(
+            (
+                line - definition.start,
+                detail["word"],
+                detail["category"],
+                detail["justified"] if local else None,
+            )
+        )
+    return dumped
@@ -1,11 +1,52 @@
-"""Deterministic structural-coherence calculations for project analysis."""
+"""Deterministic structural-coherence calculations for project analysis.
+
+Exact coherence runs on NumPy when it is installed (the ``topology`` extra)
+and falls back to pure Python otherwise; both give the same result to within
+floating-point summation order. Above the exact ceiling, coherence comes from
+an even sample of files or, with NumPy, from a k-nearest-neighbour graph over
+all of them.
+"""
 
 from __future__ import annotations
 
 import ast
-from collections import Counter
+import hashlib
+import marshal
+from collections import Counter, deque
 from math import log, sqrt
-from typing import Callable, Dict, List, Sequence
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+# Below this many files the pure-Python engine is cheaper than importing NumPy.
+_VECTORIZED_MIN_FILES = 64
+# Upper bound on the elements of one block of the vectorized distance rows.
+_BLOCK_ELEMENTS = 1 << 20
+# Terms at or below this value are left out of each KL divergence sum.
+_EPSILON = 1e-12
+# k-NN graph mode: random-projection trees, their leaf size, files whose
+# exact nearest neighbour floors the error bound, and exact distances per
+# file to spend checking the longest edges.
+_KNN_TREES = 6
+_KNN_LEAF_SIZE = 24
+_KNN_FLOOR_SAMPLES = 16
+_KNN_CERTIFY_PAIRS_PER_FILE = 64
+
+# Incremental exact coherence: new exact distances a repair may compute per
+# file before a full rebuild is cheaper.
+_REPAIR_PAIRS_PER_FILE = 256
+
+TOPOLOGY_MODES = ("deterministic_approximate", "knn_graph", "exact")
+
+
+class CoherenceEstimate(NamedTuple):
+    """Structural coherence, the ``coherence_level`` it was computed at, and its error bound.
+
+    ``error_bound`` is how much the true (exact MST) coherence may exceed
+    ``coherence``: ``0.0`` when exact, ``None`` when not known.
+    """
+
+    coherence: float
+    level: str
+    error_bound: Optional[float] = None
 
 
 def compute_dcf(tree: ast.AST) -> Dict[str, float]:
@@ -18,7 +59,7 @@ def compute_dcf(tree: ast.AST) -> Dict[str, float]:
 def js_divergence(p: List[float], q: List[float]) -> float:
     """Return Jensen-Shannon divergence for two probability vectors."""
     midpoint = [(left + right) / 2.0 for left, right in zip(p, q)]
-    epsilon = 1e-12
+    epsilon = _EPSILON
 
     def kl_divergence(left: List[float], right: List[float]) -> float:
         return sum(
@@ -62,7 +103,21 @@ def deterministic_sample_indices(total: int, sample_size: int) -> List[int]:
 
 
 def compute_coherence_vr_exact(file_dcfs: Sequence[Dict[str, float]]) -> float:
-    """Return MST H0 persistence coherence across parsed-file DCFs."""
+    """Return MST H0 persistence coherence across parsed-file DCFs.
+
+    That is one minus the longest edge of the minimum spanning tree under
+    the Jensen-Shannon distance. Large inputs use the vectorized engine when
+    NumPy is installed.
+    """
+    if len(file_dcfs) >= _VECTORIZED_MIN_FILES:
+        numpy = _numpy()
+        if numpy is not None:
+            return _coherence_vr_exact_vectorized(file_dcfs, numpy)
+    return _coherence_vr_exact_python(file_dcfs)
+
+
+def _coherence_vr_exact_python(file_dcfs: Sequence[Dict[str, float]]) -> float:
+    """Pure-Python engine: full distance matrix, then Prim's MST."""
     count = len(file_dcfs)
     if count <= 1:
         return 1.0
@@ -97,18 +152,558 @@ def compute_coherence_vr_exact(file_dcfs: Sequence[Dict[str, float]]) -> float:
     return max(0.0, 1.0 - max_persistence)
 
 
-def compute_coherence_vr(
+def _numpy() -> Optional[Any]:
+    """Import NumPy on first use; ``None`` when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _coherence_vr_exact_vectorized(file_dcfs: Sequence[Dict[str, float]], np: Any) -> float:
+    """NumPy engine: Prim's MST over distance rows computed as the tree grows.
+
+    DCFs become rows of one matrix over the global node-type vocabulary;
+    identical rows collapse first since they join the tree at distance zero.
+    Each step computes the distances from the newest tree node to every
+    remaining one in blocks of ``_BLOCK_ELEMENTS``, so memory stays linear
+    in the file count. The longest edge Prim adds is the MST's, whatever
+    order ties are taken in.
+    """
+    if len(file_dcfs) <= 1:
+        return 1.0
+    matrix = _dcf_matrix(file_dcfs, np)
+    if len(matrix) == 1:
+        return 1.0
+
+    _, _, weights = _prim_tree(_DistributionRows(matrix, np))
+    return max(0.0, 1.0 - float(weights.max()))
+
+
+def _prim_tree(rows: _DistributionRows) -> tuple[Any, Any, Any]:
+    """MST edges ``(left, right, weight)`` over all of ``rows``, which it consumes."""
+    np = rows.np
+    count = len(rows.matrix)
+    # Rows not yet in the tree are kept in ``rows.matrix[:size]``, their
+    # original indices in ``slots[:size]``, and their shortest known distance
+    # to the tree, and the tree node at the other end, in ``nearest[:size]``
+    # and ``parents[:size]``.
+    slots = np.arange(count)
+    current = rows.take(0)
+    current_slot = 0
+    size = count - 1
+    slots[0] = slots[size]
+    nearest = np.full(size, np.inf)
+    parents = np.zeros(size, dtype=np.intp)
+    left = np.empty(size, dtype=np.intp)
+    right = np.empty(size, dtype=np.intp)
+    weights = np.empty(size)
+    for edge in range(count - 1):
+        distances = rows.distances(current, size)
+        closer = distances < nearest[:size]
+        nearest[:size][closer] = distances[closer]
+        parents[:size][closer] = current_slot
+        index = int(np.argmin(nearest[:size]))
+        left[edge], right[edge], weights[edge] = parents[index], slots[index], nearest[index]
+        current_slot = int(slots[index])
+        current = rows.take(index, size)
+        size -= 1
+        nearest[index], parents[index], slots[index] = nearest[size], parents[size], slots[size]
+    return left, right, weights
+
+
+def _dcf_matrix(file_dcfs: Sequence[Dict[str, float]], np: Any) -> Any:
+    """Distinct DCFs as rows over the sorted node-type vocabulary."""
+    vocabulary = sorted(set().union(*file_dcfs))
+    columns = {name: index for index, name in enumerate(vocabulary)}
+    matrix = np.zeros((len(file_dcfs), len(vocabulary)))
+    for row, dcf in enumerate(file_dcfs):
+        for name, value in dcf.items():
+            matrix[row, columns[name]] = value
+    return np.unique(matrix, axis=0)
+
+
+class _DistributionRows:
+    """DCF rows with the per-row terms the vectorized distances reuse.
+
+    With ``s = p + q`` and ``0 * log(0) = 0``, twice the divergence is
+    ``sum(p log p) - sum(s log s) + sum(q log q) + log(2) * (|p| + |q|)``
+    where the two middle sums run over the columns where ``p`` is non-zero
+    (elsewhere ``s log s`` and ``q log q`` cancel). That is one logarithm
+    per pair and column, against four for the textbook form. The identity
+    only matches ``js_divergence`` when no non-zero entry is small enough
+    for its epsilon guards to drop a term; otherwise, and wherever the
+    difference of sums cancels down to a near-zero divergence, distances
+    come from ``_js_distances`` instead.
+    """
+
+    # Divergences below this are recomputed term by term.
+    _CANCELLATION_FLOOR = 1e-6
+
+    def __init__(self, matrix: Any, np: Any) -> None:
+        self.np = np
+        self.matrix = matrix
+        nonzero = matrix[matrix > 0.0]
+        self.fast = bool(nonzero.size == 0 or nonzero.min() > 2 * _EPSILON)
+        self.entropy_terms = np.zeros_like(matrix)
+        np.multiply(
+            matrix,
+            np.log(matrix, where=matrix > 0.0, out=np.zeros_like(matrix)),
+            out=self.entropy_terms,
+        )
+        self.entropies = self.entropy_terms.sum(axis=1)
+        self.totals = matrix.sum(axis=1)
+
+    def take(self, index: int, size: Optional[int] = None) -> Any:
+        """Remove row ``index`` of the first ``size`` rows, keeping the rest packed in front."""
+        if size is None:
+            size = len(self.matrix)
+        taken = (self.matrix[index].copy(), self.entropies[index], self.totals[index])
+        last = size - 1
+        for array in (self.matrix, self.entropy_terms, self.entropies, self.totals):
+            array[index] = array[last]
+        return taken
+
+    def distances(self, current: Any, size: int) -> Any:
+        """Jensen-Shannon distance from ``current`` (a ``take`` result) to the first ``size`` rows."""
+        np = self.np
+        p, p_entropy, p_total = current
+        rows = self.matrix[:size]
+        if not self.fast:
+            return _js_distances(p, rows, np)
+        inside = np.flatnonzero(p)
+        p_inside = p[inside]
+        doubled = (
+            p_entropy
+            + self.entropy_terms[:size] @ (p > 0.0).astype(float)
+            + log(2.0) * (p_total + self.totals[:size])
+        )
+        block = max(1, _BLOCK_ELEMENTS // max(1, len(inside)))
+        for start in range(0, size, block):
+            merged = rows[start : start + block, inside] + p_inside
+            doubled[start : start + block] -= np.einsum("ij,ij->i", merged, np.log(merged))
+        divergence = 0.5 * doubled
+        close = np.flatnonzero(divergence < self._CANCELLATION_FLOOR)
+        distances = np.sqrt(np.clip(divergence, 0.0, 1.0))
+        if close.size:
+            distances[close] = _js_distances(p, rows[close], np)
+        return distances
+
+    def pair_distances(self, left: Any, right: Any) -> Any:
+        """Jensen-Shannon distance between rows ``left[i]`` and ``right[i]`` for each ``i``."""
+        np = self.np
+        distances = np.empty(len(left))
+        block = max(1, _BLOCK_ELEMENTS // max(1, self.matrix.shape[1]))
+        for start in range(0, len(left), block):
+            first = left[start : start + block]
+            second = right[start : start + block]
+            p = self.matrix[first]
+            q = self.matrix[second]
+            if not self.fast:
+                distances[start : start + block] = _js_pair_distances(p, q, np)
+                continue
+            merged = p + q
+            logs = np.log(merged, where=merged > 0.0, out=np.zeros_like(merged))
+            divergence = 0.5 * (
+                self.entropies[first]
+                + self.entropies[second]
+                - np.einsum("ij,ij->i", merged, logs)
+                + log(2.0) * (self.totals[first] + self.totals[second])
+            )
+            chunk = np.sqrt(np.clip(divergence, 0.0, 1.0))
+            close = np.flatnonzero(divergence < self._CANCELLATION_FLOOR)
+            if close.size:
+                chunk[close] = _js_pair_distances(p[close], q[close], np)
+            distances[start : start + block] = chunk
+        return distances
+
+
+def _js_distances(p: Any, rows: Any, np: Any) -> Any:
+    """Jensen-Shannon distance from vector ``p`` to each of ``rows``, as ``js_divergence``.
+
+    Terms are those of ``js_divergence``: ``x * log(x / m)`` over entries
+    where ``x`` and the midpoint ``m`` exceed ``_EPSILON``. Logarithms are
+    only taken over the columns where ``p`` is non-zero; elsewhere ``m`` is
+    ``q / 2`` and each term reduces to ``q * log(2)``.
+    """
+    inside = np.flatnonzero(p)
+    outside = np.flatnonzero(p == 0.0)
+    p_inside = p[inside]
+    p_kept = p_inside > _EPSILON
+    log_two = log(2.0)
+    block = max(1, _BLOCK_ELEMENTS // max(1, len(p)))
+    distances = np.empty(len(rows))
+    for start in range(0, len(rows), block):
+        chunk = rows[start : start + block]
+        q = chunk[:, inside]
+        midpoint = (p_inside + q) / 2.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            left_ratio = np.where(p_kept & (midpoint > _EPSILON), p_inside / midpoint, 1.0)
+            right_ratio = np.where((q > _EPSILON) & (midpoint > _EPSILON), q / midpoint, 1.0)
+        left = (p_inside * np.log(left_ratio)).sum(axis=1)
+        right = (q * np.log(right_ratio)).sum(axis=1)
+        q_outside = chunk[:, outside]
+        right += np.where(q_outside > 2 * _EPSILON, q_outside * log_two, 0.0).sum(axis=1)
+        distances[start : start + block] = np.sqrt(np.clip(0.5 * left + 0.5 * right, 0.0, 1.0))
+    return distances
+
+
+def _js_pair_distances(p: Any, q: Any, np: Any) -> Any:
+    """Row-wise Jensen-Shannon distance between two equally shaped matrices, as ``js_divergence``."""
+    midpoint = (p + q) / 2.0
+    total = np.zeros(len(p))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for side in (p, q):
+            ratio = np.where((side > _EPSILON) & (midpoint > _EPSILON), side / midpoint, 1.0)
+            total += (side * np.log(ratio)).sum(axis=1)
+    return np.sqrt(np.clip(0.5 * total, 0.0, 1.0))
+
+
+def coherence_vr_knn(file_dcfs: Sequence[Dict[str, float]], np: Any) -> CoherenceEstimate:
+    """Approximate coherence over every file from the MST of a nearest-neighbour graph.
+
+    The graph links files that share a leaf in any tree of a seeded
+    random-projection forest over the square-root (Hellinger) DCF vectors,
+    so each file is joined to a few dozen likely neighbours by their exact
+    Jensen-Shannon distance. Borůvka's algorithm spans it, joining any
+    parts it leaves disconnected through their exact nearest outside file.
+
+    The longest edge of such a tree can only overstate the true MST's, so
+    the coherence reported is a lower bound. ``error_bound`` is how far it
+    can sit below the exact value: the heaviest edges are checked against
+    the exact shortest edge across the cut they span (replacing them when
+    a shorter one exists), and any cut's shortest crossing edge, like any
+    file's nearest-neighbour distance, bounds the true longest edge from
+    below. Lonely outlier files, which dominate the longest edge, sit on
+    small cuts and are settled exactly.
+    """
+    if len(file_dcfs) <= 1:
+        return CoherenceEstimate(1.0, "vr_structural_knn", 0.0)
+    matrix = _dcf_matrix(file_dcfs, np)
+    count = len(matrix)
+    if count == 1:
+        return CoherenceEstimate(1.0, "vr_structural_knn", 0.0)
+    rows = _DistributionRows(matrix, np)
+
+    left, right = _forest_candidates(np.sqrt(matrix), np)
+    weights = rows.pair_distances(left, right)
+    tree = _boruvka_tree(rows, left, right, weights)
+
+    # Every file's nearest-neighbour distance is a lower bound on the longest
+    # MST edge; a handful of exact ones make a cheap floor.
+    lower = 0.0
+    for index in deterministic_sample_indices(count, _KNN_FLOOR_SAMPLES):
+        others = np.delete(np.arange(count), index)
+        distances = rows.pair_distances(np.full(len(others), index), others)
+        lower = max(lower, float(distances.min()))
+    longest = _certify_longest_edge(rows, tree, lower)
+    return CoherenceEstimate(
+        max(0.0, 1.0 - longest[0]), "vr_structural_knn", max(0.0, longest[0] - longest[1])
+    )
+
+
+def _forest_candidates(points: Any, np: Any) -> tuple[Any, Any]:
+    """Distinct ``(left, right)`` index pairs, ``left < right``, sharing a leaf in any tree."""
+    count = len(points)
+    rng = np.random.default_rng(0)
+    leaf_pairs: Dict[int, tuple[Any, Any]] = {}
+    pair_blocks = []
+    for _ in range(_KNN_TREES):
+        stack = [np.arange(count)]
+        while stack:
+            members = stack.pop()
+            if len(members) <= _KNN_LEAF_SIZE:
+                if len(members) not in leaf_pairs:
+                    leaf_pairs[len(members)] = np.triu_indices(len(members), 1)
+                first, second = leaf_pairs[len(members)]
+                pair_blocks.append((members[first], members[second]))
+                continue
+            # Splitting at the median along the line through two random members
+            # adapts the cuts to the data and keeps the tree balanced.
+            a, b = rng.choice(len(members), 2, replace=False)
+            projection = points[members] @ (points[members[a]] - points[members[b]])
+            order = np.argsort(projection, kind="stable")
+            half = len(members) // 2
+            stack.append(members[order[:half]])
+            stack.append(members[order[half:]])
+    left = np.concatenate([block[0] for block in pair_blocks])
+    right = np.concatenate([block[1] for block in pair_blocks])
+    keys = np.unique(np.minimum(left, right) * count + np.maximum(left, right))
+    return keys // count, keys % count
+
+
+def _boruvka_tree(
+    rows: _DistributionRows, left: Any, right: Any, weights: Any
+) -> List[tuple[int, int, float]]:
+    """Minimum spanning tree edges over the candidate graph, bridged exactly where it is split."""
+    np = rows.np
+    count = len(rows.matrix)
+    labels = np.arange(count)
+    parent = list(range(count))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    tree: List[tuple[int, int, float]] = []
+    while len(tree) < count - 1:
+        crossing = labels[left] != labels[right]
+        left, right, weights = left[crossing], right[crossing], weights[crossing]
+        if not len(left):
+            left, right, weights = _bridge_edges(rows, labels)
+            continue
+        # Cheapest edge out of every component; ties go to the lower edge
+        # index so that all components agree and no cycle can form.
+        component = np.concatenate([labels[left], labels[right]])
+        edge = np.concatenate([np.arange(len(left)), np.arange(len(left))])
+        order = np.lexsort((edge, np.concatenate([weights, weights]), component))
+        component = component[order]
+        firsts = order[np.r_[True, component[1:] != component[:-1]]] % len(left)
+        for index in np.unique(firsts).tolist():
+            a, b = int(left[index]), int(right[index])
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_a] = root_b
+                tree.append((a, b, float(weights[index])))
+        # Labels are always roots of the previous round, so relabelling only
+        # needs the components that were there at its start.
+        relabel = np.arange(count)
+        components = np.unique(labels)
+        relabel[components] = [find(component) for component in components.tolist()]
+        labels = relabel[labels]
+    return tree
+
+
+def _bridge_edges(rows: _DistributionRows, labels: Any) -> tuple[Any, Any, Any]:
+    """Exact shortest edge out of every component except the largest."""
+    np = rows.np
+    components, sizes = np.unique(labels, return_counts=True)
+    left, right, weights = [], [], []
+    for component in components[np.argsort(sizes, kind="stable")[:-1]].tolist():
+        inside = np.flatnonzero(labels == component)
+        outside = np.flatnonzero(labels != component)
+        best = (np.inf, 0, 0)
+        for node in inside.tolist():
+            distances = rows.pair_distances(np.full(len(outside), node), outside)
+            index = int(np.argmin(distances))
+            best = min(best, (float(distances[index]), node, int(outside[index])))
+        left.append(best[1])
+        right.append(best[2])
+        weights.append(best[0])
+    return np.array(left), np.array(right), np.array(weights)
+
+
+def _certify_longest_edge(
+    rows: _DistributionRows, tree: List[tuple[int, int, float]], lower: float
+) -> tuple[float, float]:
+    """Tighten the tree's longest edge against exact cuts; return ``(upper, lower)`` bounds."""
+    np = rows.np
+    count = len(rows.matrix)
+    adjacency: List[set[int]] = [set() for _ in range(count)]
+    for a, b, _ in tree:
+        adjacency[a].add(b)
+        adjacency[b].add(a)
+    budget = _KNN_CERTIFY_PAIRS_PER_FILE * count
+    while True:
+        heaviest = max(range(len(tree)), key=lambda index: tree[index][2])
+        a, b, weight = tree[heaviest]
+        if weight <= lower:
+            return weight, weight
+        side = _smaller_side(adjacency, a, b)
+        cost = len(side) * (count - len(side))
+        if cost > budget:
+            return weight, lower
+        budget -= cost
+        outside = np.ones(count, dtype=bool)
+        outside[side] = False
+        outside_indices = np.flatnonzero(outside)
+        best = (np.inf, a, b)
+        for node in side:
+            distances = rows.pair_distances(np.full(len(outside_indices), node), outside_indices)
+            index = int(np.argmin(distances))
+            best = min(best, (float(distances[index]), node, int(outside_indices[index])))
+        lower = max(lower, best[0])
+        if best[0] < weight:
+            adjacency[a].discard(b)
+            adjacency[b].discard(a)
+            adjacency[best[1]].add(best[2])
+            adjacency[best[2]].add(best[1])
+            tree[heaviest] = (best[1], best[2], best[0])
+
+
+def _smaller_side(adjacency: List[set[int]], a: int, b: int) -> List[int]:
+    """Nodes on the smaller side of tree edge ``a``-``b``, found by growing both sides in turn."""
+    sides: tuple[List[int], List[int]] = ([a], [b])
+    seen = ({a, b}, {a, b})
+    queues = (deque([a]), deque([b]))
+    while True:
+        for turn in (0, 1):
+            if not queues[turn]:
+                return sides[turn]
+            node = queues[turn].popleft()
+            for neighbour in adjacency[node]:
+                if neighbour not in seen[turn]:
+                    seen[turn].add(neighbour)
+                    sides[turn].append(neighbour)
+                    queues[turn].append(neighbour)
+
+
+def incremental_coherence_vr_exact(
+    file_dcfs: Sequence[Dict[str, float]],
+    previous: Optional[Any],
+    max_changed_fraction: float,
+) -> tuple[float, Optional[tuple]]:
+    """Return exact coherence and a state from which the next call can repair its MST.
+
+    The state lists each distinct DCF's content key with the MST edges over
+    them. Given the ``previous`` state, tree edges between unchanged DCFs
+    are kept and only distances involving what changed are computed:
+
+    * every edge from an added DCF, and
+    * when removed DCFs split the old tree, every edge out of each piece
+      but the largest.
+
+    Any other edge closes a cycle of kept tree edges it is the longest of,
+    so it cannot be in the new MST. A full rebuild runs instead when more
+    than ``max_changed_fraction`` of the DCFs were added or removed, or the
+    repair would compute more than ``_REPAIR_PAIRS_PER_FILE`` distances per
+    DCF. Without NumPy the pure-Python engine runs and no state is returned.
+    """
+    np = _numpy()
+    if np is None:
+        return compute_coherence_vr_exact(file_dcfs), None
+    keys, matrix = _keyed_dcf_matrix(file_dcfs, np)
+    if len(keys) <= 1:
+        return 1.0, (keys, [], [], [])
+    rows = _DistributionRows(matrix, np)
+    tree = None
+    if isinstance(previous, tuple) and len(previous) == 4:
+        tree = _repaired_tree(rows, keys, previous, max_changed_fraction)
+    if tree is None:
+        tree = _prim_tree(rows)
+    left, right, weights = tree
+    state = (keys, left.tolist(), right.tolist(), weights.tolist())
+    return max(0.0, 1.0 - float(weights.max())), state
+
+
+def _keyed_dcf_matrix(file_dcfs: Sequence[Dict[str, float]], np: Any) -> tuple[List[bytes], Any]:
+    """Content keys of the distinct DCFs, in first-seen order, and their rows."""
+    distinct: Dict[bytes, Dict[str, float]] = {}
+    for dcf in file_dcfs:
+        key = hashlib.sha256(marshal.dumps(sorted(dcf.items()), 2)).digest()
+        distinct.setdefault(key, dcf)
+    vocabulary = sorted(set().union(*distinct.values()))
+    columns = {name: index for index, name in enumerate(vocabulary)}
+    matrix = np.zeros((len(distinct), len(vocabulary)))
+    for row, dcf in enumerate(distinct.values()):
+        for name, value in dcf.items():
+            matrix[row, columns[name]] = value
+    return list(distinct), matrix
+
+
+def _repaired_tree(
+    rows: _DistributionRows, keys: List[bytes], previous: tuple, max_changed_fraction: float
+) -> Optional[tuple[Any, Any, Any]]:
+    """The MST over ``rows`` repaired from a previous state, or ``None`` to rebuild."""
+    np = rows.np
+    count = len(keys)
+    old_keys, old_left, old_right, old_weights = previous
+    position = {key: index for index, key in enumerate(keys)}
+    moved = np.array([position.get(key, -1) for key in old_keys], dtype=np.intp)
+    kept = np.zeros(count, dtype=bool)
+    kept[moved[moved >= 0]] = True
+    added = np.flatnonzero(~kept)
+    removed = int((moved < 0).sum())
+    if added.size + removed > max_changed_fraction * count or not kept.any():
+        return None
+    left = moved[np.asarray(old_left, dtype=np.intp)]
+    right = moved[np.asarray(old_right, dtype=np.intp)]
+    weights = np.asarray(old_weights, dtype=float)
+    if not added.size and not removed:
+        return left, right, weights
+    forest = (left >= 0) & (right >= 0)
+    left, right, weights = left[forest], right[forest], weights[forest]
+
+    labels = _forest_labels(count, left, right, np)
+    pieces, sizes = np.unique(labels[kept], return_counts=True)
+    largest = pieces[np.argmax(sizes)]
+    sources: List[Any] = []
+    targets: List[Any] = []
+    for piece in pieces[pieces != largest].tolist():
+        members = np.flatnonzero(kept & (labels == piece))
+        # Edges to lower-labelled small pieces were taken from that side.
+        others = np.flatnonzero(kept & (labels != piece) & ((labels > piece) | (labels == largest)))
+        sources.append(np.repeat(members, len(others)))
+        targets.append(np.tile(others, len(members)))
+    for node in added.tolist():
+        others = np.flatnonzero(kept | (np.arange(count) > node))
+        sources.append(np.full(len(others), node))
+        targets.append(others)
+    pairs = sum(len(block) for block in sources)
+    if pairs > min(_REPAIR_PAIRS_PER_FILE * count, count * (count - 1) // 4):
+        return None
+    if pairs:
+        new_left = np.concatenate(sources)
+        new_right = np.concatenate(targets)
+        left = np.concatenate([left, new_left])
+        right = np.concatenate([right, new_right])
+        weights = np.concatenate([weights, rows.pair_distances(new_left, new_right)])
+    tree = _boruvka_tree(rows, left, right, weights)
+    return (
+        np.array([edge[0] for edge in tree], dtype=np.intp),
+        np.array([edge[1] for edge in tree], dtype=np.intp),
+        np.array([edge[2] for edge in tree]),
+    )
+
+
+def _forest_labels(count: int, left: Any, right: Any, np: Any) -> Any:
+    """Component label of every node of the forest with edges ``left[i]``-``right[i]``."""
+    parent = list(range(count))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for a, b in zip(left.tolist(), right.tolist()):
+        parent[find(a)] = find(b)
+    return np.array([find(node) for node in range(count)])
+
+
+def estimate_coherence_vr(
     file_dcfs: List[Dict[str, float]],
     exact_ceiling: int,
     mode_above_ceiling: str,
     exact_calculator: Callable[[Sequence[Dict[str, float]]], float] = compute_coherence_vr_exact,
-) -> tuple[float, str]:
-    """Return exact coherence or deterministic sampled coherence above the configured ceiling."""
+) -> CoherenceEstimate:
+    """Return coherence, exact up to the ceiling and per ``mode_above_ceiling`` above it.
+
+    ``knn_graph`` needs NumPy; without it the deterministic sample is used.
+    """
     if len(file_dcfs) <= 1:
-        return 1.0, "none"
+        return CoherenceEstimate(1.0, "none")
     if len(file_dcfs) <= exact_ceiling or mode_above_ceiling == "exact":
-        return exact_calculator(file_dcfs), "vr_structural"
+        return CoherenceEstimate(exact_calculator(file_dcfs), "vr_structural", 0.0)
+    if mode_above_ceiling == "knn_graph":
+        numpy = _numpy()
+        if numpy is not None:
+            return coherence_vr_knn(file_dcfs, numpy)
 
     sample_indices = deterministic_sample_indices(len(file_dcfs), exact_ceiling)
     sampled_dcfs = [file_dcfs[index] for index in sample_indices]
-    return exact_calculator(sampled_dcfs), "vr_structural_approx"
+    return CoherenceEstimate(exact_calculator(sampled_dcfs), "vr_structural_approx")
+
+
+def compute_coherence_vr(
+    file_dcfs: List[Dict[str, float]],
+    exact_ceiling: int,
+    mode_above_ceiling: str,
+    exact_calculator: Callable[[Sequence[Dict[str, float]]], float] = compute_coherence_vr_exact,
+) -> tuple[float, str]:
+    """Return exact coherence or deterministic sampled coherence above the configured ceiling."""
+    estimate = estimate_coherence_vr(file_dcfs, exact_ceiling, mode_above_ceiling, exact_calculator)
+    return estimate.coherence, estimate.level
@@ -9,6 +9,7 @@ from __future__ import annotations
 import ast
 from enum import Enum
 from pathlib import Path
+from typing import Optional
 
 
 class FileRole(Enum):
@@ -36,12 +37,8 @@ ROLE_SKIP: dict[FileRole, frozenset[str]] = {
 }
 
 
-def classify_file(path: str, content: str, tree: ast.Module) -> FileRole:
-    """Classify *path* into a FileRole based on its name and AST structure.
-
-    The classification is purely structural and fast — no I/O beyond the
-    already-parsed tree.
-    """
+def path_role(path: str) -> Optional[FileRole]:
+    """Return the role implied by *path* alone, or ``None`` if it takes the AST."""
     p = Path(path)
     parts = {part.lower() for part in p.parts}
 
@@ -56,6 +53,18 @@ def classify_file(path: str, content: str, tree: ast.Module) -> FileRole:
     # __init__.py — even if it has some logic, its primary role is re-export
     if p.name == "__init__.py":
         return FileRole.INIT
+    return None
+
+
+def classify_file(path: str, content: str, tree: ast.Module) -> FileRole:
+    """Classify *path* into a FileRole based on its name and AST structure.
+
+    The classification is purely structural and fast — no I/O beyond the
+    already-parsed tree.
+    """
+    role = path_role(path)
+    if role is not None:
+        return role
 
     # Analyse AST top-level body to determine RE_EXPORT or MODEL
     body_nodes = tree.body  # top-level only — nested stmts must not skew ratios
@@ -14,26 +14,38 @@ def _issue_severity(issue: Any) -> str:
     return severity if severity in _SEVERITIES else "low"
 
 
-def build_finding_summary(file_results: Iterable[Any]) -> Dict[str, Any]:
-    """Return stable aggregate finding counts without changing score semantics."""
-    severity = {name: 0 for name in _SEVERITIES}
-    affected_files = 0
+class FindingSummaryBuilder:
+    """Accumulate finding counts one result at a time (for streamed scans)."""
 
-    for result in file_results:
+    def __init__(self) -> None:
+        self.severity = {name: 0 for name in _SEVERITIES}
+        self.affected_files = 0
+
+    def add(self, result: Any) -> None:
         issues = getattr(result, "pattern_issues", getattr(result, "issues", [])) or []
         if issues:
-            affected_files += 1
+            self.affected_files += 1
         for issue in issues:
-            severity[_issue_severity(issue)] += 1
-
-    total = sum(severity.values())
-    return {
-        "total": total,
-        "affected_files": affected_files,
-        "severity": severity,
-        "has_critical": severity["critical"] > 0,
-        "score_semantics": "independent_of_weighted_deficit_status",
-    }
+            self.severity[_issue_severity(issue)] += 1
+
+    def build(self) -> Dict[str, Any]:
+        severity = dict(self.severity)
+        total = sum(severity.values())
+        return {
+            "total": total,
+            "affected_files": self.affected_files,
+            "severity": severity,
+            "has_critical": severity["critical"] > 0,
+            "score_semantics": "independent_of_weighted_deficit_status",
+        }
+
+
+def build_finding_summary(file_results: Iterable[Any]) -> Dict[str, Any]:
+    """Return stable aggregate finding counts without changing score semantics."""
+    builder = FindingSummaryBuilder()
+    for result in file_results:
+        builder.add(result)
+    return builder.build()
 
 
 def get_finding_summary(project_result: Any) -> Dict[str, Any]:
@@ -6,6 +6,7 @@ import ast
 from typing import List, Optional
 
 from slop_detector.models import IgnoredFunction
+from slop_detector.source_context import SourceContext
 
 
 class IgnoreHandler:
@@ -78,14 +79,22 @@ class IgnoreHandler:
 
     @staticmethod
     def get_ignored_line_ranges(
-        tree: ast.AST, ignored_functions: List[IgnoredFunction]
+        tree: ast.AST,
+        ignored_functions: List[IgnoredFunction],
+        source: Optional[SourceContext] = None,
     ) -> List[tuple]:
         """Get line ranges for ignored functions.
 
         Returns list of (start_line, end_line) tuples.
         """
-        ranges = []
+        ranges: List[tuple] = []
         ignored_names = {f.name for f in ignored_functions}
+        if not ignored_names:
+            return ranges
+        if source is not None and source.tree is tree:
+            return [
+                (fn.lineno, fn.end_lineno) for fn in source.functions if fn.name in ignored_names
+            ]
 
         for node in ast.walk(tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
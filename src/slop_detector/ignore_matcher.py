@@ -0,0 +1,177 @@
+"""Project ignore patterns compiled once into a single ordered matcher.
+
+``IgnoreMatcher`` gives the same answers as checking each pattern in turn
+with ``Path.match``, ``fnmatch`` and the ``**/``-stripped ``fnmatch``
+fallback, but it compiles every pattern into one regular expression. Each
+pattern becomes one group of an ordered alternation, so the first pattern
+that matches still names the reason.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Pattern, Sequence, Tuple
+
+DEFAULT_EXCLUDE_PARTS = frozenset(
+    {
+        ".claude",
+        ".venv",
+        "venv",
+        "site-packages",
+        "node_modules",
+        "__pycache__",
+        ".git",
+        "build",
+        "dist",
+        ".tox",
+        ".next",
+        "htmlcov",
+    }
+)
+
+# fnmatch and Path.match fold case wherever the filesystem does.
+_REGEX_FLAGS = re.DOTALL | (re.IGNORECASE if os.path.normcase("A") != "A" else 0)
+_WILDCARD_RE = re.compile(r"(\*+|\?)")
+
+
+def default_directory_reason(parts: Iterable[str]) -> Optional[str]:
+    """Return ``directory:<name>`` when any path part is a built-in excluded directory."""
+    default_parts = {part.lower() for part in parts} & DEFAULT_EXCLUDE_PARTS
+    if default_parts:
+        return f"directory:{sorted(default_parts)[0]}"
+    return None
+
+
+def _glob_regex(pattern: str, within_part: bool) -> str:
+    """Translate ``*`` / ``?`` wildcards; ``within_part`` keeps them inside one path part."""
+    star, single = ("[^/]*", "[^/]") if within_part else (".*", ".")
+    return "".join(
+        (star if token.startswith("*") else single) if index % 2 else re.escape(token)
+        for index, token in enumerate(_WILDCARD_RE.split(pattern))
+    )
+
+
+def _path_match_regex(pattern: str) -> Optional[str]:
+    """Regex for ``Path(path).match(pattern)`` over root-relative ``/``-joined paths.
+
+    ``Path.match`` compares the pattern's parts with the path's trailing parts,
+    so relative patterns match at any depth. Absolute patterns never match a
+    relative path.
+    """
+    if pattern.startswith("/"):
+        return None
+    parts = [part for part in pattern.split("/") if part not in ("", ".")]
+    return "(?:.*/)?" + "/".join(_glob_regex(part, within_part=True) for part in parts)
+
+
+def _pattern_regex(pattern: str) -> str:
+    alternatives = [_glob_regex(pattern, within_part=False)]
+    path_match = _path_match_regex(pattern)
+    if path_match is not None:
+        alternatives.insert(0, path_match)
+    if pattern.startswith("**/"):
+        alternatives.append(_glob_regex(pattern[3:], within_part=False))
+    return "|".join(f"(?:{alternative})" for alternative in alternatives)
+
+
+def _is_compilable(pattern: str) -> bool:
+    # Character classes may match a separator in some Python versions'
+    # Path.match; an empty pattern makes Path.match raise. Both keep the loop.
+    return "[" not in pattern and any(part not in ("", ".") for part in pattern.split("/"))
+
+
+def _match_patterns_in_order(normalized: str, patterns: Sequence[str]) -> Optional[str]:
+    """Per-pattern ``Path.match`` / ``fnmatch`` check, used where compilation is not exact."""
+    for pattern in patterns:
+        if Path(normalized).match(pattern):
+            return f"pattern:{pattern}"
+        if fnmatch.fnmatch(normalized, pattern):
+            return f"pattern:{pattern}"
+        if pattern.startswith("**/") and fnmatch.fnmatch(normalized, pattern[3:]):
+            return f"pattern:{pattern}"
+    return None
+
+
+class IgnoreMatcher:
+    """Ordered project ignore patterns, compiled once.
+
+    ``reason`` is a drop-in for ``core_project.ignore_reason``. The
+    directory query lets a tree walker skip per-file checks below a
+    directory: ``subtree_reason`` names the reason shared by everything
+    below it.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns: Tuple[str, ...] = tuple(str(p).replace("\\", "/") for p in patterns)
+        self._compiled: Optional[Pattern[str]] = None
+        self._subtree_patterns: List[Tuple[Optional[Pattern[str]], bool]] = []
+        if all(_is_compilable(pattern) for pattern in self.patterns) and self.patterns:
+            self._compiled = re.compile(
+                "|".join(f"({_pattern_regex(pattern)})" for pattern in self.patterns),
+                _REGEX_FLAGS,
+            )
+            for pattern in self.patterns:
+                self._subtree_patterns.append(
+                    (self._subtree_regex(pattern), not pattern.startswith("/"))
+                )
+
+    @staticmethod
+    def _subtree_regex(pattern: str) -> Optional[Pattern[str]]:
+        """Directories under which ``pattern`` matches every path (``<dir-glob>/**`` forms)."""
+        if not pattern.endswith("/**"):
+            return None
+        prefixes = [_glob_regex(pattern[:-3], within_part=False)]
+        if pattern.startswith("**/"):
+            prefixes.append(_glob_regex(pattern[3:-3], within_part=False))
+        return re.compile("|".join(f"(?:{prefix})" for prefix in prefixes), _REGEX_FLAGS)
+
+    def reason(self, file_path: Path, root: Optional[Path] = None) -> Optional[str]:
+        """Return the exclusion source for ``file_path``, if any."""
+        default = default_directory_reason(file_path.parts)
+        if default is not None:
+            return default
+        normalized = str(file_path).replace("\\", "/")
+        if root is not None:
+            try:
+                normalized = str(file_path.relative_to(root)).replace("\\", "/")
+            except ValueError:
+                pass
+        return self.pattern_reason(normalized)
+
+    def pattern_reason(self, normalized: str) -> Optional[str]:
+        """Return ``pattern:<glob>`` for the first pattern matching ``/``-joined ``normalized``."""
+        if not self.patterns:
+            return None
+        if self._compiled is None or normalized.startswith("/") or ":" in normalized:
+            # Absolute and drive-qualified paths keep Path.match's root-part rules.
+            return _match_patterns_in_order(normalized, self.patterns)
+        match = self._compiled.fullmatch(normalized)
+        if match is None:
+            return None
+        return f"pattern:{self.patterns[match.lastindex - 1]}"  # type: ignore[operator]
+
+    def subtree_reason(self, directory: str) -> Optional[str]:
+        """Reason shared by every path below root-relative ``directory``, if one is known.
+
+        Only a ``<dir-glob>/**`` pattern that matches ``directory`` covers a
+        whole subtree, and only when no earlier pattern can match below it.
+        ``None`` means paths below must be checked one by one.
+        """
+        if self._compiled is None:
+            return None
+        for pattern, (subtree, relative) in zip(self.patterns, self._subtree_patterns):
+            if subtree is not None and subtree.fullmatch(directory):
+                return f"pattern:{pattern}"
+            if relative:
+                return None
+        return None
+
+
+@lru_cache(maxsize=32)
+def compiled_ignore_matcher(patterns: Tuple[str, ...]) -> IgnoreMatcher:
+    """Shared matcher for a pattern tuple; configs reuse one pattern list per run."""
+    return IgnoreMatcher(patterns)
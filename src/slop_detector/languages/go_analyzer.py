@@ -118,6 +118,9 @@ class GoFileAnalysis:
     slop_score: float = 0.0
     status: str = "clean"  # clean | suspicious | critical_deficit
 
+    # How the analysis cache served this result; not part of the analysis.
+    cache_tier: Optional[str] = field(default=None, compare=False, repr=False)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "file_path": self.file_path,
@@ -147,11 +150,15 @@ class GoFileAnalysis:
 class GoAnalyzer:
     """Analyzes .go files for AI-slop patterns."""
 
-    def analyze(self, file_path: str) -> GoFileAnalysis:
-        """Analyze a single .go file and return GoFileAnalysis."""
+    def analyze(self, file_path: str, content: Optional[str] = None) -> GoFileAnalysis:
+        """Analyze a single .go file and return GoFileAnalysis.
+
+        ``content`` skips reading the file when the caller already did.
+        """
         path = Path(file_path)
         try:
-            content = path.read_text(encoding="utf-8", errors="ignore")
+            if content is None:
+                content = path.read_text(encoding="utf-8", errors="ignore")
         except OSError as exc:
             logger.error(f"Cannot read {file_path}: {exc}")
             return GoFileAnalysis(
@@ -167,6 +174,17 @@ class GoAnalyzer:
             return self._analyze_ast(file_path, content)
         return self._analyze_regex(file_path, content)
 
+    @staticmethod
+    def cache_key(file_path: str) -> str:
+        """Every input of ``analyze`` besides the file content, for the analysis cache."""
+        return repr(
+            (
+                "tree-sitter" if _TS_AVAILABLE else "regex",
+                GOD_FUNCTION_LINES,
+                PANIC_SEVERITY_THRESHOLD,
+            )
+        )
+
     # ------------------------------------------------------------------
     # Regex analysis (always available)
     # ------------------------------------------------------------------
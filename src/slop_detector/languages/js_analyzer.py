@@ -193,6 +193,9 @@ class JSFileAnalysis:
     slop_score: float = 0.0
     status: str = "clean"  # clean | suspicious | critical_deficit
 
+    # How the analysis cache served this result; not part of the analysis.
+    cache_tier: Optional[str] = field(default=None, compare=False, repr=False)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "file_path": self.file_path,
@@ -352,9 +355,11 @@ class JSAnalyzer:
         "low": 1.0,
     }
 
-    def analyze(self, file_path: str) -> JSFileAnalysis:
+    def analyze(self, file_path: str, content: Optional[str] = None) -> JSFileAnalysis:
+        """Analyze one file; ``content`` skips reading it when the caller already did."""
         path = Path(file_path)
-        content = path.read_text(encoding="utf-8", errors="ignore")
+        if content is None:
+            content = path.read_text(encoding="utf-8", errors="ignore")
         is_ts = path.suffix.lower() in {".ts", ".tsx"}
         is_tsx = path.suffix.lower() == ".tsx"
         language = "typescript" if is_ts else "javascript"
@@ -363,6 +368,25 @@ class JSAnalyzer:
             return self._analyze_ast(file_path, content, language, is_ts, is_tsx)
         return self._analyze_regex(file_path, content, language, is_ts)
 
+    def cache_key(self, file_path: str) -> str:
+        """Every input of ``analyze`` besides the file content, for the analysis cache.
+
+        Covers the analysis mode, the thresholds and the path-derived inputs
+        (dialect from the suffix, test-file masking).
+        """
+        path = Path(file_path)
+        return repr(
+            (
+                "tree-sitter" if _TS_AVAILABLE else "regex",
+                GOD_FUNCTION_LINES,
+                GOD_FUNCTION_COMPLEXITY,
+                GOD_DEPTH_THRESHOLD,
+                sorted(self.SEVERITY_WEIGHTS.items()),
+                path.suffix.lower(),
+                FrameworkMasker._is_js_test_file(path),
+            )
+        )
+
     @staticmethod
     def _recount_visible_issues(issues: List[JSIssue]) -> Dict[str, int]:
         return {
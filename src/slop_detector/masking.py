@@ -9,6 +9,7 @@ from typing import Any, Iterable, List, Optional, Tuple
 
 from slop_detector.models import MaskedIssue
 from slop_detector.patterns.base import Issue, Severity
+from slop_detector.source_context import SourceContext, source_context_for
 
 _PYTHON_TEST_PATH_RE = re.compile(r"(^|[\\/])(tests?|__tests__)([\\/]|$)")
 _PYTHON_TEST_FILE_RE = re.compile(r"(^test_.*\.py$|.*_test\.py$)")
@@ -37,7 +38,7 @@ class FrameworkMasker:
     """Masks a narrow set of deterministic framework boilerplate findings."""
 
     @staticmethod
-    def _is_python_test_file(file_path: Path) -> bool:
+    def is_python_test_file(file_path: Path) -> bool:
         normalized = str(file_path).replace("\\", "/")
         name = file_path.name
         return bool(
@@ -51,34 +52,24 @@ class FrameworkMasker:
         normalized = str(file_path).replace("\\", "/")
         return bool(_JS_TEST_PATH_RE.search(normalized) or _JS_TEST_FILE_RE.match(file_path.name))
 
-    @staticmethod
-    def _line_text(content: str, line_number: int) -> str:
-        lines = content.splitlines()
-        if 1 <= line_number <= len(lines):
-            return lines[line_number - 1]
-        return ""
-
-    @staticmethod
-    def _python_function_name_at_line(tree: ast.AST, line_number: int) -> Optional[str]:
-        for node in ast.walk(tree):
-            if (
-                isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-                and node.lineno == line_number
-            ):
-                return node.name
-        return None
-
     @classmethod
     def mask_python_issue(
-        cls, file_path: Path, issue: Issue, content: str, tree: ast.AST
+        cls,
+        file_path: Path,
+        issue: Issue,
+        content: str,
+        tree: ast.AST,
+        source: Optional[SourceContext] = None,
     ) -> Optional[MaskedIssue]:
-        del content
         if issue.severity == Severity.CRITICAL:
             return None
         if (
             issue.pattern_id == "pass_placeholder"
-            and cls._is_python_test_file(file_path)
-            and cls._python_function_name_at_line(tree, issue.line) in _PYTEST_NOOP_HOOKS
+            and cls.is_python_test_file(file_path)
+            and (
+                source_context_for(content, tree, source).function_name_at_line(issue.line)
+                in _PYTEST_NOOP_HOOKS
+            )
         ):
             return MaskedIssue(
                 file_path=str(file_path),
@@ -92,12 +83,18 @@ class FrameworkMasker:
 
     @classmethod
     def apply_python_masking(
-        cls, file_path: Path, content: str, tree: ast.AST, issues: Iterable[Issue]
+        cls,
+        file_path: Path,
+        content: str,
+        tree: ast.AST,
+        issues: Iterable[Issue],
+        source: Optional[SourceContext] = None,
     ) -> Tuple[List[Issue], List[MaskedIssue]]:
         visible: List[Issue] = []
         masked: List[MaskedIssue] = []
+        source = source_context_for(content, tree, source)
         for issue in issues:
-            masked_issue = cls.mask_python_issue(file_path, issue, content, tree)
+            masked_issue = cls.mask_python_issue(file_path, issue, content, tree, source)
             if masked_issue is not None:
                 masked.append(masked_issue)
                 continue
@@ -105,8 +102,14 @@ class FrameworkMasker:
         return visible, masked
 
     @classmethod
-    def mask_js_issue(cls, file_path: Path, issue: Any, content: str) -> Optional[MaskedIssue]:
-        line_text = cls._line_text(content, getattr(issue, "line", 0))
+    def mask_js_issue(
+        cls,
+        file_path: Path,
+        issue: Any,
+        content: str,
+        source: Optional[SourceContext] = None,
+    ) -> Optional[MaskedIssue]:
+        line_text = source_context_for(content, None, source).line(getattr(issue, "line", 0))
         if getattr(issue, "pattern_id", "") == "js_console_log" and cls._is_js_test_file(file_path):
             return MaskedIssue(
                 file_path=str(file_path),
@@ -138,8 +141,9 @@ class FrameworkMasker:
         path = Path(file_path)
         visible: List[Any] = []
         masked: List[MaskedIssue] = []
+        source = SourceContext(content)
         for issue in issues:
-            masked_issue = cls.mask_js_issue(path, issue, content)
+            masked_issue = cls.mask_js_issue(path, issue, content, source)
             if masked_issue is not None:
                 masked.append(masked_issue)
                 continue
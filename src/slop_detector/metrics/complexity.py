@@ -0,0 +1,186 @@
+"""AST-based McCabe cyclomatic complexity, numerically compatible with radon.
+
+Works on an already-parsed tree so callers never re-parse source text. The
+counting rules follow ``radon.visitors.ComplexityVisitor`` (radon 6):
+
+- ``if`` / ternary, ``assert``: +1 each (assert bodies are not inspected)
+- ``for`` / ``async for`` / ``while``: +1, and +1 more with an ``else``
+- ``try``: +1 per ``except`` handler, +1 for an ``else``
+- boolean operators: +1 per extra operand
+- comprehensions: +1, plus +1 per ``if`` clause
+- ``match``: +1 per case, not counting a bare ``case _``
+- nested functions and classes do not add to the enclosing function
+"""
+
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+_LOOP_NODES = (ast.For, ast.While, ast.AsyncFor)
+_MATCH_NODE: Optional[type] = getattr(ast, "Match", None)
+
+BLOCK_FUNCTION = "function"
+BLOCK_METHOD = "method"
+BLOCK_CLASS = "class"
+
+
+@dataclass(frozen=True)
+class ComplexityBlock:
+    """One radon-style block: a function, a method or a class."""
+
+    name: str
+    kind: str
+    lineno: int
+    col_offset: int
+    complexity: int
+    classname: Optional[str] = None
+
+
+@dataclass
+class _Scope:
+    """Accumulator mirroring one radon visitor instance."""
+
+    complexity: int = 0
+    functions: List[Tuple[ast.AST, int]] = field(default_factory=list)
+    classes: List["_ClassInfo"] = field(default_factory=list)
+
+
+@dataclass
+class _ClassInfo:
+    node: ast.ClassDef
+    real_complexity: int
+    methods: List[Tuple[ast.AST, int]]
+
+    @property
+    def complexity(self) -> int:
+        # radon reports a class as the mean of its methods (+1 with several).
+        if not self.methods:
+            return self.real_complexity
+        count = len(self.methods)
+        return int(self.real_complexity / float(count)) + (count > 1)
+
+
+class ComplexityReport:
+    """Per-function McCabe complexity for one tree, computed in a single pass.
+
+    ``blocks`` matches what ``radon.complexity.cc_visit`` returns for the same
+    source (functions first, then each class followed by its methods).
+    ``of(node)`` answers for any function in the tree, including closures
+    and methods of nested classes that radon leaves out of ``blocks``.
+    """
+
+    def __init__(self, tree: Optional[ast.AST]):
+        self._by_node: Dict[ast.AST, int] = {}
+        self.blocks: Tuple[ComplexityBlock, ...] = ()
+        if tree is not None:
+            self.blocks = self._build_blocks(tree)
+
+    def of(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
+        """Return the McCabe complexity of one function node."""
+        complexity = self._by_node.get(node)
+        if complexity is None:
+            complexity = self._function(node)
+        return complexity
+
+    @property
+    def average(self) -> float:
+        """Mean block complexity (radon ``cc_visit`` convention); 1.0 when empty."""
+        if not self.blocks:
+            return 1.0
+        return sum(block.complexity for block in self.blocks) / len(self.blocks)
+
+    def max_function_complexity(self, node_types: Tuple[type, ...] = _FUNCTION_NODES) -> int:
+        """Largest complexity among recorded functions of ``node_types`` (0 when none)."""
+        return max(
+            (value for node, value in self._by_node.items() if isinstance(node, node_types)),
+            default=0,
+        )
+
+    def _build_blocks(self, tree: ast.AST) -> Tuple[ComplexityBlock, ...]:
+        scope = _Scope(complexity=1)
+        for child in ast.iter_child_nodes(tree):
+            self._visit(child, scope)
+
+        blocks = [self._block(node, value, BLOCK_FUNCTION, None) for node, value in scope.functions]
+        for info in scope.classes:
+            blocks.append(
+                ComplexityBlock(
+                    name=info.node.name,
+                    kind=BLOCK_CLASS,
+                    lineno=info.node.lineno,
+                    col_offset=info.node.col_offset,
+                    complexity=info.complexity,
+                )
+            )
+            blocks.extend(
+                self._block(node, value, BLOCK_METHOD, info.node.name)
+                for node, value in info.methods
+            )
+        return tuple(blocks)
+
+    @staticmethod
+    def _block(node: ast.AST, value: int, kind: str, classname: Optional[str]) -> ComplexityBlock:
+        return ComplexityBlock(
+            name=getattr(node, "name", ""),
+            kind=kind,
+            lineno=getattr(node, "lineno", 0),
+            col_offset=getattr(node, "col_offset", 0),
+            complexity=value,
+            classname=classname,
+        )
+
+    def _visit(self, node: ast.AST, scope: _Scope) -> None:
+        if isinstance(node, _FUNCTION_NODES):
+            scope.functions.append((node, self._function(node)))
+            return
+        if isinstance(node, ast.ClassDef):
+            scope.classes.append(self._class(node))
+            return
+        if isinstance(node, ast.Assert):
+            scope.complexity += 1
+            return
+
+        if isinstance(node, ast.Try):
+            scope.complexity += len(node.handlers) + bool(node.orelse)
+        elif isinstance(node, ast.BoolOp):
+            scope.complexity += len(node.values) - 1
+        elif isinstance(node, (ast.If, ast.IfExp)):
+            scope.complexity += 1
+        elif _MATCH_NODE is not None and isinstance(node, _MATCH_NODE):
+            cases = node.cases  # type: ignore[attr-defined]
+            wildcard = any(getattr(case.pattern, "pattern", False) is None for case in cases)
+            scope.complexity += max(0, len(cases) - wildcard)
+        elif isinstance(node, _LOOP_NODES):
+            scope.complexity += bool(node.orelse) + 1
+        elif isinstance(node, ast.comprehension):
+            scope.complexity += len(node.ifs) + 1
+
+        for child in ast.iter_child_nodes(node):
+            self._visit(child, scope)
+
+    def _function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
+        complexity = 1
+        for child in node.body:
+            scope = _Scope()
+            self._visit(child, scope)
+            complexity += scope.complexity
+        self._by_node[node] = complexity
+        return complexity
+
+    def _class(self, node: ast.ClassDef) -> _ClassInfo:
+        real_complexity = 1
+        methods: List[Tuple[ast.AST, int]] = []
+        for child in node.body:
+            scope = _Scope()
+            self._visit(child, scope)
+            methods.extend(scope.functions)
+            real_complexity += scope.complexity + sum(value for _, value in scope.functions)
+        return _ClassInfo(node, real_complexity, methods)
+
+
+def function_complexity(node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
+    """McCabe complexity of a single function node, without indexing a whole tree."""
+    return ComplexityReport(None).of(node)
@@ -5,7 +5,10 @@ from __future__ import annotations
 import ast
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+from slop_detector.metrics.complexity import ComplexityReport, function_complexity
+from slop_detector.source_context import SourceContext, source_context_for
 
 
 @dataclass
@@ -144,7 +147,12 @@ class ContextJargonDetector:
         self.config = config
 
     def analyze(
-        self, file_path: str, content: str, tree: ast.AST, inflation_result: Any
+        self,
+        file_path: str,
+        content: str,
+        tree: ast.AST,
+        inflation_result: Any,
+        source: Optional[SourceContext] = None,
     ) -> ContextJargonResult:
         """Analyze jargon with context-based evidence validation."""
         # Get jargon from inflation result
@@ -154,7 +162,7 @@ class ContextJargonDetector:
         jargon_details = inflation_result.jargon_details
 
         # Collect codebase evidence
-        evidence = self._collect_evidence(content, tree, file_path)
+        evidence = self._collect_evidence(content, tree, file_path, source)
 
         # Validate each jargon claim
         evidence_results = []
@@ -222,7 +230,13 @@ class ContextJargonDetector:
             status=status,
         )
 
-    def _collect_evidence(self, content: str, tree: ast.AST, file_path: str) -> Dict[str, bool]:
+    def _collect_evidence(
+        self,
+        content: str,
+        tree: ast.AST,
+        file_path: str,
+        source: Optional[SourceContext] = None,
+    ) -> Dict[str, bool]:
         """Collect evidence from the codebase."""
         evidence = {}
 
@@ -267,7 +281,9 @@ class ContextJargonDetector:
         evidence["design_patterns"] = self._has_design_patterns(tree)
 
         # Advanced algorithms
-        evidence["advanced_algorithms"] = self._has_advanced_algorithms(tree)
+        evidence["advanced_algorithms"] = self._has_advanced_algorithms(
+            tree, source_context_for(content, tree, source)
+        )
 
         # Optimization
         evidence["optimization"] = self._has_optimization(tree, content)
@@ -299,10 +315,25 @@ class ContextJargonDetector:
                             return True
         return False
 
+    def path_signals(self, file_path: str) -> Tuple[bool, bool, bool, bool]:
+        """Path-only test evidence for ``file_path``.
+
+        Returns whether the path names a test file, sits in a test directory,
+        sits in an integration directory, and has an integration-test name.
+        """
+        path = Path(str(file_path))
+        return (
+            "test_" in str(file_path) or "_test" in str(file_path),
+            path.parent.name in ("tests", "test"),
+            any(p in self.INTEGRATION_PATH_PARTS for p in path.parts),
+            any(hint in path.name for hint in self.INTEGRATION_NAME_HINTS),
+        )
+
     def _has_tests(self, file_path: str, tree: ast.AST) -> bool:
         """Check for test presence."""
+        test_name, test_directory, _, _ = self.path_signals(file_path)
         # Check if this is a test file
-        if "test_" in str(file_path) or "_test" in str(file_path):
+        if test_name:
             return True
 
         # Check for test functions
@@ -312,18 +343,12 @@ class ContextJargonDetector:
                     return True
 
         # Check for test directory
-        path = Path(file_path)
-        if path.parent.name in ("tests", "test"):
-            return True
-
-        return False
+        return test_directory
 
     def _has_unit_tests(self, file_path: str, tree: ast.AST) -> bool:
         """Detect unit tests (fast, isolated tests)."""
-        path = Path(str(file_path))
-
         # Exclude integration/e2e directories from unit tests
-        if any(p in self.INTEGRATION_PATH_PARTS for p in path.parts):
+        if self.path_signals(file_path)[2]:
             return False
 
         # Reuse existing tests detection logic
@@ -331,14 +356,14 @@ class ContextJargonDetector:
 
     def _has_integration_tests(self, file_path: str, tree: ast.AST, content: str) -> bool:
         """Detect integration tests (tests that hit real deps)."""
-        path = Path(str(file_path))
+        _, _, integration_directory, integration_name = self.path_signals(file_path)
 
         # 1) Path-based detection
-        if any(p in self.INTEGRATION_PATH_PARTS for p in path.parts):
+        if integration_directory:
             return self._is_real_test_file(tree)
 
         # 2) File name-based detection
-        if any(hint in path.name for hint in self.INTEGRATION_NAME_HINTS):
+        if integration_name:
             return self._is_real_test_file(tree)
 
         # 3) Pytest marker-based detection
@@ -443,14 +468,13 @@ class ContextJargonDetector:
         pattern_indicators = ["factory", "singleton", "observer", "strategy", "adapter", "proxy"]
         return any(pattern in " ".join(class_names) for pattern in pattern_indicators)
 
-    def _has_advanced_algorithms(self, tree: ast.AST) -> bool:
+    def _has_advanced_algorithms(
+        self, tree: ast.AST, source: Optional[SourceContext] = None
+    ) -> bool:
         """Check for advanced algorithms."""
         # Look for complex logic indicating advanced algorithms
-        max_complexity = 0
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                complexity = self._calculate_complexity(node)
-                max_complexity = max(max_complexity, complexity)
+        report = source.complexity if source is not None else ComplexityReport(tree)
+        max_complexity = report.max_function_complexity((ast.FunctionDef,))
 
         return max_complexity >= 10  # High complexity suggests advanced logic
 
@@ -463,14 +487,8 @@ class ContextJargonDetector:
         return False
 
     def _calculate_complexity(self, node: ast.FunctionDef) -> int:
-        """Simple cyclomatic complexity calculation."""
-        complexity = 1
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.For, ast.While, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-        return complexity
+        """McCabe cyclomatic complexity (radon-compatible) of one function."""
+        return function_complexity(node)
 
     def _empty_result(self) -> ContextJargonResult:
         """Return empty result when no jargon detected."""
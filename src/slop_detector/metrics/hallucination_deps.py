@@ -5,10 +5,27 @@ from __future__ import annotations
 import ast
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List, Set
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+_KNOWN_DEPS_PATH = Path(__file__).parent.parent / "config" / "known_deps.yaml"
+
+
+@lru_cache(maxsize=None)
+def _load_known_deps_file(
+    config_path: Path,
+) -> Tuple[Dict[str, FrozenSet[str]], Dict[str, Any]]:
+    """Parse ``known_deps.yaml`` once per process; every detector shares the result."""
+    import yaml
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    categories = {k: frozenset(v) for k, v in data.get("categories", {}).items()}
+    return categories, data.get("intent_patterns", {})
+
 
 @dataclass
 class CategoryUsage:
@@ -72,12 +89,25 @@ class HallucinationDepsDetector:
     """Detect when AI hallucinates dependencies for specific purposes without using them."""
 
     def __init__(self, config):
-        """Initialize detector."""
+        """Initialize detector.
+
+        The known-dependency map is read on the first file that imports
+        anything, so building a detector never pays for YAML parsing.
+        """
         self.config = config
+        self.CATEGORY_MAP: Dict[str, Set[str]] = {}
+        self.INTENT_PATTERNS: Dict[str, Any] = {}
+        self.lib_to_categories: Dict[str, Set[str]] = {}
+        self._known_deps_loaded = False
+
+    def _ensure_known_deps(self) -> None:
+        """Load the known-dependency map and its reverse index once."""
+        if self._known_deps_loaded:
+            return
+        self._known_deps_loaded = True
         self._load_known_deps()
 
         # Build reverse map: library -> categories
-        self.lib_to_categories: Dict[str, Set[str]] = {}
         for category, libs in self.CATEGORY_MAP.items():
             for lib in libs:
                 if lib not in self.lib_to_categories:
@@ -86,24 +116,16 @@ class HallucinationDepsDetector:
 
     def _load_known_deps(self):
         """Load known dependencies from yaml config."""
-        from pathlib import Path
-
-        import yaml
-
         # Default fallback (if yaml load fails)
         self.CATEGORY_MAP = {}
         self.INTENT_PATTERNS = {}
 
         try:
             # Try to load from config dir relative to this file
-            current_dir = Path(__file__).parent.parent
-            config_path = current_dir / "config" / "known_deps.yaml"
-
-            if config_path.exists():
-                with open(config_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                    self.CATEGORY_MAP = {k: set(v) for k, v in data.get("categories", {}).items()}
-                    self.INTENT_PATTERNS = data.get("intent_patterns", {})
+            if _KNOWN_DEPS_PATH.exists():
+                categories, intent_patterns = _load_known_deps_file(_KNOWN_DEPS_PATH)
+                self.CATEGORY_MAP = {k: set(v) for k, v in categories.items()}
+                self.INTENT_PATTERNS = dict(intent_patterns)
             else:
                 # If file not found, we could warn, but for now we'll just use empty or raise
                 # In a real app we might want hardcoded fallbacks here just in case
@@ -115,6 +137,9 @@ class HallucinationDepsDetector:
         self, file_path: str, content: str, tree: ast.AST, ddc_result: Any
     ) -> HallucinationDepsResult:
         """Analyze for hallucinated dependencies."""
+        if ddc_result.imported:
+            self._ensure_known_deps()
+
         # Get unused imports from DDC
         unused_imports = set(ddc_result.unused)
 
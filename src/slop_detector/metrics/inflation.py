@@ -4,17 +4,20 @@ import ast
 import logging
 import re
 from pathlib import Path
+from typing import List, Mapping, Optional, Sequence, Tuple
 
 from slop_detector.models import InflationResult
+from slop_detector.source_context import (
+    SourceContext,
+    function_scope_map,
+    index_tree,
+    source_context_for,
+)
 
 logger = logging.getLogger(__name__)
 
-try:
-    from radon.complexity import cc_visit
-
-    RADON_AVAILABLE = True
-except ImportError:
-    RADON_AVAILABLE = False
+# Jargon hits per 1-based line: ``(word, category, justified or None)``.
+KnownJargonHits = Mapping[int, Sequence[Tuple[str, str, Optional[bool]]]]
 
 
 class InflationCalculator:
@@ -88,16 +91,32 @@ class InflationCalculator:
     def __init__(self, config):
         """Initialize with config."""
         self.config = config
-        self.use_radon = config.use_radon() and RADON_AVAILABLE
-
-    def calculate(self, file_path: str, content: str, tree: ast.AST) -> InflationResult:
-        """Calculate Inflation with context awareness (v2.8.0 TOE formula)."""
-        lines = content.splitlines()
-        logic_lines = sum(1 for ln in lines if ln.strip() and not ln.strip().startswith("#"))
-        avg_complexity = self._calculate_avg_complexity(content, tree)
-        is_config_file = self._is_config_file(file_path, tree)
+        # advanced.use_radon selects radon-compatible McCabe numbers; they are
+        # computed from the already-parsed tree, so radon itself is not needed.
+        self.use_radon = config.use_radon()
 
-        jargon_found, justified_jargon, jargon_details = self._scan_jargon(content, lines, tree)
+    def calculate(
+        self,
+        file_path: str,
+        content: str,
+        tree: ast.AST,
+        source: Optional[SourceContext] = None,
+        known_hits: Optional[KnownJargonHits] = None,
+    ) -> InflationResult:
+        """Calculate Inflation with context awareness (v2.8.0 TOE formula).
+
+        ``known_hits`` holds the jargon already found on some lines, by line:
+        those lines are not rescanned (see ``_scan_jargon``).
+        """
+        source = source_context_for(content, tree, source)
+        lines = source.lines
+        logic_lines = source.code_line_count()
+        avg_complexity = self._calculate_avg_complexity(content, tree, source)
+        is_config_file = self._is_config_file(file_path, tree, source)
+
+        jargon_found, justified_jargon, jargon_details = self._scan_jargon(
+            content, lines, tree, source, known_hits
+        )
         effective_jargon = max(0, len(jargon_found) - len(justified_jargon))
         inflation_score = self._compute_inflation_score(
             effective_jargon, logic_lines, avg_complexity, is_config_file
@@ -117,37 +136,62 @@ class InflationCalculator:
             is_config_file=is_config_file,
         )
 
-    def _scan_jargon(self, content: str, lines: list, tree: ast.AST):
-        """Scan all lines for jargon hits, returning (found, justified, details)."""
+    def _scan_jargon(
+        self,
+        content: str,
+        lines: list,
+        tree: ast.AST,
+        source: Optional[SourceContext] = None,
+        known_hits: Optional[KnownJargonHits] = None,
+    ):
+        """Scan all lines for jargon hits, returning (found, justified, details).
+
+        Lines in ``known_hits`` take their ``(word, category, justified)``
+        hits from it instead; a ``None`` justification is decided here.
+        """
         jargon_found = []
         justified_jargon = []
         jargon_details = []
-        func_scopes = self._build_function_scopes(tree, lines)
+        if source is not None and source.lines is lines:
+            func_scopes = source.function_scopes
+        else:
+            func_scopes = self._build_function_scopes(tree, lines)
+        known_hits = known_hits or {}
 
         for line_idx, line in enumerate(lines, 1):
-            if self._is_data_literal_entry(line):
-                continue
-            line_lower = line.lower()
-            for category, words in self.JARGON.items():
-                for word in words:
-                    matches = re.findall(r"\b" + re.escape(word.lower()) + r"\b", line_lower)
-                    for _ in matches:
-                        jargon_found.append(word)
-                        is_justified = self._is_jargon_justified_scoped(
-                            category, word, content, lines, line_idx, func_scopes
-                        )
-                        if is_justified:
-                            justified_jargon.append(word)
-                        jargon_details.append(
-                            {
-                                "word": word,
-                                "line": line_idx,
-                                "category": category,
-                                "justified": is_justified,
-                            }
-                        )
+            hits = known_hits.get(line_idx)
+            if hits is None:
+                hits = self._line_jargon(line)
+            for word, category, is_justified in hits:
+                jargon_found.append(word)
+                if is_justified is None:
+                    is_justified = self._is_jargon_justified_scoped(
+                        category, word, content, lines, line_idx, func_scopes
+                    )
+                if is_justified:
+                    justified_jargon.append(word)
+                jargon_details.append(
+                    {
+                        "word": word,
+                        "line": line_idx,
+                        "category": category,
+                        "justified": is_justified,
+                    }
+                )
         return jargon_found, justified_jargon, jargon_details
 
+    def _line_jargon(self, line: str) -> List[Tuple[str, str, Optional[bool]]]:
+        """Jargon on one line as ``(word, category, None)``, in scan order."""
+        if self._is_data_literal_entry(line):
+            return []
+        hits: List[Tuple[str, str, Optional[bool]]] = []
+        line_lower = line.lower()
+        for category, words in self.JARGON.items():
+            for word in words:
+                matches = re.findall(r"\b" + re.escape(word.lower()) + r"\b", line_lower)
+                hits.extend((word, category, None) for _ in matches)
+        return hits
+
     @staticmethod
     def _is_data_literal_entry(line: str) -> bool:
         """Return True for standalone quoted literals inside list-like vocab tables."""
@@ -178,16 +222,16 @@ class InflationCalculator:
         complexity_modifier = max(1.0, 1.0 + (avg_complexity - 1.0) / 10.0)
         return min(jargon_density * complexity_modifier * 10.0, 10.0)
 
-    def _calculate_avg_complexity(self, content: str, tree: ast.AST) -> float:
-        """Calculate average cyclomatic complexity using radon if available."""
+    def _calculate_avg_complexity(
+        self, content: str, tree: ast.AST, source: Optional[SourceContext] = None
+    ) -> float:
+        """Calculate average cyclomatic complexity (radon-compatible by default)."""
         if self.use_radon:
-            avg: float = 1.0  # safe default if radon fails
+            avg: float = 1.0  # safe default if the tree is too deep to visit
             try:
-                results = cc_visit(content)
-                if results:
-                    avg = sum(r.complexity for r in results) / len(results)
-            except Exception as exc:  # noqa: BLE001 — radon parse errors are unpredictable
-                logger.debug("radon cc_visit failed, using default complexity=1.0: %s", exc)
+                avg = source_context_for(content, tree, source).complexity.average
+            except RecursionError as exc:
+                logger.debug("complexity visit failed, using default complexity=1.0: %s", exc)
             return avg
 
         # Fallback: simple AST-based complexity
@@ -213,33 +257,8 @@ class InflationCalculator:
         v2.8.0: Enables function-scoped justification check.
         Returns dict: line_idx (1-based) -> (start_line, end_line) or None.
         """
-        # Collect all function ranges (include decorator lines in scope start)
-        func_ranges = []
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                end = getattr(node, "end_lineno", node.lineno + 1)
-                # Extend start to first decorator so @lru_cache etc. are in scope
-                if node.decorator_list:
-                    true_start = min(d.lineno for d in node.decorator_list)
-                else:
-                    true_start = node.lineno
-                func_ranges.append((true_start, end))
-
-        # Sort by start so inner functions are found after outer
-        func_ranges.sort()
-
-        # For each line, find the innermost enclosing function
-        n_lines = len(lines)
-        scope_map = {}
-        for line_idx in range(1, n_lines + 1):
-            enclosing = None
-            for start, end in func_ranges:
-                if start <= line_idx <= end:
-                    # Prefer innermost (latest start that still contains the line)
-                    if enclosing is None or start > enclosing[0]:
-                        enclosing = (start, end)
-            scope_map[line_idx] = enclosing
-        return scope_map
+        functions, _ = index_tree(tree)
+        return function_scope_map([(fn.start, fn.end_lineno) for fn in functions], len(lines))
 
     def _is_jargon_justified_scoped(
         self,
@@ -278,18 +297,19 @@ class InflationCalculator:
         justifiers = self.JUSTIFICATIONS[category]
         return any(j in content for j in justifiers)
 
-    def _is_config_file(self, file_path: str, tree: ast.AST) -> bool:
+    def _is_config_file(
+        self, file_path: str, tree: ast.AST, source: Optional[SourceContext] = None
+    ) -> bool:
         """Check if file is a configuration file."""
-        # Check filename patterns
-        config_patterns = self.config.get("exceptions.config_files.patterns", [])
-        for pattern in config_patterns:
-            if Path(file_path).match(pattern):
-                # Verify no functions
-                function_count = sum(
-                    1
-                    for node in ast.walk(tree)
-                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-                )
-                return function_count == 0
+        if self.is_config_path(file_path):
+            # Verify no functions
+            if source is not None and source.tree is tree:
+                return not source.functions
+            return not index_tree(tree)[0]
 
         return False
+
+    def is_config_path(self, file_path: str) -> bool:
+        """Check if the path matches a configured config-file pattern."""
+        config_patterns = self.config.get("exceptions.config_files.patterns", [])
+        return any(Path(file_path).match(pattern) for pattern in config_patterns)
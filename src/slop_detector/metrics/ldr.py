@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import ast
 import re
+from typing import Optional
 
 from slop_detector.models import LDRResult
+from slop_detector.source_context import SourceContext, source_context_for
 
 
 class LDRCalculator:
@@ -26,17 +28,22 @@ class LDRCalculator:
         self.config = config
         self.compiled_patterns = [re.compile(p) for p in self.EMPTY_PATTERNS]
 
-    def calculate(self, file_path: str, content: str, tree: ast.AST) -> LDRResult:
+    def calculate(
+        self,
+        file_path: str,
+        content: str,
+        tree: ast.AST,
+        source: Optional[SourceContext] = None,
+    ) -> LDRResult:
         """Calculate LDR with improved empty function detection."""
+        source = source_context_for(content, tree, source)
+
         # P1: Empty __init__.py is a Python packaging convention, not slop.
         # Return perfect LDR so GQG is not penalised by ln(0).
         from pathlib import Path as _Path
 
         if _Path(file_path).name == "__init__.py":
-            non_empty = [
-                ln for ln in content.splitlines() if ln.strip() and not ln.strip().startswith("#")
-            ]
-            if len(non_empty) == 0:
+            if source.code_line_count() == 0:
                 return LDRResult(
                     total_lines=0,
                     logic_lines=0,
@@ -52,24 +59,15 @@ class LDRCalculator:
 
         # Identify lines belonging to truly empty functions
         empty_func_lines: set[int] = set()
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if self._is_truly_empty_function(node):
-                    if (
-                        hasattr(node, "lineno")
-                        and hasattr(node, "end_lineno")
-                        and node.end_lineno is not None
-                    ):
-                        empty_func_lines.update(range(node.lineno, node.end_lineno + 1))
+        for span in source.functions:
+            if self._is_truly_empty_function(span.node):
+                empty_func_lines.update(range(span.lineno, span.end_lineno + 1))
 
         total_lines = 0
         logic_lines = 0
 
-        # Use enumerate to get 1-based line numbers matching AST
-        lines = content.split("\n")
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-
+        # 1-based line numbers over split("\n") to match the AST
+        for i, stripped in enumerate(source.raw_stripped_lines, 1):
             # Skip completely empty lines and comment-only lines
             if not stripped or stripped.startswith("#"):
                 continue
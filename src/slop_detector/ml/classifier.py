@@ -20,12 +20,14 @@ Version: 2.2.0
 Date: 2026-01-08
 """
 
+from __future__ import annotations
+
 import json
 import logging
 import pickle
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -278,34 +280,46 @@ class SlopClassifier:
         Returns:
             (slop_probability, confidence)
         """
+        return self.predict_batch([features])[0]
+
+    def predict_batch(self, rows: Sequence[Dict[str, float]]) -> List[Tuple[float, float]]:
+        """
+        Predict slop probability for many files with one predict_proba per model.
+
+        Args:
+            rows: One feature dictionary per file
+
+        Returns:
+            (slop_probability, confidence) per row, in input order
+        """
         if not self.is_trained:
             raise RuntimeError("Model not trained. Call train() first.")
+        if not rows:
+            return []
 
-        # Convert features to vector
-        x = np.array([[features[feat] for feat in self.FEATURE_NAMES]])
+        # Convert features to a (rows x features) matrix
+        x = np.array([[row[feat] for feat in self.FEATURE_NAMES] for row in rows])
 
         if self.model_type == "random_forest":
-            proba = self.rf_model.predict_proba(x)[0]
-            return proba[1], max(proba)
+            proba = self.rf_model.predict_proba(x)
 
         elif self.model_type == "xgboost":
             if not self.xgb_model:
                 raise RuntimeError("XGBoost model not available")
-            proba = self.xgb_model.predict_proba(x)[0]
-            return proba[1], max(proba)
+            proba = self.xgb_model.predict_proba(x)
 
         elif self.model_type == "ensemble":
-            rf_proba = self.rf_model.predict_proba(x)[0]
-            xgb_proba = self.xgb_model.predict_proba(x)[0] if self.xgb_model else rf_proba
+            rf_proba = self.rf_model.predict_proba(x)
+            xgb_proba = self.xgb_model.predict_proba(x) if self.xgb_model else rf_proba
 
             # Weighted average
-            ensemble_proba = 0.5 * rf_proba + 0.5 * xgb_proba
-
-            return ensemble_proba[1], max(ensemble_proba)
+            proba = 0.5 * rf_proba + 0.5 * xgb_proba
 
         else:
             raise ValueError(f"Unknown model type: {self.model_type}")
 
+        return [(row_proba[1], max(row_proba)) for row_proba in proba]
+
     def save(self, output_path: Path):
         """Save trained model to disk."""
         if not self.is_trained:
@@ -13,6 +13,7 @@ Integration philosophy:
 Usage:
     scorer = MLScorer.from_model(Path("models/slop_classifier.pkl"))
     ml_score = scorer.score(file_analysis)
+    ml_scores = scorer.score_batch(file_analyses)  # one model call per batch
     # ml_score.slop_probability in [0, 1]
     # ml_score.confidence in [0, 1]
     # ml_score.agreement: True if ML and rule-based agree
@@ -24,7 +25,7 @@ import logging
 import math
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -194,19 +195,56 @@ class MLScorer:
         try:
             features = _extract_features_from_analysis(file_analysis)
             slop_prob, confidence = self._clf.predict(features)
-
-            # Agreement: check if rule-based and ML agree on slop/clean
-            rule_is_slop = getattr(file_analysis, "deficit_score", 0.0) >= 30.0
-            ml_is_slop = slop_prob >= 0.40
-            agreement = rule_is_slop == ml_is_slop
-
-            return MLScore(
-                slop_probability=round(slop_prob, 4),
-                confidence=round(confidence, 4),
-                model_type=getattr(self._clf, "model_type", "unknown"),
-                agreement=agreement,
-                features_used=len(features),
-            )
+            return self._build_score(file_analysis, features, slop_prob, confidence)
         except Exception as e:
             logger.debug("[MLScorer] Scoring failed: %s", e)
             return None
+
+    def score_batch(self, file_analyses: Sequence[Any]) -> List[Optional[MLScore]]:
+        """
+        Score many FileAnalysis objects with one model call per ensemble member.
+
+        Results match calling score() on each file. A file whose features cannot
+        be extracted gets None; if the batched call fails, every file is retried
+        through score() so one bad row cannot cost the others their score.
+        """
+        predict_batch = getattr(self._clf, "predict_batch", None)
+        if predict_batch is None:
+            return [self.score(file_analysis) for file_analysis in file_analyses]
+
+        scores: List[Optional[MLScore]] = [None] * len(file_analyses)
+        rows: List[Dict[str, float]] = []
+        row_indices: List[int] = []
+        for index, file_analysis in enumerate(file_analyses):
+            try:
+                rows.append(_extract_features_from_analysis(file_analysis))
+                row_indices.append(index)
+            except Exception as e:
+                logger.debug("[MLScorer] Scoring failed: %s", e)
+
+        try:
+            predictions = predict_batch(rows)
+            for index, features, (slop_prob, confidence) in zip(row_indices, rows, predictions):
+                scores[index] = self._build_score(
+                    file_analyses[index], features, slop_prob, confidence
+                )
+        except Exception as e:
+            logger.debug("[MLScorer] Batched scoring failed, scoring per file: %s", e)
+            return [self.score(file_analysis) for file_analysis in file_analyses]
+        return scores
+
+    def _build_score(
+        self, file_analysis: Any, features: Dict[str, float], slop_prob: float, confidence: float
+    ) -> MLScore:
+        # Agreement: check if rule-based and ML agree on slop/clean
+        rule_is_slop = getattr(file_analysis, "deficit_score", 0.0) >= 30.0
+        ml_is_slop = slop_prob >= 0.40
+        agreement = rule_is_slop == ml_is_slop
+
+        return MLScore(
+            slop_probability=round(slop_prob, 4),
+            confidence=round(confidence, 4),
+            model_type=getattr(self._clf, "model_type", "unknown"),
+            agreement=agreement,
+            features_used=len(features),
+        )
@@ -1,12 +1,46 @@
 """Data models for SLOP detection."""
 
 import logging as _logging
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TypeVar
 
 _logger = _logging.getLogger(__name__)
 
+_ClassT = TypeVar("_ClassT", bound=type)
+
+
+def slotted(cls: _ClassT) -> _ClassT:
+    """Rebuild dataclass ``cls`` with ``__slots__`` and no per-instance ``__dict__``.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10. Apply
+    it above ``@dataclass``. Results are kept for every file of a project
+    scan, so dropping the instance dict matters at tens of thousands of files.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    rebuilt = type(cls)(cls.__name__, cls.__bases__, namespace)
+    rebuilt.__qualname__ = cls.__qualname__
+    return rebuilt  # type: ignore[return-value]
+
+
+def _interned(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy ``mapping`` with interned keys and string values.
+
+    Cache-restored results get fresh key strings per file from ``json.loads``;
+    interning keeps one copy of each AST node name / metric key per process.
+    """
+    return {
+        sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+        for key, value in mapping.items()
+    }
+
 
 class SlopStatus(str, Enum):
     """Detection status."""
@@ -18,6 +52,7 @@ class SlopStatus(str, Enum):
     CRITICAL_DEFICIT = "critical_deficit"
 
 
+@slotted
 @dataclass
 class LDRResult:
     """Logic Density Ratio result."""
@@ -49,6 +84,7 @@ class LDRResult:
         }
 
 
+@slotted
 @dataclass
 class InflationResult:
     """Inflation-to-Code Ratio result (formerly BCR)."""
@@ -68,6 +104,9 @@ class InflationResult:
                 "InflationResult.inflation_score %.4f below 0 — clamped", self.inflation_score
             )
             self.inflation_score = 0.0
+        self.jargon_found = [sys.intern(word) for word in self.jargon_found]
+        self.justified_jargon = [sys.intern(word) for word in self.justified_jargon]
+        self.jargon_details = [_interned(detail) for detail in self.jargon_details]
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -82,6 +121,7 @@ class InflationResult:
         }
 
 
+@slotted
 @dataclass
 class DDCResult:
     """Deep Dependency Check result."""
@@ -197,6 +237,7 @@ class MaskedIssue:
         }
 
 
+@slotted
 @dataclass
 class FileAnalysis:
     """Complete file analysis result."""
@@ -226,6 +267,17 @@ class FileAnalysis:
     # Fields: ldr_penalty, inflation_penalty, ddc_penalty, purity_penalty,
     # pattern_hits, total. Sum of penalty fields equals total within 0.01.
     deficit_breakdown: Dict[str, float] = field(default_factory=dict)
+    # Analysis-cache tier that produced this result in the current run
+    # (``analysis_cache.CACHE_TIERS``); run provenance, never serialized.
+    cache_tier: Optional[str] = field(default=None, compare=False, repr=False)
+    # SHA-256 of the analyzed source, set by ``analyze_file``; never serialized.
+    content_hash: Optional[str] = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.dcf:
+            self.dcf = _interned(self.dcf)
+        if self.deficit_breakdown:
+            self.deficit_breakdown = _interned(self.deficit_breakdown)
 
     def to_dict(self) -> Dict[str, Any]:
         result = {
@@ -279,6 +331,12 @@ class FileAnalysis:
             result["deficit_breakdown"] = self.deficit_breakdown
         return result
 
+    def drop_code_snippets(self) -> None:
+        """Release per-issue source snippets once they are no longer needed."""
+        for issue in self.pattern_issues:
+            if getattr(issue, "code", None) is not None:
+                issue.code = None
+
 
 @dataclass
 class PriorityHotspot:
@@ -326,7 +384,10 @@ class ProjectAnalysis:
     # v3.0: CQMS structural coherence — max H0 persistence (MST-based) over file DCFs.
     # 1.0 = all files structurally uniform. Low = distinct structural clusters (AI/human mix signal).
     structural_coherence: float = 1.0
-    coherence_level: str = "none"  # "vr_structural" | "vr_structural_approx" | "none"
+    # "vr_structural" | "vr_structural_approx" | "vr_structural_knn" | "none"
+    coherence_level: str = "none"
+    # How far the exact coherence may sit above structural_coherence; None when unknown.
+    coherence_error_bound: Optional[float] = None
     suppressed_issue_count: int = 0
     suppression_ledger: List[SuppressionLedgerEntry] = field(default_factory=list)
     priority_hotspots: List[PriorityHotspot] = field(default_factory=list)
@@ -361,6 +422,7 @@ class ProjectAnalysis:
             "overall_status": self.overall_status.value,
             "structural_coherence": round(self.structural_coherence, 4),
             "coherence_level": self.coherence_level,
+            "coherence_error_bound": self.coherence_error_bound,
             "suppressed_issue_count": self.suppressed_issue_count,
             "suppression_ledger": [e.to_dict() for e in self.suppression_ledger],
             "priority_hotspots": [h.to_dict() for h in self.priority_hotspots],
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import ast
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from slop_detector.models import slotted
+from slop_detector.source_context import SourceContext, source_context_for
+
 
 class Severity(Enum):
     """Issue severity levels."""
@@ -28,9 +32,14 @@ class Axis(Enum):
     STRUCTURE = "structure"  # Structural issues - bare except, anti-patterns
 
 
+@slotted
 @dataclass
 class Issue:
-    """A detected code issue."""
+    """A detected code issue.
+
+    Message and suggestion strings are interned: most are fixed per pattern,
+    so a large scan keeps one copy of each instead of one per issue.
+    """
 
     pattern_id: str
     severity: Severity
@@ -42,6 +51,12 @@ class Issue:
     code: Optional[str] = None
     suggestion: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.pattern_id = sys.intern(self.pattern_id)
+        self.message = sys.intern(self.message)
+        if self.suggestion is not None:
+            self.suggestion = sys.intern(self.suggestion)
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -66,6 +81,13 @@ class BasePattern(ABC):
     axis: Axis = Axis.NOISE
     message: str = ""
 
+    # Shared view of the file being checked, installed by the registry.
+    _source: Optional[SourceContext] = None
+
+    def source_for(self, content: str, tree: Optional[ast.AST] = None) -> SourceContext:
+        """Return the shared SourceContext for ``content``, building one if none is installed."""
+        return source_context_for(content, tree, self._source)
+
     def create_issue(
         self,
         file: Path,
@@ -127,17 +149,42 @@ class BasePattern(ABC):
 
 
 class ASTPattern(BasePattern):
-    """Base class for AST-based patterns."""
+    """Base class for AST-based patterns.
+
+    ``node_types`` declares which node classes ``check_node`` cares about so
+    the registry can dispatch them from one shared walk of the tree. An empty
+    tuple means every node is offered.
+
+    ``function_scoped`` promises that ``check_node`` reads nothing beyond the
+    node's own subtree and source lines (no per-file state from
+    ``begin_file``, no parents), so findings inside an unchanged definition
+    stay valid when the rest of the file is edited.
+    """
+
+    node_types: tuple[type[ast.AST], ...] = ()
+    function_scoped: bool = False
+
+    def begin_file(self, tree: ast.AST, file: Path, content: str) -> None:
+        """Prepare per-file state before any node of ``tree`` is dispatched."""
+
+    def end_file(self) -> None:
+        """Release per-file state after the walk, including on failure."""
 
     def check(self, tree: ast.AST, file: Path, content: str) -> list[Issue]:
         """Walk AST and check each node."""
-        issues = []
-        for node in ast.walk(tree):
-            if issue := self.check_node(node, file, content):
-                if isinstance(issue, list):
-                    issues.extend(issue)
-                else:
-                    issues.append(issue)
+        issues: list[Issue] = []
+        self.begin_file(tree, file, content)
+        try:
+            for node in ast.walk(tree):
+                if self.node_types and not isinstance(node, self.node_types):
+                    continue
+                if issue := self.check_node(node, file, content):
+                    if isinstance(issue, list):
+                        issues.extend(issue)
+                    else:
+                        issues.append(issue)
+        finally:
+            self.end_file()
         return issues
 
     @abstractmethod
@@ -164,20 +211,21 @@ class RegexPattern(BasePattern):
     def check(self, tree: ast.AST, file: Path, content: str) -> list[Issue]:
         """Search content for regex matches."""
         issues = []
-        lines = content.split("\n")
+        source = self.source_for(content, tree)
+        stripped_lines = source.raw_stripped_lines
 
         # Type guard for mypy
         pattern = self.pattern
         if isinstance(pattern, str):
             pattern = self.re.compile(pattern)
 
-        for line_num, line in enumerate(lines, start=1):
+        for index, line in enumerate(source.raw_lines):
             for match in pattern.finditer(line):
                 issue = self.create_issue(
                     file=file,
-                    line=line_num,
+                    line=index + 1,
                     column=match.start(),
-                    code=line.strip(),
+                    code=stripped_lines[index],
                 )
                 issues.append(issue)
 
@@ -15,6 +15,8 @@ class JavaScriptPushPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "JavaScript pattern: use .append() instead of .push()"
+    node_types = (ast.Call,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Call):
@@ -33,6 +35,8 @@ class JavaScriptLengthPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "JavaScript pattern: use len() instead of .length"
+    node_types = (ast.Attribute,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Attribute):
@@ -50,6 +54,8 @@ class JavaEqualsPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "Java pattern: use == instead of .equals()"
+    node_types = (ast.Call,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Call):
@@ -68,6 +74,8 @@ class JavaToStringPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "Java pattern: use str() instead of .toString()"
+    node_types = (ast.Call,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Call):
@@ -86,6 +94,8 @@ class RubyEachPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "Ruby pattern: use for loop instead of .each"
+    node_types = (ast.Call,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Call):
@@ -104,6 +114,8 @@ class RubyNilPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "Ruby pattern: use 'is None' instead of .nil?"
+    node_types = (ast.Call,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Call):
@@ -122,6 +134,8 @@ class GoPrintPattern(ASTPattern):
     severity = Severity.MEDIUM
     axis = Axis.QUALITY
     message = "Go pattern: use print() instead of fmt.Println()"
+    node_types = (ast.Call,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Call):
@@ -142,6 +156,8 @@ class CSharpLengthPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "C# pattern: use len() instead of .Length"
+    node_types = (ast.Attribute,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Attribute):
@@ -159,6 +175,8 @@ class CSharpToLowerPattern(ASTPattern):
     severity = Severity.MEDIUM
     axis = Axis.QUALITY
     message = "C# pattern: use .lower() instead of .ToLower()"
+    node_types = (ast.Call,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Call):
@@ -177,6 +195,8 @@ class PHPStrlenPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "PHP pattern: use len() instead of strlen()"
+    node_types = (ast.Call,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Call):
@@ -195,6 +215,8 @@ class PHPArrayPushPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "PHP pattern: use .append() instead of array_push()"
+    node_types = (ast.Call,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Call):
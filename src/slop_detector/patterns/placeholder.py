@@ -92,6 +92,8 @@ class PassPlaceholderPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "Empty function with only pass - placeholder not implemented"
+    node_types = (ast.FunctionDef,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if not isinstance(node, ast.FunctionDef):
@@ -183,8 +185,9 @@ class EllipsisPlaceholderPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "Empty function with only ... - placeholder not implemented"
+    node_types = (ast.FunctionDef,)
 
-    def check(self, tree: ast.AST, file, content) -> List[Issue]:
+    def begin_file(self, tree: ast.AST, file, content) -> None:
         protocol_lines: set[int] = set()
         for class_node in (node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)):
             if any(
@@ -196,10 +199,9 @@ class EllipsisPlaceholderPattern(ASTPattern):
                     if isinstance(method, (ast.FunctionDef, ast.AsyncFunctionDef))
                 )
         self._protocol_method_lines = protocol_lines
-        try:
-            return super().check(tree, file, content)
-        finally:
-            self._protocol_method_lines = set()
+
+    def end_file(self) -> None:
+        self._protocol_method_lines = set()
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if not isinstance(node, ast.FunctionDef):
@@ -230,6 +232,8 @@ class NotImplementedPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "Function raises NotImplementedError - placeholder not implemented"
+    node_types = (ast.FunctionDef,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if not isinstance(node, ast.FunctionDef):
@@ -265,6 +269,8 @@ class EmptyExceptPattern(ASTPattern):
     severity = Severity.CRITICAL
     axis = Axis.QUALITY
     message = "Empty exception handler - errors silently ignored"
+    node_types = (ast.ExceptHandler,)
+    function_scoped = True
 
     # Exception types that indicate optional-dependency guard pattern
     _IMPORT_GUARD_NAMES: frozenset = frozenset({"ImportError", "ModuleNotFoundError"})
@@ -337,6 +343,8 @@ class ReturnNonePlaceholderPattern(ASTPattern):
     severity = Severity.MEDIUM
     axis = Axis.QUALITY
     message = "Function only returns None - likely placeholder"
+    node_types = (ast.FunctionDef,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if not isinstance(node, ast.FunctionDef):
@@ -376,6 +384,8 @@ class ReturnConstantStubPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "Function body is a single return <constant> - likely stub"
+    node_types = (ast.FunctionDef,)
+    function_scoped = True
 
     _DUNDER_CONSTANT_OK = frozenset(
         {
@@ -452,6 +462,8 @@ class InterfaceOnlyClassPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.QUALITY
     message = "Class contains only abstract methods or placeholders"
+    node_types = (ast.ClassDef,)
+    function_scoped = True
 
     def _count_placeholder_methods(
         self, methods: List[Union[ast.FunctionDef, ast.AsyncFunctionDef]]
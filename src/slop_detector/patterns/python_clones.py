@@ -281,7 +281,8 @@ class FunctionClonePattern(BasePattern):
     """Detect files where many functions have near-identical AST structure.
 
     Algorithm: pairwise Jensen-Shannon Divergence on 30-dim AST node-type
-    histograms. Functions with JSD < 0.05 form clone groups (BFS components).
+    histograms. Functions with JSD < 0.05 and comparable size form clone
+    groups (the largest clique; see metrics/stub_density.py).
 
     Thresholds:
       >= 6 clones: CRITICAL
@@ -300,7 +301,7 @@ class FunctionClonePattern(BasePattern):
             calculate_stub_density,
         )
 
-        result = calculate_stub_density(content)
+        result = calculate_stub_density(content, tree)
         if result is None or result.total_functions < _MIN_FUNCTIONS_FOR_CLONE:
             return []
 
@@ -317,6 +318,8 @@ class FunctionClonePattern(BasePattern):
             return []
 
         clone_size = result.max_clone_group
+        # A budget-limited clique search only guarantees a lower bound.
+        count = str(clone_size) if result.clone_group_exact else f"At least {clone_size}"
         qualified_names = _qualified_clone_names(tree, result.clone_group_names)
         names_preview = ", ".join(qualified_names[:6])
         if len(qualified_names) > 6:
@@ -325,14 +328,14 @@ class FunctionClonePattern(BasePattern):
         if clone_size >= _CLONE_HIGH_THRESHOLD:
             sev = Severity.CRITICAL
             msg = (
-                f"{clone_size} structurally near-identical functions detected "
+                f"{count} structurally near-identical functions detected "
                 f"(AST JSD < 0.05): {names_preview}. "
                 f"Possible god function fragmented into helpers to evade per-function gates."
             )
         else:
             sev = Severity.HIGH
             msg = (
-                f"{clone_size} structurally similar functions detected "
+                f"{count} structurally similar functions detected "
                 f"(AST JSD < 0.05): {names_preview}. "
                 f"Review for unnecessary decomposition."
             )
@@ -7,22 +7,14 @@ import fnmatch
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-from slop_detector.patterns.base import Axis, BasePattern, Issue, Severity
+from slop_detector.metrics.complexity import function_complexity
+from slop_detector.patterns.base import ASTPattern, Axis, Issue, Severity
+from slop_detector.source_context import SourceContext
 
 GOD_FUNCTION_LINES = 50
 GOD_FUNCTION_COMPLEXITY = 10
 DEEP_NESTING_THRESHOLD = 4
 
-_BRANCH_NODES = (
-    ast.If,
-    ast.For,
-    ast.While,
-    ast.ExceptHandler,
-    ast.With,
-    ast.AsyncWith,
-    ast.AsyncFor,
-)
-
 _BLOCK_CONTAINER_FIELDS = ("body", "orelse", "finalbody", "handlers")
 
 _TERMINAL_STMTS = (ast.Return, ast.Raise, ast.Break, ast.Continue)
@@ -43,6 +35,15 @@ _COMPOUND_STMTS = (
 _NESTED_CC_THRESHOLD = 5
 _NESTED_DEPTH_THRESHOLD = 4
 
+# Node types owning statement blocks (``body`` / ``orelse`` / ``finalbody``).
+_BLOCK_OWNERS = tuple(
+    node_type
+    for node_type in vars(ast).values()
+    if isinstance(node_type, type)
+    and issubclass(node_type, ast.AST)
+    and {"body", "orelse", "finalbody"}.intersection(getattr(node_type, "_fields", ()))
+)
+
 
 # ------------------------------------------------------------------
 # Helpers
@@ -50,19 +51,12 @@ _NESTED_DEPTH_THRESHOLD = 4
 
 
 def _cyclomatic_complexity(func_node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
-    """Compute McCabe cyclomatic complexity of a function.
+    """Compute McCabe cyclomatic complexity of a function (radon-compatible).
 
-    Base complexity = 1.
-    +1 for each: if, for, while, except, with, async-with, async-for.
-    +1 for each additional boolean operator (and/or) in a BoolOp.
+    Patterns read the per-file value from ``SourceContext.complexity``; this
+    helper serves callers that only have a single function node.
     """
-    complexity = 1
-    for node in ast.walk(func_node):
-        if isinstance(node, _BRANCH_NODES):
-            complexity += 1
-        elif isinstance(node, ast.BoolOp):
-            complexity += len(node.values) - 1
-    return complexity
+    return function_complexity(func_node)
 
 
 def _max_nesting_depth(node: ast.AST, depth: int = 0) -> int:
@@ -92,19 +86,16 @@ def _collect_dead_statements(stmts: list[ast.stmt]) -> list[ast.stmt]:
     return dead
 
 
-def _find_dead_code_in_tree(root: ast.AST) -> list[ast.stmt]:
-    """Recursively find all unreachable statements in every block."""
+def _find_dead_code_in_node(node: ast.AST) -> list[ast.stmt]:
+    """Find the unreachable statements in the blocks owned directly by ``node``."""
     dead: list[ast.stmt] = []
-
-    for node in ast.walk(root):
-        for field_name in ("body", "orelse", "finalbody"):
-            stmts = getattr(node, field_name, None)
-            if isinstance(stmts, list) and stmts:
-                dead.extend(_collect_dead_statements(stmts))
-        if isinstance(node, ast.Try):
-            for handler in node.handlers:
-                dead.extend(_collect_dead_statements(handler.body))
-
+    for field_name in ("body", "orelse", "finalbody"):
+        stmts = getattr(node, field_name, None)
+        if isinstance(stmts, list) and stmts:
+            dead.extend(_collect_dead_statements(stmts))
+    if isinstance(node, ast.Try):
+        for handler in node.handlers:
+            dead.extend(_collect_dead_statements(handler.body))
     return dead
 
 
@@ -113,13 +104,15 @@ def _find_dead_code_in_tree(root: ast.AST) -> list[ast.stmt]:
 # ------------------------------------------------------------------
 
 
-class GodFunctionPattern(BasePattern):
+class GodFunctionPattern(ASTPattern):
     """Detect functions that are too large or too complex."""
 
     id = "god_function"
     severity = Severity.HIGH
     axis = Axis.STYLE
     message = "God function detected"
+    node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+    function_scoped = True
 
     def __init__(
         self,
@@ -131,6 +124,7 @@ class GodFunctionPattern(BasePattern):
         self.complexity_threshold = complexity_threshold
         self.lines_threshold = lines_threshold
         self.domain_overrides: List[Dict[str, Any]] = domain_overrides or []
+        self._file_source: Optional[SourceContext] = None
 
     def _thresholds_for(self, func_name: str) -> tuple[int, int]:
         for override in self.domain_overrides:
@@ -176,117 +170,107 @@ class GodFunctionPattern(BasePattern):
             severity_override=sev,
         )
 
-    def check(self, tree: ast.AST, file: Path, content: str) -> list[Issue]:
-        issues: list[Issue] = []
-        lines = content.splitlines()
-
-        for node in ast.walk(tree):
-            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                continue
-
-            start = node.lineno
-            end = getattr(node, "end_lineno", node.lineno)
-
-            logic_lines = sum(
-                1 for ln in lines[start - 1 : end] if ln.strip() and not ln.strip().startswith("#")
+    def begin_file(self, tree: ast.AST, file: Path, content: str) -> None:
+        self._file_source = self.source_for(content, tree)
+
+    def end_file(self) -> None:
+        self._file_source = None
+
+    def check_node(self, node: ast.AST, file: Path, content: str) -> Optional[Issue]:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return None
+        source = self._file_source or self.source_for(content)
+
+        start = node.lineno
+        end = getattr(node, "end_lineno", node.lineno)
+
+        logic_lines = source.code_line_count(start, end)
+
+        complexity = source.complexity.of(node)
+        cc_limit, ln_limit = self._thresholds_for(node.name)
+
+        is_too_long = logic_lines > ln_limit
+        is_too_complex = complexity > cc_limit
+
+        # Pure lines violation with complexity < 4 is typically declarative setup
+        # code (argparse subcommand tables, config blocks) — not logic fragmentation.
+        if is_too_complex or (is_too_long and complexity >= 4):
+            return self._make_god_issue(
+                file,
+                node,
+                start,
+                logic_lines,
+                complexity,
+                ln_limit,
+                cc_limit,
+                is_too_long,
+                is_too_complex,
             )
+        return None
+
 
-            complexity = _cyclomatic_complexity(node)
-            cc_limit, ln_limit = self._thresholds_for(node.name)
-
-            is_too_long = logic_lines > ln_limit
-            is_too_complex = complexity > cc_limit
-
-            # Pure lines violation with complexity < 4 is typically declarative setup
-            # code (argparse subcommand tables, config blocks) — not logic fragmentation.
-            if is_too_complex or (is_too_long and complexity >= 4):
-                issues.append(
-                    self._make_god_issue(
-                        file,
-                        node,
-                        start,
-                        logic_lines,
-                        complexity,
-                        ln_limit,
-                        cc_limit,
-                        is_too_long,
-                        is_too_complex,
-                    )
-                )
-
-        return issues
-
-
-class DeadCodePattern(BasePattern):
+class DeadCodePattern(ASTPattern):
     """Detect unreachable statements after return/raise/break/continue."""
 
     id = "dead_code"
     severity = Severity.MEDIUM
     axis = Axis.QUALITY
     message = "Unreachable code after return/raise/break/continue"
-
-    def check(self, tree: ast.AST, file: Path, content: str) -> list[Issue]:
-        issues: list[Issue] = []
-        dead_stmts = _find_dead_code_in_tree(tree)
-
-        for stmt in dead_stmts:
-            line = getattr(stmt, "lineno", 0)
-            col = getattr(stmt, "col_offset", 0)
-            issues.append(
-                self.create_issue(
-                    file=file,
-                    line=line,
-                    column=col,
-                    message=self.message,
-                    suggestion="Remove dead code. It is never executed and confuses readers.",
-                )
+    node_types = _BLOCK_OWNERS
+    function_scoped = True
+
+    def check_node(self, node: ast.AST, file: Path, content: str) -> Optional[list[Issue]]:
+        return [
+            self.create_issue(
+                file=file,
+                line=getattr(stmt, "lineno", 0),
+                column=getattr(stmt, "col_offset", 0),
+                message=self.message,
+                suggestion="Remove dead code. It is never executed and confuses readers.",
             )
-
-        return issues
+            for stmt in _find_dead_code_in_node(node)
+        ]
 
 
-class DeepNestingPattern(BasePattern):
+class DeepNestingPattern(ASTPattern):
     """Detect excessive control-flow nesting depth."""
 
     id = "deep_nesting"
     severity = Severity.HIGH
     axis = Axis.STYLE
     message = "Excessive nesting depth"
+    node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+    function_scoped = True
+
+    def check_node(self, node: ast.AST, file: Path, content: str) -> Optional[Issue]:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return None
+        depth = _max_nesting_depth(node)
+        if depth <= DEEP_NESTING_THRESHOLD:
+            return None
+        return self.create_issue(
+            file=file,
+            line=node.lineno,
+            column=node.col_offset,
+            message=(
+                f"Function '{node.name}' has nesting depth {depth} "
+                f"(limit {DEEP_NESTING_THRESHOLD})"
+            ),
+            suggestion=(
+                "Extract nested blocks into helper functions. "
+                "Use early-return / guard clauses to reduce nesting."
+            ),
+        )
+
 
-    def check(self, tree: ast.AST, file: Path, content: str) -> list[Issue]:
-        issues: list[Issue] = []
-
-        for node in ast.walk(tree):
-            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                continue
-
-            depth = _max_nesting_depth(node)
-            if depth > DEEP_NESTING_THRESHOLD:
-                issues.append(
-                    self.create_issue(
-                        file=file,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        message=(
-                            f"Function '{node.name}' has nesting depth {depth} "
-                            f"(limit {DEEP_NESTING_THRESHOLD})"
-                        ),
-                        suggestion=(
-                            "Extract nested blocks into helper functions. "
-                            "Use early-return / guard clauses to reduce nesting."
-                        ),
-                    )
-                )
-
-        return issues
-
-
-class NestedComplexityPattern(BasePattern):
+class NestedComplexityPattern(ASTPattern):
     """Detect functions that combine deep nesting with moderate cyclomatic complexity."""
 
     id = "nested_complexity"
     severity = Severity.CRITICAL
     axis = Axis.QUALITY
+    node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+    function_scoped = True
 
     def __init__(
         self,
@@ -298,6 +282,7 @@ class NestedComplexityPattern(BasePattern):
         self.depth_threshold = depth_threshold
         self.cc_threshold = cc_threshold
         self.domain_overrides: List[Dict[str, Any]] = domain_overrides or []
+        self._file_source: Optional[SourceContext] = None
 
     def _thresholds_for(self, func_name: str) -> tuple[int, int]:
         for override in self.domain_overrides:
@@ -308,29 +293,31 @@ class NestedComplexityPattern(BasePattern):
                 return depth, cc
         return self.depth_threshold, self.cc_threshold
 
-    def check(self, tree: ast.AST, file: Path, content: str) -> list[Issue]:
-        issues: list[Issue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                continue
-            depth = _max_nesting_depth(node)
-            cc = _cyclomatic_complexity(node)
-            depth_limit, cc_limit = self._thresholds_for(node.name)
-            if depth > depth_limit and cc > cc_limit:
-                issues.append(
-                    self.create_issue(
-                        file=file,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        message=(
-                            f"Function '{node.name}' has both deep nesting (depth={depth}) "
-                            f"and high cyclomatic complexity (cc={cc}) "
-                            f"-- structural complexity composite"
-                        ),
-                        suggestion=(
-                            "Extract nested blocks into named helper functions. "
-                            "Use early-return / guard clauses and reduce branch count."
-                        ),
-                    )
-                )
-        return issues
+    def begin_file(self, tree: ast.AST, file: Path, content: str) -> None:
+        self._file_source = self.source_for(content, tree)
+
+    def end_file(self) -> None:
+        self._file_source = None
+
+    def check_node(self, node: ast.AST, file: Path, content: str) -> Optional[Issue]:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return None
+        depth = _max_nesting_depth(node)
+        cc = (self._file_source or self.source_for(content)).complexity.of(node)
+        depth_limit, cc_limit = self._thresholds_for(node.name)
+        if depth > depth_limit and cc > cc_limit:
+            return self.create_issue(
+                file=file,
+                line=node.lineno,
+                column=node.col_offset,
+                message=(
+                    f"Function '{node.name}' has both deep nesting (depth={depth}) "
+                    f"and high cyclomatic complexity (cc={cc}) "
+                    f"-- structural complexity composite"
+                ),
+                suggestion=(
+                    "Extract nested blocks into named helper functions. "
+                    "Use early-return / guard clauses and reduce branch count."
+                ),
+            )
+        return None
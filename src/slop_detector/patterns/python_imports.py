@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 import importlib.util
 import logging
 import re
@@ -20,6 +21,8 @@ logger = logging.getLogger(__name__)
 
 _RESOLVABLE_MODULES_STORE: Dict[str, FrozenSet[str]] = {}
 
+_IMPORT_ENVIRONMENT_STORE: Dict[str, str] = {}
+
 # ------------------------------------------------------------------
 # Project-local package discovery
 # ------------------------------------------------------------------
@@ -30,6 +33,8 @@ _SIBLING_MODULES_CACHE: Dict[str, FrozenSet[str]] = {}
 
 _DECLARED_DEPENDENCY_SOURCES_CACHE: Dict[str, Mapping[str, FrozenSet[str]]] = {}
 
+_IMPORT_CONTEXT_CACHE: Dict[str, str] = {}
+
 
 def _discover_sibling_modules(file_path: Path) -> FrozenSet[str]:
     """Return stem names of .py files in the same directory (importable siblings)."""
@@ -91,6 +96,29 @@ def _find_project_root(file_path: Path) -> Optional[Path]:
     return None
 
 
+def import_context_key(file_path: Path) -> str:
+    """Digest of what phantom-import checks read for ``file_path`` besides its source.
+
+    Files share a digest when they resolve imports against the same project
+    packages, declared dependencies and sibling modules, wherever they live.
+    """
+    key = str(file_path.parent)
+    cached = _IMPORT_CONTEXT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    project_root = _find_project_root(file_path)
+    declared_sources = _discover_declared_dependency_sources(project_root) if project_root else {}
+    context = (
+        sorted(_discover_project_packages(project_root)) if project_root else [],
+        sorted((name, sorted(sources)) for name, sources in declared_sources.items()),
+        bool(project_root and (project_root / "pyproject.toml").exists()),
+        sorted(_discover_sibling_modules(file_path)),
+    )
+    digest = hashlib.sha256(repr(context).encode("utf-8")).hexdigest()[:16]
+    _IMPORT_CONTEXT_CACHE[key] = digest
+    return digest
+
+
 _EXTRAS_RE = re.compile(r"\[.*?\]")
 
 _PACKAGE_IMPORT_ALIASES: Dict[str, FrozenSet[str]] = {
@@ -285,6 +313,25 @@ def _get_resolvable_modules() -> FrozenSet[str]:
     return _RESOLVABLE_MODULES_STORE["v"]
 
 
+def import_environment_key() -> str:
+    """Digest of the interpreter and the top-level modules it can import.
+
+    Parsing depends on the Python version and phantom-import checks on the
+    installed packages, so results computed under another key may differ.
+    Imports found only by ``find_spec`` on extra ``sys.path`` entries are not
+    covered.
+    """
+    if "v" not in _IMPORT_ENVIRONMENT_STORE:
+        environment = (
+            sys.implementation.name,
+            sys.version_info[:2],
+            sorted(_get_resolvable_modules()),
+        )
+        digest = hashlib.sha256(repr(environment).encode("utf-8")).hexdigest()[:16]
+        _IMPORT_ENVIRONMENT_STORE["v"] = digest
+    return _IMPORT_ENVIRONMENT_STORE["v"]
+
+
 def _module_exists(name: str) -> bool:
     """Return True if name is a resolvable top-level module."""
     if name in _get_resolvable_modules():
@@ -7,6 +7,7 @@ import re
 from pathlib import Path
 
 from slop_detector.patterns.base import Axis, BasePattern, Issue, Severity
+from slop_detector.source_context import LINE_CODE
 
 _NOQA_BARE = re.compile(r"#\s*noqa\s*$", re.IGNORECASE)
 _NOQA_SPECIFIC = re.compile(r"#\s*noqa\s*:\s*[\w,\s]+", re.IGNORECASE)
@@ -43,12 +44,12 @@ class LintEscapePattern(BasePattern):
 
     def check(self, tree: ast.AST, file: Path, content: str) -> list[Issue]:
         issues: list[Issue] = []
-        lines = content.splitlines()
+        source = self.source_for(content, tree)
+        line_kinds = source.line_kinds
         string_lines = self._string_literal_lines(tree)
 
-        for lineno, raw in enumerate(lines, start=1):
-            stripped = raw.lstrip()
-            if not stripped or stripped.startswith("#"):
+        for lineno, raw in enumerate(source.lines, start=1):
+            if line_kinds[lineno - 1] != LINE_CODE:
                 continue
             if lineno in string_lines:
                 continue
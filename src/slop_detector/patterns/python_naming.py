@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import ast
 import re
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 
-from slop_detector.patterns.base import Axis, BasePattern, Issue, Severity
+from slop_detector.patterns.base import ASTPattern, Axis, Issue, Severity
 
 _PLACEHOLDER_PARAM_THRESHOLD = 5
 _NUMBERED_SEQ_HIGH = 8
@@ -45,7 +45,7 @@ def _max_consecutive_run(nums: list) -> int:
     return best
 
 
-class PlaceholderVariableNamingPattern(BasePattern):
+class PlaceholderVariableNamingPattern(ASTPattern):
     """Detect systematic placeholder variable naming in function bodies.
 
     Two sub-checks:
@@ -56,13 +56,13 @@ class PlaceholderVariableNamingPattern(BasePattern):
     id = "placeholder_variable_naming"
     severity = Severity.HIGH
     axis = Axis.QUALITY
+    node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+    function_scoped = True
 
-    def check(self, tree: ast.AST, file: Any, content: str) -> List[Issue]:
-        issues: List[Issue] = []
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                issues.extend(self._check_function(node, file))
-        return issues
+    def check_node(self, node: ast.AST, file: Any, content: str) -> Optional[List[Issue]]:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return None
+        return self._check_function(node, file)
 
     def _check_function(
         self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef], file: Any
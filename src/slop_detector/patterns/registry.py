@@ -2,10 +2,48 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+import ast
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Collection, Deque, Dict, List, Optional, Set, Tuple, cast
+
+from slop_detector.patterns.base import ASTPattern
+from slop_detector.source_context import SourceContext, source_context_for
 
 if TYPE_CHECKING:
-    from slop_detector.patterns.base import BasePattern
+    from slop_detector.patterns.base import BasePattern, Issue
+
+# Child indexes (``ast.iter_child_nodes`` order) leading from the root to a node.
+NodePath = Tuple[int, ...]
+
+
+@dataclass
+class PatternOutcome:
+    """Issues produced by one pattern for one file, or the error that stopped it."""
+
+    pattern: BasePattern
+    issues: List[Issue] = field(default_factory=list)
+    error: Optional[Exception] = None
+    # From ``check_scoped``: per issue, the child-index path of its node.
+    paths: List[NodePath] = field(default_factory=list)
+
+
+def uses_fused_dispatch(pattern: BasePattern) -> bool:
+    """Return whether a pattern can share the registry's single AST walk.
+
+    Patterns that replace ``check`` wholesale (on the class or the instance)
+    keep running through their own ``check`` for compatibility.
+    """
+    return (
+        isinstance(pattern, ASTPattern)
+        and getattr(pattern.check, "__func__", None) is ASTPattern.check
+    )
+
+
+def is_function_scoped(pattern: BasePattern) -> bool:
+    """Return whether a pattern's findings can be reused per unchanged definition."""
+    return uses_fused_dispatch(pattern) and cast(ASTPattern, pattern).function_scoped
 
 
 class PatternRegistry:
@@ -14,6 +52,12 @@ class PatternRegistry:
     def __init__(self):
         self._patterns: Dict[str, BasePattern] = {}
         self._disabled: Set[str] = set()
+        # node type -> indices (into the enabled fused patterns) interested in it
+        self._dispatch_table: Dict[type, Tuple[int, ...]] = {}
+        self._dispatch_key: Tuple[int, ...] = ()
+        # The same for the function-scoped patterns of ``check_scoped``.
+        self._scoped_table: Dict[type, Tuple[int, ...]] = {}
+        self._scoped_key: Tuple[int, ...] = ()
 
     def register(self, pattern: BasePattern) -> None:
         """Register a pattern."""
@@ -58,6 +102,197 @@ class PatternRegistry:
         """Get patterns by axis."""
         return [pattern for pattern in self.get_all() if pattern.axis.value == axis]
 
+    def check_all(
+        self,
+        tree: ast.AST,
+        file: Path,
+        content: str,
+        source: Optional[SourceContext] = None,
+        only: Optional[Collection[str]] = None,
+    ) -> List[PatternOutcome]:
+        """Run every enabled pattern on one file, walking the AST only once.
+
+        ``ASTPattern`` subclasses that keep the default ``check`` are fed from
+        a single ``ast.walk`` through a node-type dispatch table; everything
+        else runs its own ``check``. Outcomes are returned in registration
+        order and each pattern's issues keep ``ast.walk`` order, so results
+        match running ``pattern.check`` one pattern at a time.
+
+        ``source`` is the file's shared SourceContext (one is built when
+        omitted); patterns reach it through ``BasePattern.source_for``. With
+        ``only``, enabled patterns whose id is not listed are skipped.
+        """
+        source = source_context_for(content, tree, source)
+        patterns = self.get_all()
+        if only is not None:
+            patterns = [pattern for pattern in patterns if pattern.id in only]
+        outcomes = [PatternOutcome(pattern) for pattern in patterns]
+        for pattern in patterns:
+            pattern._source = source
+        try:
+            fused: List[PatternOutcome] = []
+            for outcome in outcomes:
+                if uses_fused_dispatch(outcome.pattern):
+                    fused.append(outcome)
+                    continue
+                try:
+                    outcome.issues = outcome.pattern.check(tree, file, content)
+                except Exception as exc:
+                    outcome.error = exc
+            if fused:
+                self._dispatch(fused, tree, file, content)
+        finally:
+            for pattern in patterns:
+                pattern._source = None
+        return outcomes
+
+    def check_scoped(
+        self,
+        tree: ast.AST,
+        file: Path,
+        content: str,
+        source: Optional[SourceContext] = None,
+        only: Optional[Collection[str]] = None,
+        skip: Collection[int] = (),
+    ) -> List[PatternOutcome]:
+        """Run the enabled function-scoped patterns, recording the path of each finding.
+
+        The walk is breadth-first like ``ast.walk`` but leaves out the nodes
+        whose ``id`` is in ``skip``, with their subtrees. ``outcome.paths``
+        holds the child-index path of the node behind each issue; sorting
+        issues by ``(len(path), path)`` gives ``ast.walk`` order, so findings
+        kept from an earlier walk of a skipped subtree can be merged back in.
+        """
+        source = source_context_for(content, tree, source)
+        patterns = [
+            cast(ASTPattern, pattern)
+            for pattern in self.get_all()
+            if is_function_scoped(pattern) and (only is None or pattern.id in only)
+        ]
+        outcomes = [PatternOutcome(pattern) for pattern in patterns]
+        key = tuple(id(pattern) for pattern in patterns)
+        if key != self._scoped_key:
+            self._scoped_table.clear()
+            self._scoped_key = key
+        for pattern in patterns:
+            pattern._source = source
+        try:
+            started = self._begin_file(outcomes, tree, file, content)
+            try:
+                todo: Deque[Tuple[ast.AST, NodePath]] = deque([(tree, ())])
+                while todo:
+                    node, path = todo.popleft()
+                    node_type = type(node)
+                    interested = self._scoped_table.get(node_type)
+                    if interested is None:
+                        interested = self._interested_indices(
+                            patterns, node_type, self._scoped_table
+                        )
+                    for index in interested:
+                        outcome = outcomes[index]
+                        if outcome.error is None:
+                            self._check_node(outcome, patterns[index], node, file, content, path)
+                    for position, child in enumerate(ast.iter_child_nodes(node)):
+                        if id(child) not in skip:
+                            todo.append((child, path + (position,)))
+            finally:
+                self._end_file(outcomes, started)
+        finally:
+            for pattern in patterns:
+                pattern._source = None
+        return outcomes
+
+    def _dispatch(
+        self, fused: List[PatternOutcome], tree: ast.AST, file: Path, content: str
+    ) -> None:
+        """Walk ``tree`` once and hand each node to the patterns that declared its type."""
+        patterns = [cast(ASTPattern, outcome.pattern) for outcome in fused]
+        dispatch_key = tuple(id(pattern) for pattern in patterns)
+        if dispatch_key != self._dispatch_key:
+            self._dispatch_table.clear()
+            self._dispatch_key = dispatch_key
+
+        started = self._begin_file(fused, tree, file, content)
+        try:
+            for node in ast.walk(tree):
+                node_type = type(node)
+                interested = self._dispatch_table.get(node_type)
+                if interested is None:
+                    interested = self._interested_indices(patterns, node_type, self._dispatch_table)
+                for index in interested:
+                    outcome = fused[index]
+                    if outcome.error is None:
+                        self._check_node(outcome, patterns[index], node, file, content)
+        finally:
+            self._end_file(fused, started)
+
+    @staticmethod
+    def _begin_file(
+        outcomes: List[PatternOutcome], tree: ast.AST, file: Path, content: str
+    ) -> List[int]:
+        """Call ``begin_file`` on each pattern; return the indices that started."""
+        started: List[int] = []
+        for index, outcome in enumerate(outcomes):
+            try:
+                cast(ASTPattern, outcome.pattern).begin_file(tree, file, content)
+            except Exception as exc:
+                outcome.error = exc
+                continue
+            started.append(index)
+        return started
+
+    @staticmethod
+    def _end_file(outcomes: List[PatternOutcome], started: List[int]) -> None:
+        for index in started:
+            outcome = outcomes[index]
+            try:
+                cast(ASTPattern, outcome.pattern).end_file()
+            except Exception as exc:
+                if outcome.error is None:
+                    outcome.error = exc
+                    outcome.issues = []
+                    outcome.paths = []
+
+    @staticmethod
+    def _check_node(
+        outcome: PatternOutcome,
+        pattern: ASTPattern,
+        node: ast.AST,
+        file: Path,
+        content: str,
+        path: Optional[NodePath] = None,
+    ) -> None:
+        try:
+            found = pattern.check_node(node, file, content)
+        except Exception as exc:
+            outcome.error = exc
+            outcome.issues = []
+            outcome.paths = []
+            return
+        if not found:
+            return
+        if isinstance(found, list):
+            outcome.issues.extend(found)
+            if path is not None:
+                outcome.paths.extend([path] * len(found))
+        else:
+            outcome.issues.append(found)
+            if path is not None:
+                outcome.paths.append(path)
+
+    @staticmethod
+    def _interested_indices(
+        patterns: List[ASTPattern], node_type: type, table: Dict[type, Tuple[int, ...]]
+    ) -> Tuple[int, ...]:
+        """Build and memoize the dispatch entry for one node type."""
+        indices = tuple(
+            index
+            for index, pattern in enumerate(patterns)
+            if not pattern.node_types or issubclass(node_type, pattern.node_types)
+        )
+        table[node_type] = indices
+        return indices
+
     def __len__(self) -> int:
         return len(self._patterns) - len(self._disabled)
 
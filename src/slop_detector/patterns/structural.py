@@ -15,6 +15,8 @@ class BareExceptPattern(ASTPattern):
     severity = Severity.CRITICAL
     axis = Axis.STRUCTURE
     message = "Bare except catches everything including SystemExit and KeyboardInterrupt"
+    node_types = (ast.ExceptHandler,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.ExceptHandler):
@@ -32,6 +34,8 @@ class MutableDefaultArgPattern(ASTPattern):
     severity = Severity.CRITICAL
     axis = Axis.QUALITY
     message = "Mutable default argument - shared state bug"
+    node_types = (ast.FunctionDef,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.FunctionDef):
@@ -52,6 +56,8 @@ class StarImportPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.STRUCTURE
     message = "Star import pollutes namespace and hides dependencies"
+    node_types = (ast.ImportFrom,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.ImportFrom):
@@ -72,6 +78,8 @@ class GlobalStatementPattern(ASTPattern):
     severity = Severity.HIGH
     axis = Axis.STRUCTURE
     message = "Global statement makes code harder to test and reason about"
+    node_types = (ast.Global,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Global):
@@ -88,6 +96,8 @@ class ExecEvalPattern(ASTPattern):
     severity = Severity.CRITICAL
     axis = Axis.STRUCTURE
     message = "exec/eval is a security risk - arbitrary code execution"
+    node_types = (ast.Call,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Call):
@@ -106,6 +116,8 @@ class AssertInProductionPattern(ASTPattern):
     severity = Severity.MEDIUM
     axis = Axis.STRUCTURE
     message = "Assert statements are removed when running with -O flag"
+    node_types = (ast.Assert,)
+    function_scoped = True
 
     def check_node(self, node: ast.AST, file, content) -> Optional[Issue]:
         if isinstance(node, ast.Assert):
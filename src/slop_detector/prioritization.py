@@ -4,38 +4,84 @@ from __future__ import annotations
 
 import ast
 import subprocess
+from dataclasses import asdict
+from hashlib import sha256
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from slop_detector.models import FileAnalysis, PriorityHotspot, SlopStatus
 
-_CoverageData: Any = None
-try:
-    from coverage import CoverageData
+# Project aggregate kinds (``FileAnalysisCache.put_aggregate``).
+_CHURN_AGGREGATE = "churn"
+_HOTSPOTS_AGGREGATE = "hotspots"
 
-    _CoverageData = CoverageData
-    _COVERAGE_AVAILABLE = True
-except ImportError:
-    _COVERAGE_AVAILABLE = False
+
+def _coverage_data_class() -> Any:
+    """Import ``coverage.CoverageData`` on first use (heavy; hotspot ranking only)."""
+    try:
+        from coverage import CoverageData
+    except ImportError:
+        return None
+    return CoverageData
 
 
 class ProjectPrioritizer:
-    """Ranks file-level findings by change pressure and test coverage gaps."""
+    """Ranks file-level findings by change pressure and test coverage gaps.
+
+    With an analysis ``cache``, the ranking is reused while git HEAD, the
+    coverage data file and every ranked file are unchanged, and the churn
+    counts of a HEAD are reused whatever else changed.
+    """
 
     def __init__(self, config) -> None:
         self.config = config
 
     def prioritize_project(
-        self, project_path: str, file_results: Sequence[FileAnalysis]
+        self, project_path: str, file_results: Sequence[FileAnalysis], cache: Any = None
     ) -> Tuple[List[PriorityHotspot], bool, bool]:
         python_results = [
             result for result in file_results if Path(result.file_path).suffix.lower() == ".py"
         ]
         if not python_results:
             return [], False, False
+        if cache is None:
+            return self._rank(project_path, python_results)
+
+        git_state = self._resolve_git_state(project_path)
+        key = self._hotspots_key(project_path, python_results, git_state)
+        if key is not None:
+            cached = cache.get_aggregate(_HOTSPOTS_AGGREGATE, key)
+            if cached is not None:
+                hotspots, churn_available, coverage_available = cached
+                return (
+                    [PriorityHotspot(**item) for item in hotspots],
+                    churn_available,
+                    coverage_available,
+                )
+        ranked = self._rank(project_path, python_results, cache, git_state)
+        if key is not None:
+            hotspots, churn_available, coverage_available = ranked
+            cache.put_aggregate(
+                _HOTSPOTS_AGGREGATE,
+                key,
+                ([asdict(item) for item in hotspots], churn_available, coverage_available),
+            )
+        return ranked
 
+    def _rank(
+        self,
+        project_path: str,
+        python_results: Sequence[FileAnalysis],
+        cache: Any = None,
+        git_state: Optional[Tuple[Path, str]] = None,
+    ) -> Tuple[List[PriorityHotspot], bool, bool]:
         file_paths = [Path(result.file_path).resolve() for result in python_results]
-        churn_counts = self._load_git_churn(project_path, file_paths)
+        if cache is None:
+            churn_counts = self._load_git_churn(project_path, file_paths)
+        else:
+            churn_counts = self._load_git_churn(
+                project_path, file_paths, cache=cache, git_state=git_state
+            )
         coverage_ratios = self._load_coverage_ratios(project_path, file_paths)
 
         churn_available = any(count > 0 for count in churn_counts.values())
@@ -134,15 +180,84 @@ class ProjectPrioritizer:
 
         return reasons
 
-    def _load_git_churn(self, project_path: str, file_paths: Sequence[Path]) -> Dict[str, int]:
+    def _hotspots_key(
+        self,
+        project_path: str,
+        python_results: Sequence[FileAnalysis],
+        git_state: Optional[Tuple[Path, str]],
+    ) -> Optional[str]:
+        """Digest every input of the ranking, or ``None`` when one is unknown.
+
+        Coverage ratios depend on file content, so with a coverage data file
+        present every result must carry its content hash.
+        """
+        try:
+            stat = (Path(project_path) / self.config.get_coverage_data_file()).stat()
+            coverage_state: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            coverage_state = None
+        files = []
+        for result in python_results:
+            content_hash = getattr(result, "content_hash", None)
+            if content_hash is None and coverage_state is not None:
+                return None
+            files.append(
+                (result.file_path, result.deficit_score, result.status.value, content_hash)
+            )
+        inputs = (
+            str(Path(project_path).resolve()),
+            None if git_state is None else (str(git_state[0]), git_state[1]),
+            self.config.get_churn_commit_window(),
+            coverage_state,
+            sorted(self.config.get_hotspot_weights().items()),
+            self.config.get_hotspot_limit(),
+            files,
+        )
+        return sha256(repr(inputs).encode("utf-8")).hexdigest()
+
+    def _load_git_churn(
+        self,
+        project_path: str,
+        file_paths: Sequence[Path],
+        cache: Any = None,
+        git_state: Optional[Tuple[Path, str]] = None,
+    ) -> Dict[str, int]:
+        """Count recent commits touching each file.
+
+        With a ``cache`` and the repository's ``git_state`` (root, HEAD), the
+        touches of every path in the commit window are reused for that HEAD.
+        """
         target_paths = {str(path.resolve()) for path in file_paths}
         if not target_paths:
             return {}
 
-        project_root = self._resolve_git_root(project_path)
-        if project_root is None:
-            return {}
-
+        if cache is not None and git_state is not None:
+            project_root, head = git_state
+            key = "\0".join(
+                (
+                    str(project_root),
+                    head,
+                    str(self.config.get_churn_commit_window()),
+                    str(Path(project_path).resolve()),
+                )
+            )
+            touches = cache.get_aggregate(_CHURN_AGGREGATE, key)
+            if touches is None:
+                touches = self._git_touches(project_path, project_root)
+                if touches is None:
+                    return {}
+                cache.put_aggregate(_CHURN_AGGREGATE, key, touches)
+        else:
+            resolved_root = self._resolve_git_root(project_path)
+            if resolved_root is None:
+                return {}
+            touches = self._git_touches(project_path, resolved_root)
+            if touches is None:
+                return {}
+        return {path: touches.get(path, 0) for path in target_paths}
+
+    def _git_touches(self, project_path: str, project_root: Path) -> Optional[Dict[str, int]]:
+        """Commits in the churn window touching each path, or ``None`` if git fails."""
         commit_window = self.config.get_churn_commit_window()
         try:
             result = subprocess.run(
@@ -163,31 +278,29 @@ class ProjectPrioritizer:
                 check=True,
             )
         except (FileNotFoundError, subprocess.CalledProcessError):
-            return {}
+            return None
 
-        counts = {path: 0 for path in target_paths}
+        counts: Dict[str, int] = {}
         for line in result.stdout.splitlines():
             rel = line.strip()
             if not rel:
                 continue
-            candidate = (project_root / rel).resolve()
-            key = str(candidate)
-            if key in counts:
-                counts[key] += 1
+            key = str((project_root / rel).resolve())
+            counts[key] = counts.get(key, 0) + 1
         return counts
 
     def _load_coverage_ratios(
         self, project_path: str, file_paths: Sequence[Path]
     ) -> Dict[str, Optional[float]]:
-        if not _COVERAGE_AVAILABLE:
-            return {}
-
         coverage_file = Path(project_path) / self.config.get_coverage_data_file()
         if not coverage_file.exists():
             return {}
+        coverage_data = _coverage_data_class()
+        if coverage_data is None:
+            return {}
 
         try:
-            data = _CoverageData(basename=str(coverage_file))
+            data = coverage_data(basename=str(coverage_file))
             data.read()
         except Exception:
             return {}
@@ -221,6 +334,23 @@ class ProjectPrioritizer:
         root = result.stdout.strip()
         return Path(root).resolve() if root else None
 
+    def _resolve_git_state(self, project_path: str) -> Optional[Tuple[Path, str]]:
+        """Return the repository root and HEAD commit, or ``None`` outside a git repository."""
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--show-toplevel", "HEAD"],
+                cwd=project_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            return None
+        lines = result.stdout.splitlines()
+        if len(lines) != 2:
+            return None
+        return Path(lines[0]).resolve(), lines[1]
+
     @staticmethod
     def _resolve_coverage_path(project_path: str, measured_path: str) -> Path:
         candidate = Path(measured_path)
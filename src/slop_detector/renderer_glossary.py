@@ -26,7 +26,8 @@ _MEANS_ICR = "Unjustified jargon compared with average cyclomatic complexity."
 _MEANS_DDC = "Imported libraries that are referenced by runtime code."
 
 # Plain-language view of structural coherence. The internal algorithm name
-# (the coherence_level value "vr_structural" / "vr_structural_approx") is kept
+# (the coherence_level value "vr_structural" / "vr_structural_approx" /
+# "vr_structural_knn") is kept
 # in the JSON output for tooling and audit, but hidden from the human-facing
 # summary so a first-time reader is not shown unexplained internals.
 _MEANS_COHERENCE = (
@@ -190,7 +191,13 @@ def coherence_display(result: Any) -> Dict[str, str]:
     level = getattr(result, "coherence_level", "none")
     if level == "none":
         return {}
-    coverage = "sampled (large project)" if level == "vr_structural_approx" else "full"
+    if level == "vr_structural_approx":
+        coverage = "sampled (large project)"
+    elif level == "vr_structural_knn":
+        bound = getattr(result, "coherence_error_bound", None) or 0.0
+        coverage = "all files, approximate" + (f" (up to {bound:.1%} low)" if bound else "")
+    else:
+        coverage = "full"
     return {
         "label": "Structure Coherence",
         "value": f"{getattr(result, 'structural_coherence', 1.0):.0%}",
@@ -166,19 +166,40 @@ def _md_scan_coverage_section(result) -> list:
     analyzed = coverage["analyzed"]
     excluded = coverage["excluded"]
     unsupported = coverage.get("unsupported", {})
-    return [
-        "## Scan Coverage",
-        "| Analyzed | Python | JS/TS | Go | Excluded Supported Source Files | Unsupported Source Files |",
-        "| ---: | ---: | ---: | ---: | ---: | ---: |",
-        (
-            f"| {analyzed['total']} | {analyzed['python']} | "
-            f"{analyzed['javascript']} | {analyzed['go']} | {excluded['total']} | "
-            f"{unsupported.get('total', 0)} |"
-        ),
-        "",
-        "_JSON output includes each excluded path and its matching ignore rule._",
-        "",
-    ]
+    pruned = coverage.get("pruned", {}).get("total", 0)
+    pruned_note = (
+        [f"_{pruned} dependency/build directories were pruned without being walked._", ""]
+        if pruned
+        else []
+    )
+    cache_tiers = coverage.get("analysis_cache")
+    cache_note = (
+        [
+            "_Analysis cache: "
+            + ", ".join(f"{k}={v}" for k, v in cache_tiers.items())
+            + " Python files._",
+            "",
+        ]
+        if cache_tiers
+        else []
+    )
+    return (
+        [
+            "## Scan Coverage",
+            "| Analyzed | Python | JS/TS | Go | Excluded Supported Source Files | Unsupported Source Files |",
+            "| ---: | ---: | ---: | ---: | ---: | ---: |",
+            (
+                f"| {analyzed['total']} | {analyzed['python']} | "
+                f"{analyzed['javascript']} | {analyzed['go']} | {excluded['total']} | "
+                f"{unsupported.get('total', 0)} |"
+            ),
+            "",
+            "_JSON output includes each excluded path and its matching ignore rule._",
+            "",
+        ]
+        + pruned_note
+        + cache_note
+    )
 
 
 def _md_ml_scoring_section(result) -> list:
@@ -117,13 +117,20 @@ def _build_rich_summary_tables(result):
         analyzed = scan_coverage["analyzed"]
         excluded = scan_coverage["excluded"]
         unsupported = scan_coverage.get("unsupported", {})
+        pruned = scan_coverage.get("pruned", {}).get("total", 0)
         summary_table.add_row(
             "Scan Coverage",
             (
                 f"analyzed={analyzed['total']}, excluded={excluded['total']} supported source files, "
                 f"unsupported={unsupported.get('total', 0)}"
+                + (f", pruned={pruned} dependency/build directories" if pruned else "")
             ),
         )
+        cache_tiers = scan_coverage.get("analysis_cache")
+        if cache_tiers:
+            summary_table.add_row(
+                "Analysis Cache", ", ".join(f"{k}={v}" for k, v in cache_tiers.items())
+            )
     ml_scoring = getattr(result, "ml_scoring", {})
     if ml_scoring:
         style = "green" if ml_scoring["status"] == "available" else "yellow"
@@ -81,16 +81,23 @@ def _text_project_section(result) -> list:
         "Project Metrics:",
     ]
     if scan_coverage:
+        pruned = scan_coverage.get("pruned", {}).get("total", 0)
         lines += [
             (
                 "Scan Coverage: "
                 f"analyzed={scan_coverage['analyzed']['total']}, "
                 f"excluded={excluded['total']} supported source files, "
                 f"unsupported={unsupported.get('total', 0)}"
+                + (f", pruned={pruned} dependency/build directories" if pruned else "")
             ),
             "  Excluded paths and matching rules are available in JSON output.",
-            "",
         ]
+        cache_tiers = scan_coverage.get("analysis_cache")
+        if cache_tiers:
+            lines.append(
+                "  Analysis cache: " + ", ".join(f"{k}={v}" for k, v in cache_tiers.items())
+            )
+        lines.append("")
     if ml_scoring:
         lines += [f"ML Scoring: {ml_scoring['status'].upper()} (optional secondary signal)"]
         if ml_scoring.get("reason"):
@@ -0,0 +1,210 @@
+"""Shared per-file view of source text, built once and reused by every analyzer."""
+
+from __future__ import annotations
+
+import ast
+import re
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from slop_detector.metrics.complexity import ComplexityReport
+
+LINE_BLANK = 0
+LINE_COMMENT = 1
+LINE_CODE = 2
+
+# Line boundaries recognised by str.splitlines() beyond "\n" and "\r\n".
+_IRREGULAR_BREAK_RE = re.compile("\r(?!\n)|[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+@dataclass(frozen=True)
+class FunctionSpan:
+    """Line span of one ``def`` / ``async def``; ``start`` includes decorators."""
+
+    name: str
+    lineno: int
+    end_lineno: int
+    start: int
+    node: ast.FunctionDef | ast.AsyncFunctionDef
+
+
+def index_tree(tree: Optional[ast.AST]) -> Tuple[Tuple[FunctionSpan, ...], Counter]:
+    """Walk ``tree`` once, returning function spans (walk order) and a node-type histogram."""
+    functions: List[FunctionSpan] = []
+    histogram: Counter = Counter()
+    if tree is None:
+        return (), histogram
+    for node in ast.walk(tree):
+        histogram[type(node)] += 1
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            end = node.end_lineno if node.end_lineno is not None else node.lineno
+            start = (
+                min(d.lineno for d in node.decorator_list) if node.decorator_list else node.lineno
+            )
+            functions.append(FunctionSpan(node.name, node.lineno, end, start, node))
+    return tuple(functions), histogram
+
+
+def function_scope_map(
+    ranges: Sequence[Tuple[int, int]], line_count: int
+) -> Dict[int, Optional[Tuple[int, int]]]:
+    """Map each 1-based line to the innermost ``(start, end)`` range containing it.
+
+    Innermost means the latest start; among equal starts the shortest range
+    wins. Lines outside every range map to ``None``.
+    """
+    scope_map: Dict[int, Optional[Tuple[int, int]]] = dict.fromkeys(range(1, line_count + 1))
+    for start, end in sorted(ranges):
+        scope = (start, end)
+        for line_idx in range(max(start, 1), min(end, line_count) + 1):
+            current = scope_map[line_idx]
+            if current is None or start > current[0]:
+                scope_map[line_idx] = scope
+    return scope_map
+
+
+class SourceContext:
+    """Line table and indexes for one file, computed lazily and at most once.
+
+    ``lines`` follows ``str.splitlines()`` and ``raw_lines`` follows
+    ``content.split("\\n")`` so every analyzer keeps the line convention it
+    has always used. Classification (blank / comment / code) is over
+    ``lines``. Function spans and the node-type histogram come from a single
+    walk of ``tree`` and are empty when no tree is given; ``complexity`` is
+    computed from the same tree on first use.
+    """
+
+    def __init__(self, content: str, tree: Optional[ast.AST] = None):
+        self.content = content
+        self.tree = tree
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.content.splitlines()
+
+    @cached_property
+    def raw_lines(self) -> List[str]:
+        return self.content.split("\n")
+
+    @cached_property
+    def stripped_lines(self) -> List[str]:
+        return [line.strip() for line in self.lines]
+
+    @cached_property
+    def raw_stripped_lines(self) -> List[str]:
+        """``line.strip()`` for each entry of ``raw_lines``."""
+        if _IRREGULAR_BREAK_RE.search(self.content) is None:
+            # Only "\n" / "\r\n" breaks: the two tables agree once stripped,
+            # apart from the trailing empty entry split("\n") may add.
+            stripped = self.stripped_lines
+            return stripped + [""] * (self.content.count("\n") + 1 - len(stripped))
+        return [line.strip() for line in self.raw_lines]
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        """Character offset at which each ``raw_lines`` entry starts."""
+        offsets = [0]
+        position = 0
+        for line in self.raw_lines[:-1]:
+            position += len(line) + 1
+            offsets.append(position)
+        return offsets
+
+    def line_at_offset(self, offset: int) -> int:
+        """Return the 1-based ``raw_lines`` number containing character ``offset``."""
+        return bisect_right(self.line_offsets, offset)
+
+    def line(self, lineno: int) -> str:
+        """Return line ``lineno`` (1-based) of ``lines``, or ``""`` when out of range."""
+        if 1 <= lineno <= len(self.lines):
+            return self.lines[lineno - 1]
+        return ""
+
+    @cached_property
+    def line_kinds(self) -> List[int]:
+        """``LINE_BLANK`` / ``LINE_COMMENT`` / ``LINE_CODE`` for each entry of ``lines``."""
+        return [
+            LINE_BLANK if not s else LINE_COMMENT if s.startswith("#") else LINE_CODE
+            for s in self.stripped_lines
+        ]
+
+    @cached_property
+    def _code_prefix(self) -> List[int]:
+        prefix = [0]
+        total = 0
+        for kind in self.line_kinds:
+            total += kind == LINE_CODE
+            prefix.append(total)
+        return prefix
+
+    def code_line_count(self, start: int = 1, end: Optional[int] = None) -> int:
+        """Count code lines in ``lines[start - 1 : end]`` (1-based, inclusive end)."""
+        count = len(self.lines)
+        lo = min(max(start - 1, 0), count)
+        hi = count if end is None else min(max(end, 0), count)
+        if hi <= lo:
+            return 0
+        return self._code_prefix[hi] - self._code_prefix[lo]
+
+    def comment_lines(self) -> Iterator[Tuple[int, str]]:
+        """Yield ``(lineno, line)`` for every comment-only line."""
+        for index, kind in enumerate(self.line_kinds):
+            if kind == LINE_COMMENT:
+                yield index + 1, self.lines[index]
+
+    @cached_property
+    def _tree_index(self) -> Tuple[Tuple[FunctionSpan, ...], Counter]:
+        return index_tree(self.tree)
+
+    @property
+    def functions(self) -> Tuple[FunctionSpan, ...]:
+        """Every function definition in ``ast.walk`` order."""
+        return self._tree_index[0]
+
+    @property
+    def node_histogram(self) -> Counter:
+        """Number of nodes of each AST node class in ``tree``."""
+        return self._tree_index[1]
+
+    def node_count(self, *node_types: type) -> int:
+        """Total number of nodes whose exact class is one of ``node_types``."""
+        histogram = self.node_histogram
+        return sum(histogram[node_type] for node_type in node_types)
+
+    @cached_property
+    def _function_names_by_line(self) -> Dict[int, str]:
+        names: Dict[int, str] = {}
+        for span in self.functions:
+            names.setdefault(span.lineno, span.name)
+        return names
+
+    def function_name_at_line(self, lineno: int) -> Optional[str]:
+        """Return the name of the first function whose ``def`` is on ``lineno``."""
+        return self._function_names_by_line.get(lineno)
+
+    @cached_property
+    def complexity(self) -> ComplexityReport:
+        """Radon-compatible McCabe complexity for every function in ``tree``."""
+        from slop_detector.metrics.complexity import ComplexityReport
+
+        return ComplexityReport(self.tree)
+
+    @cached_property
+    def function_scopes(self) -> Dict[int, Optional[Tuple[int, int]]]:
+        """Innermost decorated function ``(start, end)`` for each line of ``lines``."""
+        return function_scope_map(
+            [(span.start, span.end_lineno) for span in self.functions], len(self.lines)
+        )
+
+
+def source_context_for(
+    content: str, tree: Optional[ast.AST] = None, source: Optional[SourceContext] = None
+) -> SourceContext:
+    """Reuse ``source`` when it describes ``content`` (and ``tree``), else build a new one."""
+    if source is not None and source.content is content and (tree is None or source.tree is tree):
+        return source
+    return SourceContext(content, tree)
@@ -6,6 +6,7 @@ import re
 from typing import List, Optional
 
 from slop_detector.models import SuppressionDirective, SuppressionLedgerEntry
+from slop_detector.source_context import SourceContext, source_context_for
 
 _SUPPRESSION_RE = re.compile(r"^\s*#\s*slop-(disable-next-line|disable|enable)\b(?:\s+(.+?))?\s*$")
 
@@ -14,9 +15,12 @@ class SuppressionHandler:
     """Parses and applies inline comment-based suppressions."""
 
     @staticmethod
-    def parse_comment_suppressions(content: str) -> List[SuppressionDirective]:
+    def parse_comment_suppressions(
+        content: str, source: Optional[SourceContext] = None
+    ) -> List[SuppressionDirective]:
         directives: List[SuppressionDirective] = []
-        for lineno, line in enumerate(content.splitlines(), start=1):
+        # Directives must start the line after indentation, so only comment lines qualify.
+        for lineno, line in source_context_for(content, None, source).comment_lines():
             match = _SUPPRESSION_RE.match(line)
             if not match:
                 continue
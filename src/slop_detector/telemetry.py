@@ -5,7 +5,6 @@ from __future__ import annotations
 import hashlib
 import json
 import os
-import platform
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -46,6 +45,8 @@ def _issue_count_from_result(result: Any) -> int:
 
 
 def _analysis_payload(command: str, result: Any, project_root: Path) -> Dict[str, Any]:
+    import platform  # only when a payload is actually built; slow to import
+
     if hasattr(result, "file_results"):
         analysis = {
             "project_mode": True,
@@ -207,11 +208,12 @@ class TelemetryManager:
         }
 
     def capture(self, command: str, result: Any, project_root: Path) -> Optional[Dict[str, Any]]:
+        inspect = os.getenv("AI_SLOP_DETECTOR_TELEMETRY", "").strip().lower() == "inspect"
+        if not inspect and not self._load_config().get("enabled", False):
+            return None
         payload = self.build_payload(command, result, project_root)
-        if os.getenv("AI_SLOP_DETECTOR_TELEMETRY", "").strip().lower() == "inspect":
+        if inspect:
             return payload
-        if not self._load_config().get("enabled", False):
-            return None
         queue_path = self._queue_path()
         queue_path.parent.mkdir(parents=True, exist_ok=True)
         with queue_path.open("a", encoding="utf-8") as handle:
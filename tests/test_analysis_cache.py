@@ -1,11 +1,21 @@
 """Tests for SQLite-backed repeated-run file analysis cache."""
 
+import os
+import pickle
+import sqlite3
 from hashlib import sha256
+from pathlib import Path
+
+import pytest
 
 from slop_detector.analysis_cache import (
     CACHE_ENGINE_VERSION,
+    CODEC_JSON,
     FileAnalysisCache,
+    LazySection,
+    decode_file_analysis,
     deserialize_file_analysis,
+    encode_file_analysis,
     fingerprint_config,
     serialize_file_analysis,
 )
@@ -104,7 +114,7 @@ def test_analyze_file_invalidates_cache_when_config_changes(tmp_path, monkeypatc
 
     detector_b = SlopDetector()
     detector_b._analysis_cache = FileAnalysisCache(cache_db)
-    detector_b.config.config["weights"]["ldr"] = 0.55
+    detector_b.config.config["thresholds"]["ldr"]["critical"] = 0.35
 
     calls = {"count": 0}
     original = detector_b.ldr_calc.calculate
@@ -175,3 +185,939 @@ def test_analyze_project_reuses_cached_results_for_unchanged_files(tmp_path, mon
     detector.analyze_project(str(tmp_path))
 
     assert calls["count"] == 1
+
+
+def test_cache_round_trip_shares_one_path_per_file(tmp_path):
+    file_path = tmp_path / "sample.py"
+    file_path.write_text(
+        "def a():\n    try:\n        pass\n    except:\n        pass\n"
+        "def b():\n    try:\n        pass\n    except:\n        pass\n",
+        encoding="utf-8",
+    )
+    result = SlopDetector().analyze_file(str(file_path))
+    restored = deserialize_file_analysis(serialize_file_analysis(result))
+
+    assert len(restored.pattern_issues) >= 2
+    assert len({id(issue.file) for issue in restored.pattern_issues}) == 1
+    assert [i.to_dict() for i in restored.pattern_issues] == [
+        i.to_dict() for i in result.pattern_issues
+    ]
+
+
+def _put_sample(cache, file_path, fingerprint="fp"):
+    result = SlopDetector().analyze_file(str(file_path))
+    stat = file_path.stat()
+    key = dict(
+        file_path=str(file_path.resolve()),
+        file_size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        content_hash=sha256(file_path.read_bytes()).hexdigest(),
+        config_fingerprint=fingerprint,
+    )
+    cache.put(result=result, **key)
+    return key
+
+
+def _statements(cache):
+    executed = []
+    cache._connection().set_trace_callback(executed.append)
+    return executed
+
+
+def test_cache_uses_one_wal_connection(tmp_path):
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+
+    key = _put_sample(cache, file_path)
+    conn = cache._connection()
+    assert cache.get(**key) is not None
+    assert cache._connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_session_prefetches_rows_and_batches_writes(tmp_path):
+    db_path = tmp_path / "analysis_cache.db"
+    cache = FileAnalysisCache(db_path)
+    cached_file = tmp_path / "cached.py"
+    new_file = tmp_path / "new.py"
+    cached_file.write_text("def a():\n    return 1\n", encoding="utf-8")
+    new_file.write_text("def b():\n    return 2\n", encoding="utf-8")
+    cached_key = _put_sample(cache, cached_file)
+    new_result = SlopDetector().analyze_file(str(new_file))
+    new_key = dict(cached_key, file_path=str(new_file.resolve()))
+
+    executed = _statements(cache)
+    with cache.session([cached_key["file_path"], new_key["file_path"]], "fp"):
+        prefetch_statements = len(executed)
+        assert cache.get(**cached_key) is not None
+        assert cache.get(**new_key) is None
+        cache.put(result=new_result, **new_key)
+        assert len(executed) == prefetch_statements
+        assert FileAnalysisCache(db_path).get(**new_key) is None
+
+    assert sum("SELECT" in statement for statement in executed) == 1
+    assert FileAnalysisCache(db_path).get(**new_key) is not None
+
+
+def test_session_prefetch_respects_key_and_fingerprint(tmp_path):
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    key = _put_sample(cache, file_path)
+
+    with cache.session([key["file_path"]], "other-fp"):
+        assert cache.get(**dict(key, config_fingerprint="other-fp")) is None
+    with cache.session([key["file_path"]], "fp"):
+        assert cache.get(**dict(key, content_hash="0" * 64)) is None
+
+
+def test_analyze_project_fingerprints_config_once_per_scan(tmp_path, monkeypatch):
+    import slop_detector.core as core_module
+
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(tmp_path / "cache" / "analysis_cache.db")
+    detector.config.config["ignore"] = []
+    project = tmp_path / "project"
+    project.mkdir()
+    for index in range(4):
+        (project / f"m{index}.py").write_text(f"def f():\n    return {index}\n", encoding="utf-8")
+    calls = {"count": 0}
+    original = core_module.fingerprint_config
+
+    def counting(config):
+        calls["count"] += 1
+        return original(config)
+
+    monkeypatch.setattr(core_module, "fingerprint_config", counting)
+    cold = detector.analyze_project(str(project), max_workers=1)
+    warm = detector.analyze_project(str(project), max_workers=1)
+
+    assert calls["count"] == 2
+    assert [r.to_dict() for r in warm.file_results] == [r.to_dict() for r in cold.file_results]
+
+    detector.analyze_file(str(project / "m0.py"))
+    assert calls["count"] == 3
+
+
+def _stat_detector(cache_db, verify_rate=0.0):
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(cache_db)
+    detector.config.config["advanced"]["analysis_cache_trust"] = "stat"
+    detector.config.config["advanced"]["analysis_cache_verify_rate"] = verify_rate
+    return detector
+
+
+def _forbid_reads(monkeypatch):
+    def explode(self):
+        raise AssertionError("stat-trusted hit should not read the file")
+
+    monkeypatch.setattr(type(Path()), "read_bytes", explode)
+
+
+def test_stat_trust_serves_hits_without_reading(tmp_path, monkeypatch):
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    detector = _stat_detector(tmp_path / "analysis_cache.db")
+    first = detector.analyze_file(str(file_path))
+
+    _forbid_reads(monkeypatch)
+    second = detector.analyze_file(str(file_path))
+
+    assert first.cache_tier == "miss"
+    assert second.cache_tier == "stat"
+    assert second.to_dict() == first.to_dict()
+
+
+def test_hash_trust_is_the_default(tmp_path):
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+
+    detector.analyze_file(str(file_path))
+
+    assert detector.config.get_analysis_cache_trust() == "hash"
+    assert detector.analyze_file(str(file_path)).cache_tier == "hash"
+
+
+def test_stat_trust_records_inode_for_rows_written_without_one(tmp_path, monkeypatch):
+    cache_db = tmp_path / "analysis_cache.db"
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    _put_sample(
+        FileAnalysisCache(cache_db),
+        file_path,
+        fingerprint=fingerprint_config(SlopDetector().config.config),
+    )
+    detector = _stat_detector(cache_db)
+
+    assert detector.analyze_file(str(file_path)).cache_tier == "hash"
+    _forbid_reads(monkeypatch)
+    assert detector.analyze_file(str(file_path)).cache_tier == "stat"
+
+
+def test_verification_sample_catches_content_change_behind_unchanged_stat(tmp_path, caplog):
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    detector = _stat_detector(tmp_path / "analysis_cache.db", verify_rate=1.0)
+    detector.analyze_file(str(file_path))
+    assert detector.analyze_file(str(file_path)).cache_tier == "verified"
+
+    stat = file_path.stat()
+    with open(file_path, "r+b") as handle:  # same size, same inode
+        handle.write(b"def sub")
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    changed = detector.analyze_file(str(file_path))
+
+    assert changed.cache_tier == "stale"
+    assert "no longer matches its content" in caplog.text
+    assert detector.analyze_file(str(file_path)).cache_tier == "verified"
+
+
+def test_project_scan_reports_cache_tiers(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.py").write_text("def a():\n    return 1\n", encoding="utf-8")
+    (project / "b.py").write_text("def b():\n    return 2\n", encoding="utf-8")
+    detector = _stat_detector(tmp_path / "cache" / "analysis_cache.db")
+    detector.config.config["ignore"] = []
+
+    cold = detector.analyze_project(str(project), max_workers=1)
+    (project / "b.py").write_text("def b():\n    return 20\n", encoding="utf-8")
+    warm = detector.analyze_project(str(project), max_workers=1)
+
+    assert cold.scan_coverage["analysis_cache"] == {
+        "stat": 0,
+        "hash": 0,
+        "content": 0,
+        "stages": 0,
+        "functions": 0,
+        "verified": 0,
+        "stale": 0,
+        "miss": 2,
+    }
+    assert warm.scan_coverage["analysis_cache"]["stat"] == 1
+    assert warm.scan_coverage["analysis_cache"]["miss"] == 1
+
+    detector._analysis_cache = None
+    uncached = detector.analyze_project(str(project), max_workers=1)
+    assert "analysis_cache" not in uncached.scan_coverage
+
+
+def test_cache_adds_inode_column_to_existing_database(tmp_path):
+    cache_db = tmp_path / "analysis_cache.db"
+    with sqlite3.connect(cache_db) as conn:
+        conn.execute(
+            "CREATE TABLE file_analysis_cache (file_path TEXT PRIMARY KEY, "
+            "file_size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, sha256 TEXT NOT NULL, "
+            "engine_version TEXT NOT NULL, config_fingerprint TEXT NOT NULL, "
+            "result_json TEXT NOT NULL)"
+        )
+    conn.close()
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+
+    cache = FileAnalysisCache(cache_db)
+    key = _put_sample(cache, file_path)
+
+    assert cache.get(**key) is not None
+    stat = file_path.stat()
+    assert (
+        cache.get_by_stat(key["file_path"], stat.st_size, stat.st_mtime_ns, stat.st_ino, "fp")
+        is None
+    )
+
+
+CORPUS_FILE = Path(__file__).parent / "corpus" / "test_case_1_ai_slop.py"
+
+
+def test_binary_codec_round_trip_matches_json(tmp_path):
+    result = SlopDetector().analyze_file(str(CORPUS_FILE))
+    payload = encode_file_analysis(result)
+    restored = decode_file_analysis(payload)
+
+    assert payload.startswith(b"SLFA")
+    assert len(payload) < len(serialize_file_analysis(result).encode("utf-8")) / 2
+    assert (
+        restored.to_dict() == deserialize_file_analysis(serialize_file_analysis(result)).to_dict()
+    )
+    assert restored.docstring_inflation == result.docstring_inflation
+    assert [i.to_dict() for i in restored.pattern_issues] == [
+        i.to_dict() for i in result.pattern_issues
+    ]
+
+
+def test_binary_codec_decodes_sections_only_when_touched():
+    restored = decode_file_analysis(
+        encode_file_analysis(SlopDetector().analyze_file(str(CORPUS_FILE)))
+    )
+    sections = [restored.docstring_inflation, restored.hallucination_deps, restored.context_jargon]
+
+    assert all(isinstance(section, LazySection) for section in sections)
+    restored.to_dict()
+    assert all(section._value is None for section in sections)
+
+    details = restored.docstring_inflation.details
+    assert details and all(hasattr(detail, "inflation_ratio") for detail in details)
+    assert restored.docstring_inflation._value is not None
+    assert restored.context_jargon._value is None
+
+
+def test_lazy_sections_survive_pickling():
+    restored = decode_file_analysis(
+        encode_file_analysis(SlopDetector().analyze_file(str(CORPUS_FILE)))
+    )
+    restored.hallucination_deps.status  # materialize one section only
+    copied = pickle.loads(pickle.dumps(restored))
+
+    assert copied.to_dict() == restored.to_dict()
+    assert copied.context_jargon.evidence_details == restored.context_jargon.evidence_details
+
+
+def test_cache_reads_rows_of_either_codec(tmp_path):
+    cache_db = tmp_path / "analysis_cache.db"
+    file_path = tmp_path / "sample.py"
+    file_path.write_text(CORPUS_FILE.read_text(encoding="utf-8"), encoding="utf-8")
+
+    key = _put_sample(FileAnalysisCache(cache_db, codec=CODEC_JSON), file_path)
+    from_json = FileAnalysisCache(cache_db).get(**key)
+    key = _put_sample(FileAnalysisCache(cache_db), file_path)
+    from_binary = FileAnalysisCache(cache_db, codec=CODEC_JSON).get(**key)
+
+    assert from_json is not None and from_binary is not None
+    assert from_json.to_dict() == from_binary.to_dict()
+
+
+def test_unreadable_binary_rows_are_cache_misses(tmp_path):
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    key = _put_sample(cache, file_path)
+
+    for payload in (b"SLFA\x63" + b"future", b"SLFA\x01" + b"not zlib"):
+        with cache._conn() as conn:
+            conn.execute("UPDATE file_analysis_cache SET result_json = ?", (payload,))
+        assert cache.get(**key) is None
+
+
+def _fill_synthetic(cache, count, file_path):
+    result = SlopDetector().analyze_file(str(file_path))
+    keys = []
+    for index in range(count):
+        key = dict(
+            file_path=f"/synthetic/module_{index}.py",
+            file_size=index,
+            mtime_ns=index,
+            content_hash="0",
+            config_fingerprint="fp",
+        )
+        cache.put(result=result, **key)
+        keys.append(key)
+    with cache._conn() as conn:
+        conn.executemany(
+            "UPDATE file_analysis_cache SET last_access = ? WHERE file_path = ?",
+            [(index + 1, key["file_path"]) for index, key in enumerate(keys)],
+        )
+    return keys
+
+
+def _cached_paths(cache):
+    with cache._conn() as conn:
+        return {row[0] for row in conn.execute("SELECT file_path FROM file_analysis_cache")}
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path):
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db", max_entries=10)
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    keys = _fill_synthetic(cache, 12, file_path)
+    assert cache.get(**keys[0]) is not None
+
+    assert cache.evict() == 3
+    assert _cached_paths(cache) == {keys[0]["file_path"]} | {key["file_path"] for key in keys[4:]}
+    assert cache.evict() == 0
+    assert cache.stats()["evictions"] == 3
+
+
+def test_eviction_keeps_database_within_size_limit(tmp_path):
+    max_bytes = 128 * 1024
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db", max_bytes=max_bytes)
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    keys = _fill_synthetic(cache, 300, file_path)
+    assert cache.stats()["used_bytes"] > max_bytes
+
+    evicted = cache.evict()
+
+    stats = cache.stats()
+    assert 0 < evicted < len(keys)
+    assert stats["used_bytes"] <= max_bytes
+    assert stats["entries"] == len(keys) - evicted
+    assert keys[-1]["file_path"] in _cached_paths(cache)
+
+
+def test_stats_report_hit_ratio_including_session_lookups(tmp_path):
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    file_path = tmp_path / "sample.py"
+    file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    key = _put_sample(cache, file_path)
+
+    assert cache.get(**key) is not None
+    with cache.session([key["file_path"]], "fp"):
+        assert cache.get(**dict(key, content_hash="0" * 64)) is None
+    stats = FileAnalysisCache(tmp_path / "analysis_cache.db").stats()
+
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_ratio"] == 0.5
+    assert stats["size_bytes"] > 0
+
+
+def test_analyze_project_evicts_in_the_background(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    for index in range(4):
+        (project / f"module_{index}.py").write_text(
+            f"def f{index}():\n    return {index}\n", encoding="utf-8"
+        )
+    detector = SlopDetector()
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db", max_entries=2)
+    detector._analysis_cache = cache
+
+    detector.analyze_project(str(project))
+    cache._eviction_thread.join(timeout=30)
+
+    assert not cache._eviction_thread.is_alive()
+    assert cache.stats()["entries"] <= 2
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_locked_cache_does_not_fail_the_scan(tmp_path, monkeypatch, caplog, max_workers):
+    monkeypatch.setattr("slop_detector.analysis_cache._BUSY_TIMEOUT_S", 0.05)
+    project = tmp_path / "project"
+    project.mkdir()
+    for index in range(3):
+        (project / f"module_{index}.py").write_text(
+            f"def f{index}():\n    return {index}\n", encoding="utf-8"
+        )
+    detector = SlopDetector()
+    detector.config.config["ignore"] = []
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    detector._analysis_cache = cache
+    other = sqlite3.connect(cache.db_path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        result = detector.analyze_project(str(project), max_workers=max_workers)
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+
+    assert result.total_files == 3
+    assert cache.stats()["entries"] == 0
+    if max_workers == 1:
+        assert "Analysis cache write failed" in caplog.text
+
+
+def test_cache_command_prunes_vacuums_and_clears(tmp_path, capsys):
+    import json
+
+    from slop_detector.cli import main
+
+    cache_db = tmp_path / "analysis_cache.db"
+    config_path = tmp_path / ".slopconfig.yaml"
+    config_path.write_text(f"advanced:\n  analysis_cache_db: '{cache_db}'\n", encoding="utf-8")
+    cache = FileAnalysisCache(cache_db)
+    kept = tmp_path / "kept.py"
+    deleted = tmp_path / "deleted.py"
+    for file_path in (kept, deleted):
+        file_path.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+        _put_sample(cache, file_path)
+    cache.close()
+    deleted.unlink()
+
+    def run(action):
+        capsys.readouterr()
+        assert main(["cache", action, "--config", str(config_path), "--json"]) == 0
+        return json.loads(capsys.readouterr().out)
+
+    assert run("stats")["entries"] == 2
+    assert run("prune") == {"missing": 1, "outdated": 0, "evicted": 0}
+    assert run("stats")["entries"] == 1
+    assert set(run("vacuum")) == {"size_before", "size_after"}
+    assert run("clear")["removed"] == 1
+    assert run("stats")["entries"] == 0
+
+
+def _checkout(root, source):
+    package = root / "pkg"
+    package.mkdir(parents=True)
+    (package / "module.py").write_text(
+        source + "\n\ndef noop(items=[]):\n    # slop-disable-next-line mutable_default_arg\n"
+        "    return items\n\n\n# slop-disable-next-line mutable_default_arg\n"
+        "def keep(items=[]):\n    return items\n",
+        encoding="utf-8",
+    )
+    (package / "helpers.py").write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    return package
+
+
+def test_identical_content_is_shared_across_checkouts(tmp_path, monkeypatch):
+    source = CORPUS_FILE.read_text(encoding="utf-8")
+    first = _checkout(tmp_path / "first", source)
+    second = _checkout(tmp_path / "second", source)
+    cache_db = tmp_path / "analysis_cache.db"
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(cache_db)
+    detector.analyze_project(str(first.parent))
+
+    reference = SlopDetector()
+    reference._analysis_cache = None
+    expected = {p.name: reference.analyze_file(str(p)) for p in sorted(second.glob("*.py"))}
+
+    def explode(*args, **kwargs):
+        raise AssertionError("identical content should be served from the cache")
+
+    monkeypatch.setattr(detector, "_build_file_analysis", explode)
+    for path in sorted(second.glob("*.py")):
+        result = detector.analyze_file(str(path))
+        assert result.cache_tier == "content"
+        assert result.to_dict() == expected[path.name].to_dict()
+    module = detector.analyze_file(str(second / "module.py"))
+    assert module.suppression_ledger
+    assert {str(issue.file) for issue in module.pattern_issues} | {
+        entry.file_path for entry in module.suppression_ledger
+    } == {str((second / "module.py").resolve())}
+
+    # The copy now has its own entry and hits by path from here on.
+    assert module.cache_tier == "hash"
+
+
+def test_content_is_not_shared_across_path_roles(tmp_path):
+    source = "def add(a, b):\n    return a + b\n"
+    package = tmp_path / "pkg"
+    tests_dir = tmp_path / "tests"
+    for directory in (package, tests_dir):
+        directory.mkdir()
+        (directory / "calc.py").write_text(source, encoding="utf-8")
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+
+    detector.analyze_file(str(package / "calc.py"))
+    moved = detector.analyze_file(str(tests_dir / "calc.py"))
+
+    assert moved.cache_tier == "miss"
+    assert detector._path_role_key(str(package / "calc.py")) != detector._path_role_key(
+        str(tests_dir / "calc.py")
+    )
+
+
+def test_content_hit_replaces_the_path_miss_in_stats(tmp_path):
+    source = "def add(a, b):\n    return a + b\n"
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "calc.py").write_text(source, encoding="utf-8")
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    detector = SlopDetector()
+    detector._analysis_cache = cache
+
+    detector.analyze_file(str(tmp_path / "a" / "calc.py"))
+    assert detector.analyze_file(str(tmp_path / "b" / "calc.py")).cache_tier == "content"
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (2, 1, 1)
+
+
+def _stage_detectors(tmp_path, configure):
+    """A detector that filled the cache, one under a changed config, and its uncached twin."""
+    cache_db = tmp_path / "analysis_cache.db"
+    warm = SlopDetector()
+    warm._analysis_cache = FileAnalysisCache(cache_db)
+    warm.analyze_file(str(CORPUS_FILE))
+    changed, reference = SlopDetector(), SlopDetector()
+    for detector in (changed, reference):
+        configure(detector.config.config)
+        detector._build_analyzers()
+    changed._analysis_cache = FileAnalysisCache(cache_db)
+    reference._analysis_cache = None
+    return changed, reference
+
+
+def test_weight_change_rescores_from_cached_stages(tmp_path, monkeypatch):
+    changed, reference = _stage_detectors(
+        tmp_path, lambda config: config["weights"].update(ldr=0.55)
+    )
+    expected = reference.analyze_file(str(CORPUS_FILE)).to_dict()
+
+    def explode(*args, **kwargs):
+        raise AssertionError("only scoring should rerun after a weight change")
+
+    monkeypatch.setattr(changed.ldr_calc, "calculate", explode)
+    monkeypatch.setattr(changed.pattern_registry, "check_all", explode)
+    monkeypatch.setattr("slop_detector.core.ast.parse", explode)
+    result = changed.analyze_file(str(CORPUS_FILE))
+
+    assert result.cache_tier == "stages"
+    assert {**result.to_dict(), "cache_tier": None} == {**expected, "cache_tier": None}
+
+
+def test_pattern_config_change_reruns_only_that_pattern(tmp_path, monkeypatch):
+    changed, reference = _stage_detectors(
+        tmp_path,
+        lambda config: config["patterns"]["god_function"].update(lines_threshold=5),
+    )
+    expected = reference.analyze_file(str(CORPUS_FILE)).to_dict()
+    runs = []
+
+    def recording(name):
+        original = getattr(changed.pattern_registry, name)
+
+        def run(*args, only=None, **kwargs):
+            runs.append((name, sorted(only)))
+            return original(*args, only=only, **kwargs)
+
+        return run
+
+    for name in ("check_all", "check_scoped"):
+        monkeypatch.setattr(changed.pattern_registry, name, recording(name))
+    monkeypatch.setattr(changed.ldr_calc, "calculate", lambda *args: pytest.fail("ldr reran"))
+    result = changed.analyze_file(str(CORPUS_FILE))
+
+    assert runs == [("check_scoped", ["god_function"])]
+    assert {**result.to_dict(), "cache_tier": None} == {**expected, "cache_tier": None}
+
+
+def test_edited_file_reuses_findings_of_unchanged_definitions(tmp_path, monkeypatch):
+    file_path = tmp_path / "slop.py"
+    source = CORPUS_FILE.read_text(encoding="utf-8")
+    file_path.write_text(source, encoding="utf-8")
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    detector.analyze_file(str(file_path))
+
+    # Shift every definition down and touch one of them.
+    lines = source.splitlines()
+    first = next(i for i, line in enumerate(lines) if line.startswith("def "))
+    lines[first + 1 : first + 1] = ["    # TODO: revisit this robust, seamless helper"]
+    file_path.write_text("\n\n" + "\n".join(lines) + "\n", encoding="utf-8")
+    checked = []
+    original = detector.pattern_registry.check_scoped
+
+    def recording(*args, skip=(), **kwargs):
+        checked.append(len(skip))
+        return original(*args, skip=skip, **kwargs)
+
+    monkeypatch.setattr(detector.pattern_registry, "check_scoped", recording)
+    result = detector.analyze_file(str(file_path))
+    detector._analysis_cache = None
+    expected = detector.analyze_file(str(file_path))
+
+    assert result.cache_tier == "functions"
+    assert checked and checked[0] > 0
+    assert {**result.to_dict(), "cache_tier": None} == {**expected.to_dict(), "cache_tier": None}
+
+
+@pytest.mark.parametrize("limits", [{"max_entries": 1}, {"max_bytes": 100_000}])
+def test_repeated_edits_leave_no_orphaned_stage_entries(tmp_path, limits):
+    file_path = tmp_path / "slop.py"
+    source = CORPUS_FILE.read_text(encoding="utf-8")
+    cache_db = tmp_path / "analysis_cache.db"
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(cache_db)
+    for edit in range(30):
+        file_path.write_text(f"{source}\nEDIT = {edit}\n", encoding="utf-8")
+        detector.analyze_file(str(file_path))
+
+    # Only the stages of the path's current content remain; they seed the next edit.
+    assert detector._analysis_cache.stats()["stage_entries"] == 1
+    cache = FileAnalysisCache(cache_db, **limits)
+    cache.evict()
+
+    stats = cache.stats()
+    assert stats["entries"] <= 1
+    assert stats["stage_entries"] == stats["entries"]
+    assert stats["used_bytes"] <= 100_000
+
+
+def test_unchanged_project_reuses_cached_aggregates(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    project.mkdir()
+    for name in ("a", "b", "c"):
+        (project / f"{name}.py").write_text(
+            CORPUS_FILE.read_text(encoding="utf-8") + f"\n{name} = 1\n"
+        )
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    detector.config.config["ignore"] = []
+    cold = detector.analyze_project(str(project), max_workers=1)
+
+    def explode(*args, **kwargs):
+        raise AssertionError("aggregates of an unchanged project should come from the cache")
+
+    monkeypatch.setattr(detector, "_estimate_coherence_vr", explode)
+    monkeypatch.setattr(detector.project_prioritizer, "_rank", explode)
+    warm = detector.analyze_project(str(project), max_workers=1)
+
+    assert cold.priority_hotspots
+    assert warm.structural_coherence == cold.structural_coherence
+    assert warm.coherence_level == cold.coherence_level
+    assert [item.to_dict() for item in warm.priority_hotspots] == [
+        item.to_dict() for item in cold.priority_hotspots
+    ]
+
+    (project / "c.py").write_text("def c():\n    return 3\n", encoding="utf-8")
+    with pytest.raises(AssertionError, match="from the cache"):
+        detector.analyze_project(str(project), max_workers=1)
+
+
+def test_edited_project_coherence_matches_an_uncached_scan(tmp_path):
+    pytest.importorskip("numpy")
+    project = tmp_path / "project"
+    project.mkdir()
+    for index in range(12):
+        body = "".join(f"def f{n}(x):\n    return x + {n}\n" for n in range(index % 4 + 1))
+        (project / f"m{index}.py").write_text(body + "class C:\n    pass\n" * (index % 3))
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    detector.config.config["ignore"] = []
+    detector.analyze_project(str(project), max_workers=1)
+    topology = detector._analysis_cache.get_aggregate("coherence_topology", str(project.resolve()))
+
+    (project / "m5.py").write_text("import os\n\nprint(os.sep)\n")
+    warm = detector.analyze_project(str(project), max_workers=1)
+    uncached = SlopDetector()
+    uncached._analysis_cache = None
+    uncached.config.config["ignore"] = []
+    fresh = uncached.analyze_project(str(project), max_workers=1)
+
+    assert topology is not None and len(topology[0]) == 12
+    assert warm.structural_coherence == pytest.approx(fresh.structural_coherence, abs=1e-12)
+    assert warm.coherence_level == fresh.coherence_level == "vr_structural"
+
+
+def test_sampled_coherence_leaves_the_cached_project_mst_alone(tmp_path):
+    pytest.importorskip("numpy")
+    project = tmp_path / "project"
+    project.mkdir()
+    for index in range(12):
+        body = "".join(f"def f{n}(x):\n    return x + {n}\n" for n in range(index % 4 + 1))
+        (project / f"m{index}.py").write_text(body + "class C:\n    pass\n" * (index % 3))
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    detector.config.config["ignore"] = []
+    detector.analyze_project(str(project), max_workers=1)
+    topology = detector._analysis_cache.get_aggregate("coherence_topology", str(project.resolve()))
+
+    detector.config.config["advanced"].update(
+        exact_topology_ceiling=4, topology_mode_above_ceiling="deterministic_approximate"
+    )
+    (project / "m5.py").write_text("import os\n\nprint(os.sep)\n")
+    sampled = detector.analyze_project(str(project), max_workers=1)
+
+    assert sampled.coherence_level == "vr_structural_approx"
+    assert topology is not None and len(topology[0]) == 12
+    assert (
+        detector._analysis_cache.get_aggregate("coherence_topology", str(project.resolve()))
+        == topology
+    )
+
+
+def test_bundle_seeds_a_fresh_cache_for_another_checkout(tmp_path, capsys, monkeypatch):
+    import json
+
+    from slop_detector.cli import main
+
+    source = CORPUS_FILE.read_text(encoding="utf-8")
+    main_checkout = _checkout(tmp_path / "main", source)
+    ci_checkout = _checkout(tmp_path / "ci", source)
+    configs = {}
+    for name in ("main", "ci"):
+        configs[name] = tmp_path / f"{name}.yaml"
+        configs[name].write_text(
+            f"advanced:\n  analysis_cache_db: '{tmp_path / name}.db'\n", encoding="utf-8"
+        )
+    SlopDetector(config_path=str(configs["main"])).analyze_project(str(main_checkout.parent))
+    bundle = tmp_path / "main.bundle"
+
+    def run(*args):
+        capsys.readouterr()
+        assert main(["cache", *args, "--json"]) == 0
+        return json.loads(capsys.readouterr().out)
+
+    exported = run("export", str(bundle), "--config", str(configs["main"]))
+    assert exported["entries"] == 2 and exported["stage_entries"] == 2
+    with sqlite3.connect(bundle) as conn:
+        payloads = [row[0] for row in conn.execute("SELECT result_json FROM content_entries")]
+    for payload in payloads:
+        result = decode_file_analysis(payload)
+        assert result.file_path == "<bundle>"
+        assert {str(issue.file) for issue in result.pattern_issues} <= {"<bundle>"}
+    assert run("import", str(bundle), "--config", str(configs["ci"])) == {
+        "entries": 2,
+        "stage_entries": 2,
+        "language_entries": 0,
+    }
+
+    reference = SlopDetector()
+    reference._analysis_cache = None
+    detector = SlopDetector(config_path=str(configs["ci"]))
+    monkeypatch.setattr(detector, "_build_file_analysis", lambda *args: pytest.fail("reanalyzed"))
+    for path in sorted(ci_checkout.glob("*.py")):
+        result = detector.analyze_file(str(path))
+        assert result.cache_tier == "content"
+        assert {**result.to_dict(), "cache_tier": None} == {
+            **reference.analyze_file(str(path)).to_dict(),
+            "cache_tier": None,
+        }
+
+
+def test_export_uses_the_config_of_scans_with_cli_overrides(tmp_path, capsys):
+    from slop_detector.cli import main
+
+    checkout = _checkout(tmp_path / "main", CORPUS_FILE.read_text(encoding="utf-8"))
+    config_path = tmp_path / "main.yaml"
+    config_path.write_text(
+        f"advanced:\n  analysis_cache_db: '{tmp_path / 'main.db'}'\n", encoding="utf-8"
+    )
+    main([str(checkout.parent), "--topology-mode", "exact", "--config", str(config_path)])
+    bundle = tmp_path / "main.bundle"
+
+    def export(*flags):
+        capsys.readouterr()
+        assert main(["cache", "export", str(bundle), "--config", str(config_path), *flags]) == 0
+        capsys.readouterr()
+        with sqlite3.connect(bundle) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM content_entries").fetchone()[0]
+        bundle.unlink()
+        return count
+
+    assert export() == 0
+    assert export("--topology-mode", "exact") == 2
+
+
+def test_imported_entries_are_evicted_least_recently_used_first(tmp_path):
+    checkout = _checkout(tmp_path / "main", CORPUS_FILE.read_text(encoding="utf-8"))
+    for index in range(2):
+        (checkout / f"extra_{index}.py").write_text(
+            f"def extra():\n    return {index}\n", encoding="utf-8"
+        )
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(tmp_path / "main.db")
+    detector.analyze_project(str(checkout.parent))
+    detector._analysis_cache.export_bundle(tmp_path / "main.bundle")
+    cache = FileAnalysisCache(tmp_path / "ci.db", max_entries=3)
+    cache.import_bundle(tmp_path / "main.bundle")
+    with cache._conn() as conn:
+        assert conn.execute("SELECT MIN(last_access) FROM file_analysis_content").fetchone()[0]
+        conn.execute("UPDATE file_analysis_content SET last_access = rowid")
+        imported = conn.execute(
+            "SELECT sha256, path_role, config_fingerprint FROM file_analysis_content "
+            "ORDER BY rowid"
+        ).fetchall()
+
+    assert len(imported) == 4
+    assert cache.get_by_content("/ci/pkg/module.py", *imported[0]) is not None
+    assert cache.evict() == 2
+
+    with cache._conn() as conn:
+        kept = conn.execute("SELECT sha256, path_role FROM file_analysis_content").fetchall()
+        stages = conn.execute("SELECT sha256, path_role FROM file_analysis_stages").fetchall()
+    assert sorted(kept) == sorted(row[:2] for row in (imported[0], imported[3]))
+    assert sorted(stages) == sorted(kept)
+    assert cache.stats()["hits"] == 1
+
+
+def test_bundle_results_are_only_served_in_their_environment(tmp_path, monkeypatch, caplog):
+    checkout = _checkout(tmp_path / "main", CORPUS_FILE.read_text(encoding="utf-8"))
+    detector = SlopDetector()
+    detector._analysis_cache = FileAnalysisCache(tmp_path / "main.db")
+    detector.analyze_project(str(checkout.parent))
+    bundle = tmp_path / "main.bundle"
+    monkeypatch.setattr("slop_detector.analysis_cache.import_environment_key", lambda: "py-a")
+    detector._analysis_cache.export_bundle(bundle)
+    with detector._analysis_cache._conn() as conn:
+        key = conn.execute(
+            "SELECT sha256, path_role, config_fingerprint FROM file_analysis_cache "
+            "WHERE file_path LIKE '%module.py'"
+        ).fetchone()
+
+    monkeypatch.setattr("slop_detector.analysis_cache.import_environment_key", lambda: "py-b")
+    other = FileAnalysisCache(tmp_path / "other.db")
+    assert other.import_bundle(bundle) == {
+        "entries": 0,
+        "stage_entries": 0,
+        "language_entries": 0,
+    }
+    assert "another Python environment" in caplog.text
+
+    cache = FileAnalysisCache(tmp_path / "ci.db")
+    monkeypatch.setattr("slop_detector.analysis_cache.import_environment_key", lambda: "py-a")
+    assert cache.import_bundle(bundle)["entries"] == 2
+    assert cache.get_by_content("/ci/pkg/module.py", *key) is not None
+    # Installing or removing packages changes the key; the imported results stop hitting.
+    monkeypatch.setattr("slop_detector.analysis_cache.import_environment_key", lambda: "py-b")
+    assert cache.get_by_content("/ci/pkg/module.py", *key) is None
+    cache.prune()
+    assert cache.stats()["imported_entries"] == 0
+
+
+def test_import_rejects_files_that_are_not_bundles(tmp_path):
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    not_a_bundle = tmp_path / "other.db"
+    sqlite3.connect(not_a_bundle).execute("CREATE TABLE t (x)").connection.close()
+
+    with pytest.raises(ValueError, match="Not an analysis cache bundle"):
+        cache.import_bundle(not_a_bundle)
+    with pytest.raises(ValueError, match="not found"):
+        cache.import_bundle(tmp_path / "missing.bundle")
+
+
+_JS_SOURCE = "var x = 1;\nif (x == 2) { console.log(x); }\nconst f = () => {};\n"
+_GO_SOURCE = 'package main\n\nimport "fmt"\n\nfunc main() {\n\tfmt.Println(1)\n\tpanic(2)\n}\n'
+
+
+def test_js_and_go_results_are_cached_by_content(tmp_path, monkeypatch):
+    from slop_detector.languages import js_analyzer
+
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "app.js").write_text(_JS_SOURCE, encoding="utf-8")
+    (project / "app.test.js").write_text(_JS_SOURCE, encoding="utf-8")
+    (project / "types.ts").write_text("let a: any = 1;\n" + _JS_SOURCE, encoding="utf-8")
+    (project / "main.go").write_text(_GO_SOURCE, encoding="utf-8")
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+    detector = SlopDetector()
+    detector._analysis_cache = cache
+    detector.config.config["ignore"] = []
+
+    cold = detector.analyze_project(str(project), max_workers=1)
+    (project / "copy.js").write_text(_JS_SOURCE, encoding="utf-8")
+    for analyzer in (detector._get_js_analyzer(), detector._get_go_analyzer()):
+        monkeypatch.setattr(analyzer, "analyze", lambda *args: pytest.fail("reanalyzed"))
+    warm = detector.analyze_project(str(project), max_workers=1)
+
+    assert cold.scan_coverage["analysis_cache_languages"] == {
+        "javascript": {"hits": 0, "misses": 3},
+        "go": {"hits": 0, "misses": 1},
+    }
+    assert warm.scan_coverage["analysis_cache_languages"] == {
+        "javascript": {"hits": 4, "misses": 0},
+        "go": {"hits": 1, "misses": 0},
+    }
+
+    def by_name(results):
+        return {Path(result.file_path).name: result.to_dict() for result in results}
+
+    warm_js = by_name(warm.js_file_results)
+    assert {**warm_js, "copy.js": None} == {**by_name(cold.js_file_results), "copy.js": None}
+    assert by_name(warm.go_file_results) == by_name(cold.go_file_results)
+    assert warm_js["app.test.js"]["masked_issues"]
+    assert warm_js["copy.js"] == {**warm_js["app.js"], "file_path": str(project / "copy.js")}
+    stats = cache.stats()
+    assert stats["language_entries"] == 4
+    assert (stats["javascript_hits"], stats["javascript_misses"]) == (4, 3)
+    assert (stats["go_hits"], stats["go_misses"]) == (1, 1)
+
+    # A changed analyzer threshold is part of the key.
+    monkeypatch.setattr(js_analyzer, "GOD_FUNCTION_LINES", 10)
+    with pytest.raises(pytest.fail.Exception, match="reanalyzed"):
+        detector.analyze_js_file(str(project / "app.js"))
@@ -634,6 +634,23 @@ def test_cli_parser_accepts_topology_flags():
     assert args.topology_mode == "exact"
 
 
+def test_cli_parser_accepts_jobs_flag_and_applies_worker_override():
+    args = _build_arg_parser().parse_args(["--project", ".", "--jobs", "4"])
+    detector = SlopDetector()
+
+    _apply_runtime_overrides(args, detector)
+
+    assert args.jobs == 4
+    assert detector.config.get_max_workers() == 4
+
+
+def test_apply_runtime_overrides_rejects_negative_jobs():
+    args = _build_arg_parser().parse_args(["--project", ".", "--jobs", "-2"])
+
+    with pytest.raises(ValueError, match="--jobs"):
+        _apply_runtime_overrides(args, SlopDetector())
+
+
 def test_cli_parser_accepts_format_json_alias():
     parser = _build_arg_parser()
     args = parser.parse_args(["--format", "json"])
@@ -1027,3 +1044,39 @@ def test_main_analysis_error(tmp_path):
         result = main()
         # May return 0 or 1 depending on error handling
         assert result in (0, 1)
+
+
+def test_main_stream_writes_ndjson_records(tmp_path):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "file1.py").write_text("def func1():\n    pass\n")
+    (project_dir / "file2.py").write_text("def func2():\n    return 42\n")
+    output = tmp_path / "stream.ndjson"
+
+    result = main([str(project_dir), "--stream", "--output", str(output), "--no-color"])
+
+    assert result == 0
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [record["type"] for record in records] == ["file", "file", "summary"]
+    assert {record["result"]["file_path"] for record in records[:2]} == {
+        str(project_dir / "file1.py"),
+        str(project_dir / "file2.py"),
+    }
+    assert records[-1]["result"]["total_files"] == 2
+    assert records[-1]["result"]["file_results"] == []
+
+
+def test_main_stream_requires_directory(tmp_path):
+    test_file = tmp_path / "single.py"
+    test_file.write_text("x = 1\n")
+
+    assert main([str(test_file), "--stream"]) == 2
+
+
+def test_cli_drop_code_snippets_flag_disables_snippet_retention():
+    args = _build_arg_parser().parse_args(["--project", ".", "--drop-code-snippets"])
+    detector = SlopDetector()
+
+    _apply_runtime_overrides(args, detector)
+
+    assert detector.config.retain_code_snippets() is False
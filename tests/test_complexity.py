@@ -0,0 +1,173 @@
+"""Tests for the AST-based McCabe complexity engine."""
+
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+
+from slop_detector.metrics.complexity import (
+    BLOCK_CLASS,
+    BLOCK_FUNCTION,
+    BLOCK_METHOD,
+    ComplexityReport,
+    function_complexity,
+)
+from slop_detector.source_context import SourceContext
+
+radon_complexity = pytest.importorskip("radon.complexity")
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+CONSTRUCTS = """
+def branches(a, b, items):
+    if a and b or not a:
+        x = 1 if a else 2
+    elif b:
+        x = 3
+    for item in items:
+        if item:
+            break
+    else:
+        x = 4
+    while a:
+        a -= 1
+    try:
+        x = 5
+    except ValueError:
+        x = 6
+    except (TypeError, KeyError):
+        x = 7
+    else:
+        x = 8
+    finally:
+        x = 9
+    assert a or b, "message"
+    return [i for i in items if i if i > 1] + list({k: v for k, v in items})
+
+
+def outer(n):
+    def inner(m):
+        if m:
+            return m
+        return 0
+
+    class Local:
+        def method(self):
+            return 1 if n else 2
+
+    return inner(n)
+
+
+async def runner(stream):
+    async for item in stream:
+        async with item:
+            pass
+
+
+class Service:
+    def first(self, a):
+        return a or None
+
+    def second(self):
+        while True:
+            pass
+
+    class Inner:
+        def hidden(self):
+            if self:
+                pass
+
+
+class Empty:
+    value = [i for i in range(3)]
+"""
+
+
+def _radon_blocks(content):
+    return [
+        (block.name, block.lineno, block.complexity) for block in radon_complexity.cc_visit(content)
+    ]
+
+
+def _engine_blocks(content):
+    report = ComplexityReport(ast.parse(content))
+    return [(block.name, block.lineno, block.complexity) for block in report.blocks]
+
+
+def test_constructs_match_radon():
+    assert _engine_blocks(CONSTRUCTS) == _radon_blocks(CONSTRUCTS)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="match statements need Python 3.10+")
+def test_match_statements_match_radon():
+    content = """
+def matcher(value):
+    match value:
+        case 1:
+            return "one"
+        case [x, y]:
+            return "pair"
+        case _:
+            return "other"
+
+
+def exhaustive(value):
+    match value:
+        case 1 | 2:
+            return "small"
+        case {"key": k}:
+            return k
+"""
+    assert _engine_blocks(content) == _radon_blocks(content)
+
+
+def test_repository_sources_match_radon():
+    paths = sorted((REPO_ROOT / "src").rglob("*.py")) + sorted(
+        (REPO_ROOT / "tests" / "corpus").rglob("*.py")
+    )
+    assert paths
+    for path in paths:
+        content = path.read_text(encoding="utf-8")
+        try:
+            ast.parse(content)
+        except SyntaxError:
+            continue
+        assert _engine_blocks(content) == _radon_blocks(content), path
+
+
+def test_report_covers_closures_methods_and_block_kinds():
+    tree = ast.parse(CONSTRUCTS)
+    report = ComplexityReport(tree)
+    functions = {
+        node.name: node
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+    assert report.of(functions["inner"]) == 2
+    assert report.of(functions["hidden"]) == 2
+    assert report.of(functions["outer"]) == 1
+    assert function_complexity(functions["branches"]) == report.of(functions["branches"])
+    kinds = {block.name: block.kind for block in report.blocks}
+    assert kinds["branches"] == BLOCK_FUNCTION
+    assert kinds["Service"] == BLOCK_CLASS
+    assert kinds["first"] == BLOCK_METHOD
+    assert "hidden" not in kinds and "inner" not in kinds
+    expected = sum(c for _, _, c in _radon_blocks(CONSTRUCTS)) / len(report.blocks)
+    assert report.average == pytest.approx(expected)
+
+
+def test_empty_module_defaults_to_one():
+    assert ComplexityReport(ast.parse("x = 1\n")).average == 1.0
+    assert ComplexityReport(None).blocks == ()
+
+
+def test_source_context_computes_complexity_once():
+    tree = ast.parse(CONSTRUCTS)
+    source = SourceContext(CONSTRUCTS, tree)
+
+    assert source.complexity is source.complexity
+    assert source.complexity.max_function_complexity() == max(
+        source.complexity.of(span.node) for span in source.functions
+    )
@@ -224,6 +224,95 @@ def build_d(values):
     assert result.max_clone_group == 4
 
 
+def _generated_module(count, seed):
+    import random
+
+    rng = random.Random(seed)
+    parts = []
+    for i in range(count):
+        kind = rng.randrange(4)
+        if kind == 0:
+            parts.append(
+                f"def f{i}(values):\n    total = {i}\n    for v in values:\n"
+                f"        if v % {rng.randint(2, 9)} == 0:\n            total += v\n"
+                f"    return total\n"
+            )
+        elif kind == 1:
+            body = "\n".join(f"    x{k} = obj.attr{k}({k})" for k in range(rng.randint(1, 8)))
+            parts.append(f"def f{i}(obj):\n{body}\n    return x0\n")
+        elif kind == 2:
+            ops = " + ".join(f"x * {k}" for k in range(rng.randint(1, 6)))
+            parts.append(f"def f{i}(x):\n    if x > {i}:\n        return {ops}\n    return None\n")
+        else:
+            parts.append(f"def f{i}(a, b):\n    return a.get('k{i}') + b.call({i})\n")
+    return "\n\n".join(parts)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_clone_edge_pruning_keeps_every_clone_pair(monkeypatch, vectorized):
+    """Size windows and histogram buckets must not drop a pair the full scan keeps."""
+    import ast
+
+    from slop_detector.metrics import stub_density
+
+    if vectorized:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(stub_density, "_numpy", lambda: None)
+    funcs = [
+        node
+        for node in ast.walk(ast.parse(_generated_module(120, 7)))
+        if isinstance(node, ast.FunctionDef)
+    ]
+    profiles = [stub_density._node_profile(f) for f in funcs]
+    histograms = [h for h, _ in profiles]
+    sizes = [size for _, size in profiles]
+
+    expected = [set() for _ in funcs]
+    for i in range(len(funcs)):
+        for j in range(i + 1, len(funcs)):
+            ratio = max(sizes[i], sizes[j]) / min(sizes[i], sizes[j])
+            if ratio <= 1.5 and stub_density._jsd(histograms[i], histograms[j]) < 0.05:
+                expected[i].add(j)
+                expected[j].add(i)
+
+    assert stub_density._clone_edges(histograms, sizes) == expected
+
+
+def test_clone_search_budget_reports_a_genuine_lower_bound(monkeypatch):
+    """An exhausted clique search still names mutually similar functions."""
+    from slop_detector.metrics import stub_density
+
+    # Complement of a perfect matching: 2^15 maximal cliques of size 15.
+    adjacency = [set(range(30)) - {i, i ^ 1} for i in range(30)]
+    members, exact = stub_density._largest_clique(adjacency, budget=10)
+    assert not exact
+    assert all(b in adjacency[a] for a in members for b in members if a != b)
+    assert len(members) == 15
+    assert stub_density._largest_clique(adjacency, budget=10**6) == (members, True)
+
+    monkeypatch.setattr(stub_density, "_CLONE_SEARCH_BUDGET", 0)
+    result = stub_density.calculate_stub_density(_generated_module(40, 1))
+    assert result is not None
+    assert not result.clone_group_exact
+    assert result.max_clone_group == len(result.clone_group_names) >= 4
+
+
+def test_clone_cluster_larger_than_the_recursion_limit():
+    """A module of identical helpers must not overflow the clique search."""
+    import sys
+
+    from slop_detector.metrics.stub_density import calculate_stub_density
+
+    count = sys.getrecursionlimit() + 50
+    code = "\n".join(f"def f{i}(x):\n    return x.get({i}) + 1\n" for i in range(count))
+    result = calculate_stub_density(code)
+
+    assert result is not None
+    assert result.max_clone_group == count
+    assert result.clone_group_exact
+
+
 def test_analyze_file_syntax_error(detector, temp_python_file):
     """Test handling syntax errors gracefully."""
     code = '''
@@ -684,6 +773,84 @@ def test_analyze_project_filters_rust_discovered_build_artifacts(detector, tmp_p
     assert build_path.resolve() not in analyzed
 
 
+def _write_scan_tree(root):
+    files = {
+        "app.py": "x = 1\n",
+        "Upper.PY": "x = 1\n",
+        "web/index.js": "let a = 1;\n",
+        "web/view.tsx": "let b = 1;\n",
+        "web/types.d.ts": "let c = 1;\n",
+        "svc/main.go": "package main\n",
+        "svc/native.rs": "fn main() {}\n",
+        "pkg/core.py": "y = 2\n",
+        "pkg/.venv/lib/site.py": "z = 3\n",
+        "node_modules/dep/index.js": "module.exports = 1;\n",
+        "node_modules/dep/setup.py": "w = 4\n",
+        "tests/test_app.py": "def test_app():\n    pass\n",
+        "build/out.go": "package out\n",
+        "README.md": "docs\n",
+    }
+    for relative, text in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+def test_scan_project_files_matches_glob_discovery(tmp_path):
+    from slop_detector.core_project import discover_supported_files, scan_project_files
+
+    _write_scan_tree(tmp_path)
+    ignore_patterns = ["tests/**"]
+
+    def glob_discovery(extensions):
+        return discover_supported_files(
+            tmp_path,
+            [f"**/*{ext}" for ext in sorted(extensions)],
+            extensions,
+            ignore_patterns,
+            rust_discoverer=lambda *args: None,
+        )
+
+    scanned = scan_project_files(tmp_path, ignore_patterns)
+
+    assert scanned.python == glob_discovery({".py"})
+    assert sorted(scanned.javascript) == sorted(glob_discovery({".js", ".jsx", ".ts", ".tsx"}))
+    assert scanned.go == glob_discovery({".go"})
+    assert [p.relative_to(tmp_path).as_posix() for p in scanned.python] == ["app.py", "pkg/core.py"]
+
+
+def test_scan_project_files_prunes_dependency_dirs_before_descending(tmp_path, monkeypatch):
+    import slop_detector.core_project as core_project
+
+    _write_scan_tree(tmp_path)
+    listed = []
+    real_scandir = core_project.os.scandir
+
+    def recording_scandir(path):
+        listed.append(Path(path).relative_to(tmp_path).as_posix())
+        return real_scandir(path)
+
+    monkeypatch.setattr(core_project.os, "scandir", recording_scandir)
+
+    coverage = core_project.scan_project_files(tmp_path, ["tests/**"]).scan_coverage
+
+    assert not any(part in path for path in listed for part in ("node_modules", ".venv", "build"))
+    pruned = coverage["pruned"]
+    assert pruned["total"] == 3
+    assert sorted(pruned["directories"], key=lambda item: item["path"]) == [
+        {"path": "build", "reason": "directory:build"},
+        {"path": "node_modules", "reason": "directory:node_modules"},
+        {"path": "pkg/.venv", "reason": "directory:.venv"},
+    ]
+    assert pruned["by_reason"] == {
+        "directory:.venv": 1,
+        "directory:build": 1,
+        "directory:node_modules": 1,
+    }
+    assert coverage["excluded"]["by_reason"] == {"pattern:tests/**": 1}
+    assert coverage["unsupported"]["files"] == [{"path": "svc/native.rs", "extension": ".rs"}]
+
+
 def test_analyze_project_includes_non_python_results_in_aggregate(detector, tmp_path, monkeypatch):
     """Project totals and status must include JS/Go analyzer results."""
     (tmp_path / "src").mkdir()
@@ -737,6 +904,161 @@ def test_analyze_project_js_only_is_not_reported_as_empty_clean(detector, tmp_pa
     assert result.overall_status == SlopStatus.CRITICAL_DEFICIT
 
 
+def test_analyze_project_parallel_matches_serial_in_discovery_order(detector, tmp_path):
+    detector.config.config["ignore"] = []
+    detector._analysis_cache = None
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "a.py").write_text("def a():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "pkg" / "b.py").write_text(
+        "def b(x=[]):\n    try:\n        pass\n    except:\n        pass\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "pkg" / "c.py").write_text("class C:\n    pass\n", encoding="utf-8")
+    (tmp_path / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+
+    serial = detector.analyze_project(str(tmp_path), max_workers=1)
+    parallel = detector.analyze_project(str(tmp_path), max_workers=2)
+
+    assert [r.file_path for r in parallel.file_results] == [
+        r.file_path for r in serial.file_results
+    ]
+    assert [r.to_dict() for r in parallel.file_results] == [
+        r.to_dict() for r in serial.file_results
+    ]
+    assert parallel.weighted_deficit_score == serial.weighted_deficit_score
+
+
+def test_parallel_pool_isolates_per_file_errors(detector, tmp_path, caplog):
+    from slop_detector.core_execution import WorkerState, analyze_files_in_pool
+
+    good = tmp_path / "good.py"
+    good.write_text("x = 1\n", encoding="utf-8")
+    missing = tmp_path / "missing.py"
+    state = WorkerState(None, None, detector.config.config, None)
+
+    results = analyze_files_in_pool([("python", [missing, good])], 2, state)
+
+    assert [Path(r.file_path).name for r in results["python"]] == ["good.py"]
+    assert f"Error analyzing {missing}" in caplog.text
+
+
+def test_analyze_project_parallel_passes_effective_config_to_workers(
+    detector, tmp_path, monkeypatch
+):
+    detector.config.config["ignore"] = []
+    (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("y = 2\n", encoding="utf-8")
+
+    def fake_pool(files_by_language, worker_count, state):
+        assert worker_count == 2
+        assert state.config is detector.config.config
+        return {"python": [], "javascript": [], "go": []}
+
+    monkeypatch.setattr("slop_detector.core.analyze_files_in_pool", fake_pool)
+
+    result = detector.analyze_project(str(tmp_path), max_workers=2)
+
+    assert result.total_files == 0
+
+
+def test_analyze_project_falls_back_to_serial_when_pool_unavailable(
+    detector, tmp_path, monkeypatch
+):
+    detector.config.config["ignore"] = []
+    (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("y = 2\n", encoding="utf-8")
+    monkeypatch.setattr("slop_detector.core.analyze_files_in_pool", lambda *args: None)
+
+    result = detector.analyze_project(str(tmp_path), max_workers=2)
+
+    assert result.total_files == 2
+
+
+class _BatchScorer:
+    """Stands in for MLScorer and records every batch it is asked to score."""
+
+    def __init__(self):
+        self.batches = []
+
+    def score_batch(self, results):
+        from slop_detector.ml.scorer import MLScore
+
+        self.batches.append(sorted(Path(r.file_path).name for r in results))
+        return [
+            MLScore(
+                slop_probability=r.deficit_score / 100.0,
+                confidence=1.0,
+                model_type="fake",
+                agreement=True,
+                features_used=16,
+            )
+            for r in results
+        ]
+
+
+def _use_batch_scorer(detector):
+    scorer = _BatchScorer()
+    detector._analysis_cache = None
+    detector._ml_scorer = scorer
+    detector._ml_scoring = {"status": "available", "reason": None, "model_path": "fake.pkl"}
+    return scorer
+
+
+def _write_ml_project(root):
+    (root / "pkg").mkdir()
+    (root / "a.py").write_text("def a():\n    return 1\n", encoding="utf-8")
+    (root / "pkg" / "b.py").write_text("def b(x=[]):\n    return x\n", encoding="utf-8")
+    (root / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_analyze_project_scores_ml_in_one_batch(detector, tmp_path, max_workers):
+    detector.config.config["ignore"] = []
+    scorer = _use_batch_scorer(detector)
+    _write_ml_project(tmp_path)
+
+    result = detector.analyze_project(str(tmp_path), max_workers=max_workers)
+
+    assert scorer.batches == [["a.py", "b.py"]]
+    by_name = {Path(r.file_path).name: r for r in result.file_results}
+    for name in ("a.py", "b.py"):
+        assert by_name[name].ml_scoring == detector._ml_scoring
+        assert by_name[name].ml_score.model_type == "fake"
+        assert by_name[name].ml_score.slop_probability == by_name[name].deficit_score / 100.0
+    # Parse errors never carried an ML score and still do not.
+    assert by_name["broken.py"].ml_score is None
+    assert by_name["broken.py"].ml_scoring == {}
+
+
+def test_analyze_file_still_scores_ml_per_file(detector, tmp_path):
+    scorer = _use_batch_scorer(detector)
+    _write_ml_project(tmp_path)
+
+    result = detector.analyze_file(str(tmp_path / "a.py"))
+
+    assert scorer.batches == [["a.py"]]
+    assert result.ml_score.model_type == "fake"
+    assert result.ml_scoring == detector._ml_scoring
+
+
+def test_cache_hit_without_ml_score_is_scored_by_batch(detector, tmp_path):
+    from slop_detector.analysis_cache import FileAnalysisCache
+
+    detector.config.config["ignore"] = []
+    scorer = _use_batch_scorer(detector)
+    detector._analysis_cache = FileAnalysisCache(tmp_path / "cache" / "analysis.db")
+    project = tmp_path / "project"
+    project.mkdir()
+    _write_ml_project(project)
+
+    first = detector.analyze_project(str(project), max_workers=1)
+    second = detector.analyze_project(str(project), max_workers=1)
+
+    # Batched scores are not written back to the cache, so the warm run scores again.
+    assert scorer.batches == [["a.py", "b.py"], ["a.py", "b.py"]]
+    assert [r.to_dict() for r in second.file_results] == [r.to_dict() for r in first.file_results]
+
+
 def test_compute_coherence_uses_deterministic_approximation_above_ceiling(detector):
     detector.config.config["advanced"]["exact_topology_ceiling"] = 2
     detector.config.config["advanced"]["topology_mode_above_ceiling"] = "deterministic_approximate"
@@ -818,6 +1140,177 @@ def test_compute_coherence_caps_exact_input_size_for_large_repo(monkeypatch, det
     assert seen_sizes == [5]
 
 
+def _random_dcfs(count, seed):
+    import random
+
+    rng = random.Random(seed)
+    names = [f"Node{index}" for index in range(30)]
+    dcfs = []
+    for _ in range(count):
+        picked = rng.sample(names, rng.randint(1, 12))
+        weights = {name: rng.random() for name in picked}
+        total = sum(weights.values())
+        dcfs.append({name: weight / total for name, weight in weights.items()})
+    return dcfs
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vectorized_exact_coherence_matches_pure_python(seed):
+    numpy = pytest.importorskip("numpy")
+    from slop_detector import core_topology
+
+    dcfs = _random_dcfs(90, seed)
+    # Exact and near duplicates: zero-length and cancellation-prone edges.
+    dcfs += dcfs[:10]
+    dcfs.append({name: value * (1 + 1e-9) for name, value in dcfs[0].items()})
+
+    expected = core_topology._coherence_vr_exact_python(dcfs)
+    actual = core_topology._coherence_vr_exact_vectorized(dcfs, numpy)
+
+    assert actual == pytest.approx(expected, abs=1e-9)
+    assert core_topology.compute_coherence_vr_exact(dcfs) == pytest.approx(expected, abs=1e-9)
+
+
+def test_vectorized_exact_coherence_keeps_epsilon_guards_for_tiny_entries():
+    numpy = pytest.importorskip("numpy")
+    from slop_detector import core_topology
+
+    dcfs = _random_dcfs(70, 3)
+    dcfs[5] = {"Node0": 1.0 - 1e-13, "Node1": 1e-13}
+
+    expected = core_topology._coherence_vr_exact_python(dcfs)
+
+    assert core_topology._coherence_vr_exact_vectorized(dcfs, numpy) == pytest.approx(
+        expected, abs=1e-9
+    )
+
+
+def test_vectorized_exact_coherence_of_identical_files_is_one():
+    numpy = pytest.importorskip("numpy")
+    from slop_detector import core_topology
+
+    assert core_topology._coherence_vr_exact_vectorized([{"Module": 1.0}] * 80, numpy) == 1.0
+
+
+def test_knn_coherence_settles_outlier_exactly():
+    numpy = pytest.importorskip("numpy")
+    from slop_detector import core_topology
+
+    dcfs = _random_dcfs(400, 4) + [{"Module": 0.5, "Pass": 0.5}]
+
+    estimate = core_topology.coherence_vr_knn(dcfs, numpy)
+
+    assert estimate.level == "vr_structural_knn"
+    assert estimate.error_bound == 0.0
+    assert estimate.coherence == pytest.approx(
+        core_topology._coherence_vr_exact_vectorized(dcfs, numpy), abs=1e-9
+    )
+
+
+def test_knn_coherence_error_bound_brackets_exact_value(monkeypatch):
+    numpy = pytest.importorskip("numpy")
+    from slop_detector import core_topology
+
+    # A sparse forest and no budget for checking edges leave a loose tree.
+    monkeypatch.setattr(core_topology, "_KNN_TREES", 1)
+    monkeypatch.setattr(core_topology, "_KNN_LEAF_SIZE", 3)
+    monkeypatch.setattr(core_topology, "_KNN_FLOOR_SAMPLES", 1)
+    monkeypatch.setattr(core_topology, "_KNN_CERTIFY_PAIRS_PER_FILE", 0)
+    dcfs = _random_dcfs(200, 5)
+
+    estimate = core_topology.coherence_vr_knn(dcfs, numpy)
+    exact = core_topology._coherence_vr_exact_vectorized(dcfs, numpy)
+
+    assert estimate.error_bound > 0.0
+    assert estimate.coherence - 1e-12 <= exact <= estimate.coherence + estimate.error_bound + 1e-12
+
+
+def test_incremental_coherence_repairs_tree_when_a_leaf_changes(monkeypatch):
+    pytest.importorskip("numpy")
+    from collections import Counter
+
+    from slop_detector import core_topology
+
+    dcfs = _random_dcfs(60, 6)
+    _, state = core_topology.incremental_coherence_vr_exact(dcfs, None, 0.25)
+    degrees = Counter(state[1] + state[2])
+    leaf = next(index for index in range(len(dcfs)) if degrees[index] == 1)
+    dcfs[leaf] = _random_dcfs(1, 7)[0]
+
+    def rebuild(rows):
+        raise AssertionError("one changed leaf should be repaired, not rebuilt")
+
+    monkeypatch.setattr(core_topology, "_prim_tree", rebuild)
+    coherence, _ = core_topology.incremental_coherence_vr_exact(dcfs, state, 0.25)
+
+    assert coherence == pytest.approx(core_topology._coherence_vr_exact_python(dcfs), abs=1e-12)
+
+
+def test_incremental_coherence_rebuilds_past_changed_fraction(monkeypatch):
+    pytest.importorskip("numpy")
+    from slop_detector import core_topology
+
+    dcfs = _random_dcfs(40, 8)
+    _, state = core_topology.incremental_coherence_vr_exact(dcfs, None, 0.25)
+    dcfs[:6] = _random_dcfs(6, 9)
+    rebuilds = []
+    prim_tree = core_topology._prim_tree
+
+    def spy(rows):
+        rebuilds.append(len(rows.matrix))
+        return prim_tree(rows)
+
+    monkeypatch.setattr(core_topology, "_prim_tree", spy)
+    coherence, _ = core_topology.incremental_coherence_vr_exact(dcfs, state, 0.25)
+
+    assert rebuilds == [40]
+    assert coherence == pytest.approx(core_topology._coherence_vr_exact_python(dcfs), abs=1e-12)
+
+
+@pytest.mark.parametrize("seed", [10, 11, 12])
+def test_incremental_coherence_matches_exact_across_edits(seed):
+    pytest.importorskip("numpy")
+    import random
+
+    from slop_detector import core_topology
+
+    rng = random.Random(seed)
+    dcfs = _random_dcfs(80, seed)
+    state = None
+    for step in range(6):
+        for _ in range(rng.randint(1, 4)):
+            action = rng.random()
+            if action < 0.3:
+                dcfs.pop(rng.randrange(len(dcfs)))
+            elif action < 0.7:
+                dcfs[rng.randrange(len(dcfs))] = _random_dcfs(1, seed * 100 + step)[0]
+            else:
+                dcfs.append(dict(rng.choice(dcfs)))
+        coherence, state = core_topology.incremental_coherence_vr_exact(dcfs, state, 0.5)
+
+        assert coherence == pytest.approx(core_topology._coherence_vr_exact_python(dcfs), abs=1e-12)
+
+
+def test_analyze_project_reports_knn_coherence_above_ceiling(detector, tmp_path):
+    pytest.importorskip("numpy")
+    detector.config.config["advanced"]["exact_topology_ceiling"] = 2
+    detector.config.config["advanced"]["topology_mode_above_ceiling"] = "knn_graph"
+    detector.config.config["ignore"] = []
+
+    (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "c.py").write_text("class C:\n    pass\n", encoding="utf-8")
+
+    result = detector.analyze_project(str(tmp_path))
+    payload = result.to_dict()
+
+    assert payload["coherence_level"] == "vr_structural_knn"
+    assert payload["coherence_error_bound"] == 0.0
+    assert result.structural_coherence == pytest.approx(
+        detector._compute_coherence_vr_exact([r.dcf for r in result.file_results])
+    )
+
+
 def test_calculate_pattern_penalty(detector):
     """Test pattern penalty calculation."""
     from slop_detector.patterns.base import Axis, Issue, Severity
@@ -1108,3 +1601,91 @@ def test_function():
     # Patterns should run and find issues
     assert hasattr(result, "pattern_issues")
     assert isinstance(result.pattern_issues, list)
+
+
+def _write_stream_project(root):
+    (root / "pkg").mkdir()
+    (root / "a.py").write_text("def a():\n    return 1\n", encoding="utf-8")
+    (root / "pkg" / "b.py").write_text(
+        "def b(x=[]):\n    try:\n        pass\n    except:\n        pass\n",
+        encoding="utf-8",
+    )
+    (root / "pkg" / "c.py").write_text("class C:\n    pass\n# TODO: fix\n", encoding="utf-8")
+    (root / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_analyze_project_iter_matches_analyze_project(detector, tmp_path, max_workers):
+    detector.config.config["ignore"] = []
+    detector._analysis_cache = None
+    _write_stream_project(tmp_path)
+
+    expected = detector.analyze_project(str(tmp_path), max_workers=1)
+    items = list(detector.analyze_project_iter(str(tmp_path), max_workers=max_workers))
+    summary = items[-1]
+
+    assert [r.to_dict() for r in items[:-1]] == [r.to_dict() for r in expected.file_results]
+    assert summary.file_results == []
+    assert summary.total_files == expected.total_files
+    assert summary.deficit_files == expected.deficit_files
+    assert summary.weighted_deficit_score == expected.weighted_deficit_score
+    assert summary.avg_ldr == expected.avg_ldr
+    assert summary.overall_status == expected.overall_status
+    assert summary.finding_summary == expected.finding_summary
+    assert summary.scan_coverage == expected.scan_coverage
+
+
+def test_iter_files_in_pool_finishes_serially_when_pool_breaks(tmp_path, monkeypatch):
+    from concurrent.futures.process import BrokenProcessPool
+
+    from slop_detector import core_execution
+
+    class BrokenPool:
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+        def shutdown(self, wait=True):
+            pass
+
+    monkeypatch.setattr(core_execution, "_new_pool", lambda *args: BrokenPool())
+    paths = [tmp_path / f"{name}.py" for name in "abc"]
+    state = core_execution.WorkerState(None, None, {}, None)
+
+    outcomes = list(
+        core_execution.iter_files_in_pool(
+            [("python", paths)], 2, state, lambda task: (task[1], None)
+        )
+    )
+
+    assert [path for _, path, _, _ in outcomes] == [str(p) for p in paths]
+    assert [result for _, _, result, _ in outcomes] == [str(p) for p in paths]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_analyze_project_drops_code_snippets_when_not_retained(detector, tmp_path, max_workers):
+    detector.config.config["ignore"] = []
+    detector.config.config["advanced"]["retain_code_snippets"] = False
+    detector._analysis_cache = None
+    _write_stream_project(tmp_path)
+    assert detector.analyze_file(str(tmp_path / "pkg" / "c.py")).pattern_issues[0].code
+
+    result = detector.analyze_project(str(tmp_path), max_workers=max_workers)
+
+    issues = [issue for r in result.file_results for issue in r.pattern_issues]
+    assert issues
+    assert all(issue.code is None for issue in issues)
+
+
+def test_analyze_project_iter_yields_snippets_before_dropping(detector, tmp_path):
+    detector.config.config["ignore"] = []
+    detector.config.config["advanced"]["retain_code_snippets"] = False
+    detector._analysis_cache = None
+    _write_stream_project(tmp_path)
+
+    seen = []
+    for item in detector.analyze_project_iter(str(tmp_path), max_workers=1):
+        for issue in getattr(item, "pattern_issues", []):
+            seen.append((issue, issue.code))
+
+    assert any(code is not None for _, code in seen)
+    assert all(issue.code is None for issue, _ in seen)
@@ -0,0 +1,158 @@
+"""Tests for cross-file duplicate detection."""
+
+import ast
+import random
+from types import SimpleNamespace
+
+from slop_detector.analysis.cross_file import CrossFileAnalyzer
+from slop_detector.analysis.near_duplicates import function_shingles, near_duplicate_pairs
+
+LOADER = '''
+def load_config(path, defaults=None):
+    """Load a config file."""
+    result = dict(defaults or {})
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, _, value = line.partition("=")
+            result[key.strip()] = value.strip()
+    return result
+'''
+
+# The same helper with renamed locals and one altered statement.
+SETTINGS_READER = """
+def read_settings(filename, fallback=None):
+    settings = dict(fallback or {})
+    with open(filename, encoding="utf-8") as fh:
+        for raw in fh:
+            raw = raw.strip()
+            if not raw or raw.startswith(";"):
+                continue
+            name, _, val = raw.partition("=")
+            settings[name.strip().lower()] = val.strip()
+    return settings
+"""
+
+SUMMARY = """
+def summarize(records):
+    totals = {}
+    for record in records:
+        bucket = totals.setdefault(record.kind, [])
+        bucket.append(record.amount)
+    return {kind: sum(values) / len(values) for kind, values in totals.items() if values}
+"""
+
+
+def _shingles(source):
+    return function_shingles(ast.parse(source).body[0])
+
+
+def _analyze(tmp_path, files):
+    analyses = []
+    for name, source in files.items():
+        path = tmp_path / name
+        path.write_text(source, encoding="utf-8")
+        analyses.append(SimpleNamespace(file_path=str(path), deficit_score=0.0))
+    return CrossFileAnalyzer().analyze(str(tmp_path), analyses)
+
+
+def test_renamed_locals_do_not_change_shingles():
+    renamed = LOADER.replace("result", "merged").replace("handle", "stream")
+    assert _shingles(renamed) == _shingles(LOADER)
+
+
+def test_near_duplicate_helpers_across_files_are_reported(tmp_path):
+    report = _analyze(
+        tmp_path,
+        {"config.py": LOADER + SUMMARY, "settings.py": SETTINGS_READER},
+    )
+
+    assert len(report.duplicates) == 1
+    dup = report.duplicates[0]
+    assert {dup.func_a, dup.func_b} == {"load_config", "read_settings"}
+    assert 0.85 <= dup.similarity < 1.0
+
+
+def test_exact_duplicates_come_first_and_same_file_pairs_are_skipped(tmp_path):
+    report = _analyze(
+        tmp_path,
+        {
+            "a.py": LOADER + SETTINGS_READER,
+            "b.py": LOADER,
+        },
+    )
+
+    similarities = [(d.func_a, d.func_b, d.similarity, d.exact) for d in report.duplicates]
+    assert similarities[0] == ("load_config", "load_config", 1.0, True)
+    assert not report.duplicates[1].exact
+    assert all(d.file_a != d.file_b for d in report.duplicates)
+    assert len(report.duplicates) == 2
+
+
+def test_normalized_matches_are_not_labelled_identical(tmp_path, capsys):
+    from slop_detector.cli_commands import _run_cross_file
+
+    renamed = LOADER.replace("result", "merged").replace("handle", "stream")
+    files = {"a.py": LOADER, "b.py": LOADER, "c.py": renamed}
+    for name, source in files.items():
+        (tmp_path / name).write_text(source, encoding="utf-8")
+    project = SimpleNamespace(
+        project_path=str(tmp_path),
+        file_results=[
+            SimpleNamespace(file_path=str(tmp_path / name), deficit_score=0.0) for name in files
+        ],
+    )
+
+    _run_cross_file(project)
+
+    lines = [line.strip() for line in capsys.readouterr().out.splitlines() if "load_config" in line]
+    assert lines[0] == "a.py:load_config() == b.py:load_config() (sim=100%)"
+    assert sorted(lines[1:]) == [
+        "a.py:load_config() ~ c.py:load_config() (sim=100%, normalized)",
+        "b.py:load_config() ~ c.py:load_config() (sim=100%, normalized)",
+    ]
+
+
+def test_lsh_finds_planted_near_duplicates_among_unrelated_functions():
+    rng = random.Random(3)
+    statements = [
+        "x{k} = obj.attr{k}(y)",
+        "if x{k} > {c}:\n        return x{k}",
+        "for item in items{k}:\n        total += item * {c}",
+        "result.append(helper{k}(x{k}, {c}))",
+        "data[{c}] = values.get('k{k}', None)",
+        "while count > {c}:\n        count -= step{k}",
+    ]
+    sources = []
+    for i in range(400):
+        body = "\n    ".join(
+            rng.choice(statements).format(k=rng.randrange(40), c=rng.randrange(9))
+            for _ in range(rng.randint(6, 12))
+        )
+        sources.append(f"def f{i}(obj, items):\n    total = 0\n    {body}\n    return total")
+    planted = []
+    for original in rng.sample(range(400), 20):
+        copy = sources[original].replace(
+            "    return total", "    obj.check(total)\n    return total"
+        )
+        sources.append(copy)
+        planted.append((original, len(sources) - 1))
+    shingles = [_shingles(source) for source in sources]
+
+    pairs = near_duplicate_pairs(shingles, 0.85, groups=list(range(len(sources))))
+
+    found = {(i, j) for i, j, _ in pairs}
+    expected = [
+        pair
+        for pair in planted
+        if len(set(shingles[pair[0]]) & set(shingles[pair[1]]))
+        >= 0.85 * len(set(shingles[pair[0]]) | set(shingles[pair[1]]))
+    ]
+    assert expected
+    assert set(expected) <= found
+    assert [similarity for _, _, similarity in pairs] == sorted(
+        (similarity for _, _, similarity in pairs), reverse=True
+    )
+    assert all(similarity >= 0.85 for _, _, similarity in pairs)
@@ -0,0 +1,189 @@
+"""Tests for the compiled project ignore matcher."""
+
+import fnmatch
+import random
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from slop_detector.config import Config
+from slop_detector.ignore_matcher import DEFAULT_EXCLUDE_PARTS, IgnoreMatcher
+
+ROOT = Path("/work/project")
+
+PATH_PARTS = [
+    "src",
+    "pkg",
+    "tests",
+    "Tests",
+    "test_utils",
+    "sub",
+    "a.b",
+    "build",
+    "node_modules",
+    ".venv",
+    "docs",
+    "x",
+]
+FILE_NAMES = [
+    "app.py",
+    "__init__.py",
+    "test_app.py",
+    "app_test.py",
+    "types.pyi",
+    "schema.generated.py",
+    "README.md",
+    "main.go",
+    "index.ts",
+    "abc.py",
+    "t.py",
+]
+PATTERN_PARTS = [
+    "**",
+    "*",
+    "tests",
+    "src",
+    "pkg",
+    "*.py",
+    "test_*.py",
+    "*_test.py",
+    "?kg",
+    "s*c",
+    "__init__.py",
+    "*.generated.py",
+    "[st]*",
+    "[!a]*.py",
+    ".",
+    "a?c.py",
+    "sub",
+]
+
+
+def reference_ignore_reason(
+    file_path: Path, patterns: List[str], root: Optional[Path] = None
+) -> Optional[str]:
+    """``core_project.ignore_reason`` as it was before patterns were compiled."""
+    lowered_parts = {part.lower() for part in file_path.parts}
+    default_parts = lowered_parts & DEFAULT_EXCLUDE_PARTS
+    if default_parts:
+        return f"directory:{sorted(default_parts)[0]}"
+
+    if root is not None:
+        try:
+            normalized_paths = {str(file_path.relative_to(root)).replace("\\", "/")}
+        except ValueError:
+            normalized_paths = {str(file_path).replace("\\", "/")}
+    else:
+        normalized_paths = {str(file_path).replace("\\", "/")}
+
+    for pattern in patterns:
+        normalized_pattern = str(pattern).replace("\\", "/")
+        for normalized in normalized_paths:
+            if Path(normalized).match(normalized_pattern):
+                return f"pattern:{normalized_pattern}"
+            if fnmatch.fnmatch(normalized, normalized_pattern):
+                return f"pattern:{normalized_pattern}"
+            if normalized_pattern.startswith("**/") and fnmatch.fnmatch(
+                normalized, normalized_pattern[3:]
+            ):
+                return f"pattern:{normalized_pattern}"
+    return None
+
+
+def _random_relative_path(rng):
+    depth = rng.randint(0, 4)
+    return (
+        "/".join(rng.choice(PATH_PARTS) for _ in range(depth))
+        + ("/" if depth else "")
+        + rng.choice(FILE_NAMES)
+    )
+
+
+def _random_pattern(rng):
+    body = "/".join(rng.choice(PATTERN_PARTS) for _ in range(rng.randint(1, 3)))
+    prefix = rng.choice(["", "", "**/", "/", "./"])
+    suffix = rng.choice(["", "", "/**", "/*"])
+    pattern = prefix + body + suffix
+    return pattern.replace("/", "\\") if rng.random() < 0.05 else pattern
+
+
+def _pattern_sets(rng, count):
+    defaults = Config().get_ignore_patterns()
+    yield defaults
+    yield []
+    for _ in range(count):
+        patterns = [_random_pattern(rng) for _ in range(rng.randint(1, 6))]
+        if rng.random() < 0.3:
+            patterns += rng.sample(defaults, 4)
+        yield patterns
+
+
+def test_matches_reference_on_randomized_corpus():
+    rng = random.Random(20240611)
+    paths = sorted({_random_relative_path(rng) for _ in range(400)})
+    checked = matched = 0
+    for patterns in _pattern_sets(rng, 50):
+        if any(not p.replace("\\", "/").strip("/.") for p in patterns):
+            continue  # Path.match rejects empty patterns; covered separately below.
+        matcher = IgnoreMatcher(patterns)
+        for relative in paths:
+            for file_path, root in (
+                (ROOT / relative, ROOT),
+                (Path(relative), None),
+                (ROOT / relative, None),
+                (Path("/elsewhere") / relative, ROOT),
+            ):
+                expected = reference_ignore_reason(file_path, patterns, root)
+                assert matcher.reason(file_path, root) == expected, (relative, patterns, root)
+                checked += 1
+                matched += expected is not None
+    assert checked > 40_000
+    assert 0.05 < matched / checked < 0.95
+
+
+def test_compiles_patterns_without_character_classes():
+    assert IgnoreMatcher(Config().get_ignore_patterns())._compiled is not None
+    assert IgnoreMatcher(["src/[ab]*.py"])._compiled is None
+
+
+def test_empty_pattern_behaves_like_reference():
+    with pytest.raises(ValueError):
+        reference_ignore_reason(ROOT / "a.py", [""], ROOT)
+    with pytest.raises(ValueError):
+        IgnoreMatcher([""]).reason(ROOT / "a.py", ROOT)
+
+
+def test_subtree_reason_agrees_with_every_path_below():
+    rng = random.Random(7)
+    paths = sorted({_random_relative_path(rng) for _ in range(400)})
+    directories = sorted({path.rsplit("/", 1)[0] for path in paths if "/" in path})
+    covered = 0
+    for patterns in [["tests/**", "**/*.pyi"], ["**/sub/**", "src/**"], ["/abs/**", "pkg/**"]]:
+        patterns = patterns + [_random_pattern(rng) for _ in range(2)]
+        if any("[" in p or not p.strip("/.") for p in patterns):
+            continue
+        matcher = IgnoreMatcher(patterns)
+        for directory in directories:
+            reason = matcher.subtree_reason(directory)
+            below = [
+                p
+                for p in paths
+                if p.startswith(directory + "/")
+                and not set(p.lower().split("/")) & DEFAULT_EXCLUDE_PARTS
+            ]
+            if reason is not None:
+                covered += 1
+                for path in below:
+                    assert reference_ignore_reason(ROOT / path, patterns, ROOT) == reason
+    assert covered
+
+
+def test_subtree_reason_requires_no_earlier_pattern_can_match():
+    assert IgnoreMatcher(["tests/**"]).subtree_reason("tests") == "pattern:tests/**"
+    assert IgnoreMatcher(["**/node_modules/**"]).subtree_reason("web/node_modules") == (
+        "pattern:**/node_modules/**"
+    )
+    # An earlier relative pattern may claim some files below with its own reason.
+    assert IgnoreMatcher(["**/__init__.py", "tests/**"]).subtree_reason("tests") is None
+    assert IgnoreMatcher(["/abs/**", "tests/**"]).subtree_reason("tests") == "pattern:tests/**"
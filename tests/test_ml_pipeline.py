@@ -134,3 +134,101 @@ def test_train_from_dataset_requires_both_classes(tmp_path):
             test_size=0.2,
             save_model=False,
         )
+
+
+class _RowClassifier:
+    """Deterministic stand-in for SlopClassifier with row and batch entry points."""
+
+    model_type = "ensemble"
+
+    def __init__(self, fail_batch=False):
+        self.fail_batch = fail_batch
+        self.calls = []
+
+    @staticmethod
+    def _proba(features):
+        slop = min(1.0, features["pattern_count_high"] / 4.0 + (1.0 - features["ldr_score"]) / 3.0)
+        return slop, max(slop, 1.0 - slop)
+
+    def predict(self, features):
+        self.calls.append("row")
+        return self._proba(features)
+
+    def predict_batch(self, rows):
+        self.calls.append(("batch", len(rows)))
+        if self.fail_batch:
+            raise ValueError("batch rejected")
+        return [self._proba(row) for row in rows]
+
+
+def _file_analysis(ldr_score, high_issues, deficit_score):
+    issue = SimpleNamespace(severity=SimpleNamespace(value="high"), pattern_id="god_function")
+    return SimpleNamespace(
+        ldr=SimpleNamespace(ldr_score=ldr_score, total_lines=40, logic_lines=30, empty_lines=5),
+        inflation=SimpleNamespace(inflation_score=0.4, avg_complexity=3.0),
+        ddc=SimpleNamespace(usage_ratio=0.8),
+        pattern_issues=[issue] * high_issues,
+        deficit_score=deficit_score,
+    )
+
+
+def _analyses():
+    return [
+        _file_analysis(0.9, 0, 5.0),
+        _file_analysis(0.2, 3, 72.0),
+        # Unextractable features: scored as None, like score() does.
+        SimpleNamespace(pattern_issues=None),
+        _file_analysis(0.5, 1, 35.0),
+    ]
+
+
+def test_score_batch_matches_per_row_scoring_with_one_model_call():
+    analyses = _analyses()
+    per_row = [MLScorer(_RowClassifier()).score(fa) for fa in analyses]
+    classifier = _RowClassifier()
+
+    batched = MLScorer(classifier).score_batch(analyses)
+
+    assert classifier.calls == [("batch", 3)]
+    assert batched == per_row
+    assert batched[2] is None
+    assert batched[1].agreement is True
+
+
+def test_score_batch_falls_back_to_per_row_scoring_when_batch_fails():
+    analyses = _analyses()
+    classifier = _RowClassifier(fail_batch=True)
+
+    batched = MLScorer(classifier).score_batch(analyses)
+
+    assert classifier.calls == [("batch", 3)] + ["row"] * 3
+    assert batched == [MLScorer(_RowClassifier()).score(fa) for fa in analyses]
+
+
+def test_score_batch_without_batch_support_scores_each_file():
+    classifier = _RowClassifier()
+    classifier.predict_batch = None
+
+    batched = MLScorer(classifier).score_batch(_analyses())
+
+    assert classifier.calls == ["row"] * 3
+    assert [score is None for score in batched] == [False, False, True, False]
+
+
+def test_classifier_predict_batch_matches_predict():
+    np = pytest.importorskip("numpy")
+    ensemble = pytest.importorskip("sklearn.ensemble")
+    from slop_detector.ml.classifier import SlopClassifier
+
+    rng = np.random.RandomState(7)
+    names = SlopClassifier.FEATURE_NAMES
+    features = rng.rand(60, len(names))
+    labels = (features[:, 0] < 0.5).astype(int)
+    classifier = SlopClassifier(model_type="random_forest")
+    classifier.rf_model = ensemble.RandomForestClassifier(n_estimators=10, random_state=0)
+    classifier.rf_model.fit(features, labels)
+    classifier.is_trained = True
+    rows = [dict(zip(names, row)) for row in rng.rand(25, len(names))]
+
+    assert classifier.predict_batch(rows) == [classifier.predict(row) for row in rows]
+    assert classifier.predict_batch([]) == []
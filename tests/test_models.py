@@ -0,0 +1,94 @@
+"""Tests for the compact result models."""
+
+import pickle
+from dataclasses import fields
+from pathlib import Path
+
+import pytest
+
+from slop_detector.models import (
+    DDCResult,
+    FileAnalysis,
+    InflationResult,
+    LDRResult,
+    SlopStatus,
+)
+from slop_detector.patterns.base import Axis, Issue, Severity
+
+
+def _issue(message, code="x = 1"):
+    return Issue(
+        pattern_id="bare_except",
+        severity=Severity.HIGH,
+        axis=Axis.STRUCTURE,
+        file=Path("a.py"),
+        line=3,
+        column=0,
+        message=message,
+        code=code,
+        suggestion="".join(["Catch ", "specific exceptions"]),
+    )
+
+
+def _file_analysis(issues):
+    return FileAnalysis(
+        file_path="a.py",
+        ldr=LDRResult(10, 8, 2, 0.8, "A"),
+        inflation=InflationResult(1, 2.0, 0.1, "pass", ["robust"], [{"word": "robust", "line": 1}]),
+        ddc=DDCResult(["os"], ["os"], [], [], [], 1.0, "A"),
+        deficit_score=12.5,
+        status=SlopStatus.CLEAN,
+        pattern_issues=issues,
+        dcf={"Module": 0.5, "Expr": 0.5},
+    )
+
+
+@pytest.mark.parametrize("cls", [Issue, LDRResult, InflationResult, DDCResult, FileAnalysis])
+def test_result_models_are_slotted(cls):
+    assert cls.__slots__ == tuple(f.name for f in fields(cls))
+    assert cls.__qualname__ == cls.__name__
+
+
+def test_slotted_instances_have_no_instance_dict_and_round_trip():
+    result = _file_analysis([_issue("Bare except")])
+
+    assert not hasattr(result, "__dict__")
+    assert not hasattr(result.pattern_issues[0], "__dict__")
+    with pytest.raises(AttributeError):
+        result.unexpected = True
+    restored = pickle.loads(pickle.dumps(result))
+    assert restored == result
+    assert restored.to_dict() == result.to_dict()
+
+
+def test_issue_and_metric_strings_are_interned():
+    first = _issue("".join(["Bare ", "except"]))
+    second = _issue("".join(["Bare ", "exc", "ept"]))
+
+    assert first.message is second.message
+    assert first.suggestion is second.suggestion
+    key = "".join(["Mod", "ule"])
+    result = _file_analysis([])
+    other = FileAnalysis(**{**_kwargs(result), "dcf": {key: 1.0}})
+    assert next(iter(other.dcf)) is next(iter(result.dcf))
+
+
+def _kwargs(result):
+    return {name: getattr(result, name) for name in result.__slots__}
+
+
+def test_ldr_clamping_still_runs_on_slotted_models():
+    assert LDRResult(1, 1, 0, 1.5, "A").ldr_score == 1.0
+
+
+def test_drop_code_snippets_clears_only_code():
+    result = _file_analysis([_issue("Bare except"), _issue("Bare except", code=None)])
+    before = result.to_dict()
+
+    result.drop_code_snippets()
+
+    after = result.to_dict()
+    assert [issue["code"] for issue in after["pattern_issues"]] == [None, None]
+    for issue in before["pattern_issues"]:
+        issue["code"] = None
+    assert after == before
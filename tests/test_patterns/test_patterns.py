@@ -169,3 +169,90 @@ def boundary_case(flag, xs):
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def _legacy_check(pattern, tree, file, content):
+    """Reference: the pre-dispatch behaviour of offering every node to check_node."""
+    issues = []
+    pattern.begin_file(tree, file, content)
+    try:
+        for node in ast.walk(tree):
+            if issue := pattern.check_node(node, file, content):
+                issues.extend(issue if isinstance(issue, list) else [issue])
+    finally:
+        pattern.end_file()
+    return issues
+
+
+def test_fused_dispatch_matches_per_pattern_walks():
+    """The single-walk registry must produce byte-identical issues to per-pattern walks."""
+    from slop_detector.patterns import get_all_patterns
+    from slop_detector.patterns.base import ASTPattern
+    from slop_detector.patterns.registry import PatternRegistry
+
+    registry = PatternRegistry()
+    registry.register_all([p for p in get_all_patterns() if isinstance(p, ASTPattern)])
+    repo_root = Path(__file__).resolve().parents[2]
+    sources = sorted((repo_root / "tests" / "corpus").glob("*.py")) + sorted(
+        (repo_root / "src" / "slop_detector" / "patterns").glob("*.py")
+    )
+    assert sources
+
+    for source in sources:
+        content = source.read_text(encoding="utf-8")
+        tree = ast.parse(content)
+        outcomes = registry.check_all(tree, source, content)
+        assert [o.pattern.id for o in outcomes] == [p.id for p in registry.get_all()]
+        for outcome in outcomes:
+            assert outcome.error is None
+            expected = _legacy_check(outcome.pattern, tree, source, content)
+            assert [i.to_dict() for i in outcome.issues] == [i.to_dict() for i in expected], (
+                source,
+                outcome.pattern.id,
+            )
+
+
+def test_fused_dispatch_honours_check_overrides_and_isolates_failures():
+    from slop_detector.patterns.registry import PatternRegistry
+
+    code = "try:\n    x = 1\nexcept:\n    pass\nfrom os import *\n"
+    tree = ast.parse(code)
+    bare, star = BareExceptPattern(), StarImportPattern()
+    star.check = lambda tree, file, content: ["overridden"]
+
+    def explode(node, file, content):
+        raise RuntimeError("boom")
+
+    mutable = MutableDefaultArgPattern()
+    mutable.node_types = ()
+    mutable.check_node = explode
+    registry = PatternRegistry()
+    registry.register_all([bare, star, mutable])
+
+    bare_outcome, star_outcome, mutable_outcome = registry.check_all(tree, Path("t.py"), code)
+
+    assert [i.pattern_id for i in bare_outcome.issues] == ["bare_except"]
+    assert star_outcome.issues == ["overridden"]
+    assert isinstance(mutable_outcome.error, RuntimeError)
+    assert mutable_outcome.issues == []
+
+
+def test_scoped_walk_skips_subtrees_and_keeps_walk_order():
+    from slop_detector.patterns import get_all_patterns
+    from slop_detector.patterns.registry import PatternRegistry, is_function_scoped
+
+    registry = PatternRegistry()
+    registry.register_all([p for p in get_all_patterns() if is_function_scoped(p)])
+    source = Path(__file__).resolve().parents[1] / "corpus" / "test_case_1_ai_slop.py"
+    content = source.read_text(encoding="utf-8")
+    tree = ast.parse(content)
+    walked = registry.check_all(tree, source, content)
+    skipped = next(node for node in tree.body if isinstance(node, ast.FunctionDef))
+
+    for full, outcome in zip(walked, registry.check_scoped(tree, source, content)):
+        ordered = sorted(zip(outcome.paths, outcome.issues), key=lambda x: (len(x[0]), x[0]))
+        assert [i.to_dict() for _, i in ordered] == [i.to_dict() for i in full.issues]
+    lines = range(skipped.lineno, skipped.end_lineno + 1)
+    assert any(issue.line in lines for outcome in walked for issue in outcome.issues)
+    for outcome in registry.check_scoped(tree, source, content, skip={id(skipped)}):
+        assert not any(issue.line in lines for issue in outcome.issues)
@@ -155,3 +155,44 @@ def test_load_git_churn_counts_recent_touches(tmp_path, monkeypatch):
 
     assert calls["count"] == 2
     assert counts[str(file_path.resolve())] == 2
+
+
+def test_cached_churn_is_reused_while_head_is_unchanged(tmp_path, monkeypatch):
+    from slop_detector.analysis_cache import FileAnalysisCache
+
+    prioritizer = ProjectPrioritizer(
+        SimpleNamespace(
+            get_hotspot_weights=lambda: {"deficit": 0.5, "churn": 0.3, "coverage_gap": 0.2},
+            get_hotspot_limit=lambda: 10,
+            get_churn_commit_window=lambda: 25,
+            get_coverage_data_file=lambda: ".coverage",
+        )
+    )
+    file_path = tmp_path / "hot.py"
+    file_path.write_text("x = 1\n", encoding="utf-8")
+    head = {"commit": "a" * 40}
+    logs = []
+
+    def fake_run(cmd, cwd, capture_output, text, check):
+        if "rev-parse" in cmd:
+            return SimpleNamespace(stdout=f"{tmp_path}\n{head['commit']}\n", returncode=0)
+        logs.append(cmd)
+        return SimpleNamespace(stdout="hot.py\nhot.py\n", returncode=0)
+
+    monkeypatch.setattr("slop_detector.prioritization.subprocess.run", fake_run)
+    cache = FileAnalysisCache(tmp_path / "analysis_cache.db")
+
+    def rank(deficit_score):
+        result = _file_result(file_path, deficit_score, SlopStatus.CRITICAL_DEFICIT)
+        return prioritizer.prioritize_project(str(tmp_path), [result], cache=cache)
+
+    first = rank(80.0)
+    # A changed score misses the ranking but reuses the churn of this HEAD.
+    rescored = rank(60.0)
+    assert len(logs) == 1
+    assert rescored[0][0].churn_count == first[0][0].churn_count == 2
+    assert rank(60.0) == rescored
+
+    head["commit"] = "b" * 40
+    rank(60.0)
+    assert len(logs) == 2
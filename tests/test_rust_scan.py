@@ -36,19 +36,39 @@ def test_discover_project_files_resolves_root_relative_rust_paths(tmp_path, monk
     assert discover_project_files(project, ["**/*.py"], []) == [file_path]
 
 
-def test_analyze_project_uses_rust_file_discovery(tmp_path, monkeypatch):
+def test_analyze_project_uses_rust_file_discovery_for_custom_patterns(tmp_path, monkeypatch):
     project = tmp_path / "proj"
     project.mkdir()
     file_path = project / "app.py"
     file_path.write_text("def ok():\n    return 1\n", encoding="utf-8")
+    calls = []
 
-    monkeypatch.setattr(
-        "slop_detector.core.discover_project_files",
-        lambda root, include_patterns, ignore_patterns: [file_path],
-    )
+    def fake_discover(root, include_patterns, ignore_patterns):
+        calls.append(list(include_patterns))
+        return [file_path]
+
+    monkeypatch.setattr("slop_detector.core.discover_project_files", fake_discover)
 
     detector = SlopDetector()
-    result = detector.analyze_project(str(project))
+    result = detector.analyze_project(str(project), pattern="*.py")
+
+    assert calls == [["*.py"]]
 
     assert result.total_files == 1
     assert [Path(fr.file_path).name for fr in result.file_results] == ["app.py"]
+
+
+def test_default_project_scan_does_not_spawn_rust_helper(tmp_path, monkeypatch):
+    """The single project walk already lists every source; the helper would only repeat it."""
+    project = tmp_path / "proj"
+    project.mkdir()
+    (project / "app.py").write_text("def ok():\n    return 1\n", encoding="utf-8")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("rust discovery should not run for the default scan")
+
+    monkeypatch.setattr("slop_detector.core.discover_project_files", fail)
+
+    result = SlopDetector().analyze_project(str(project))
+
+    assert [Path(fr.file_path).name for fr in result.file_results] == ["app.py"]
@@ -0,0 +1,125 @@
+"""Tests for the shared per-file SourceContext."""
+
+import ast
+from pathlib import Path
+
+from slop_detector.core import SlopDetector
+from slop_detector.patterns.base import ASTPattern, Axis, BasePattern, Severity
+from slop_detector.patterns.registry import PatternRegistry
+from slop_detector.source_context import (
+    LINE_BLANK,
+    LINE_CODE,
+    LINE_COMMENT,
+    SourceContext,
+    source_context_for,
+)
+
+SAMPLE = """import functools
+
+# module comment
+
+@functools.lru_cache
+def outer(x):
+    def inner(y):
+        return y
+
+    return inner(x)
+
+
+async def other():
+    pass
+"""
+
+
+def test_line_tables_match_legacy_splits():
+    for content in (SAMPLE, "", "a\n", "a\r\nb\r\n", "a\rb\n\x0cc\n", "x = 1 y\n\n"):
+        source = SourceContext(content)
+        assert source.lines == content.splitlines()
+        assert source.raw_lines == content.split("\n")
+        assert source.raw_stripped_lines == [line.strip() for line in content.split("\n")]
+        for lineno, offset in enumerate(source.line_offsets, start=1):
+            assert source.line_at_offset(offset) == lineno
+
+
+def test_line_classification_and_code_counts():
+    source = SourceContext(SAMPLE)
+    assert source.line_kinds[:4] == [LINE_CODE, LINE_BLANK, LINE_COMMENT, LINE_BLANK]
+    assert source.code_line_count() == sum(
+        1 for ln in SAMPLE.splitlines() if ln.strip() and not ln.strip().startswith("#")
+    )
+    assert source.code_line_count(6, 10) == 4
+    assert source.code_line_count(50, 60) == 0
+    assert list(source.comment_lines()) == [(3, "# module comment")]
+
+
+def test_function_index_and_scopes():
+    tree = ast.parse(SAMPLE)
+    source = SourceContext(SAMPLE, tree)
+
+    assert [span.name for span in source.functions] == ["outer", "other", "inner"]
+    assert source.functions[0].start == 5
+    assert source.function_name_at_line(6) == "outer"
+    assert source.function_name_at_line(1) is None
+    assert source.node_count(ast.FunctionDef, ast.AsyncFunctionDef) == 3
+    assert source.function_scopes[1] is None
+    assert source.function_scopes[5] == (5, 10)
+    assert source.function_scopes[8] == (7, 8)
+    assert source.function_scopes[14] == (13, 14)
+
+
+def test_source_context_for_reuses_only_matching_source():
+    tree = ast.parse(SAMPLE)
+    source = SourceContext(SAMPLE, tree)
+
+    assert source_context_for(SAMPLE, tree, source) is source
+    assert source_context_for(SAMPLE, None, source) is source
+    assert source_context_for(SAMPLE, ast.parse(SAMPLE), source) is not source
+    assert source_context_for("other = 1\n", None, source) is not source
+
+
+class _SourceProbe(ASTPattern):
+    id = "source_probe"
+    severity = Severity.LOW
+    axis = Axis.NOISE
+    message = "probe"
+    node_types = (ast.Module,)
+
+    def __init__(self, seen):
+        self.seen = seen
+
+    def check_node(self, node, file, content):
+        self.seen.append(self.source_for(content))
+        return None
+
+
+class _CompatSourceProbe(BasePattern):
+    id = "compat_source_probe"
+
+    def __init__(self, seen):
+        self.seen = seen
+
+    def check(self, tree, file, content):
+        self.seen.append(self.source_for(content, tree))
+        return []
+
+
+def test_registry_shares_one_source_with_every_pattern():
+    seen: list = []
+    registry = PatternRegistry()
+    registry.register_all([_SourceProbe(seen), _CompatSourceProbe(seen)])
+    tree = ast.parse(SAMPLE)
+    source = SourceContext(SAMPLE, tree)
+
+    registry.check_all(tree, Path("sample.py"), SAMPLE, source)
+
+    assert seen == [source, source]
+    assert all(pattern._source is None for pattern in registry.get_all())
+
+
+def test_detector_results_unchanged_for_irregular_line_breaks():
+    content = "x = 1\r\ny = 2\rdef f():\x0c\n    pass\n# slop-disable all\n"
+    result = SlopDetector().analyze_code_string(content, filename="odd.py")
+
+    # LDR keeps split("\n") lines; suppressions keep splitlines() numbering.
+    assert result.ldr.total_lines == 3
+    assert [d.lineno for d in result.suppression_directives] == [6]
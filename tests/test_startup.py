@@ -0,0 +1,109 @@
+"""Cold-start regression checks for single-file analysis."""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+# Modules the single-file path must not import: optional extras, renderers,
+# the process pool and subsystems only reached by other commands.
+DEFERRED_MODULES = (
+    "concurrent.futures.process",
+    "coverage",
+    "fastapi",
+    "multiprocessing",
+    "numpy",
+    "pydantic",
+    "radon",
+    "rich",
+    "slop_detector.api",
+    "slop_detector.autofix",
+    "slop_detector.gate",
+    "slop_detector.languages",
+    "slop_detector.leda_injection",
+    "tree_sitter",
+    "yaml",
+)
+
+# Wall-clock budget for `slop-detector file.py --json` beyond bare interpreter
+# startup. The target is 150 ms; a warm developer machine measures about
+# 115-145 ms. The extra 50 ms is headroom for CI jitter, which the best of
+# three runs keeps to tens of milliseconds. A slowdown of roughly a third
+# fails, e.g. the ML scorer (~95 ms) loading again; smaller eager imports
+# such as pydantic or yaml are caught precisely by DEFERRED_MODULES above.
+# Override with SLOP_STARTUP_BUDGET_MS on runners that are slower overall.
+STARTUP_BUDGET_MS = float(os.environ.get("SLOP_STARTUP_BUDGET_MS", "200"))
+
+
+def _run(args, cwd):
+    env = dict(os.environ)
+    env["HOME"] = str(cwd)
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def _best_of(args, cwd, runs=3):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = _run(args, cwd)
+        timings.append(time.perf_counter() - start)
+        assert result.returncode == 0, result.stderr
+    return min(timings) * 1000.0
+
+
+def _write_sample(tmp_path):
+    sample = tmp_path / "sample.py"
+    sample.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    return sample
+
+
+def test_single_file_analysis_defers_heavy_imports(tmp_path):
+    sample = _write_sample(tmp_path)
+    script = textwrap.dedent(
+        f"""
+        import json, sys
+        sys.argv = ["slop-detector", {str(sample)!r}, "--json", "--no-history"]
+        from slop_detector import cli
+        try:
+            cli.main()
+        except SystemExit:
+            pass
+        loaded = [m for m in {DEFERRED_MODULES!r} if m in sys.modules]
+        sys.stderr.write("LOADED=" + json.dumps(loaded))
+        """
+    )
+    result = _run(["-c", script], tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout)["status"] == "clean"
+    loaded = json.loads(result.stderr.rsplit("LOADED=", 1)[1])
+    assert loaded == []
+
+
+def test_package_import_is_lazy(tmp_path):
+    script = "import sys, slop_detector; print(sorted(m for m in sys.modules if m.startswith('slop_detector')))"
+    result = _run(["-c", script], tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "['slop_detector', 'slop_detector.decorators']"
+
+
+def test_single_file_cold_start_within_budget(tmp_path):
+    sample = _write_sample(tmp_path)
+    baseline = _best_of(["-c", "pass"], tmp_path)
+    elapsed = _best_of(["-m", "slop_detector.cli", str(sample), "--json", "--no-history"], tmp_path)
+
+    assert elapsed - baseline < STARTUP_BUDGET_MS, (
+        f"single-file cold start took {elapsed:.0f} ms "
+        f"({elapsed - baseline:.0f} ms over interpreter startup); "
+        f"budget is {STARTUP_BUDGET_MS:.0f} ms"
+    )